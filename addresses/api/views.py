@@ -1,15 +1,18 @@
 # addresses/api/views.py
 
+import hashlib
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
-from addresses.models.province import Province
-from addresses.models.district import District
-from addresses.models.municipality import Municipality
-from addresses.models.ward import Ward
+from addresses.services.address_tree import get_address_tree
 
 from addresses.api.serializers import (
     ProvinceSerializer,
@@ -19,6 +22,49 @@ from addresses.api.serializers import (
 )
 
 
+def accepted_encodings(header):
+    """
+    {content-coding: qvalue} of an Accept-Encoding header.
+    """
+    accepted = {}
+
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+
+        accepted[coding] = q
+
+    return accepted
+
+
+def tree_response(request, build):
+    """
+    Response from the in-memory address tree, validated by the tree
+    version: an unchanged tree answers If-None-Match with 304.
+    """
+    tree = get_address_tree()
+    etag = f'"{tree.version}"'
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = Response(build(tree))
+
+    response["ETag"] = etag
+    patch_cache_control(response, public=True, max_age=settings.ADDRESS_CACHE_MAX_AGE)
+    return response
+
+
 # =========================
 # PROVINCE
 # =========================
@@ -33,9 +79,7 @@ class ProvinceListView(APIView):
         tags=["addresses"],
     )
     def get(self, request):
-        qs = Province.objects.all().order_by("code")
-        serializer = ProvinceSerializer(qs, many=True)
-        return Response(serializer.data)
+        return tree_response(request, lambda tree: tree.province_list())
 
 
 # =========================
@@ -52,11 +96,7 @@ class DistrictListView(APIView):
         tags=["addresses"],
     )
     def get(self, request, province_id):
-        qs = District.objects.filter(
-            province_id=province_id
-        ).select_related("province")
-        serializer = DistrictSerializer(qs, many=True)
-        return Response(serializer.data)
+        return tree_response(request, lambda tree: tree.district_list(province_id))
 
 
 # =========================
@@ -73,11 +113,7 @@ class MunicipalityListView(APIView):
         tags=["addresses"],
     )
     def get(self, request, district_id):
-        qs = Municipality.objects.filter(
-            district_id=district_id
-        ).select_related("district", "district__province")
-        serializer = MunicipalitySerializer(qs, many=True)
-        return Response(serializer.data)
+        return tree_response(request, lambda tree: tree.municipality_list(district_id))
 
 
 # =========================
@@ -94,12 +130,93 @@ class WardListView(APIView):
         tags=["addresses"],
     )
     def get(self, request, municipality_id):
-        qs = Ward.objects.filter(
-            municipality_id=municipality_id
-        ).select_related(
-            "municipality",
-            "municipality__district",
-            "municipality__district__province",
+        return tree_response(request, lambda tree: tree.ward_list(municipality_id))
+
+
+# =========================
+# WHOLE TREE
+# =========================
+
+class AddressTreeView(APIView):
+    permission_classes = [AllowAny]
+
+    # Preferred first
+    ENCODINGS = ("br", "gzip")
+
+    @extend_schema(
+        summary="Address tree",
+        description=(
+            "The whole Province → District → Municipality → Ward hierarchy in one "
+            "compact, precompressed payload, or the subtree under one province, "
+            "district or municipality. Nodes are arrays whose columns are named "
+            "in `fields`.\n\n"
+            "Send the `version` from a previous payload as `?version=` to get a "
+            "response cacheable forever (`Cache-Control: immutable`); without "
+            "it, revalidate with `If-None-Match`."
+        ),
+        parameters=[
+            OpenApiParameter("province", int, OpenApiParameter.QUERY),
+            OpenApiParameter("district", int, OpenApiParameter.QUERY),
+            OpenApiParameter("municipality", int, OpenApiParameter.QUERY),
+            OpenApiParameter(
+                "version",
+                str,
+                OpenApiParameter.QUERY,
+                description="Tree version the client expects",
+            ),
+        ],
+        responses={200: OpenApiResponse(description="Compact address tree")},
+        tags=["addresses"],
+    )
+    def get(self, request):
+        params = request.query_params
+
+        try:
+            scope = {
+                level: int(params[level]) if params.get(level) else None
+                for level in ("province", "district", "municipality")
+            }
+        except ValueError:
+            raise Http404
+
+        tree = get_address_tree()
+        encodings = tree.encoded(**scope)
+        if encodings is None:
+            raise Http404
+
+        # Highest qvalue wins, ties by our preference; q=0 refuses a coding
+        accepted = accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        ranked = sorted(
+            (
+                (-accepted.get(name, accepted.get("*", 0)), index, name)
+                for index, name in enumerate(self.ENCODINGS)
+                if name in encodings
+            ),
         )
-        serializer = WardSerializer(qs, many=True)
-        return Response(serializer.data)
+        encoding = ranked[0][2] if ranked and ranked[0][0] < 0 else "identity"
+
+        # Strong validator per representation
+        etag = '"{}-{}"'.format(
+            hashlib.md5(f"{tree.version}:{sorted(scope.items())}".encode()).hexdigest()[:16],
+            encoding,
+        )
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(
+                encodings[encoding],
+                content_type="application/json; charset=utf-8",
+            )
+            if encoding != "identity":
+                response["Content-Encoding"] = encoding
+
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept-Encoding"])
+
+        if params.get("version") == tree.version:
+            # Versioned URL: content can never change
+            patch_cache_control(response, public=True, max_age=31536000, immutable=True)
+        else:
+            patch_cache_control(response, public=True, no_cache=True)
+
+        return response
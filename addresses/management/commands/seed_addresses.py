@@ -1,31 +1,52 @@
 # addresses/management/commands/seed_addresses.py
 
-from django.core.management.base import BaseCommand
-from django.core.management import call_command
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, transaction
+
+from addresses.services.address_seed_service import AddressSeedService, DEFAULT_SEED_FILE
+from addresses.services.address_tree import reset_address_tree
 
 
 class Command(BaseCommand):
-    help = "Seed all Nepal address data (province → district → municipality → ward)"
+    help = (
+        "Seed all Nepal address data (province → district → municipality → ward) "
+        "from the bundled seed file. Safe to re-run: existing rows are upserted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=str(DEFAULT_SEED_FILE),
+            help="Seed file (gzipped COPY text, see AddressSeedService)",
+        )
+        parser.add_argument(
+            "--export",
+            action="store_true",
+            help="Write the current address tables to --file instead of loading it",
+        )
 
     def handle(self, *args, **options):
-        self.stdout.write(self.style.NOTICE("🚀 Seeding Nepal address data..."))
-
-        try:
-            self.stdout.write("→ Seeding provinces...")
-            call_command("seed_provinces")
+        started = time.monotonic()
 
-            self.stdout.write("→ Seeding districts...")
-            call_command("seed_districts")
+        if options["export"]:
+            counts = AddressSeedService.export(options["file"])
+            summary = ", ".join(f"{count} {level}" for level, count in counts.items())
+            self.stdout.write(self.style.SUCCESS(f"Exported {summary} to {options['file']}"))
+            return
 
-            self.stdout.write("→ Seeding municipalities...")
-            call_command("seed_municipalities")
+        try:
+            result = AddressSeedService.load(options["file"])
+        except (OSError, ValueError, DatabaseError) as e:
+            raise CommandError(f"Address seeding failed: {e}")
 
-            self.stdout.write("→ Seeding wards...")
-            call_command("seed_wards")
+        # Processes reload the in-memory address tree
+        transaction.on_commit(reset_address_tree)
 
-        except Exception as e:
-            self.stderr.write(self.style.ERROR("Address seeding failed"))
-            self.stderr.write(self.style.ERROR(str(e)))
-            return
+        for level, (total, changed) in result.items():
+            self.stdout.write(f"→ {level}: {total} rows, {changed} inserted/updated")
 
-        self.stdout.write(self.style.SUCCESS("All address data seeded successfully"))
+        self.stdout.write(self.style.SUCCESS(
+            f"All address data seeded in {time.monotonic() - started:.2f}s"
+        ))
@@ -1,18 +0,0 @@
-INSERT INTO
-    addresses_province(
-        id,
-        title,
-        title_nepali,
-        code
-    )
-VALUES (1, 'Koshi', 'कोशी', 1), (
-        2,
-        'Madhesh Pradesh',
-        'मधेश प्रदेश',
-        2
-    ), (3, 'Bagmati', 'बागमती', 3), (4, 'Gandaki', 'गण्डकी', 4), (5, 'Lumbini', 'लुम्बिनी', 5), (6, 'Karnali', 'कर्णाली', 6), (
-        7,
-        'Sudurpashchim',
-        'सुदूरपश्चिम',
-        7
-    );
\ No newline at end of file
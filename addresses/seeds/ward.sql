@@ -1,6771 +0,0 @@
-INSERT INTO addresses_ward(id,municipality_id,number,number_nepali)
- VALUES
-    (1,1,1,'१'),
-    (2,1,2,'२'),
-    (3,1,3,'३'),
-    (4,1,4,'४'),
-    (5,1,5,'५'),
-    (6,1,6,'६'),
-    (7,1,7,'७'),
-    (8,2,1,'१'),
-    (9,2,2,'२'),
-    (10,2,3,'३'),
-    (11,2,4,'४'),
-    (12,2,5,'५'),
-    (13,3,1,'१'),
-    (14,3,2,'२'),
-    (15,3,3,'३'),
-    (16,3,4,'४'),
-    (17,3,5,'५'),
-    (18,3,6,'६'),
-    (19,4,1,'१'),
-    (20,4,2,'२'),
-    (21,4,3,'३'),
-    (22,4,4,'४'),
-    (23,4,5,'५'),
-    (24,4,6,'६'),
-    (25,5,1,'१'),
-    (26,5,2,'२'),
-    (27,5,3,'३'),
-    (28,5,4,'४'),
-    (29,5,5,'५'),
-    (30,6,1,'१'),
-    (31,6,2,'२'),
-    (32,6,3,'३'),
-    (33,6,4,'४'),
-    (34,6,5,'५'),
-    (35,6,6,'६'),
-    (36,6,7,'७'),
-    (37,6,8,'८'),
-    (38,6,9,'९'),
-    (39,6,10,'१०'),
-    (40,6,11,'११'),
-    (41,7,1,'१'),
-    (42,7,2,'२'),
-    (43,7,3,'३'),
-    (44,7,4,'४'),
-    (45,7,5,'५'),
-    (46,7,6,'६'),
-    (47,8,1,'१'),
-    (48,8,2,'२'),
-    (49,8,3,'३'),
-    (50,8,4,'४'),
-    (51,8,5,'५'),
-    (52,8,6,'६'),
-    (53,8,7,'७'),
-    (54,8,8,'८'),
-    (55,9,1,'१'),
-    (56,9,2,'२'),
-    (57,9,3,'३'),
-    (58,9,4,'४'),
-    (59,9,5,'५'),
-    (60,9,6,'६'),
-    (61,9,7,'७'),
-    (62,10,1,'१'),
-    (63,10,2,'२'),
-    (64,10,3,'३'),
-    (65,10,4,'४'),
-    (66,10,5,'५'),
-    (67,11,1,'१'),
-    (68,11,2,'२'),
-    (69,11,3,'३'),
-    (70,11,4,'४'),
-    (71,11,5,'५'),
-    (72,11,6,'६'),
-    (73,12,1,'१'),
-    (74,12,2,'२'),
-    (75,12,3,'३'),
-    (76,12,4,'४'),
-    (77,12,5,'५'),
-    (78,13,1,'१'),
-    (79,13,2,'२'),
-    (80,13,3,'३'),
-    (81,13,4,'४'),
-    (82,13,5,'५'),
-    (83,14,1,'१'),
-    (84,14,2,'२'),
-    (85,14,3,'३'),
-    (86,14,4,'४'),
-    (87,14,5,'५'),
-    (88,14,6,'६'),
-    (89,15,1,'१'),
-    (90,15,2,'२'),
-    (91,15,3,'३'),
-    (92,15,4,'४'),
-    (93,15,5,'५'),
-    (94,15,6,'६'),
-    (95,15,7,'७'),
-    (96,15,8,'८'),
-    (97,15,9,'९'),
-    (98,15,10,'१०'),
-    (99,15,11,'११'),
-    (100,16,1,'१'),
-    (101,16,2,'२'),
-    (102,16,3,'३'),
-    (103,16,4,'४'),
-    (104,16,5,'५'),
-    (105,16,6,'६'),
-    (106,16,7,'७'),
-    (107,16,8,'८'),
-    (108,16,9,'९'),
-    (109,17,1,'१'),
-    (110,17,2,'२'),
-    (111,17,3,'३'),
-    (112,17,4,'४'),
-    (113,17,5,'५'),
-    (114,17,6,'६'),
-    (115,17,7,'७'),
-    (116,17,8,'८'),
-    (117,17,9,'९'),
-    (118,17,10,'१०'),
-    (119,17,11,'११'),
-    (120,18,1,'१'),
-    (121,18,2,'२'),
-    (122,18,3,'३'),
-    (123,18,4,'४'),
-    (124,18,5,'५'),
-    (125,18,6,'६'),
-    (126,18,7,'७'),
-    (127,18,8,'८'),
-    (128,18,9,'९'),
-    (129,19,1,'१'),
-    (130,19,2,'२'),
-    (131,19,3,'३'),
-    (132,19,4,'४'),
-    (133,19,5,'५'),
-    (134,19,6,'६'),
-    (135,19,7,'७'),
-    (136,19,8,'८'),
-    (137,19,9,'९'),
-    (138,20,1,'१'),
-    (139,20,2,'२'),
-    (140,20,3,'३'),
-    (141,20,4,'४'),
-    (142,20,5,'५'),
-    (143,21,1,'१'),
-    (144,21,2,'२'),
-    (145,21,3,'३'),
-    (146,21,4,'४'),
-    (147,21,5,'५'),
-    (148,22,1,'१'),
-    (149,22,2,'२'),
-    (150,22,3,'३'),
-    (151,22,4,'४'),
-    (152,22,5,'५'),
-    (153,23,1,'१'),
-    (154,23,2,'२'),
-    (155,23,3,'३'),
-    (156,23,4,'४'),
-    (157,23,5,'५'),
-    (158,23,6,'६'),
-    (159,23,7,'७'),
-    (160,24,1,'१'),
-    (161,24,2,'२'),
-    (162,24,3,'३'),
-    (163,24,4,'४'),
-    (164,24,5,'५'),
-    (165,24,6,'६'),
-    (166,24,7,'७'),
-    (167,24,8,'८'),
-    (168,24,9,'९'),
-    (169,25,1,'१'),
-    (170,25,2,'२'),
-    (171,25,3,'३'),
-    (172,25,4,'४'),
-    (173,25,5,'५'),
-    (174,25,6,'६'),
-    (175,26,1,'१'),
-    (176,26,2,'२'),
-    (177,26,3,'३'),
-    (178,26,4,'४'),
-    (179,26,5,'५'),
-    (180,26,6,'६'),
-    (181,26,7,'७'),
-    (182,26,8,'८'),
-    (183,26,9,'९'),
-    (184,26,10,'१०'),
-    (185,27,1,'१'),
-    (186,27,2,'२'),
-    (187,27,3,'३'),
-    (188,27,4,'४'),
-    (189,27,5,'५'),
-    (190,28,1,'१'),
-    (191,28,2,'२'),
-    (192,28,3,'३'),
-    (193,28,4,'४'),
-    (194,28,5,'५'),
-    (195,28,6,'६'),
-    (196,28,7,'७'),
-    (197,28,8,'८'),
-    (198,29,1,'१'),
-    (199,29,2,'२'),
-    (200,29,3,'३'),
-    (201,29,4,'४'),
-    (202,29,5,'५'),
-    (203,29,6,'६'),
-    (204,29,7,'७'),
-    (205,29,8,'८'),
-    (206,29,9,'९'),
-    (207,29,10,'१०'),
-    (208,29,11,'११'),
-    (209,29,12,'१२'),
-    (210,30,1,'१'),
-    (211,30,2,'२'),
-    (212,30,3,'३'),
-    (213,30,4,'४'),
-    (214,30,5,'५'),
-    (215,30,6,'६'),
-    (216,30,7,'७'),
-    (217,30,8,'८'),
-    (218,31,1,'१'),
-    (219,31,2,'२'),
-    (220,31,3,'३'),
-    (221,31,4,'४'),
-    (222,31,5,'५'),
-    (223,31,6,'६'),
-    (224,31,7,'७'),
-    (225,31,8,'८'),
-    (226,31,9,'९'),
-    (227,32,1,'१'),
-    (228,32,2,'२'),
-    (229,32,3,'३'),
-    (230,32,4,'४'),
-    (231,32,5,'५'),
-    (232,32,6,'६'),
-    (233,32,7,'७'),
-    (234,32,8,'८'),
-    (235,32,9,'९'),
-    (236,33,1,'१'),
-    (237,33,2,'२'),
-    (238,33,3,'३'),
-    (239,33,4,'४'),
-    (240,33,5,'५'),
-    (241,33,6,'६'),
-    (242,33,7,'७'),
-    (243,33,8,'८'),
-    (244,33,9,'९'),
-    (245,33,10,'१०'),
-    (246,34,1,'१'),
-    (247,34,2,'२'),
-    (248,34,3,'३'),
-    (249,34,4,'४'),
-    (250,34,5,'५'),
-    (251,34,6,'६'),
-    (252,34,7,'७'),
-    (253,34,8,'८'),
-    (254,34,9,'९'),
-    (255,34,10,'१०'),
-    (256,35,1,'१'),
-    (257,35,2,'२'),
-    (258,35,3,'३'),
-    (259,35,4,'४'),
-    (260,35,5,'५'),
-    (261,35,6,'६'),
-    (262,35,7,'७'),
-    (263,35,8,'८'),
-    (264,35,9,'९'),
-    (265,36,1,'१'),
-    (266,36,2,'२'),
-    (267,36,3,'३'),
-    (268,36,4,'४'),
-    (269,36,5,'५'),
-    (270,36,6,'६'),
-    (271,36,7,'७'),
-    (272,37,1,'१'),
-    (273,37,2,'२'),
-    (274,37,3,'३'),
-    (275,37,4,'४'),
-    (276,37,5,'५'),
-    (277,37,6,'६'),
-    (278,37,7,'७'),
-    (279,38,1,'१'),
-    (280,38,2,'२'),
-    (281,38,3,'३'),
-    (282,38,4,'४'),
-    (283,38,5,'५'),
-    (284,38,6,'६'),
-    
-    (285,39,1,'१'),
-    (286,39,2,'२'),
-    (287,39,3,'३'),
-    (288,39,4,'४'),
-    (289,39,5,'५'),
-    (290,39,6,'६'),
-    (291,39,7,'७'),
-    (292,39,8,'८'),
-    (293,39,9,'९'),
-    (294,39,10,'१०'),
-    (295,39,11,'११'),
-    (296,40,1,'१'),
-    (297,40,2,'२'),
-    (298,40,3,'३'),
-    (299,40,4,'४'),
-    (300,40,5,'५'),
-    (301,40,6,'६'),
-    (302,40,7,'७'),
-    (303,40,8,'८'),
-    (304,40,9,'९'),
-    (305,40,10,'१०'),
-    (306,40,11,'११'),
-    (307,40,12,'१२'),
-    (308,40,13,'१३'),
-    (309,40,14,'१४'),
-    (310,40,15,'१५'),
-    (311,41,1,'१'),
-    (312,41,2,'२'),
-    (313,41,3,'३'),
-    (314,41,4,'४'),
-    (315,41,5,'५'),
-    (316,42,1,'१'),
-    (317,42,2,'२'),
-    (318,42,3,'३'),
-    (319,42,4,'४'),
-    (320,42,5,'५'),
-    (321,42,6,'६'),
-    (322,42,7,'७'),
-    (323,43,1,'१'),
-    (324,43,2,'२'),
-    (325,43,3,'३'),
-    (326,43,4,'४'),
-    (327,43,5,'५'),
-    (328,43,6,'६'),
-    (329,43,7,'७'),
-    (330,43,8,'८'),
-    (331,43,9,'९'),
-    (332,44,1,'१'),
-    (333,44,2,'२'),
-    (334,44,3,'३'),
-    (335,44,4,'४'),
-    (336,44,5,'५'),
-    (337,44,6,'६'),
-    (338,45,1,'१'),
-    (339,45,2,'२'),
-    (340,45,3,'३'),
-    (341,45,4,'४'),
-    (342,45,5,'५'),
-    (343,45,6,'६'),
-    (344,46,1,'१'),
-    (345,46,2,'२'),
-    (346,46,3,'३'),
-    (347,46,4,'४'),
-    (348,46,5,'५'),
-    (349,46,6,'६'),
-    (350,46,7,'७'),
-    (351,46,8,'८'),
-    (352,46,9,'९'),
-    (353,46,10,'१०'),
-    (354,46,11,'११'),
-    (355,46,12,'१२'),
-    (356,46,13,'१३'),
-    (357,46,14,'१४'),
-    (358,47,1,'१'),
-    (359,47,2,'२'),
-    (360,47,3,'३'),
-    (361,47,4,'४'),
-    (362,47,5,'५'),
-    (363,47,6,'६'),
-    (364,48,1,'१'),
-    (365,48,2,'२'),
-    (366,48,3,'३'),
-    (367,48,4,'४'),
-    (368,48,5,'५'),
-    (369,48,6,'६'),
-    (370,48,7,'७'),
-    (371,48,8,'८'),
-    (372,48,9,'९'),
-    (373,49,1,'१'),
-    (374,49,2,'२'),
-    (375,49,3,'३'),
-    (376,49,4,'४'),
-    (377,49,5,'५'),
-    (378,49,6,'६'),
-    (379,49,7,'७'),
-    (380,49,8,'८'),
-    (381,49,9,'९'),
-    (382,49,10,'१०'),
-    (383,49,11,'११'),
-    (384,49,12,'१२'),
-    (385,50,1,'१'),
-    (386,50,2,'२'),
-    (387,50,3,'३'),
-    (388,50,4,'४'),
-    (389,50,5,'५'),
-    (390,50,6,'६'),
-    (391,50,7,'७'),
-    (392,51,1,'१'),
-    (393,51,2,'२'),
-    (394,51,3,'३'),
-    (395,51,4,'४'),
-    (396,51,5,'५'),
-    (397,51,6,'६'),
-    (398,52,1,'१'),
-    (399,52,2,'२'),
-    (400,52,3,'३'),
-    (401,52,4,'४'),
-    (402,52,5,'५'),
-    (403,52,6,'६'),
-    (404,52,7,'७'),
-    (405,52,8,'८'),
-    (406,53,1,'१'),
-    (407,53,2,'२'),
-    (408,53,3,'३'),
-    (409,53,4,'४'),
-    (410,53,5,'५'),
-    (411,53,6,'६'),
-    (412,53,7,'७'),
-    (413,53,8,'८'),
-    (414,53,9,'९'),
-    (415,54,1,'१'),
-    (416,54,2,'२'),
-    (417,54,3,'३'),
-    (418,54,4,'४'),
-    (419,54,5,'५'),
-    (420,54,6,'६'),
-    (421,54,7,'७'),
-    (422,54,8,'८'),
-    (423,54,9,'९'),
-    (424,54,10,'१०'),
-    (425,55,1,'१'),
-    (426,55,2,'२'),
-    (427,55,3,'३'),
-    (428,55,4,'४'),
-    (429,55,5,'५'),
-    (430,55,6,'६'),
-    (431,55,7,'७'),
-    (432,55,8,'८'),
-    (433,55,9,'९'),
-    (434,56,1,'१'),
-    (435,56,2,'२'),
-    (436,56,3,'३'),
-    (437,56,4,'४'),
-    (438,56,5,'५'),
-    (439,56,6,'६'),
-    (440,56,7,'७'),
-    (441,56,8,'८'),
-    (442,56,9,'९'),
-    (443,56,10,'१०'),
-    (444,57,1,'१'),
-    (445,57,2,'२'),
-    (446,57,3,'३'),
-    (447,57,4,'४'),
-    (448,57,5,'५'),
-    (449,57,6,'६'),
-    (450,58,1,'१'),
-    (451,58,2,'२'),
-    (452,58,3,'३'),
-    (453,58,4,'४'),
-    (454,58,5,'५'),
-    (455,58,6,'६'),
-    (456,58,7,'७'),
-    (457,58,8,'८'),
-    (458,58,9,'९'),
-    (459,58,10,'१०'),
-    (460,59,1,'१'),
-    (461,59,2,'२'),
-    (462,59,3,'३'),
-    (463,59,4,'४'),
-    (464,59,5,'५'),
-    (465,59,6,'६'),
-    (466,59,7,'७'),
-    (467,60,1,'१'),
-    (468,60,2,'२'),
-    (469,60,3,'३'),
-    (470,60,4,'४'),
-    (471,60,5,'५'),
-    (472,60,6,'६'),
-    (473,60,7,'७'),
-    (474,60,8,'८'),
-    (475,60,9,'९'),
-    (476,60,10,'१०'),
-    (477,61,1,'१'),
-    (478,61,2,'२'),
-    (479,61,3,'३'),
-    (480,61,4,'४'),
-    (481,61,5,'५'),
-    (482,61,6,'६'),
-    (483,61,7,'७'),
-    (484,61,8,'८'),
-    (485,62,1,'१'),
-    (486,62,2,'२'),
-    (487,62,3,'३'),
-    (488,62,4,'४'),
-    (489,62,5,'५'),
-    (490,62,6,'६'),
-    (491,62,7,'७'),
-    (492,63,1,'१'),
-    (493,63,2,'२'),
-    (494,63,3,'३'),
-    (495,63,4,'४'),
-    (496,63,5,'५'),
-    (497,64,1,'१'),
-    (498,64,2,'२'),
-    (499,64,3,'३'),
-    (500,64,4,'४'),
-
-    (501,64,5,'५'),
-    (502,64,6,'६'),
-    (503,65,1,'१'),
-    (504,65,2,'२'),
-    (505,65,3,'३'),
-    (506,65,4,'४'),
-    (507,65,5,'५'),
-    (508,65,6,'६'),
-    (509,65,7,'७'),
-    (510,65,8,'८'),
-    (511,65,9,'९'),
-    (512,65,10,'१०'),
-    (513,66,1,'१'),
-    (514,66,2,'२'),
-    (515,66,3,'३'),
-    (516,66,4,'४'),
-    (517,66,5,'५'),
-    (518,66,6,'६'),
-    (519,66,7,'७'),
-    (520,66,8,'८'),
-    (521,66,9,'९'),
-    (522,67,1,'१'),
-    (523,67,2,'२'),
-    (524,67,3,'३'),
-    (525,67,4,'४'),
-    (526,67,5,'५'),
-    (527,67,6,'६'),
-    (528,68,1,'१'),
-    (529,68,2,'२'),
-    (530,68,3,'३'),
-    (531,68,4,'४'),
-    (532,68,5,'५'),
-    (533,68,6,'६'),
-    (534,69,1,'१'),
-    (535,69,2,'२'),
-    (536,69,3,'३'),
-    (537,69,4,'४'),
-    (538,69,5,'५'),
-    (539,69,6,'६'),
-    (540,69,7,'७'),
-    (541,70,1,'१'),
-    (542,70,2,'२'),
-    (543,70,3,'३'),
-    (544,70,4,'४'),
-    (545,70,5,'५'),
-    (546,70,6,'६'),
-    (547,70,7,'७'),
-    (548,70,8,'८'),
-    (549,71,1,'१'),
-    (550,71,2,'२'),
-    (551,71,3,'३'),
-    (552,71,4,'४'),
-    (553,71,5,'५'),
-    (554,71,6,'६'),
-    (555,71,7,'७'),
-    (556,71,8,'८'),
-    (557,71,9,'९'),
-    (558,71,10,'१०'),
-    (559,71,11,'११'),
-    (560,71,12,'१२'),
-    (561,71,13,'१३'),
-    (562,71,14,'१४'),
-    (563,72,1,'१'),
-    (564,72,2,'२'),
-    (565,72,3,'३'),
-    (566,72,4,'४'),
-    (567,72,5,'५'),
-    (568,72,6,'६'),
-    (569,72,7,'७'),
-    (570,73,1,'१'),
-    (571,73,2,'२'),
-    (572,73,3,'३'),
-    (573,73,4,'४'),
-    (574,73,5,'५'),
-    (575,74,1,'१'),
-    (576,74,2,'२'),
-    (577,74,3,'३'),
-    (578,74,4,'४'),
-    (579,74,5,'५'),
-    (580,75,1,'१'),
-    (581,75,2,'२'),
-    (582,75,3,'३'),
-    (583,75,4,'४'),
-    (584,75,5,'५'),
-    (585,75,6,'६'),
-    (586,75,7,'७'),
-    (587,75,8,'८'),
-    (588,76,1,'१'),
-    (589,76,2,'२'),
-    (590,76,3,'३'),
-    (591,76,4,'४'),
-    (592,76,5,'५'),
-    (593,76,6,'६'),
-    (594,77,1,'१'),
-    (595,77,2,'२'),
-    (596,77,3,'३'),
-    (597,77,4,'४'),
-    (598,77,5,'५'),
-    (599,78,1,'१'),
-    (600,78,2,'२'),
-    (601,78,3,'३'),
-    (602,78,4,'४'),
-    (603,78,5,'५'),
-    (604,78,6,'६'),
-    (605,78,7,'७'),
-    (606,78,8,'८'),
-    (607,78,9,'९'),
-    (608,78,10,'१०'),
-    (609,78,11,'११'),
-    (610,78,12,'१२'),
-    (611,79,1,'१'),
-    (612,79,2,'२'),
-    (613,79,3,'३'),
-    (614,79,4,'४'),
-    (615,79,5,'५'),
-    (616,79,6,'६'),
-    (617,79,7,'७'),
-    (618,79,8,'८'),
-    (619,79,9,'९'),
-    (620,80,1,'१'),
-    (621,80,2,'२'),
-    (622,80,3,'३'),
-    (623,80,4,'४'),
-    (624,80,5,'५'),
-    (625,80,6,'६'),
-    (626,80,7,'७'),
-    (627,81,1,'१'),
-    (628,81,2,'२'),
-    (629,81,3,'३'),
-    (630,81,4,'४'),
-    (631,81,5,'५'),
-    (632,81,6,'६'),
-    (633,82,1,'१'),
-    (634,82,2,'२'),
-    (635,82,3,'३'),
-    (636,82,4,'४'),
-    (637,82,5,'५'),
-    (638,82,6,'६'),
-    (639,83,1,'१'),
-    (640,83,2,'२'),
-    (641,83,3,'३'),
-    (642,83,4,'४'),
-    (643,83,5,'५'),
-    (644,83,6,'६'),
-    (645,83,7,'७'),
-    (646,83,8,'८'),
-    (647,83,9,'९'),
-    (648,83,10,'१०'),
-    (649,84,1,'१'),
-    (650,84,2,'२'),
-    (651,84,3,'३'),
-    (652,84,4,'४'),
-    (653,84,5,'५'),
-    (654,84,6,'६'),
-    (655,84,7,'७'),
-    (656,84,8,'८'),
-    (657,84,9,'९'),
-    (658,84,10,'१०'),
-    (659,84,11,'११'),
-    (660,84,12,'१२'),
-    (661,84,13,'१३'),
-    (662,84,14,'१४'),
-    (663,85,1,'१'),
-    (664,85,2,'२'),
-    (665,85,3,'३'),
-    (666,85,4,'४'),
-    (667,85,5,'५'),
-    (668,85,6,'६'),
-    (669,86,1,'१'),
-    (670,86,2,'२'),
-    (671,86,3,'३'),
-    (672,86,4,'४'),
-    (673,86,5,'५'),
-    (674,86,6,'६'),
-    (675,86,7,'७'),
-    (676,86,8,'८'),
-    (677,86,9,'९'),
-    (678,86,10,'१०'),
-    (679,86,11,'११'),
-    (680,86,12,'१२'),
-    (681,86,13,'१३'),
-    (682,86,14,'१४'),
-    (683,86,15,'१५'),
-    (684,87,1,'१'),
-    (685,87,2,'२'),
-    (686,87,3,'३'),
-    (687,87,4,'४'),
-    (688,87,5,'५'),
-    (689,87,6,'६'),
-    (690,87,7,'७'),
-    (691,88,1,'१'),
-    (692,88,2,'२'),
-    (693,88,3,'३'),
-    (694,88,4,'४'),
-    (695,88,5,'५'),
-    (696,88,6,'६'),
-    (697,88,7,'७'),
-    (698,88,8,'८'),
-    (699,88,9,'९'),
-    (700,88,10,'१०'),
-    (701,88,11,'११'),
-    (702,89,1,'१'),
-    (703,89,2,'२'),
-    (704,89,3,'३'),
-    (705,89,4,'४'),
-    (706,89,5,'५'),
-    (707,89,6,'६'),
-    (708,89,7,'७'),
-    (709,89,8,'८'),
-    (710,89,9,'९'),
-    (711,90,1,'१'),
-    (712,90,2,'२'),
-    (713,90,3,'३'),
-    (714,90,4,'४'),
-    (715,90,5,'५'),
-    (716,90,6,'६'),
-    (717,90,7,'७'),
-    (718,90,8,'८'),
-    (719,90,9,'९'),
-    (720,90,10,'१०'),
-    (721,90,11,'११'),
-    (722,91,1,'१'),
-    (723,91,2,'२'),
-    (724,91,3,'३'),
-    (725,91,4,'४'),
-    (726,91,5,'५'),
-    (727,91,6,'६'),
-    (728,91,7,'७'),
-    (729,92,1,'१'),
-    (730,92,2,'२'),
-    (731,92,3,'३'),
-    (732,92,4,'४'),
-    (733,92,5,'५'),
-    (734,92,6,'६'),
-    (735,92,7,'७'),
-    (736,92,8,'८'),
-    (737,92,9,'९'),
-    (738,92,10,'१०'),
-    (739,93,1,'१'),
-    (740,93,2,'२'),
-    (741,93,3,'३'),
-    (742,93,4,'४'),
-    (743,93,5,'५'),
-    (744,93,6,'६'),
-    (745,93,7,'७'),
-    (746,93,8,'८'),
-    (747,93,9,'९'),
-    (748,94,1,'१'),
-    (749,94,2,'२'),
-    (750,94,3,'३'),
-    (751,94,4,'४'),
-    (752,94,5,'५'),
-    (753,94,6,'६'),
-    (754,95,1,'१'),
-    (755,95,2,'२'),
-    (756,95,3,'३'),
-    (757,95,4,'४'),
-    (758,95,5,'५'),
-    (759,95,6,'६'),
-    (760,95,7,'७'),
-    (761,96,1,'१'),
-    (762,96,2,'२'),
-    (763,96,3,'३'),
-    (764,96,4,'४'),
-    (765,96,5,'५'),
-    (766,96,6,'६'),
-    (767,96,7,'७'),
-    (768,97,1,'१'),
-    (769,97,2,'२'),
-    (770,97,3,'३'),
-    (771,97,4,'४'),
-    (772,97,5,'५'),
-    (773,97,6,'६'),
-    (774,97,7,'७'),
-    (775,97,8,'८'),
-    (776,97,9,'९'),
-    (777,97,10,'१०'),
-    (778,98,1,'१'),
-    (779,98,2,'२'),
-    (780,98,3,'३'),
-    (781,98,4,'४'),
-    (782,98,5,'५'),
-    (783,99,1,'१'),
-    (784,99,2,'२'),
-    (785,99,3,'३'),
-    (786,99,4,'४'),
-    (787,99,5,'५'),
-    (788,99,6,'६'),
-    (789,99,7,'७'),
-    (790,99,8,'८'),
-    (791,99,9,'९'),
-    (792,99,10,'१०'),
-    (793,100,1,'१'),
-    (794,100,2,'२'),
-    (795,100,3,'३'),
-    (796,100,4,'४'),
-    (797,100,5,'५'),
-    (798,100,6,'६'),
-    (799,100,7,'७'),
-    (800,101,1,'१'),
-    (801,101,2,'२'),
-    (802,101,3,'३'),
-    (803,101,4,'४'),
-    (804,101,5,'५'),
-    (805,101,6,'६'),
-    (806,101,7,'७'),
-    (807,101,8,'८'),
-    (808,101,9,'९'),
-    (809,102,1,'१'),
-    (810,102,2,'२'),
-    (811,102,3,'३'),
-    (812,102,4,'४'),
-    (813,102,5,'५'),
-    (814,102,6,'६'),
-    (815,102,7,'७'),
-    (816,102,8,'८'),
-    (817,102,9,'९'),
-    (818,103,1,'१'),
-    (819,103,2,'२'),
-    (820,103,3,'३'),
-    (821,103,4,'४'),
-    (822,103,5,'५'),
-    (823,103,6,'६'),
-    (824,103,7,'७'),
-    (825,103,8,'८'),
-    (826,103,9,'९'),
-    (827,103,10,'१०'),
-    (828,104,1,'१'),
-    (829,104,2,'२'),
-    (830,104,3,'३'),
-    (831,104,4,'४'),
-    (832,104,5,'५'),
-    (833,104,6,'६'),
-    (834,104,7,'७'),
-    (835,104,8,'८'),
-    (836,104,9,'९'),
-    (837,104,10,'१०'),
-    (838,104,11,'११'),
-    (839,104,12,'१२'),
-    (840,105,1,'१'),
-    (841,105,2,'२'),
-    (842,105,3,'३'),
-    (843,105,4,'४'),
-    (844,105,5,'५'),
-    (845,105,6,'६'),
-    (846,105,7,'७'),
-    (847,105,8,'८'),
-    (848,105,9,'९'),
-    (849,105,10,'१०'),
-    (850,105,11,'११'),
-    (851,106,1,'१'),
-    (852,106,2,'२'),
-    (853,106,3,'३'),
-    (854,106,4,'४'),
-    (855,106,5,'५'),
-    (856,106,6,'६'),
-    (857,106,7,'७'),
-    (858,107,1,'१'),
-    (859,107,2,'२'),
-    (860,107,3,'३'),
-    (861,107,4,'४'),
-    (862,107,5,'५'),
-    (863,107,6,'६'),
-    (864,107,7,'७'),
-    (865,107,8,'८'),
-    (866,107,9,'९'),
-    (867,107,10,'१०'),
-    (868,108,1,'१'),
-    (869,108,2,'२'),
-    (870,108,3,'३'),
-    (871,108,4,'४'),
-    (872,108,5,'५'),
-    (873,108,6,'६'),
-    (874,108,7,'७'),
-    (875,108,8,'८'),
-    (876,108,9,'९'),
-    (877,109,1,'१'),
-    (878,109,2,'२'),
-    (879,109,3,'३'),
-    (880,109,4,'४'),
-    (881,109,5,'५'),
-    (882,109,6,'६'),
-    (883,109,7,'७'),
-    (884,109,8,'८'),
-    (885,109,9,'९'),
-    (886,109,10,'१०'),
-    (887,110,1,'१'),
-    (888,110,2,'२'),
-    (889,110,3,'३'),
-    (890,110,4,'४'),
-    (891,110,5,'५'),
-    (892,110,6,'६'),
-    (893,110,7,'७'),
-    (894,110,8,'८'),
-    (895,110,9,'९'),
-    (896,111,1,'१'),
-    (897,111,2,'२'),
-    (898,111,3,'३'),
-    (899,111,4,'४'),
-    (900,111,5,'५'),
-    (901,111,6,'६'),
-    (902,111,7,'७'),
-    (903,111,8,'८'),
-    (904,111,9,'९'),
-    (905,112,1,'१'),
-    (906,112,2,'२'),
-    (907,112,3,'३'),
-    (908,112,4,'४'),
-    (909,112,5,'५'),
-    (910,112,6,'६'),
-    (911,112,7,'७'),
-    (912,113,1,'१'),
-    (913,113,2,'२'),
-    (914,113,3,'३'),
-    (915,113,4,'४'),
-    (916,113,5,'५'),
-    (917,113,6,'६'),
-    (918,113,7,'७'),
-    (919,114,1,'१'),
-    (920,114,2,'२'),
-    (921,114,3,'३'),
-    (922,114,4,'४'),
-    (923,114,5,'५'),
-    (924,114,6,'६'),
-    (925,114,7,'७'),
-    (926,114,8,'८'),
-    (927,114,9,'९'),
-    (928,114,10,'१०'),
-    (929,114,11,'११'),
-    (930,114,12,'१२'),
-    (931,114,13,'१३'),
-    (932,114,14,'१४'),
-    (933,114,15,'१५'),
-    (934,114,16,'१६'),
-    (935,114,17,'१७'),
-    (936,114,18,'१८'),
-    (937,114,19,'१९'),
-    (938,115,1,'१'),
-    (939,115,2,'२'),
-    (940,115,3,'३'),
-    (941,115,4,'४'),
-    (942,115,5,'५'),
-    (943,115,6,'६'),
-    (944,115,7,'७'),
-    (945,116,1,'१'),
-    (946,116,2,'२'),
-    (947,116,3,'३'),
-    (948,116,4,'४'),
-    (949,116,5,'५'),
-    (950,116,6,'६'),
-    (951,116,7,'७'),
-    (952,117,1,'१'),
-    (953,117,2,'२'),
-    (954,117,3,'३'),
-    (955,117,4,'४'),
-    (956,117,5,'५'),
-    (957,117,6,'६'),
-    (958,117,7,'७'),
-    (959,118,1,'१'),
-    (960,118,2,'२'),
-    (961,118,3,'३'),
-    (962,118,4,'४'),
-    (963,118,5,'५'),
-    (964,118,6,'६'),
-    (965,118,7,'७'),
-    (966,118,8,'८'),
-    (967,118,9,'९'),
-    (968,118,10,'१०'),
-    (969,118,11,'११'),
-    (970,118,12,'१२'),
-    (971,118,13,'१३'),
-    (972,118,14,'१४'),
-    (973,118,15,'१५'),
-    (974,118,16,'१६'),
-    (975,118,17,'१७'),
-    (976,118,18,'१८'),
-    (977,118,19,'१९'),
-    (978,118,20,'२०'),
-    (979,119,1,'१'),
-    (980,119,2,'२'),
-    (981,119,3,'३'),
-    (982,119,4,'४'),
-    (983,119,5,'५'),
-    (984,119,6,'६'),
-    (985,119,7,'७'),
-    (986,119,8,'८'),
-    (987,119,9,'९'),
-    (988,119,10,'१०'),
-    (989,119,11,'११'),
-    (990,120,1,'१'),
-    (991,120,2,'२'),
-    (992,120,3,'३'),
-    (993,120,4,'४'),
-    (994,120,5,'५'),
-    (995,120,6,'६'),
-    (996,120,7,'७'),
-    (997,120,8,'८'),
-    (998,121,1,'१'),
-    (999,121,2,'२'),
-    (1000,121,3,'३'),
-    (1001,121,4,'४'),
-    (1002,121,5,'५'),
-    (1003,121,6,'६'),
-    (1004,121,7,'७'),
-    (1005,121,8,'८'),
-    (1006,122,1,'१'),
-    (1007,122,2,'२'),
-    (1008,122,3,'३'),
-    (1009,122,4,'४'),
-    (1010,122,5,'५'),
-    (1011,122,6,'६'),
-    (1012,122,7,'७'),
-    (1013,122,8,'८'),
-    (1014,122,9,'९'),
-    (1015,123,1,'१'),
-    (1016,123,2,'२'),
-    (1017,123,3,'३'),
-    (1018,123,4,'४'),
-    (1019,123,5,'५'),
-    (1020,123,6,'६'),
-    (1021,123,7,'७'),
-    (1022,123,8,'८'),
-    (1023,123,9,'९'),
-    (1024,123,10,'१०'),
-    (1025,123,11,'११'),
-    (1026,123,12,'१२'),
-    (1027,123,13,'१३'),
-    (1028,123,14,'१४'),
-    (1029,123,15,'१५'),
-    (1030,123,16,'१६'),
-    (1031,123,17,'१७'),
-    (1032,123,18,'१८'),
-    (1033,123,19,'१९'),
-    (1034,123,20,'२०'),
-    (1035,124,1,'१'),
-    (1036,124,2,'२'),
-    (1037,124,3,'३'),
-    (1038,124,4,'४'),
-    (1039,124,5,'५'),
-    (1040,124,6,'६'),
-    (1041,124,7,'७'),
-    (1042,124,8,'८'),
-    (1043,124,9,'९'),
-    (1044,124,10,'१०'),
-    (1045,124,11,'११'),
-    (1046,124,12,'१२'),
-    (1047,125,1,'१'),
-    (1048,125,2,'२'),
-    (1049,125,3,'३'),
-    (1050,125,4,'४'),
-    (1051,125,5,'५'),
-    (1052,125,6,'६'),
-    (1053,126,1,'१'),
-    (1054,126,2,'२'),
-    (1055,126,3,'३'),
-    (1056,126,4,'४'),
-    (1057,126,5,'५'),
-    (1058,126,6,'६'),
-    (1059,126,7,'७'),
-    (1060,126,8,'८'),
-    (1061,126,9,'९'),
-    (1062,126,10,'१०'),
-    (1063,127,1,'१'),
-    (1064,127,2,'२'),
-    (1065,127,3,'३'),
-    (1066,127,4,'४'),
-    (1067,127,5,'५'),
-    (1068,127,6,'६'),
-    (1069,127,7,'७'),
-    (1070,128,1,'१'),
-    (1071,128,2,'२'),
-    (1072,128,3,'३'),
-    (1073,128,4,'४'),
-    (1074,128,5,'५'),
-    (1075,128,6,'६'),
-    (1076,128,7,'७'),
-    (1077,129,1,'१'),
-    (1078,129,2,'२'),
-    (1079,129,3,'३'),
-    (1080,129,4,'४'),
-    (1081,129,5,'५'),
-    (1082,129,6,'६'),
-    (1083,130,1,'१'),
-    (1084,130,2,'२'),
-    (1085,130,3,'३'),
-    (1086,130,4,'४'),
-    (1087,130,5,'५'),
-    (1088,130,6,'६'),
-    (1089,130,7,'७'),
-    (1090,130,8,'८'),
-    (1091,130,9,'९'),
-    (1092,131,1,'१'),
-    (1093,131,2,'२'),
-    (1094,131,3,'३'),
-    (1095,131,4,'४'),
-    (1096,131,5,'५'),
-    (1097,131,6,'६'),
-    (1098,131,7,'७'),
-    (1099,131,8,'८'),
-    (1100,131,9,'९'),
-    (1101,131,10,'१०'),
-    (1102,132,1,'१'),
-    (1103,132,2,'२'),
-    (1104,132,3,'३'),
-    (1105,132,4,'४'),
-    (1106,132,5,'५'),
-    (1107,132,6,'६'),
-    (1108,132,7,'७'),
-    (1109,132,8,'८'),
-    (1110,132,9,'९'),
-    (1111,132,10,'१०'),
-    (1112,132,11,'११'),
-    (1113,132,12,'१२'),
-    (1114,132,13,'१३'),
-    (1115,132,14,'१४'),
-    (1116,132,15,'१५'),
-    (1117,132,16,'१६'),
-    (1118,133,1,'१'),
-    (1119,133,2,'२'),
-    (1120,133,3,'३'),
-    (1121,133,4,'४'),
-    (1122,133,5,'५'),
-    (1123,133,6,'६'),
-    (1124,133,7,'७'),
-    (1125,133,8,'८'),
-    (1126,134,1,'१'),
-    (1127,134,2,'२'),
-    (1128,134,3,'३'),
-    (1129,134,4,'४'),
-    (1130,134,5,'५'),
-    (1131,135,1,'१'),
-    (1132,135,2,'२'),
-    (1133,135,3,'३'),
-    (1134,135,4,'४'),
-    (1135,135,5,'५'),
-    (1136,136,1,'१'),
-    (1137,136,2,'२'),
-    (1138,136,3,'३'),
-    (1139,136,4,'४'),
-    (1140,136,5,'५'),
-    (1141,136,6,'६'),
-    (1142,136,7,'७'),
-    (1143,136,8,'८'),
-    (1144,136,9,'९'),
-    (1145,136,10,'१०'),
-    (1146,136,11,'११'),
-    (1147,136,12,'१२'),
-    (1148,136,13,'१३'),
-    (1149,136,14,'१४'),
-    (1150,137,1,'१'),
-    (1151,137,2,'२'),
-    (1152,137,3,'३'),
-    (1153,137,4,'४'),
-    (1154,137,5,'५'),
-    (1155,137,6,'६'),
-    (1156,137,7,'७'),
-    (1157,137,8,'८'),
-    (1158,138,1,'१'),
-    (1159,138,2,'२'),
-    (1160,138,3,'३'),
-    (1161,138,4,'४'),
-    (1162,138,5,'५'),
-    (1163,138,6,'६'),
-    (1164,138,7,'७'),
-    (1165,138,8,'८'),
-    (1166,138,9,'९'),
-    (1167,138,10,'१०'),
-    (1168,138,11,'११'),
-    (1169,139,1,'१'),
-    (1170,139,2,'२'),
-    (1171,139,3,'३'),
-    (1172,139,4,'४'),
-    (1173,139,5,'५'),
-    (1174,139,6,'६'),
-    (1175,139,7,'७'),
-    (1176,139,8,'८'),
-    (1177,139,9,'९'),
-    (1178,139,10,'१०'),
-    (1179,139,11,'११'),
-    (1180,139,12,'१२'),
-    (1181,140,1,'१'),
-    (1182,140,2,'२'),
-    (1183,140,3,'३'),
-    (1184,140,4,'४'),
-    (1185,140,5,'५'),
-    (1186,140,6,'६'),
-    (1187,141,1,'१'),
-    (1188,141,2,'२'),
-    (1189,141,3,'३'),
-    (1190,141,4,'४'),
-    (1191,141,5,'५'),
-    (1192,141,6,'६'),
-    (1193,142,1,'१'),
-    (1194,142,2,'२'),
-    (1195,142,3,'३'),
-    (1196,142,4,'४'),
-    (1197,142,5,'५'),
-    (1198,142,6,'६'),
-    (1199,142,7,'७'),
-    (1200,142,8,'८'),
-    (1201,142,9,'९'),
-    (1202,142,10,'१०'),
-    (1203,142,11,'११'),
-    (1204,142,12,'१२'),
-    (1205,143,1,'१'),
-    (1206,143,2,'२'),
-    (1207,143,3,'३'),
-    (1208,143,4,'४'),
-    (1209,143,5,'५'),
-    (1210,143,6,'६'),
-    (1211,143,7,'७'),
-    (1212,143,8,'८'),
-    (1213,143,9,'९'),
-    (1214,143,10,'१०'),
-    (1215,143,11,'११'),
-    (1216,144,1,'१'),
-    (1217,144,2,'२'),
-    (1218,144,3,'३'),
-    (1219,144,4,'४'),
-    (1220,144,5,'५'),
-    (1221,144,6,'६'),
-    (1222,144,7,'७'),
-    (1223,144,8,'८'),
-    (1224,144,9,'९'),
-    (1225,144,10,'१०'),
-    (1226,144,11,'११'),
-    (1227,145,1,'१'),
-    (1228,145,2,'२'),
-    (1229,145,3,'३'),
-    (1230,145,4,'४'),
-    (1231,145,5,'५'),
-    (1232,145,6,'६'),
-    (1233,146,1,'१'),
-    (1234,146,2,'२'),
-    (1235,146,3,'३'),
-    (1236,146,4,'४'),
-    (1237,146,5,'५'),
-    (1238,146,6,'६'),
-    (1239,146,7,'७'),
-    (1240,146,8,'८'),
-    (1241,146,9,'९'),
-    (1242,146,10,'१०'),
-    (1243,147,1,'१'),
-    (1244,147,2,'२'),
-    (1245,147,3,'३'),
-    (1246,147,4,'४'),
-    (1247,147,5,'५'),
-    (1248,147,6,'६'),
-    (1249,147,7,'७'),
-    (1250,147,8,'८'),
-
-    (1251,147,9,'९'),
-    (1252,147,10,'१०'),
-    (1253,148,1,'१'),
-    (1254,148,2,'२'),
-    (1255,148,3,'३'),
-    (1256,148,4,'४'),
-    (1257,148,5,'५'),
-    (1258,148,6,'६'),
-    (1259,149,1,'१'),
-    (1260,149,2,'२'),
-    (1261,149,3,'३'),
-    (1262,149,4,'४'),
-    (1263,149,5,'५'),
-    (1264,149,6,'६'),
-    (1265,149,7,'७'),
-    (1266,150,1,'१'),
-    (1267,150,2,'२'),
-    (1268,150,3,'३'),
-    (1269,150,4,'४'),
-    (1270,150,5,'५'),
-    (1271,150,6,'६'),
-    (1272,150,7,'७'),
-    (1273,150,8,'८'),
-    (1274,150,9,'९'),
-    (1275,150,10,'१०'),
-    (1276,150,11,'११'),
-    (1277,150,12,'१२'),
-    (1278,150,13,'१३'),
-    (1279,150,14,'१४'),
-    (1280,150,15,'१५'),
-    (1281,150,16,'१६'),
-    (1282,151,1,'१'),
-    (1283,151,2,'२'),
-    (1284,151,3,'३'),
-    (1285,151,4,'४'),
-    (1286,151,5,'५'),
-    (1287,151,6,'६'),
-    (1288,152,1,'१'),
-    (1289,152,2,'२'),
-    (1290,152,3,'३'),
-    (1291,152,4,'४'),
-    (1292,152,5,'५'),
-    (1293,153,1,'१'),
-    (1294,153,2,'२'),
-    (1295,153,3,'३'),
-    (1296,153,4,'४'),
-    (1297,153,5,'५'),
-    (1298,153,6,'६'),
-    (1299,153,7,'७'),
-    (1300,153,8,'८'),
-    (1301,153,9,'९'),
-    (1302,153,10,'१०'),
-    (1303,153,11,'११'),
-    (1304,153,12,'१२'),
-    (1305,153,13,'१३'),
-    (1306,153,14,'१४'),
-    (1307,154,1,'१'),
-    (1308,154,2,'२'),
-    (1309,154,3,'३'),
-    (1310,154,4,'४'),
-    (1311,154,5,'५'),
-    (1312,154,6,'६'),
-    (1313,154,7,'७'),
-    (1314,154,8,'८'),
-    (1315,155,1,'१'),
-    (1316,155,2,'२'),
-    (1317,155,3,'३'),
-    (1318,155,4,'४'),
-    (1319,155,5,'५'),
-    (1320,155,6,'६'),
-    (1321,155,7,'७'),
-    (1322,156,1,'१'),
-    (1323,156,2,'२'),
-    (1324,156,3,'३'),
-    (1325,156,4,'४'),
-    (1326,156,5,'५'),
-    (1327,156,6,'६'),
-    (1328,156,7,'७'),
-    (1329,156,8,'८'),
-    (1330,156,9,'९'),
-    (1331,156,10,'१०'),
-    (1332,156,11,'११'),
-    (1333,156,12,'१२'),
-    (1334,156,13,'१३'),
-    (1335,156,14,'१४'),
-    (1336,156,15,'१५'),
-    (1337,156,16,'१६'),
-    (1338,156,17,'१७'),
-    (1339,156,18,'१८'),
-    (1340,156,19,'१९'),
-    (1341,156,20,'२०'),
-    (1342,156,21,'२१'),
-    (1343,156,22,'२२'),
-    (1344,156,23,'२३'),
-    (1345,156,24,'२४'),
-    (1346,157,1,'१'),
-    (1347,157,2,'२'),
-    (1348,157,3,'३'),
-    (1349,157,4,'४'),
-    (1350,157,5,'५'),
-    (1351,157,6,'६'),
-    (1352,157,7,'७'),
-    (1353,157,8,'८'),
-    (1354,157,9,'९'),
-    (1355,157,10,'१०'),
-    (1356,157,11,'११'),
-    (1357,157,12,'१२'),
-    (1358,157,13,'१३'),
-    (1359,157,14,'१४'),
-    (1360,158,1,'१'),
-    (1361,158,2,'२'),
-    (1362,158,3,'३'),
-    (1363,158,4,'४'),
-    (1364,158,5,'५'),
-    (1365,158,6,'६'),
-    (1366,158,7,'७'),
-    (1367,158,8,'८'),
-    (1368,158,9,'९'),
-    (1369,158,10,'१०'),
-    (1370,158,11,'११'),
-    (1371,158,12,'१२'),
-    (1372,158,13,'१३'),
-    (1373,159,1,'१'),
-    (1374,159,2,'२'),
-    (1375,159,3,'३'),
-    (1376,159,4,'४'),
-    (1377,159,5,'५'),
-    (1378,159,6,'६'),
-    (1379,159,7,'७'),
-    (1380,159,8,'८'),
-    (1381,159,9,'९'),
-    (1382,159,10,'१०'),
-    (1383,159,11,'११'),
-    (1384,159,12,'१२'),
-    (1385,160,1,'१'),
-    (1386,160,2,'२'),
-    (1387,160,3,'३'),
-    (1388,160,4,'४'),
-    (1389,160,5,'५'),
-    (1390,160,6,'६'),
-    (1391,160,7,'७'),
-    (1392,160,8,'८'),
-    (1393,160,9,'९'),
-    (1394,160,10,'१०'),
-    (1395,160,11,'११'),
-    (1396,161,1,'१'),
-    (1397,161,2,'२'),
-    (1398,161,3,'३'),
-    (1399,161,4,'४'),
-    (1400,161,5,'५'),
-    (1401,161,6,'६'),
-    (1402,161,7,'७'),
-    (1403,161,8,'८'),
-    (1404,161,9,'९'),
-    (1405,161,10,'१०'),
-    (1406,161,11,'११'),
-    (1407,161,12,'१२'),
-    (1408,162,1,'१'),
-    (1409,162,2,'२'),
-    (1410,162,3,'३'),
-    (1411,162,4,'४'),
-    (1412,162,5,'५'),
-    (1413,163,1,'१'),
-    (1414,163,2,'२'),
-    (1415,163,3,'३'),
-    (1416,163,4,'४'),
-    (1417,163,5,'५'),
-    (1418,164,1,'१'),
-    (1419,164,2,'२'),
-    (1420,164,3,'३'),
-    (1421,164,4,'४'),
-    (1422,164,5,'५'),
-    (1423,165,1,'१'),
-    (1424,165,2,'२'),
-    (1425,165,3,'३'),
-    (1426,165,4,'४'),
-    (1427,165,5,'५'),
-    (1428,165,6,'६'),
-    (1429,165,7,'७'),
-    (1430,165,8,'८'),
-    (1431,165,9,'९'),
-    (1432,165,10,'१०'),
-    (1433,166,1,'१'),
-    (1434,166,2,'२'),
-    (1435,166,3,'३'),
-    (1436,166,4,'४'),
-    (1437,166,5,'५'),
-    (1438,166,6,'६'),
-    (1439,167,1,'१'),
-    (1440,167,2,'२'),
-    (1441,167,3,'३'),
-    (1442,167,4,'४'),
-    (1443,167,5,'५'),
-    (1444,168,1,'१'),
-    (1445,168,2,'२'),
-    (1446,168,3,'३'),
-    (1447,168,4,'४'),
-    (1448,168,5,'५'),
-    (1449,169,1,'१'),
-    (1450,169,2,'२'),
-    (1451,169,3,'३'),
-    (1452,169,4,'४'),
-    (1453,169,5,'५'),
-    (1454,170,1,'१'),
-    (1455,170,2,'२'),
-    (1456,170,3,'३'),
-    (1457,170,4,'४'),
-    (1458,170,5,'५'),
-    (1459,171,1,'१'),
-    (1460,171,2,'२'),
-    (1461,171,3,'३'),
-    (1462,171,4,'४'),
-    (1463,171,5,'५'),
-    (1464,172,1,'१'),
-    (1465,172,2,'२'),
-    (1466,172,3,'३'),
-    (1467,172,4,'४'),
-    (1468,172,5,'५'),
-    (1469,172,6,'६'),
-    (1470,172,7,'७'),
-    (1471,172,8,'८'),
-    (1472,172,9,'९'),
-    (1473,172,10,'१०'),
-    (1474,172,11,'११'),
-    (1475,172,12,'१२'),
-    (1476,172,13,'१३'),
-    (1477,172,14,'१४'),
-    (1478,172,15,'१५'),
-    (1479,172,16,'१६'),
-    (1480,172,17,'१७'),
-    (1481,172,18,'१८'),
-    (1482,172,19,'१९'),
-    (1483,172,20,'२०'),
-    (1484,172,21,'२१'),
-    (1485,172,22,'२२'),
-    (1486,173,1,'१'),
-    (1487,173,2,'२'),
-    (1488,173,3,'३'),
-    (1489,173,4,'४'),
-    (1490,173,5,'५'),
-    (1491,173,6,'६'),
-    (1492,173,7,'७'),
-    (1493,173,8,'८'),
-    (1494,173,9,'९'),
-    (1495,173,10,'१०'),
-    (1496,173,11,'११'),
-    (1497,174,1,'१'),
-    (1498,174,2,'२'),
-    (1499,174,3,'३'),
-    (1500,174,4,'४'),
-
-    (1501,174,5,'५'),
-    (1502,174,6,'६'),
-    (1503,174,7,'७'),
-    (1504,174,8,'८'),
-    (1505,174,9,'९'),
-    (1506,175,1,'१'),
-    (1507,175,2,'२'),
-    (1508,175,3,'३'),
-    (1509,175,4,'४'),
-    (1510,175,5,'५'),
-    (1511,175,6,'६'),
-    (1512,175,7,'७'),
-    (1513,175,8,'८'),
-    (1514,175,9,'९'),
-    (1515,175,10,'१०'),
-    (1516,175,11,'११'),
-    (1517,176,1,'१'),
-    (1518,176,2,'२'),
-    (1519,176,3,'३'),
-    (1520,176,4,'४'),
-    (1521,176,5,'५'),
-    (1522,177,1,'१'),
-    (1523,177,2,'२'),
-    (1524,177,3,'३'),
-    (1525,177,4,'४'),
-    (1526,177,5,'५'),
-    (1527,177,6,'६'),
-    (1528,177,7,'७'),
-    (1529,177,8,'८'),
-    (1530,177,9,'९'),
-    (1531,177,10,'१०'),
-    (1532,178,1,'१'),
-    (1533,178,2,'२'),
-    (1534,178,3,'३'),
-    (1535,178,4,'४'),
-    (1536,178,5,'५'),
-    (1537,178,6,'६'),
-    (1538,178,7,'७'),
-    (1539,179,1,'१'),
-    (1540,179,2,'२'),
-    (1541,179,3,'३'),
-    (1542,179,4,'४'),
-    (1543,179,5,'५'),
-    (1544,179,6,'६'),
-    (1545,179,7,'७'),
-    (1546,179,8,'८'),
-    (1547,179,9,'९'),
-    (1548,179,10,'१०'),
-    (1549,180,1,'१'),
-    (1550,180,2,'२'),
-    (1551,180,3,'३'),
-    (1552,180,4,'४'),
-    (1553,180,5,'५'),
-    (1554,180,6,'६'),
-    (1555,180,7,'७'),
-    (1556,180,8,'८'),
-    (1557,180,9,'९'),
-    (1558,181,1,'१'),
-    (1559,181,2,'२'),
-    (1560,181,3,'३'),
-    (1561,181,4,'४'),
-    (1562,181,5,'५'),
-    (1563,181,6,'६'),
-    (1564,181,7,'७'),
-    (1565,181,8,'८'),
-    (1566,181,9,'९'),
-    (1567,181,10,'१०'),
-    (1568,181,11,'११'),
-    (1569,181,12,'१२'),
-    (1570,181,13,'१३'),
-    (1571,182,1,'१'),
-    (1572,182,2,'२'),
-    (1573,182,3,'३'),
-    (1574,182,4,'४'),
-    (1575,182,5,'५'),
-    (1576,182,6,'६'),
-    (1577,182,7,'७'),
-    (1578,182,8,'८'),
-    (1579,182,9,'९'),
-    (1580,183,1,'१'),
-    (1581,183,2,'२'),
-    (1582,183,3,'३'),
-    (1583,183,4,'४'),
-    (1584,183,5,'५'),
-    (1585,183,6,'६'),
-    (1586,183,7,'७'),
-    (1587,183,8,'८'),
-    (1588,183,9,'९'),
-    (1589,184,1,'१'),
-    (1590,184,2,'२'),
-    (1591,184,3,'३'),
-    (1592,184,4,'४'),
-    (1593,184,5,'५'),
-    (1594,184,6,'६'),
-    (1595,185,1,'१'),
-    (1596,185,2,'२'),
-    (1597,185,3,'३'),
-    (1598,185,4,'४'),
-    (1599,185,5,'५'),
-    (1600,185,6,'६'),
-    (1601,185,7,'७'),
-    (1602,185,8,'८'),
-    (1603,185,9,'९'),
-    (1604,186,1,'१'),
-    (1605,186,2,'२'),
-    (1606,186,3,'३'),
-    (1607,186,4,'४'),
-    (1608,186,5,'५'),
-    (1609,186,6,'६'),
-    (1610,187,1,'१'),
-    (1611,187,2,'२'),
-    (1612,187,3,'३'),
-    (1613,187,4,'४'),
-    (1614,187,5,'५'),
-    (1615,187,6,'६'),
-    (1616,187,7,'७'),
-    (1617,187,8,'८'),
-    (1618,187,9,'९'),
-    (1619,187,10,'१०'),
-    (1620,187,11,'११'),
-    (1621,187,12,'१२'),
-    (1622,187,13,'१३'),
-    (1623,187,14,'१४'),
-    (1624,187,15,'१५'),
-    (1625,187,16,'१६'),
-    (1626,187,17,'१७'),
-    (1627,187,18,'१८'),
-    (1628,187,19,'१९'),
-    (1629,187,20,'२०'),
-    (1630,187,21,'२१'),
-    (1631,187,22,'२२'),
-    (1632,187,23,'२३'),
-    (1633,187,24,'२४'),
-    (1634,187,25,'२५'),
-    (1635,188,1,'१'),
-    (1636,188,2,'२'),
-    (1637,188,3,'३'),
-    (1638,188,4,'४'),
-    (1639,188,5,'५'),
-    (1640,189,1,'१'),
-    (1641,189,2,'२'),
-    (1642,189,3,'३'),
-    (1643,189,4,'४'),
-    (1644,189,5,'५'),
-    (1645,189,6,'६'),
-    (1646,189,7,'७'),
-    (1647,189,8,'८'),
-    (1648,189,9,'९'),
-    (1649,190,1,'१'),
-    (1650,190,2,'२'),
-    (1651,190,3,'३'),
-    (1652,190,4,'४'),
-    (1653,190,5,'५'),
-    (1654,190,6,'६'),
-    (1655,191,1,'१'),
-    (1656,191,2,'२'),
-    (1657,191,3,'३'),
-    (1658,191,4,'४'),
-    (1659,191,5,'५'),
-    (1660,191,6,'६'),
-    (1661,191,7,'७'),
-    (1662,191,8,'८'),
-    (1663,191,9,'९'),
-    (1664,191,10,'१०'),
-    (1665,191,11,'११'),
-    (1666,191,12,'१२'),
-    (1667,191,13,'१३'),
-    (1668,191,14,'१४'),
-    (1669,192,1,'१'),
-    (1670,192,2,'२'),
-    (1671,192,3,'३'),
-    (1672,192,4,'४'),
-    (1673,192,5,'५'),
-    (1674,192,6,'६'),
-    (1675,192,7,'७'),
-    (1676,192,8,'८'),
-    (1677,192,9,'९'),
-    (1678,192,10,'१०'),
-    (1679,192,11,'११'),
-    (1680,192,12,'१२'),
-    (1681,193,1,'१'),
-    (1682,193,2,'२'),
-    (1683,193,3,'३'),
-    (1684,193,4,'४'),
-    (1685,193,5,'५'),
-    (1686,193,6,'६'),
-    (1687,193,7,'७'),
-    (1688,193,8,'८'),
-    (1689,194,1,'१'),
-    (1690,194,2,'२'),
-    (1691,194,3,'३'),
-    (1692,194,4,'४'),
-    (1693,194,5,'५'),
-    (1694,194,6,'६'),
-    (1695,194,7,'७'),
-    (1696,194,8,'८'),
-    (1697,194,9,'९'),
-    (1698,195,1,'१'),
-    (1699,195,2,'२'),
-    (1700,195,3,'३'),
-    (1701,195,4,'४'),
-    (1702,195,5,'५'),
-    (1703,195,6,'६'),
-    (1704,195,7,'७'),
-    (1705,195,8,'८'),
-    (1706,195,9,'९'),
-    (1707,196,1,'१'),
-    (1708,196,2,'२'),
-    (1709,196,3,'३'),
-    (1710,196,4,'४'),
-    (1711,196,5,'५'),
-    (1712,196,6,'६'),
-    (1713,196,7,'७'),
-    (1714,196,8,'८'),
-    (1715,196,9,'९'),
-    (1716,197,1,'१'),
-    (1717,197,2,'२'),
-    (1718,197,3,'३'),
-    (1719,197,4,'४'),
-    (1720,197,5,'५'),
-    (1721,197,6,'६'),
-    (1722,197,7,'७'),
-    (1723,197,8,'८'),
-    (1724,197,9,'९'),
-    (1725,197,10,'१०'),
-    (1726,197,11,'११'),
-    (1727,198,1,'१'),
-    (1728,198,2,'२'),
-    (1729,198,3,'३'),
-    (1730,198,4,'४'),
-    (1731,198,5,'५'),
-    (1732,198,6,'६'),
-    (1733,198,7,'७'),
-    (1734,198,8,'८'),
-    (1735,198,9,'९'),
-    (1736,199,1,'१'),
-    (1737,199,2,'२'),
-    (1738,199,3,'३'),
-    (1739,199,4,'४'),
-    (1740,199,5,'५'),
-    (1741,199,6,'६'),
-    (1742,199,7,'७'),
-    (1743,200,1,'१'),
-    (1744,200,2,'२'),
-    (1745,200,3,'३'),
-    (1746,200,4,'४'),
-    (1747,200,5,'५'),
-    (1748,200,6,'६'),
-    (1749,200,7,'७'),
-    (1750,200,8,'८'),
-
-    (1751,200,9,'९'),
-    (1752,200,10,'१०'),
-    (1753,201,1,'१'),
-    (1754,201,2,'२'),
-    (1755,201,3,'३'),
-    (1756,201,4,'४'),
-    (1757,201,5,'५'),
-    (1758,201,6,'६'),
-    (1759,202,1,'१'),
-    (1760,202,2,'२'),
-    (1761,202,3,'३'),
-    (1762,202,4,'४'),
-    (1763,202,5,'५'),
-    (1764,202,6,'६'),
-    (1765,203,1,'१'),
-    (1766,203,2,'२'),
-    (1767,203,3,'३'),
-    (1768,203,4,'४'),
-    (1769,203,5,'५'),
-    (1770,203,6,'६'),
-    (1771,203,7,'७'),
-    (1772,204,1,'१'),
-    (1773,204,2,'२'),
-    (1774,204,3,'३'),
-    (1775,204,4,'४'),
-    (1776,204,5,'५'),
-    (1777,204,6,'६'),
-    (1778,204,7,'७'),
-    (1779,204,8,'८'),
-    (1780,204,9,'९'),
-    (1781,205,1,'१'),
-    (1782,205,2,'२'),
-    (1783,205,3,'३'),
-    (1784,205,4,'४'),
-    (1785,205,5,'५'),
-    (1786,205,6,'६'),
-    (1787,205,7,'७'),
-    (1788,205,8,'८'),
-    (1789,205,9,'९'),
-    (1790,205,10,'१०'),
-    (1791,205,11,'११'),
-    (1792,205,12,'१२'),
-    (1793,206,1,'१'),
-    (1794,206,2,'२'),
-    (1795,206,3,'३'),
-    (1796,206,4,'४'),
-    (1797,206,5,'५'),
-    (1798,206,6,'६'),
-    (1799,206,7,'७'),
-    (1800,206,8,'८'),
-    (1801,206,9,'९'),
-    (1802,206,10,'१०'),
-    (1803,206,11,'११'),
-    (1804,206,12,'१२'),
-    (1805,206,13,'१३'),
-    (1806,206,14,'१४'),
-    (1807,206,15,'१५'),
-    (1808,206,16,'१६'),
-    (1809,206,17,'१७'),
-    (1810,207,1,'१'),
-    (1811,207,2,'२'),
-    (1812,207,3,'३'),
-    (1813,207,4,'४'),
-    (1814,207,5,'५'),
-    (1815,207,6,'६'),
-    (1816,207,7,'७'),
-    (1817,207,8,'८'),
-    (1818,207,9,'९'),
-    (1819,207,10,'१०'),
-    (1820,207,11,'११'),
-    (1821,208,1,'१'),
-    (1822,208,2,'२'),
-    (1823,208,3,'३'),
-    (1824,208,4,'४'),
-    (1825,208,5,'५'),
-    (1826,208,6,'६'),
-    (1827,208,7,'७'),
-    (1828,208,8,'८'),
-    (1829,208,9,'९'),
-    (1830,208,10,'१०'),
-    (1831,208,11,'११'),
-    (1832,208,12,'१२'),
-    (1833,209,1,'१'),
-    (1834,209,2,'२'),
-    (1835,209,3,'३'),
-    (1836,209,4,'४'),
-    (1837,209,5,'५'),
-    (1838,209,6,'६'),
-    (1839,209,7,'७'),
-    (1840,209,8,'८'),
-    (1841,209,9,'९'),
-    (1842,209,10,'१०'),
-    (1843,209,11,'११'),
-    (1844,209,12,'१२'),
-    (1845,209,13,'१३'),
-    (1846,209,14,'१४'),
-    (1847,209,15,'१५'),
-    (1848,209,16,'१६'),
-    (1849,209,17,'१७'),
-    (1850,209,18,'१८'),
-    (1851,210,1,'१'),
-    (1852,210,2,'२'),
-    (1853,210,3,'३'),
-    (1854,210,4,'४'),
-    (1855,210,5,'५'),
-    (1856,210,6,'६'),
-    (1857,210,7,'७'),
-    (1858,210,8,'८'),
-    (1859,210,9,'९'),
-    (1860,211,1,'१'),
-    (1861,211,2,'२'),
-    (1862,211,3,'३'),
-    (1863,211,4,'४'),
-    (1864,211,5,'५'),
-    (1865,211,6,'६'),
-    (1866,211,7,'७'),
-    (1867,211,8,'८'),
-    (1868,211,9,'९'),
-    (1869,211,10,'१०'),
-    (1870,211,11,'११'),
-    (1871,211,12,'१२'),
-    (1872,211,13,'१३'),
-    (1873,211,14,'१४'),
-    (1874,211,15,'१५'),
-    (1875,212,1,'१'),
-    (1876,212,2,'२'),
-    (1877,212,3,'३'),
-    (1878,212,4,'४'),
-    (1879,212,5,'५'),
-    (1880,212,6,'६'),
-    (1881,212,7,'७'),
-    (1882,212,8,'८'),
-    (1883,212,9,'९'),
-    (1884,213,1,'१'),
-    (1885,213,2,'२'),
-    (1886,213,3,'३'),
-    (1887,213,4,'४'),
-    (1888,213,5,'५'),
-    (1889,213,6,'६'),
-    (1890,214,1,'१'),
-    (1891,214,2,'२'),
-    (1892,214,3,'३'),
-    (1893,214,4,'४'),
-    (1894,214,5,'५'),
-    (1895,214,6,'६'),
-    (1896,214,7,'७'),
-    (1897,215,1,'१'),
-    (1898,215,2,'२'),
-    (1899,215,3,'३'),
-    (1900,215,4,'४'),
-    (1901,215,5,'५'),
-    (1902,215,6,'६'),
-    (1903,215,7,'७'),
-    (1904,216,1,'१'),
-    (1905,216,2,'२'),
-    (1906,216,3,'३'),
-    (1907,216,4,'४'),
-    (1908,216,5,'५'),
-    (1909,216,6,'६'),
-    (1910,216,7,'७'),
-    (1911,216,8,'८'),
-    (1912,216,9,'९'),
-    (1913,216,10,'१०'),
-    (1914,217,1,'१'),
-    (1915,217,2,'२'),
-    (1916,217,3,'३'),
-    (1917,217,4,'४'),
-    (1918,217,5,'५'),
-    (1919,217,6,'६'),
-    (1920,217,7,'७'),
-    (1921,217,8,'८'),
-    (1922,217,9,'९'),
-    (1923,218,1,'१'),
-    (1924,218,2,'२'),
-    (1925,218,3,'३'),
-    (1926,218,4,'४'),
-    (1927,218,5,'५'),
-    (1928,218,6,'६'),
-    (1929,219,1,'१'),
-    (1930,219,2,'२'),
-    (1931,219,3,'३'),
-    (1932,219,4,'४'),
-    (1933,219,5,'५'),
-    (1934,219,6,'६'),
-    (1935,219,7,'७'),
-    (1936,220,1,'१'),
-    (1937,220,2,'२'),
-    (1938,220,3,'३'),
-    (1939,220,4,'४'),
-    (1940,220,5,'५'),
-    (1941,220,6,'६'),
-    (1942,220,7,'७'),
-    (1943,221,1,'१'),
-    (1944,221,2,'२'),
-    (1945,221,3,'३'),
-    (1946,221,4,'४'),
-    (1947,221,5,'५'),
-    (1948,221,6,'६'),
-    (1949,221,7,'७'),
-    (1950,221,8,'८'),
-    (1951,221,9,'९'),
-    (1952,221,10,'१०'),
-    (1953,221,11,'११'),
-    (1954,222,1,'१'),
-    (1955,222,2,'२'),
-    (1956,222,3,'३'),
-    (1957,222,4,'४'),
-    (1958,222,5,'५'),
-    (1959,222,6,'६'),
-    (1960,222,7,'७'),
-    (1961,222,8,'८'),
-    (1962,222,9,'९'),
-    (1963,222,10,'१०'),
-    (1964,222,11,'११'),
-    (1965,222,12,'१२'),
-    (1966,223,1,'१'),
-    (1967,223,2,'२'),
-    (1968,223,3,'३'),
-    (1969,223,4,'४'),
-    (1970,223,5,'५'),
-    (1971,223,6,'६'),
-    (1972,223,7,'७'),
-    (1973,223,8,'८'),
-    (1974,224,1,'१'),
-    (1975,224,2,'२'),
-    (1976,224,3,'३'),
-    (1977,224,4,'४'),
-    (1978,224,5,'५'),
-    (1979,224,6,'६'),
-    (1980,224,7,'७'),
-    (1981,225,1,'१'),
-    (1982,225,2,'२'),
-    (1983,225,3,'३'),
-    (1984,225,4,'४'),
-    (1985,225,5,'५'),
-    (1986,225,6,'६'),
-    (1987,225,7,'७'),
-    (1988,225,8,'८'),
-    (1989,225,9,'९'),
-    (1990,225,10,'१०'),
-    (1991,225,11,'११'),
-    (1992,225,12,'१२'),
-    (1993,226,1,'१'),
-    (1994,226,2,'२'),
-    (1995,226,3,'३'),
-    (1996,226,4,'४'),
-    (1997,226,5,'५'),
-    (1998,226,6,'६'),
-    (1999,226,7,'७'),
-    (2000,226,8,'८'),
-
-    (2001,226,9,'९'),
-    (2002,226,10,'१०'),
-    (2003,227,1,'१'),
-    (2004,227,2,'२'),
-    (2005,227,3,'३'),
-    (2006,227,4,'४'),
-    (2007,227,5,'५'),
-    (2008,227,6,'६'),
-    (2009,227,7,'७'),
-    (2010,227,8,'८'),
-    (2011,227,9,'९'),
-    (2012,228,1,'१'),
-    (2013,228,2,'२'),
-    (2014,228,3,'३'),
-    (2015,228,4,'४'),
-    (2016,228,5,'५'),
-    (2017,228,6,'६'),
-    (2018,228,7,'७'),
-    (2019,228,8,'८'),
-    (2020,228,9,'९'),
-    (2021,228,10,'१०'),
-    (2022,228,11,'११'),
-    (2023,229,1,'१'),
-    (2024,229,2,'२'),
-    (2025,229,3,'३'),
-    (2026,229,4,'४'),
-    (2027,229,5,'५'),
-    (2028,229,6,'६'),
-    (2029,229,7,'७'),
-    (2030,229,8,'८'),
-    (2031,229,9,'९'),
-    (2032,230,1,'१'),
-    (2033,230,2,'२'),
-    (2034,230,3,'३'),
-    (2035,230,4,'४'),
-    (2036,230,5,'५'),
-    (2037,230,6,'६'),
-    (2038,230,7,'७'),
-    (2039,230,8,'८'),
-    (2040,230,9,'९'),
-    (2041,231,1,'१'),
-    (2042,231,2,'२'),
-    (2043,231,3,'३'),
-    (2044,231,4,'४'),
-    (2045,231,5,'५'),
-    (2046,231,6,'६'),
-    (2047,231,7,'७'),
-    (2048,231,8,'८'),
-    (2049,231,9,'९'),
-    (2050,232,1,'१'),
-    (2051,232,2,'२'),
-    (2052,232,3,'३'),
-    (2053,232,4,'४'),
-    (2054,232,5,'५'),
-    (2055,232,6,'६'),
-    (2056,232,7,'७'),
-    (2057,232,8,'८'),
-    (2058,232,9,'९'),
-    (2059,233,1,'१'),
-    (2060,233,2,'२'),
-    (2061,233,3,'३'),
-    (2062,233,4,'४'),
-    (2063,233,5,'५'),
-    (2064,233,6,'६'),
-    (2065,233,7,'७'),
-    (2066,233,8,'८'),
-    (2067,233,9,'९'),
-    (2068,234,1,'१'),
-    (2069,234,2,'२'),
-    (2070,234,3,'३'),
-    (2071,234,4,'४'),
-    (2072,234,5,'५'),
-    (2073,234,6,'६'),
-    (2074,234,7,'७'),
-    (2075,234,8,'८'),
-    (2076,234,9,'९'),
-    (2077,235,1,'१'),
-    (2078,235,2,'२'),
-    (2079,235,3,'३'),
-    (2080,235,4,'४'),
-    (2081,235,5,'५'),
-    (2082,235,6,'६'),
-    (2083,235,7,'७'),
-    (2084,235,8,'८'),
-    (2085,235,9,'९'),
-    (2086,236,1,'१'),
-    (2087,236,2,'२'),
-    (2088,236,3,'३'),
-    (2089,236,4,'४'),
-    (2090,236,5,'५'),
-    (2091,236,6,'६'),
-    (2092,236,7,'७'),
-    (2093,236,8,'८'),
-    (2094,236,9,'९'),
-    (2095,237,1,'१'),
-    (2096,237,2,'२'),
-    (2097,237,3,'३'),
-    (2098,237,4,'४'),
-    (2099,237,5,'५'),
-    (2100,237,6,'६'),
-    (2101,237,7,'७'),
-    (2102,237,8,'८'),
-    (2103,237,9,'९'),
-    (2104,238,1,'१'),
-    (2105,238,2,'२'),
-    (2106,238,3,'३'),
-    (2107,238,4,'४'),
-    (2108,238,5,'५'),
-    (2109,238,6,'६'),
-    (2110,238,7,'७'),
-    (2111,238,8,'८'),
-    (2112,238,9,'९'),
-    (2113,239,1,'१'),
-    (2114,239,2,'२'),
-    (2115,239,3,'३'),
-    (2116,239,4,'४'),
-    (2117,239,5,'५'),
-    (2118,240,1,'१'),
-    (2119,240,2,'२'),
-    (2120,240,3,'३'),
-    (2121,240,4,'४'),
-    (2122,240,5,'५'),
-    (2123,241,1,'१'),
-    (2124,241,2,'२'),
-    (2125,241,3,'३'),
-    (2126,241,4,'४'),
-    (2127,241,5,'५'),
-    (2128,241,6,'६'),
-    (2129,241,7,'७'),
-    (2130,241,8,'८'),
-    (2131,241,9,'९'),
-    (2132,242,1,'१'),
-    (2133,242,2,'२'),
-    (2134,242,3,'३'),
-    (2135,242,4,'४'),
-    (2136,242,5,'५'),
-    (2137,242,6,'६'),
-    (2138,242,7,'७'),
-    (2139,242,8,'८'),
-    (2140,242,9,'९'),
-    (2141,243,1,'१'),
-    (2142,243,2,'२'),
-    (2143,243,3,'३'),
-    (2144,243,4,'४'),
-    (2145,243,5,'५'),
-    (2146,243,6,'६'),
-    (2147,243,7,'७'),
-    (2148,243,8,'८'),
-    (2149,243,9,'९'),
-    (2150,244,1,'१'),
-    (2151,244,2,'२'),
-    (2152,244,3,'३'),
-    (2153,244,4,'४'),
-    (2154,244,5,'५'),
-    (2155,244,6,'६'),
-    (2156,244,7,'७'),
-    (2157,244,8,'८'),
-    (2158,244,9,'९'),
-    (2159,244,10,'१०'),
-    (2160,244,11,'११'),
-    (2161,244,12,'१२'),
-    (2162,244,13,'१३'),
-    (2163,245,1,'१'),
-    (2164,245,2,'२'),
-    (2165,245,3,'३'),
-    (2166,245,4,'४'),
-    (2167,245,5,'५'),
-    (2168,245,6,'६'),
-    (2169,245,7,'७'),
-    (2170,245,8,'८'),
-    (2171,245,9,'९'),
-    (2172,245,10,'१०'),
-    (2173,245,11,'११'),
-    (2174,246,1,'१'),
-    (2175,246,2,'२'),
-    (2176,246,3,'३'),
-    (2177,246,4,'४'),
-    (2178,246,5,'५'),
-    (2179,246,6,'६'),
-    (2180,246,7,'७'),
-    (2181,246,8,'८'),
-    (2182,246,9,'९'),
-    (2183,246,10,'१०'),
-    (2184,246,11,'११'),
-    (2185,246,12,'१२'),
-    (2186,246,13,'१३'),
-    (2187,246,14,'१४'),
-    (2188,246,15,'१५'),
-    (2189,246,16,'१६'),
-    (2190,246,17,'१७'),
-    (2191,246,18,'१८'),
-    (2192,246,19,'१९'),
-    (2193,246,20,'२०'),
-    (2194,246,21,'२१'),
-    (2195,246,22,'२२'),
-    (2196,246,23,'२३'),
-    (2197,246,24,'२४'),
-    (2198,247,1,'१'),
-    (2199,247,2,'२'),
-    (2200,247,3,'३'),
-    (2201,247,4,'४'),
-    (2202,247,5,'५'),
-    (2203,248,1,'१'),
-    (2204,248,2,'२'),
-    (2205,248,3,'३'),
-    (2206,248,4,'४'),
-    (2207,248,5,'५'),
-    (2208,248,6,'६'),
-    (2209,248,7,'७'),
-    (2210,249,1,'१'),
-    (2211,249,2,'२'),
-    (2212,249,3,'३'),
-    (2213,249,4,'४'),
-    (2214,249,5,'५'),
-    (2215,250,1,'१'),
-    (2216,250,2,'२'),
-    (2217,250,3,'३'),
-    (2218,250,4,'४'),
-    (2219,250,5,'५'),
-    (2220,250,6,'६'),
-    (2221,250,7,'७'),
-    (2222,251,1,'१'),
-    (2223,251,2,'२'),
-    (2224,251,3,'३'),
-    (2225,251,4,'४'),
-    (2226,251,5,'५'),
-    (2227,251,6,'६'),
-    (2228,251,7,'७'),
-    (2229,251,8,'८'),
-    (2230,251,9,'९'),
-    (2231,251,10,'१०'),
-    (2232,251,11,'११'),
-    (2233,251,12,'१२'),
-    (2234,251,13,'१३'),
-    (2235,251,14,'१४'),
-    (2236,251,15,'१५'),
-    (2237,251,16,'१६'),
-    (2238,251,17,'१७'),
-    (2239,251,18,'१८'),
-    (2240,251,19,'१९'),
-    (2241,251,20,'२०'),
-    (2242,251,21,'२१'),
-    (2243,251,22,'२२'),
-    (2244,251,23,'२३'),
-    (2245,251,24,'२४'),
-    (2246,251,25,'२५'),
-    (2247,251,26,'२६'),
-    (2248,251,27,'२७'),
-    (2249,252,1,'१'),
-    (2250,252,2,'२'),
-
-    (2251,252,3,'३'),
-    (2252,252,4,'४'),
-    (2253,252,5,'५'),
-    (2254,252,6,'६'),
-    (2255,252,7,'७'),
-    (2256,252,8,'८'),
-    (2257,253,1,'१'),
-    (2258,253,2,'२'),
-    (2259,253,3,'३'),
-    (2260,253,4,'४'),
-    (2261,253,5,'५'),
-    (2262,253,6,'६'),
-    (2263,254,1,'१'),
-    (2264,254,2,'२'),
-    (2265,254,3,'३'),
-    (2266,254,4,'४'),
-    (2267,254,5,'५'),
-    (2268,254,6,'६'),
-    (2269,254,7,'७'),
-    (2270,254,8,'८'),
-    (2271,255,1,'१'),
-    (2272,255,2,'२'),
-    (2273,255,3,'३'),
-    (2274,255,4,'४'),
-    (2275,255,5,'५'),
-    (2276,255,6,'६'),
-    (2277,255,7,'७'),
-    (2278,255,8,'८'),
-    (2279,255,9,'९'),
-    (2280,255,10,'१०'),
-    (2281,255,11,'११'),
-    (2282,256,1,'१'),
-    (2283,256,2,'२'),
-    (2284,256,3,'३'),
-    (2285,256,4,'४'),
-    (2286,256,5,'५'),
-    (2287,256,6,'६'),
-    (2288,256,7,'७'),
-    (2289,256,8,'८'),
-    (2290,256,9,'९'),
-    (2291,257,1,'१'),
-    (2292,257,2,'२'),
-    (2293,257,3,'३'),
-    (2294,257,4,'४'),
-    (2295,257,5,'५'),
-    (2296,257,6,'६'),
-    (2297,257,7,'७'),
-    (2298,257,8,'८'),
-    (2299,257,9,'९'),
-    (2300,257,10,'१०'),
-    (2301,257,11,'११'),
-    (2302,258,1,'१'),
-    (2303,258,2,'२'),
-    (2304,258,3,'३'),
-    (2305,258,4,'४'),
-    (2306,258,5,'५'),
-    (2307,258,6,'६'),
-    (2308,258,7,'७'),
-    (2309,259,1,'१'),
-    (2310,259,2,'२'),
-    (2311,259,3,'३'),
-    (2312,259,4,'४'),
-    (2313,259,5,'५'),
-    (2314,259,6,'६'),
-    (2315,259,7,'७'),
-    (2316,259,8,'८'),
-    (2317,260,1,'१'),
-    (2318,260,2,'२'),
-    (2319,260,3,'३'),
-    (2320,260,4,'४'),
-    (2321,260,5,'५'),
-    (2322,261,1,'१'),
-    (2323,261,2,'२'),
-    (2324,261,3,'३'),
-    (2325,261,4,'४'),
-    (2326,261,5,'५'),
-    (2327,262,1,'१'),
-    (2328,262,2,'२'),
-    (2329,262,3,'३'),
-    (2330,262,4,'४'),
-    (2331,262,5,'५'),
-    (2332,262,6,'६'),
-    (2333,263,1,'१'),
-    (2334,263,2,'२'),
-    (2335,263,3,'३'),
-    (2336,263,4,'४'),
-    (2337,263,5,'५'),
-    (2338,264,1,'१'),
-    (2339,264,2,'२'),
-    (2340,264,3,'३'),
-    (2341,264,4,'४'),
-    (2342,264,5,'५'),
-    (2343,264,6,'६'),
-    (2344,265,1,'१'),
-    (2345,265,2,'२'),
-    (2346,265,3,'३'),
-    (2347,265,4,'४'),
-    (2348,265,5,'५'),
-    (2349,265,6,'६'),
-    (2350,265,7,'७'),
-    (2351,265,8,'८'),
-    (2352,265,9,'९'),
-    (2353,266,1,'१'),
-    (2354,266,2,'२'),
-    (2355,266,3,'३'),
-    (2356,266,4,'४'),
-    (2357,266,5,'५'),
-    (2358,266,6,'६'),
-    (2359,266,7,'७'),
-    (2360,266,8,'८'),
-    (2361,266,9,'९'),
-    (2362,266,10,'१०'),
-    (2363,266,11,'११'),
-    (2364,266,12,'१२'),
-    (2365,266,13,'१३'),
-    (2366,266,14,'१४'),
-    (2367,266,15,'१५'),
-    (2368,266,16,'१६'),
-    (2369,266,17,'१७'),
-    (2370,266,18,'१८'),
-    (2371,266,19,'१९'),
-    (2372,266,20,'२०'),
-    (2373,266,21,'२१'),
-    (2374,266,22,'२२'),
-    (2375,266,23,'२३'),
-    (2376,266,24,'२४'),
-    (2377,266,25,'२५'),
-    (2378,266,26,'२६'),
-    (2379,266,27,'२७'),
-    (2380,266,28,'२८'),
-    (2381,266,29,'२९'),
-    (2382,266,30,'३०'),
-    (2383,266,31,'३१'),
-    (2384,266,32,'३२'),
-    (2385,267,1,'१'),
-    (2386,267,2,'२'),
-    (2387,267,3,'३'),
-    (2388,267,4,'४'),
-    (2389,267,5,'५'),
-    (2390,267,6,'६'),
-    (2391,267,7,'७'),
-    (2392,267,8,'८'),
-    (2393,267,9,'९'),
-    (2394,268,1,'१'),
-    (2395,268,2,'२'),
-    (2396,268,3,'३'),
-    (2397,268,4,'४'),
-    (2398,268,5,'५'),
-    (2399,268,6,'६'),
-    (2400,268,7,'७'),
-    (2401,268,8,'८'),
-    (2402,268,9,'९'),
-    (2403,268,10,'१०'),
-    (2404,269,1,'१'),
-    (2405,269,2,'२'),
-    (2406,269,3,'३'),
-    (2407,269,4,'४'),
-    (2408,269,5,'५'),
-    (2409,270,1,'१'),
-    (2410,270,2,'२'),
-    (2411,270,3,'३'),
-    (2412,270,4,'४'),
-    (2413,270,5,'५'),
-    (2414,271,1,'१'),
-    (2415,271,2,'२'),
-    (2416,271,3,'३'),
-    (2417,271,4,'४'),
-    (2418,271,5,'५'),
-    (2419,272,1,'१'),
-    (2420,272,2,'२'),
-    (2421,272,3,'३'),
-    (2422,272,4,'४'),
-    (2423,272,5,'५'),
-    (2424,273,1,'१'),
-    (2425,273,2,'२'),
-    (2426,273,3,'३'),
-    (2427,273,4,'४'),
-    (2428,273,5,'५'),
-    (2429,274,1,'१'),
-    (2430,274,2,'२'),
-    (2431,274,3,'३'),
-    (2432,274,4,'४'),
-    (2433,274,5,'५'),
-    (2434,274,6,'६'),
-    (2435,274,7,'७'),
-    (2436,274,8,'८'),
-    (2437,274,9,'९'),
-    (2438,275,1,'१'),
-    (2439,275,2,'२'),
-    (2440,275,3,'३'),
-    (2441,275,4,'४'),
-    (2442,275,5,'५'),
-    (2443,275,6,'६'),
-    (2444,275,7,'७'),
-    (2445,275,8,'८'),
-    (2446,276,1,'१'),
-    (2447,276,2,'२'),
-    (2448,276,3,'३'),
-    (2449,276,4,'४'),
-    (2450,276,5,'५'),
-    (2451,276,6,'६'),
-    (2452,276,7,'७'),
-    (2453,276,8,'८'),
-    (2454,276,9,'९'),
-    (2455,277,1,'१'),
-    (2456,277,2,'२'),
-    (2457,277,3,'३'),
-    (2458,277,4,'४'),
-    (2459,277,5,'५'),
-    (2460,277,6,'६'),
-    (2461,277,7,'७'),
-    (2462,277,8,'८'),
-    (2463,278,1,'१'),
-    (2464,278,2,'२'),
-    (2465,278,3,'३'),
-    (2466,278,4,'४'),
-    (2467,278,5,'५'),
-    (2468,278,6,'६'),
-    (2469,278,7,'७'),
-    (2470,278,8,'८'),
-    (2471,278,9,'९'),
-    (2472,279,1,'१'),
-    (2473,279,2,'२'),
-    (2474,279,3,'३'),
-    (2475,279,4,'४'),
-    (2476,279,5,'५'),
-    (2477,279,6,'६'),
-    (2478,279,7,'७'),
-    (2479,280,1,'१'),
-    (2480,280,2,'२'),
-    (2481,280,3,'३'),
-    (2482,280,4,'४'),
-    (2483,280,5,'५'),
-    (2484,280,6,'६'),
-    (2485,280,7,'७'),
-    (2486,281,1,'१'),
-    (2487,281,2,'२'),
-    (2488,281,3,'३'),
-    (2489,281,4,'४'),
-    (2490,281,5,'५'),
-    (2491,281,6,'६'),
-    (2492,281,7,'७'),
-    (2493,281,8,'८'),
-    (2494,282,1,'१'),
-    (2495,282,2,'२'),
-    (2496,282,3,'३'),
-    (2497,282,4,'४'),
-    (2498,282,5,'५'),
-    (2499,282,6,'६'),
-    (2500,282,7,'७'),
-
-
-    (2501,282,8,'८'),
-    (2502,282,9,'९'),
-    (2503,283,1,'१'),
-    (2504,283,2,'२'),
-    (2505,283,3,'३'),
-    (2506,283,4,'४'),
-    (2507,283,5,'५'),
-    (2508,284,1,'१'),
-    (2509,284,2,'२'),
-    (2510,284,3,'३'),
-    (2511,284,4,'४'),
-    (2512,284,5,'५'),
-    (2513,284,6,'६'),
-    (2514,284,7,'७'),
-    (2515,285,1,'१'),
-    (2516,285,2,'२'),
-    (2517,285,3,'३'),
-    (2518,285,4,'४'),
-    (2519,285,5,'५'),
-    (2520,285,6,'६'),
-    (2521,285,7,'७'),
-    (2522,285,8,'८'),
-    (2523,286,1,'१'),
-    (2524,286,2,'२'),
-    (2525,286,3,'३'),
-    (2526,286,4,'४'),
-    (2527,286,5,'५'),
-    (2528,286,6,'६'),
-    (2529,286,7,'७'),
-    (2530,287,1,'१'),
-    (2531,287,2,'२'),
-    (2532,287,3,'३'),
-    (2533,287,4,'४'),
-    (2534,287,5,'५'),
-    (2535,287,6,'६'),
-    (2536,287,7,'७'),
-    (2537,287,8,'८'),
-    (2538,287,9,'९'),
-    (2539,287,10,'१०'),
-    (2540,287,11,'११'),
-    (2541,287,12,'१२'),
-    (2542,287,13,'१३'),
-    (2543,288,1,'१'),
-    (2544,288,2,'२'),
-    (2545,288,3,'३'),
-    (2546,288,4,'४'),
-    (2547,288,5,'५'),
-    (2548,288,6,'६'),
-    (2549,288,7,'७'),
-    (2550,288,8,'८'),
-    (2551,288,9,'९'),
-    (2552,288,10,'१०'),
-    (2553,288,11,'११'),
-    (2554,288,12,'१२'),
-    (2555,289,1,'१'),
-    (2556,289,2,'२'),
-    (2557,289,3,'३'),
-    (2558,289,4,'४'),
-    (2559,289,5,'५'),
-    (2560,289,6,'६'),
-    (2561,289,7,'७'),
-    (2562,289,8,'८'),
-    (2563,289,9,'९'),
-    (2564,289,10,'१०'),
-    (2565,289,11,'११'),
-    (2566,289,12,'१२'),
-    (2567,289,13,'१३'),
-    (2568,289,14,'१४'),
-    (2569,290,1,'१'),
-    (2570,290,2,'२'),
-    (2571,290,3,'३'),
-    (2572,290,4,'४'),
-    (2573,290,5,'५'),
-    (2574,290,6,'६'),
-    (2575,290,7,'७'),
-    (2576,290,8,'८'),
-    (2577,291,1,'१'),
-    (2578,291,2,'२'),
-    (2579,291,3,'३'),
-    (2580,291,4,'४'),
-    (2581,291,5,'५'),
-    (2582,291,6,'६'),
-    (2583,291,7,'७'),
-    (2584,291,8,'८'),
-    (2585,291,9,'९'),
-    (2586,292,1,'१'),
-    (2587,292,2,'२'),
-    (2588,292,3,'३'),
-    (2589,292,4,'४'),
-    (2590,292,5,'५'),
-    (2591,292,6,'६'),
-    (2592,293,1,'१'),
-    (2593,293,2,'२'),
-    (2594,293,3,'३'),
-    (2595,293,4,'४'),
-    (2596,293,5,'५'),
-    (2597,293,6,'६'),
-    (2598,293,7,'७'),
-    (2599,294,1,'१'),
-    (2600,294,2,'२'),
-    (2601,294,3,'३'),
-    (2602,294,4,'४'),
-    (2603,294,5,'५'),
-    (2604,294,6,'६'),
-    (2605,294,7,'७'),
-    (2606,295,1,'१'),
-    (2607,295,2,'२'),
-    (2608,295,3,'३'),
-    (2609,295,4,'४'),
-    (2610,295,5,'५'),
-    (2611,295,6,'६'),
-    (2612,296,1,'१'),
-    (2613,296,2,'२'),
-    (2614,296,3,'३'),
-    (2615,296,4,'४'),
-    (2616,296,5,'५'),
-    (2617,297,1,'१'),
-    (2618,297,2,'२'),
-    (2619,297,3,'३'),
-    (2620,297,4,'४'),
-    (2621,297,5,'५'),
-    (2622,298,1,'१'),
-    (2623,298,2,'२'),
-    (2624,298,3,'३'),
-    (2625,298,4,'४'),
-    (2626,298,5,'५'),
-    (2627,299,1,'१'),
-    (2628,299,2,'२'),
-    (2629,299,3,'३'),
-    (2630,299,4,'४'),
-    (2631,299,5,'५'),
-    (2632,299,6,'६'),
-    (2633,300,1,'१'),
-    (2634,300,2,'२'),
-    (2635,300,3,'३'),
-    (2636,300,4,'४'),
-    (2637,300,5,'५'),
-    (2638,300,6,'६'),
-    (2639,301,1,'१'),
-    (2640,301,2,'२'),
-    (2641,301,3,'३'),
-    (2642,301,4,'४'),
-    (2643,301,5,'५'),
-    (2644,302,1,'१'),
-    (2645,302,2,'२'),
-    (2646,302,3,'३'),
-    (2647,302,4,'४'),
-    (2648,302,5,'५'),
-    (2649,302,6,'६'),
-    (2650,302,7,'७'),
-    (2651,303,1,'१'),
-    (2652,303,2,'२'),
-    (2653,303,3,'३'),
-    (2654,303,4,'४'),
-    (2655,303,5,'५'),
-    (2656,303,6,'६'),
-    (2657,303,7,'७'),
-    (2658,304,1,'१'),
-    (2659,304,2,'२'),
-    (2660,304,3,'३'),
-    (2661,304,4,'४'),
-    (2662,304,5,'५'),
-    (2663,305,1,'१'),
-    (2664,305,2,'२'),
-    (2665,305,3,'३'),
-    (2666,305,4,'४'),
-    (2667,305,5,'५'),
-    (2668,305,6,'६'),
-    (2669,305,7,'७'),
-    (2670,305,8,'८'),
-    (2671,305,9,'९'),
-    (2672,305,10,'१०'),
-    (2673,305,11,'११'),
-    (2674,305,12,'१२'),
-    (2675,305,13,'१३'),
-    (2676,305,14,'१४'),
-    (2677,306,1,'१'),
-    (2678,306,2,'२'),
-    (2679,306,3,'३'),
-    (2680,306,4,'४'),
-    (2681,306,5,'५'),
-    (2682,306,6,'६'),
-    (2683,306,7,'७'),
-    (2684,307,1,'१'),
-    (2685,307,2,'२'),
-    (2686,307,3,'३'),
-    (2687,307,4,'४'),
-    (2688,307,5,'५'),
-    (2689,307,6,'६'),
-    (2690,307,7,'७'),
-    (2691,308,1,'१'),
-    (2692,308,2,'२'),
-    (2693,308,3,'३'),
-    (2694,308,4,'४'),
-    (2695,308,5,'५'),
-    (2696,308,6,'६'),
-    (2697,308,7,'७'),
-    (2698,308,8,'८'),
-    (2699,308,9,'९'),
-    (2700,308,10,'१०'),
-    (2701,309,1,'१'),
-    (2702,309,2,'२'),
-    (2703,309,3,'३'),
-    (2704,309,4,'४'),
-    (2705,309,5,'५'),
-    (2706,309,6,'६'),
-    (2707,309,7,'७'),
-    (2708,309,8,'८'),
-    (2709,310,1,'१'),
-    (2710,310,2,'२'),
-    (2711,310,3,'३'),
-    (2712,310,4,'४'),
-    (2713,310,5,'५'),
-    (2714,310,6,'६'),
-    (2715,310,7,'७'),
-    (2716,310,8,'८'),
-    (2717,311,1,'१'),
-    (2718,311,2,'२'),
-    (2719,311,3,'३'),
-    (2720,311,4,'४'),
-    (2721,311,5,'५'),
-    (2722,311,6,'६'),
-    (2723,311,7,'७'),
-    (2724,311,8,'८'),
-    (2725,311,9,'९'),
-    (2726,311,10,'१०'),
-    (2727,311,11,'११'),
-    (2728,312,1,'१'),
-    (2729,312,2,'२'),
-    (2730,312,3,'३'),
-    (2731,312,4,'४'),
-    (2732,312,5,'५'),
-    (2733,312,6,'६'),
-    (2734,312,7,'७'),
-    (2735,312,8,'८'),
-    (2736,312,9,'९'),
-    (2737,313,1,'१'),
-    (2738,313,2,'२'),
-    (2739,313,3,'३'),
-    (2740,313,4,'४'),
-    (2741,313,5,'५'),
-    (2742,313,6,'६'),
-    (2743,313,7,'७'),
-    (2744,314,1,'१'),
-    (2745,314,2,'२'),
-    (2746,314,3,'३'),
-    (2747,314,4,'४'),
-    (2748,314,5,'५'),
-    (2749,314,6,'६'),
-    (2750,315,1,'१'),
-
-    (2751,315,2,'२'),
-    (2752,315,3,'३'),
-    (2753,315,4,'४'),
-    (2754,315,5,'५'),
-    (2755,316,1,'१'),
-    (2756,316,2,'२'),
-    (2757,316,3,'३'),
-    (2758,316,4,'४'),
-    (2759,316,5,'५'),
-    (2760,316,6,'६'),
-    (2761,316,7,'७'),
-    (2762,316,8,'८'),
-    (2763,316,9,'९'),
-    (2764,316,10,'१०'),
-    (2765,316,11,'११'),
-    (2766,316,12,'१२'),
-    (2767,316,13,'१३'),
-    (2768,317,1,'१'),
-    (2769,317,2,'२'),
-    (2770,317,3,'३'),
-    (2771,317,4,'४'),
-    (2772,317,5,'५'),
-    (2773,318,1,'१'),
-    (2774,318,2,'२'),
-    (2775,318,3,'३'),
-    (2776,318,4,'४'),
-    (2777,318,5,'५'),
-    (2778,318,6,'६'),
-    (2779,319,1,'१'),
-    (2780,319,2,'२'),
-    (2781,319,3,'३'),
-    (2782,319,4,'४'),
-    (2783,319,5,'५'),
-    (2784,319,6,'६'),
-    (2785,320,1,'१'),
-    (2786,320,2,'२'),
-    (2787,320,3,'३'),
-    (2788,320,4,'४'),
-    (2789,320,5,'५'),
-    (2790,320,6,'६'),
-    (2791,320,7,'७'),
-    (2792,320,8,'८'),
-    (2793,320,9,'९'),
-    (2794,320,10,'१०'),
-    (2795,320,11,'११'),
-    (2796,320,12,'१२'),
-    (2797,320,13,'१३'),
-    (2798,321,1,'१'),
-    (2799,321,2,'२'),
-    (2800,321,3,'३'),
-    (2801,321,4,'४'),
-    (2802,321,5,'५'),
-    (2803,321,6,'६'),
-    (2804,322,1,'१'),
-    (2805,322,2,'२'),
-    (2806,322,3,'३'),
-    (2807,322,4,'४'),
-    (2808,322,5,'५'),
-    (2809,323,1,'१'),
-    (2810,323,2,'२'),
-    (2811,323,3,'३'),
-    (2812,323,4,'४'),
-    (2813,323,5,'५'),
-    (2814,323,6,'६'),
-    (2815,323,7,'७'),
-    (2816,323,8,'८'),
-    (2817,324,1,'१'),
-    (2818,324,2,'२'),
-    (2819,324,3,'३'),
-    (2820,324,4,'४'),
-    (2821,324,5,'५'),
-    (2822,324,6,'६'),
-    (2823,324,7,'७'),
-    (2824,324,8,'८'),
-    (2825,325,1,'१'),
-    (2826,325,2,'२'),
-    (2827,325,3,'३'),
-    (2828,325,4,'४'),
-    (2829,325,5,'५'),
-    (2830,325,6,'६'),
-    (2831,325,7,'७'),
-    (2832,325,8,'८'),
-    (2833,325,9,'९'),
-    (2834,326,1,'१'),
-    (2835,326,2,'२'),
-    (2836,326,3,'३'),
-    (2837,326,4,'४'),
-    (2838,326,5,'५'),
-    (2839,326,6,'६'),
-    (2840,326,7,'७'),
-    (2841,326,8,'८'),
-    (2842,326,9,'९'),
-    (2843,327,1,'१'),
-    (2844,327,2,'२'),
-    (2845,327,3,'३'),
-    (2846,327,4,'४'),
-    (2847,327,5,'५'),
-    (2848,327,6,'६'),
-    (2849,327,7,'७'),
-    (2850,327,8,'८'),
-    (2851,327,9,'९'),
-    (2852,328,1,'१'),
-    (2853,328,2,'२'),
-    (2854,328,3,'३'),
-    (2855,328,4,'४'),
-    (2856,328,5,'५'),
-    (2857,328,6,'६'),
-    (2858,328,7,'७'),
-    (2859,328,8,'८'),
-    (2860,328,9,'९'),
-    (2861,328,10,'१०'),
-    (2862,328,11,'११'),
-    (2863,328,12,'१२'),
-    (2864,328,13,'१३'),
-    (2865,329,1,'१'),
-    (2866,329,2,'२'),
-    (2867,329,3,'३'),
-    (2868,329,4,'४'),
-    (2869,329,5,'५'),
-    (2870,329,6,'६'),
-    (2871,329,7,'७'),
-    (2872,329,8,'८'),
-    (2873,329,9,'९'),
-    (2874,329,10,'१०'),
-    (2875,329,11,'११'),
-    (2876,330,1,'१'),
-    (2877,330,2,'२'),
-    (2878,330,3,'३'),
-    (2879,330,4,'४'),
-    (2880,330,5,'५'),
-    (2881,330,6,'६'),
-    (2882,330,7,'७'),
-    (2883,330,8,'८'),
-    (2884,330,9,'९'),
-    (2885,330,10,'१०'),
-    (2886,330,11,'११'),
-    (2887,331,1,'१'),
-    (2888,331,2,'२'),
-    (2889,331,3,'३'),
-    (2890,331,4,'४'),
-    (2891,331,5,'५'),
-    (2892,331,6,'६'),
-    (2893,331,7,'७'),
-    (2894,331,8,'८'),
-    (2895,331,9,'९'),
-    (2896,331,10,'१०'),
-    (2897,332,1,'१'),
-    (2898,332,2,'२'),
-    (2899,332,3,'३'),
-    (2900,332,4,'४'),
-    (2901,332,5,'५'),
-    (2902,332,6,'६'),
-    (2903,332,7,'७'),
-    (2904,332,8,'८'),
-    (2905,332,9,'९'),
-    (2906,332,10,'१०'),
-    (2907,332,11,'११'),
-    (2908,332,12,'१२'),
-    (2909,332,13,'१३'),
-    (2910,332,14,'१४'),
-    (2911,332,15,'१५'),
-    (2912,332,16,'१६'),
-    (2913,332,17,'१७'),
-    (2914,332,18,'१८'),
-    (2915,332,19,'१९'),
-    (2916,332,20,'२०'),
-    (2917,332,21,'२१'),
-    (2918,332,22,'२२'),
-    (2919,332,23,'२३'),
-    (2920,332,24,'२४'),
-    (2921,332,25,'२५'),
-    (2922,332,26,'२६'),
-    (2923,332,27,'२७'),
-    (2924,332,28,'२८'),
-    (2925,332,29,'२९'),
-    (2926,332,30,'३०'),
-    (2927,332,31,'३१'),
-    (2928,332,32,'३२'),
-    (2929,333,1,'१'),
-    (2930,333,2,'२'),
-    (2931,333,3,'३'),
-    (2932,333,4,'४'),
-    (2933,333,5,'५'),
-    (2934,333,6,'६'),
-    (2935,333,7,'७'),
-    (2936,333,8,'८'),
-    (2937,333,9,'९'),
-    (2938,333,10,'१०'),
-    (2939,334,1,'१'),
-    (2940,334,2,'२'),
-    (2941,334,3,'३'),
-    (2942,334,4,'४'),
-    (2943,334,5,'५'),
-    (2944,334,6,'६'),
-    (2945,334,7,'७'),
-    (2946,334,8,'८'),
-    (2947,334,9,'९'),
-    (2948,334,10,'१०'),
-    (2949,334,11,'११'),
-    (2950,334,12,'१२'),
-    (2951,334,13,'१३'),
-    (2952,334,14,'१४'),
-    (2953,334,15,'१५'),
-    (2954,335,1,'१'),
-    (2955,335,2,'२'),
-    (2956,335,3,'३'),
-    (2957,335,4,'४'),
-    (2958,335,5,'५'),
-    (2959,335,6,'६'),
-    (2960,335,7,'७'),
-    (2961,335,8,'८'),
-    (2962,335,9,'९'),
-    (2963,336,1,'१'),
-    (2964,336,2,'२'),
-    (2965,336,3,'३'),
-    (2966,336,4,'४'),
-    (2967,336,5,'५'),
-    (2968,336,6,'६'),
-    (2969,336,7,'७'),
-    (2970,336,8,'८'),
-    (2971,336,9,'९'),
-    (2972,337,1,'१'),
-    (2973,337,2,'२'),
-    (2974,337,3,'३'),
-    (2975,337,4,'४'),
-    (2976,337,5,'५'),
-    (2977,337,6,'६'),
-    (2978,337,7,'७'),
-    (2979,337,8,'८'),
-    (2980,337,9,'९'),
-    (2981,337,10,'१०'),
-    (2982,338,1,'१'),
-    (2983,338,2,'२'),
-    (2984,338,3,'३'),
-    (2985,338,4,'४'),
-    (2986,338,5,'५'),
-    (2987,338,6,'६'),
-    (2988,338,7,'७'),
-    (2989,338,8,'८'),
-    (2990,338,9,'९'),
-    (2991,339,1,'१'),
-    (2992,339,2,'२'),
-    (2993,339,3,'३'),
-    (2994,339,4,'४'),
-    (2995,339,5,'५'),
-    (2996,339,6,'६'),
-    (2997,339,7,'७'),
-    (2998,339,8,'८'),
-    (2999,339,9,'९'),
-    (3000,339,10,'१०'),
-
-    (3001,340,1,'१'),
-    (3002,340,2,'२'),
-    (3003,340,3,'३'),
-    (3004,340,4,'४'),
-    (3005,340,5,'५'),
-    (3006,340,6,'६'),
-    (3007,340,7,'७'),
-    (3008,340,8,'८'),
-    (3009,340,9,'९'),
-    (3010,340,10,'१०'),
-    (3011,341,1,'१'),
-    (3012,341,2,'२'),
-    (3013,341,3,'३'),
-    (3014,341,4,'४'),
-    (3015,341,5,'५'),
-    (3016,341,6,'६'),
-    (3017,341,7,'७'),
-    (3018,341,8,'८'),
-    (3019,341,9,'९'),
-    (3020,341,10,'१०'),
-    (3021,341,11,'११'),
-    (3022,341,12,'१२'),
-    (3023,341,13,'१३'),
-    (3024,341,14,'१४'),
-    (3025,341,15,'१५'),
-    (3026,341,16,'१६'),
-    (3027,341,17,'१७'),
-    (3028,341,18,'१८'),
-    (3029,341,19,'१९'),
-    (3030,341,20,'२०'),
-    (3031,341,21,'२१'),
-    (3032,341,22,'२२'),
-    (3033,341,23,'२३'),
-    (3034,341,24,'२४'),
-    (3035,341,25,'२५'),
-    (3036,341,26,'२६'),
-    (3037,341,27,'२७'),
-    (3038,341,28,'२८'),
-    (3039,341,29,'२९'),
-    (3040,342,1,'१'),
-    (3041,342,2,'२'),
-    (3042,342,3,'३'),
-    (3043,342,4,'४'),
-    (3044,342,5,'५'),
-    (3045,342,6,'६'),
-    (3046,342,7,'७'),
-    (3047,342,8,'८'),
-    (3048,342,9,'९'),
-    (3049,342,10,'१०'),
-    (3050,342,11,'११'),
-    (3051,342,12,'१२'),
-    (3052,342,13,'१३'),
-    (3053,342,14,'१४'),
-    (3054,343,1,'१'),
-    (3055,343,2,'२'),
-    (3056,343,3,'३'),
-    (3057,343,4,'४'),
-    (3058,343,5,'५'),
-    (3059,344,1,'१'),
-    (3060,344,2,'२'),
-    (3061,344,3,'३'),
-    (3062,344,4,'४'),
-    (3063,344,5,'५'),
-    (3064,344,6,'६'),
-    (3065,345,1,'१'),
-    (3066,345,2,'२'),
-    (3067,345,3,'३'),
-    (3068,345,4,'४'),
-    (3069,345,5,'५'),
-    (3070,345,6,'६'),
-    (3071,345,7,'७'),
-    (3072,346,1,'१'),
-    (3073,346,2,'२'),
-    (3074,346,3,'३'),
-    (3075,346,4,'४'),
-    (3076,346,5,'५'),
-    (3077,346,6,'६'),
-    (3078,346,7,'७'),
-    (3079,346,8,'८'),
-    (3080,346,9,'९'),
-    (3081,347,1,'१'),
-    (3082,347,2,'२'),
-    (3083,347,3,'३'),
-    (3084,347,4,'४'),
-    (3085,347,5,'५'),
-    (3086,347,6,'६'),
-    (3087,347,7,'७'),
-    (3088,347,8,'८'),
-    (3089,347,9,'९'),
-    (3090,347,10,'१०'),
-    (3091,348,1,'१'),
-    (3092,348,2,'२'),
-    (3093,348,3,'३'),
-    (3094,348,4,'४'),
-    (3095,348,5,'५'),
-    (3096,348,6,'६'),
-    (3097,348,7,'७'),
-    (3098,348,8,'८'),
-    (3099,348,9,'९'),
-    (3100,348,10,'१०'),
-    (3101,348,11,'११'),
-    (3102,348,12,'१२'),
-    (3103,349,1,'१'),
-    (3104,349,2,'२'),
-    (3105,349,3,'३'),
-    (3106,349,4,'४'),
-    (3107,349,5,'५'),
-    (3108,349,6,'६'),
-    (3109,349,7,'७'),
-    (3110,349,8,'८'),
-    (3111,349,9,'९'),
-    (3112,349,10,'१०'),
-    (3113,349,11,'११'),
-    (3114,349,12,'१२'),
-    (3115,349,13,'१३'),
-    (3116,349,14,'१४'),
-    (3117,350,1,'१'),
-    (3118,350,2,'२'),
-    (3119,350,3,'३'),
-    (3120,350,4,'४'),
-    (3121,350,5,'५'),
-    (3122,350,6,'६'),
-    (3123,350,7,'७'),
-    (3124,350,8,'८'),
-    (3125,350,9,'९'),
-    (3126,350,10,'१०'),
-    (3127,350,11,'११'),
-    (3128,350,12,'१२'),
-    (3129,351,1,'१'),
-    (3130,351,2,'२'),
-    (3131,351,3,'३'),
-    (3132,351,4,'४'),
-    (3133,351,5,'५'),
-    (3134,351,6,'६'),
-    (3135,351,7,'७'),
-    (3136,351,8,'८'),
-    (3137,351,9,'९'),
-    (3138,351,10,'१०'),
-    (3139,351,11,'११'),
-    (3140,351,12,'१२'),
-    (3141,351,13,'१३'),
-    (3142,352,1,'१'),
-    (3143,352,2,'२'),
-    (3144,352,3,'३'),
-    (3145,352,4,'४'),
-    (3146,352,5,'५'),
-    (3147,352,6,'६'),
-    (3148,352,7,'७'),
-    (3149,352,8,'८'),
-    (3150,352,9,'९'),
-    (3151,353,1,'१'),
-    (3152,353,2,'२'),
-    (3153,353,3,'३'),
-    (3154,353,4,'४'),
-    (3155,353,5,'५'),
-    (3156,353,6,'६'),
-    (3157,353,7,'७'),
-    (3158,353,8,'८'),
-    (3159,353,9,'९'),
-    (3160,353,10,'१०'),
-    (3161,353,11,'११'),
-    (3162,354,1,'१'),
-    (3163,354,2,'२'),
-    (3164,354,3,'३'),
-    (3165,354,4,'४'),
-    (3166,354,5,'५'),
-    (3167,354,6,'६'),
-    (3168,354,7,'७'),
-    (3169,354,8,'८'),
-    (3170,354,9,'९'),
-    (3171,354,10,'१०'),
-    (3172,354,11,'११'),
-    (3173,354,12,'१२'),
-    (3174,355,1,'१'),
-    (3175,355,2,'२'),
-    (3176,355,3,'३'),
-    (3177,355,4,'४'),
-    (3178,355,5,'५'),
-    (3179,355,6,'६'),
-    (3180,356,1,'१'),
-    (3181,356,2,'२'),
-    (3182,356,3,'३'),
-    (3183,356,4,'४'),
-    (3184,356,5,'५'),
-    (3185,356,6,'६'),
-    (3186,356,7,'७'),
-    (3187,356,8,'८'),
-    (3188,356,9,'९'),
-    (3189,356,10,'१०'),
-    (3190,356,11,'११'),
-    (3191,356,12,'१२'),
-    (3192,357,1,'१'),
-    (3193,357,2,'२'),
-    (3194,357,3,'३'),
-    (3195,357,4,'४'),
-    (3196,357,5,'५'),
-    (3197,357,6,'६'),
-    (3198,357,7,'७'),
-    (3199,357,8,'८'),
-    (3200,358,1,'१'),
-    (3201,358,2,'२'),
-    (3202,358,3,'३'),
-    (3203,358,4,'४'),
-    (3204,358,5,'५'),
-    (3205,358,6,'६'),
-    (3206,358,7,'७'),
-    (3207,359,1,'१'),
-    (3208,359,2,'२'),
-    (3209,359,3,'३'),
-    (3210,359,4,'४'),
-    (3211,359,5,'५'),
-    (3212,359,6,'६'),
-    (3213,359,7,'७'),
-    (3214,360,1,'१'),
-    (3215,360,2,'२'),
-    (3216,360,3,'३'),
-    (3217,360,4,'४'),
-    (3218,360,5,'५'),
-    (3219,360,6,'६'),
-    (3220,361,1,'१'),
-    (3221,361,2,'२'),
-    (3222,361,3,'३'),
-    (3223,361,4,'४'),
-    (3224,361,5,'५'),
-    (3225,361,6,'६'),
-    (3226,361,7,'७'),
-    (3227,362,1,'१'),
-    (3228,362,2,'२'),
-    (3229,362,3,'३'),
-    (3230,362,4,'४'),
-    (3231,362,5,'५'),
-    (3232,362,6,'६'),
-    (3233,362,7,'७'),
-    (3234,362,8,'८'),
-    (3235,362,9,'९'),
-    (3236,363,1,'१'),
-    (3237,363,2,'२'),
-    (3238,363,3,'३'),
-    (3239,363,4,'४'),
-    (3240,363,5,'५'),
-    (3241,363,6,'६'),
-    (3242,363,7,'७'),
-    (3243,363,8,'८'),
-    (3244,363,9,'९'),
-    (3245,363,10,'१०'),
-    (3246,363,11,'११'),
-    (3247,363,12,'१२'),
-    (3248,363,13,'१३'),
-    (3249,363,14,'१४'),
-    (3250,364,1,'१'),
-
-    (3251,364,2,'२'),
-    (3252,364,3,'३'),
-    (3253,364,4,'४'),
-    (3254,364,5,'५'),
-    (3255,364,6,'६'),
-    (3256,364,7,'७'),
-    (3257,364,8,'८'),
-    (3258,364,9,'९'),
-    (3259,365,1,'१'),
-    (3260,365,2,'२'),
-    (3261,365,3,'३'),
-    (3262,365,4,'४'),
-    (3263,365,5,'५'),
-    (3264,365,6,'६'),
-    (3265,365,7,'७'),
-    (3266,366,1,'१'),
-    (3267,366,2,'२'),
-    (3268,366,3,'३'),
-    (3269,366,4,'४'),
-    (3270,366,5,'५'),
-    (3271,367,1,'१'),
-    (3272,367,2,'२'),
-    (3273,367,3,'३'),
-    (3274,367,4,'४'),
-    (3275,367,5,'५'),
-    (3276,367,6,'६'),
-    (3277,367,7,'७'),
-    (3278,367,8,'८'),
-    (3279,367,9,'९'),
-    (3280,367,10,'१०'),
-    (3281,367,11,'११'),
-    (3282,367,12,'१२'),
-    (3283,367,13,'१३'),
-    (3284,367,14,'१४'),
-    (3285,368,1,'१'),
-    (3286,368,2,'२'),
-    (3287,368,3,'३'),
-    (3288,368,4,'४'),
-    (3289,368,5,'५'),
-    (3290,368,6,'६'),
-    (3291,369,1,'१'),
-    (3292,369,2,'२'),
-    (3293,369,3,'३'),
-    (3294,369,4,'४'),
-    (3295,369,5,'५'),
-    (3296,369,6,'६'),
-    (3297,369,7,'७'),
-    (3298,369,8,'८'),
-    (3299,369,9,'९'),
-    (3300,369,10,'१०'),
-    (3301,369,11,'११'),
-    (3302,370,1,'१'),
-    (3303,370,2,'२'),
-    (3304,370,3,'३'),
-    (3305,370,4,'४'),
-    (3306,370,5,'५'),
-    (3307,370,6,'६'),
-    (3308,370,7,'७'),
-    (3309,371,1,'१'),
-    (3310,371,2,'२'),
-    (3311,371,3,'३'),
-    (3312,371,4,'४'),
-    (3313,371,5,'५'),
-    (3314,371,6,'६'),
-    (3315,371,7,'७'),
-    (3316,371,8,'८'),
-    (3317,371,9,'९'),
-    (3318,371,10,'१०'),
-    (3319,371,11,'११'),
-    (3320,371,12,'१२'),
-    (3321,371,13,'१३'),
-    (3322,371,14,'१४'),
-    (3323,372,1,'१'),
-    (3324,372,2,'२'),
-    (3325,372,3,'३'),
-    (3326,372,4,'४'),
-    (3327,372,5,'५'),
-    (3328,372,6,'६'),
-    (3329,372,7,'७'),
-    (3330,373,1,'१'),
-    (3331,373,2,'२'),
-    (3332,373,3,'३'),
-    (3333,373,4,'४'),
-    (3334,373,5,'५'),
-    (3335,374,1,'१'),
-    (3336,374,2,'२'),
-    (3337,374,3,'३'),
-    (3338,374,4,'४'),
-    (3339,374,5,'५'),
-    (3340,374,6,'६'),
-    (3341,374,7,'७'),
-    (3342,375,1,'१'),
-    (3343,375,2,'२'),
-    (3344,375,3,'३'),
-    (3345,375,4,'४'),
-    (3346,375,5,'५'),
-    (3347,375,6,'६'),
-    (3348,375,7,'७'),
-    (3349,375,8,'८'),
-    (3350,376,1,'१'),
-    (3351,376,2,'२'),
-    (3352,376,3,'३'),
-    (3353,376,4,'४'),
-    (3354,376,5,'५'),
-    (3355,377,1,'१'),
-    (3356,377,2,'२'),
-    (3357,377,3,'३'),
-    (3358,377,4,'४'),
-    (3359,377,5,'५'),
-    (3360,377,6,'६'),
-    (3361,377,7,'७'),
-    (3362,377,8,'८'),
-    (3363,377,9,'९'),
-    (3364,377,10,'१०'),
-    (3365,377,11,'११'),
-    (3366,377,12,'१२'),
-    (3367,378,1,'१'),
-    (3368,378,2,'२'),
-    (3369,378,3,'३'),
-    (3370,378,4,'४'),
-    (3371,378,5,'५'),
-    (3372,378,6,'६'),
-    (3373,378,7,'७'),
-    (3374,378,8,'८'),
-    (3375,378,9,'९'),
-    (3376,378,10,'१०'),
-    (3377,379,1,'१'),
-    (3378,379,2,'२'),
-    (3379,379,3,'३'),
-    (3380,379,4,'४'),
-    (3381,379,5,'५'),
-    (3382,379,6,'६'),
-    (3383,379,7,'७'),
-    (3384,379,8,'८'),
-    (3385,379,9,'९'),
-    (3386,380,1,'१'),
-    (3387,380,2,'२'),
-    (3388,380,3,'३'),
-    (3389,380,4,'४'),
-    (3390,380,5,'५'),
-    (3391,380,6,'६'),
-    (3392,380,7,'७'),
-    (3393,380,8,'८'),
-    (3394,380,9,'९'),
-    (3395,381,1,'१'),
-    (3396,381,2,'२'),
-    (3397,381,3,'३'),
-    (3398,381,4,'४'),
-    (3399,381,5,'५'),
-    (3400,381,6,'६'),
-    (3401,381,7,'७'),
-    (3402,381,8,'८'),
-    (3403,381,9,'९'),
-    (3404,381,10,'१०'),
-    (3405,381,11,'११'),
-    (3406,381,12,'१२'),
-    (3407,381,13,'१३'),
-    (3408,381,14,'१४'),
-    (3409,381,15,'१५'),
-    (3410,381,16,'१६'),
-    (3411,381,17,'१७'),
-    (3412,381,18,'१८'),
-    (3413,381,19,'१९'),
-    (3414,382,1,'१'),
-    (3415,382,2,'२'),
-    (3416,382,3,'३'),
-    (3417,382,4,'४'),
-    (3418,382,5,'५'),
-    (3419,382,6,'६'),
-    (3420,382,7,'७'),
-    (3421,382,8,'८'),
-    (3422,382,9,'९'),
-    (3423,383,1,'१'),
-    (3424,383,2,'२'),
-    (3425,383,3,'३'),
-    (3426,383,4,'४'),
-    (3427,383,5,'५'),
-    (3428,383,6,'६'),
-    (3429,383,7,'७'),
-    (3430,383,8,'८'),
-    (3431,384,1,'१'),
-    (3432,384,2,'२'),
-    (3433,384,3,'३'),
-    (3434,384,4,'४'),
-    (3435,384,5,'५'),
-    (3436,384,6,'६'),
-    (3437,384,7,'७'),
-    (3438,384,8,'८'),
-    (3439,384,9,'९'),
-    (3440,384,10,'१०'),
-    (3441,384,11,'११'),
-    (3442,384,12,'१२'),
-    (3443,385,1,'१'),
-    (3444,385,2,'२'),
-    (3445,385,3,'३'),
-    (3446,385,4,'४'),
-    (3447,385,5,'५'),
-    (3448,385,6,'६'),
-    (3449,385,7,'७'),
-    (3450,385,8,'८'),
-    (3451,385,9,'९'),
-    (3452,386,1,'१'),
-    (3453,386,2,'२'),
-    (3454,386,3,'३'),
-    (3455,386,4,'४'),
-    (3456,386,5,'५'),
-    (3457,386,6,'६'),
-    (3458,386,7,'७'),
-    (3459,386,8,'८'),
-    (3460,386,9,'९'),
-    (3461,386,10,'१०'),
-    (3462,386,11,'११'),
-    (3463,386,12,'१२'),
-    (3464,386,13,'१३'),
-    (3465,387,1,'१'),
-    (3466,387,2,'२'),
-    (3467,387,3,'३'),
-    (3468,387,4,'४'),
-    (3469,387,5,'५'),
-    (3470,387,6,'६'),
-    (3471,387,7,'७'),
-    (3472,387,8,'८'),
-    (3473,387,9,'९'),
-    (3474,387,10,'१०'),
-    (3475,387,11,'११'),
-    (3476,388,1,'१'),
-    (3477,388,2,'२'),
-    (3478,388,3,'३'),
-    (3479,388,4,'४'),
-    (3480,388,5,'५'),
-    (3481,388,6,'६'),
-    (3482,388,7,'७'),
-    (3483,389,1,'१'),
-    (3484,389,2,'२'),
-    (3485,389,3,'३'),
-    (3486,389,4,'४'),
-    (3487,389,5,'५'),
-    (3488,389,6,'६'),
-    (3489,389,7,'७'),
-    (3490,389,8,'८'),
-    (3491,389,9,'९'),
-    (3492,389,10,'१०'),
-    (3493,389,11,'११'),
-    (3494,389,12,'१२'),
-    (3495,389,13,'१३'),
-    (3496,389,14,'१४'),
-    (3497,389,15,'१५'),
-    (3498,389,16,'१६'),
-    (3499,389,17,'१७'),
-    (3500,389,18,'१८'),
-
-    (3501,389,19,'१९'),
-    (3502,389,20,'२०'),
-    (3503,389,21,'२१'),
-    (3504,389,22,'२२'),
-    (3505,389,23,'२३'),
-    (3506,389,24,'२४'),
-    (3507,389,25,'२५'),
-    (3508,389,26,'२६'),
-    (3509,389,27,'२७'),
-    (3510,389,28,'२८'),
-    (3511,389,29,'२९'),
-    (3512,390,1,'१'),
-    (3513,390,2,'२'),
-    (3514,390,3,'३'),
-    (3515,390,4,'४'),
-    (3516,390,5,'५'),
-    (3517,390,6,'६'),
-    (3518,390,7,'७'),
-    (3519,390,8,'८'),
-    (3520,390,9,'९'),
-    (3521,390,10,'१०'),
-    (3522,390,11,'११'),
-    (3523,390,12,'१२'),
-    (3524,390,13,'१३'),
-    (3525,390,14,'१४'),
-    (3526,390,15,'१५'),
-    (3527,390,16,'१६'),
-    (3528,391,1,'१'),
-    (3529,391,2,'२'),
-    (3530,391,3,'३'),
-    (3531,391,4,'४'),
-    (3532,391,5,'५'),
-    (3533,391,6,'६'),
-    (3534,391,7,'७'),
-    (3535,391,8,'८'),
-    (3536,391,9,'९'),
-    (3537,391,10,'१०'),
-    (3538,391,11,'११'),
-    (3539,391,12,'१२'),
-    (3540,391,13,'१३'),
-    (3541,392,1,'१'),
-    (3542,392,2,'२'),
-    (3543,392,3,'३'),
-    (3544,392,4,'४'),
-    (3545,392,5,'५'),
-    (3546,392,6,'६'),
-    (3547,392,7,'७'),
-    (3548,392,8,'८'),
-    (3549,392,9,'९'),
-    (3550,393,1,'१'),
-    (3551,393,2,'२'),
-    (3552,393,3,'३'),
-    (3553,393,4,'४'),
-    (3554,393,5,'५'),
-    (3555,393,6,'६'),
-    (3556,393,7,'७'),
-    (3557,394,1,'१'),
-    (3558,394,2,'२'),
-    (3559,394,3,'३'),
-    (3560,394,4,'४'),
-    (3561,394,5,'५'),
-    (3562,395,1,'१'),
-    (3563,395,2,'२'),
-    (3564,395,3,'३'),
-    (3565,395,4,'४'),
-    (3566,395,5,'५'),
-    (3567,395,6,'६'),
-    (3568,395,7,'७'),
-    (3569,395,8,'८'),
-    (3570,396,1,'१'),
-    (3571,396,2,'२'),
-    (3572,396,3,'३'),
-    (3573,396,4,'४'),
-    (3574,396,5,'५'),
-    (3575,396,6,'६'),
-    (3576,396,7,'७'),
-    (3577,397,1,'१'),
-    (3578,397,2,'२'),
-    (3579,397,3,'३'),
-    (3580,397,4,'४'),
-    (3581,397,5,'५'),
-    (3582,397,6,'६'),
-    (3583,397,7,'७'),
-    (3584,397,8,'८'),
-    (3585,397,9,'९'),
-    (3586,397,10,'१०'),
-    (3587,398,1,'१'),
-    (3588,398,2,'२'),
-    (3589,398,3,'३'),
-    (3590,398,4,'४'),
-    (3591,398,5,'५'),
-    (3592,398,6,'६'),
-    (3593,398,7,'७'),
-    (3594,398,8,'८'),
-    (3595,399,1,'१'),
-    (3596,399,2,'२'),
-    (3597,399,3,'३'),
-    (3598,399,4,'४'),
-    (3599,399,5,'५'),
-    (3600,399,6,'६'),
-    (3601,399,7,'७'),
-    (3602,399,8,'८'),
-    (3603,400,1,'१'),
-    (3604,400,2,'२'),
-    (3605,400,3,'३'),
-    (3606,400,4,'४'),
-    (3607,400,5,'५'),
-    (3608,400,6,'६'),
-    (3609,400,7,'७'),
-    (3610,400,8,'८'),
-    (3611,400,9,'९'),
-    (3612,400,10,'१०'),
-    (3613,401,1,'१'),
-    (3614,401,2,'२'),
-    (3615,401,3,'३'),
-    (3616,401,4,'४'),
-    (3617,401,5,'५'),
-    (3618,401,6,'६'),
-    (3619,401,7,'७'),
-    (3620,401,8,'८'),
-    (3621,401,9,'९'),
-    (3622,401,10,'१०'),
-    (3623,401,11,'११'),
-    (3624,401,12,'१२'),
-    (3625,401,13,'१३'),
-    (3626,401,14,'१४'),
-    (3627,402,1,'१'),
-    (3628,402,2,'२'),
-    (3629,402,3,'३'),
-    (3630,402,4,'४'),
-    (3631,402,5,'५'),
-    (3632,402,6,'६'),
-    (3633,402,7,'७'),
-    (3634,402,8,'८'),
-    (3635,402,9,'९'),
-    (3636,403,1,'१'),
-    (3637,403,2,'२'),
-    (3638,403,3,'३'),
-    (3639,403,4,'४'),
-    (3640,403,5,'५'),
-    (3641,403,6,'६'),
-    (3642,403,7,'७'),
-    (3643,403,8,'८'),
-    (3644,404,1,'१'),
-    (3645,404,2,'२'),
-    (3646,404,3,'३'),
-    (3647,404,4,'४'),
-    (3648,404,5,'५'),
-    (3649,405,1,'१'),
-    (3650,405,2,'२'),
-    (3651,405,3,'३'),
-    (3652,405,4,'४'),
-    (3653,405,5,'५'),
-    (3654,405,6,'६'),
-    (3655,405,7,'७'),
-    (3656,405,8,'८'),
-    (3657,405,9,'९'),
-    (3658,406,1,'१'),
-    (3659,406,2,'२'),
-    (3660,406,3,'३'),
-    (3661,406,4,'४'),
-    (3662,406,5,'५'),
-    (3663,407,1,'१'),
-    (3664,407,2,'२'),
-    (3665,407,3,'३'),
-    (3666,407,4,'४'),
-    (3667,407,5,'५'),
-    (3668,407,6,'६'),
-    (3669,407,7,'७'),
-    (3670,407,8,'८'),
-    (3671,407,9,'९'),
-    (3672,408,1,'१'),
-    (3673,408,2,'२'),
-    (3674,408,3,'३'),
-    (3675,408,4,'४'),
-    (3676,408,5,'५'),
-    (3677,409,1,'१'),
-    (3678,409,2,'२'),
-    (3679,409,3,'३'),
-    (3680,409,4,'४'),
-    (3681,409,5,'५'),
-    (3682,410,1,'१'),
-    (3683,410,2,'२'),
-    (3684,410,3,'३'),
-    (3685,410,4,'४'),
-    (3686,410,5,'५'),
-    (3687,411,1,'१'),
-    (3688,411,2,'२'),
-    (3689,411,3,'३'),
-    (3690,411,4,'४'),
-    (3691,411,5,'५'),
-    (3692,412,1,'१'),
-    (3693,412,2,'२'),
-    (3694,412,3,'३'),
-    (3695,412,4,'४'),
-    (3696,412,5,'५'),
-    (3697,413,1,'१'),
-    (3698,413,2,'२'),
-    (3699,413,3,'३'),
-    (3700,413,4,'४'),
-    (3701,413,5,'५'),
-    (3702,413,6,'६'),
-    (3703,413,7,'७'),
-    (3704,413,8,'८'),
-    (3705,414,1,'१'),
-    (3706,414,2,'२'),
-    (3707,414,3,'३'),
-    (3708,414,4,'४'),
-    (3709,414,5,'५'),
-    (3710,414,6,'६'),
-    (3711,414,7,'७'),
-    (3712,414,8,'८'),
-    (3713,415,1,'१'),
-    (3714,415,2,'२'),
-    (3715,415,3,'३'),
-    (3716,415,4,'४'),
-    (3717,415,5,'५'),
-    (3718,415,6,'६'),
-    (3719,415,7,'७'),
-    (3720,416,1,'१'),
-    (3721,416,2,'२'),
-    (3722,416,3,'३'),
-    (3723,416,4,'४'),
-    (3724,416,5,'५'),
-    (3725,416,6,'६'),
-    (3726,416,7,'७'),
-    (3727,417,1,'१'),
-    (3728,417,2,'२'),
-    (3729,417,3,'३'),
-    (3730,417,4,'४'),
-    (3731,417,5,'५'),
-    (3732,418,1,'१'),
-    (3733,418,2,'२'),
-    (3734,418,3,'३'),
-    (3735,418,4,'४'),
-    (3736,418,5,'५'),
-    (3737,418,6,'६'),
-    (3738,418,7,'७'),
-    (3739,418,8,'८'),
-    (3740,418,9,'९'),
-    (3741,418,10,'१०'),
-    (3742,419,1,'१'),
-    (3743,419,2,'२'),
-    (3744,419,3,'३'),
-    (3745,419,4,'४'),
-    (3746,419,5,'५'),
-    (3747,419,6,'६'),
-    (3748,419,7,'७'),
-    (3749,419,8,'८'),
-    (3750,419,9,'९'),
-
-    (3751,419,10,'१०'),
-    (3752,419,11,'११'),
-    (3753,419,12,'१२'),
-    (3754,420,1,'१'),
-    (3755,420,2,'२'),
-    (3756,420,3,'३'),
-    (3757,420,4,'४'),
-    (3758,420,5,'५'),
-    (3759,420,6,'६'),
-    (3760,420,7,'७'),
-    (3761,420,8,'८'),
-    (3762,420,9,'९'),
-    (3763,421,1,'१'),
-    (3764,421,2,'२'),
-    (3765,421,3,'३'),
-    (3766,421,4,'४'),
-    (3767,421,5,'५'),
-    (3768,421,6,'६'),
-    (3769,421,7,'७'),
-    (3770,421,8,'८'),
-    (3771,421,9,'९'),
-    (3772,421,10,'१०'),
-    (3773,421,11,'११'),
-    (3774,422,1,'१'),
-    (3775,422,2,'२'),
-    (3776,422,3,'३'),
-    (3777,422,4,'४'),
-    (3778,422,5,'५'),
-    (3779,422,6,'६'),
-    (3780,422,7,'७'),
-    (3781,422,8,'८'),
-    (3782,422,9,'९'),
-    (3783,422,10,'१०'),
-    (3784,422,11,'११'),
-    (3785,422,12,'१२'),
-    (3786,422,13,'१३'),
-    (3787,422,14,'१४'),
-    (3788,422,15,'१५'),
-    (3789,422,16,'१६'),
-    (3790,422,17,'१७'),
-    (3791,422,18,'१८'),
-    (3792,422,19,'१९'),
-    (3793,422,20,'२०'),
-    (3794,422,21,'२१'),
-    (3795,422,22,'२२'),
-    (3796,422,23,'२३'),
-    (3797,422,24,'२४'),
-    (3798,422,25,'२५'),
-    (3799,422,26,'२६'),
-    (3800,422,27,'२७'),
-    (3801,422,28,'२८'),
-    (3802,422,29,'२९'),
-    (3803,422,30,'३०'),
-    (3804,422,31,'३१'),
-    (3805,422,32,'३२'),
-    (3806,422,33,'३३'),
-    (3807,423,1,'१'),
-    (3808,423,2,'२'),
-    (3809,423,3,'३'),
-    (3810,423,4,'४'),
-    (3811,423,5,'५'),
-    (3812,423,6,'६'),
-    (3813,423,7,'७'),
-    (3814,424,1,'१'),
-    (3815,424,2,'२'),
-    (3816,424,3,'३'),
-    (3817,424,4,'४'),
-    (3818,424,5,'५'),
-    (3819,424,6,'६'),
-    (3820,424,7,'७'),
-    (3821,424,8,'८'),
-    (3822,424,9,'९'),
-    (3823,425,1,'१'),
-    (3824,425,2,'२'),
-    (3825,425,3,'३'),
-    (3826,425,4,'४'),
-    (3827,425,5,'५'),
-    (3828,425,6,'६'),
-    (3829,425,7,'७'),
-    (3830,425,8,'८'),
-    (3831,425,9,'९'),
-    (3832,426,1,'१'),
-    (3833,426,2,'२'),
-    (3834,426,3,'३'),
-    (3835,426,4,'४'),
-    (3836,426,5,'५'),
-    (3837,426,6,'६'),
-    (3838,426,7,'७'),
-    (3839,426,8,'८'),
-    (3840,426,9,'९'),
-    (3841,427,1,'१'),
-    (3842,427,2,'२'),
-    (3843,427,3,'३'),
-    (3844,427,4,'४'),
-    (3845,427,5,'५'),
-    (3846,427,6,'६'),
-    (3847,427,7,'७'),
-    (3848,427,8,'८'),
-    (3849,427,9,'९'),
-    (3850,427,10,'१०'),
-    (3851,428,1,'१'),
-    (3852,428,2,'२'),
-    (3853,428,3,'३'),
-    (3854,428,4,'४'),
-    (3855,428,5,'५'),
-    (3856,428,6,'६'),
-    (3857,428,7,'७'),
-    (3858,428,8,'८'),
-    (3859,428,9,'९'),
-    (3860,428,10,'१०'),
-    (3861,428,11,'११'),
-    (3862,429,1,'१'),
-    (3863,429,2,'२'),
-    (3864,429,3,'३'),
-    (3865,429,4,'४'),
-    (3866,429,5,'५'),
-    (3867,429,6,'६'),
-    (3868,429,7,'७'),
-    (3869,429,8,'८'),
-    (3870,429,9,'९'),
-    (3871,429,10,'१०'),
-    (3872,429,11,'११'),
-    (3873,430,1,'१'),
-    (3874,430,2,'२'),
-    (3875,430,3,'३'),
-    (3876,430,4,'४'),
-    (3877,430,5,'५'),
-    (3878,430,6,'६'),
-    (3879,430,7,'७'),
-    (3880,430,8,'८'),
-    (3881,430,9,'९'),
-    (3882,430,10,'१०'),
-    (3883,431,1,'१'),
-    (3884,431,2,'२'),
-    (3885,431,3,'३'),
-    (3886,431,4,'४'),
-    (3887,431,5,'५'),
-    (3888,431,6,'६'),
-    (3889,432,1,'१'),
-    (3890,432,2,'२'),
-    (3891,432,3,'३'),
-    (3892,432,4,'४'),
-    (3893,432,5,'५'),
-    (3894,432,6,'६'),
-    (3895,432,7,'७'),
-    (3896,432,8,'८'),
-    (3897,432,9,'९'),
-    (3898,432,10,'१०'),
-    (3899,432,11,'११'),
-    (3900,432,12,'१२'),
-    (3901,432,13,'१३'),
-    (3902,433,1,'१'),
-    (3903,433,2,'२'),
-    (3904,433,3,'३'),
-    (3905,433,4,'४'),
-    (3906,433,5,'५'),
-    (3907,433,6,'६'),
-    (3908,433,7,'७'),
-    (3909,433,8,'८'),
-    (3910,433,9,'९'),
-    (3911,433,10,'१०'),
-    (3912,433,11,'११'),
-    (3913,433,12,'१२'),
-    (3914,433,13,'१३'),
-    (3915,433,14,'१४'),
-    (3916,434,1,'१'),
-    (3917,434,2,'२'),
-    (3918,434,3,'३'),
-    (3919,434,4,'४'),
-    (3920,434,5,'५'),
-    (3921,434,6,'६'),
-    (3922,434,7,'७'),
-    (3923,435,1,'१'),
-    (3924,435,2,'२'),
-    (3925,435,3,'३'),
-    (3926,435,4,'४'),
-    (3927,435,5,'५'),
-    (3928,435,6,'६'),
-    (3929,435,7,'७'),
-    (3930,435,8,'८'),
-    (3931,435,9,'९'),
-    (3932,435,10,'१०'),
-    (3933,435,11,'११'),
-    (3934,435,12,'१२'),
-    (3935,436,1,'१'),
-    (3936,436,2,'२'),
-    (3937,436,3,'३'),
-    (3938,436,4,'४'),
-    (3939,436,5,'५'),
-    (3940,436,6,'६'),
-    (3941,436,7,'७'),
-    (3942,436,8,'८'),
-    (3943,436,9,'९'),
-    (3944,437,1,'१'),
-    (3945,437,2,'२'),
-    (3946,437,3,'३'),
-    (3947,437,4,'४'),
-    (3948,437,5,'५'),
-    (3949,438,1,'१'),
-    (3950,438,2,'२'),
-    (3951,438,3,'३'),
-    (3952,438,4,'४'),
-    (3953,438,5,'५'),
-    (3954,438,6,'६'),
-    (3955,438,7,'७'),
-    (3956,438,8,'८'),
-    (3957,439,1,'१'),
-    (3958,439,2,'२'),
-    (3959,439,3,'३'),
-    (3960,439,4,'४'),
-    (3961,439,5,'५'),
-    (3962,440,1,'१'),
-    (3963,440,2,'२'),
-    (3964,440,3,'३'),
-    (3965,440,4,'४'),
-    (3966,440,5,'५'),
-    (3967,440,6,'६'),
-    (3968,441,1,'१'),
-    (3969,441,2,'२'),
-    (3970,441,3,'३'),
-    (3971,441,4,'४'),
-    (3972,441,5,'५'),
-    (3973,441,6,'६'),
-    (3974,442,1,'१'),
-    (3975,442,2,'२'),
-    (3976,442,3,'३'),
-    (3977,442,4,'४'),
-    (3978,442,5,'५'),
-    (3979,442,6,'६'),
-    (3980,442,7,'७'),
-    (3981,442,8,'८'),
-    (3982,442,9,'९'),
-    (3983,442,10,'१०'),
-    (3984,442,11,'११'),
-    (3985,442,12,'१२'),
-    (3986,442,13,'१३'),
-    (3987,442,14,'१४'),
-    (3988,442,15,'१५'),
-    (3989,442,16,'१६'),
-    (3990,442,17,'१७'),
-    (3991,442,18,'१८'),
-    (3992,443,1,'१'),
-    (3993,443,2,'२'),
-    (3994,443,3,'३'),
-    (3995,443,4,'४'),
-    (3996,443,5,'५'),
-    (3997,443,6,'६'),
-    (3998,444,1,'१'),
-    (3999,444,2,'२'),
-    (4000,444,3,'३'),
-
-    (4001,444,4,'४'),
-    (4002,444,5,'५'),
-    (4003,444,6,'६'),
-    (4004,445,1,'१'),
-    (4005,445,2,'२'),
-    (4006,445,3,'३'),
-    (4007,445,4,'४'),
-    (4008,445,5,'५'),
-    (4009,445,6,'६'),
-    (4010,446,1,'१'),
-    (4011,446,2,'२'),
-    (4012,446,3,'३'),
-    (4013,446,4,'४'),
-    (4014,446,5,'५'),
-    (4015,446,6,'६'),
-    (4016,446,7,'७'),
-    (4017,446,8,'८'),
-    (4018,446,9,'९'),
-    (4019,446,10,'१०'),
-    (4020,446,11,'११'),
-    (4021,446,12,'१२'),
-    (4022,446,13,'१३'),
-    (4023,446,14,'१४'),
-    (4024,446,15,'१५'),
-    (4025,446,16,'१६'),
-    (4026,446,17,'१७'),
-    (4027,447,1,'१'),
-    (4028,447,2,'२'),
-    (4029,447,3,'३'),
-    (4030,447,4,'४'),
-    (4031,447,5,'५'),
-    (4032,447,6,'६'),
-    (4033,447,7,'७'),
-    (4034,447,8,'८'),
-    (4035,447,9,'९'),
-    (4036,447,10,'१०'),
-    (4037,447,11,'११'),
-    (4038,447,12,'१२'),
-    (4039,447,13,'१३'),
-    (4040,447,14,'१४'),
-    (4041,447,15,'१५'),
-    (4042,447,16,'१६'),
-    (4043,447,17,'१७'),
-    (4044,448,1,'१'),
-    (4045,448,2,'२'),
-    (4046,448,3,'३'),
-    (4047,448,4,'४'),
-    (4048,448,5,'५'),
-    (4049,448,6,'६'),
-    (4050,448,7,'७'),
-    (4051,448,8,'८'),
-    (4052,448,9,'९'),
-    (4053,448,10,'१०'),
-    (4054,448,11,'११'),
-    (4055,448,12,'१२'),
-    (4056,448,13,'१३'),
-    (4057,448,14,'१४'),
-    (4058,448,15,'१५'),
-    (4059,449,1,'१'),
-    (4060,449,2,'२'),
-    (4061,449,3,'३'),
-    (4062,449,4,'४'),
-    (4063,449,5,'५'),
-    (4064,449,6,'६'),
-    (4065,449,7,'७'),
-    (4066,450,1,'१'),
-    (4067,450,2,'२'),
-    (4068,450,3,'३'),
-    (4069,450,4,'४'),
-    (4070,450,5,'५'),
-    (4071,450,6,'६'),
-    (4072,450,7,'७'),
-    (4073,450,8,'८'),
-    (4074,450,9,'९'),
-    (4075,450,10,'१०'),
-    (4076,450,11,'११'),
-    (4077,450,12,'१२'),
-    (4078,450,13,'१३'),
-    (4079,450,14,'१४'),
-    (4080,451,1,'१'),
-    (4081,451,2,'२'),
-    (4082,451,3,'३'),
-    (4083,451,4,'४'),
-    (4084,451,5,'५'),
-    (4085,452,1,'१'),
-    (4086,452,2,'२'),
-    (4087,452,3,'३'),
-    (4088,452,4,'४'),
-    (4089,452,5,'५'),
-    (4090,452,6,'६'),
-    (4091,453,1,'१'),
-    (4092,453,2,'२'),
-    (4093,453,3,'३'),
-    (4094,453,4,'४'),
-    (4095,453,5,'५'),
-    (4096,453,6,'६'),
-    (4097,454,1,'१'),
-    (4098,454,2,'२'),
-    (4099,454,3,'३'),
-    (4100,454,4,'४'),
-    (4101,454,5,'५'),
-    (4102,454,6,'६'),
-    (4103,454,7,'७'),
-    (4104,454,8,'८'),
-    (4105,454,9,'९'),
-    (4106,455,1,'१'),
-    (4107,455,2,'२'),
-    (4108,455,3,'३'),
-    (4109,455,4,'४'),
-    (4110,455,5,'५'),
-    (4111,455,6,'६'),
-    (4112,455,7,'७'),
-    (4113,455,8,'८'),
-    (4114,456,1,'१'),
-    (4115,456,2,'२'),
-    (4116,456,3,'३'),
-    (4117,456,4,'४'),
-    (4118,456,5,'५'),
-    (4119,456,6,'६'),
-    (4120,456,7,'७'),
-    (4121,457,1,'१'),
-    (4122,457,2,'२'),
-    (4123,457,3,'३'),
-    (4124,457,4,'४'),
-    (4125,457,5,'५'),
-    (4126,457,6,'६'),
-    (4127,457,7,'७'),
-    (4128,457,8,'८'),
-    (4129,457,9,'९'),
-    (4130,457,10,'१०'),
-    (4131,458,1,'१'),
-    (4132,458,2,'२'),
-    (4133,458,3,'३'),
-    (4134,458,4,'४'),
-    (4135,458,5,'५'),
-    (4136,458,6,'६'),
-    (4137,458,7,'७'),
-    (4138,458,8,'८'),
-    (4139,458,9,'९'),
-    (4140,458,10,'१०'),
-    (4141,458,11,'११'),
-    (4142,458,12,'१२'),
-    (4143,458,13,'१३'),
-    (4144,458,14,'१४'),
-    (4145,459,1,'१'),
-    (4146,459,2,'२'),
-    (4147,459,3,'३'),
-    (4148,459,4,'४'),
-    (4149,459,5,'५'),
-    (4150,459,6,'६'),
-    (4151,459,7,'७'),
-    (4152,459,8,'८'),
-    (4153,459,9,'९'),
-    (4154,459,10,'१०'),
-    (4155,459,11,'११'),
-    (4156,460,1,'१'),
-    (4157,460,2,'२'),
-    (4158,460,3,'३'),
-    (4159,460,4,'४'),
-    (4160,460,5,'५'),
-    (4161,460,6,'६'),
-    (4162,460,7,'७'),
-    (4163,461,1,'१'),
-    (4164,461,2,'२'),
-    (4165,461,3,'३'),
-    (4166,461,4,'४'),
-    (4167,461,5,'५'),
-    (4168,461,6,'६'),
-    (4169,461,7,'७'),
-    (4170,461,8,'८'),
-    (4171,462,1,'१'),
-    (4172,462,2,'२'),
-    (4173,462,3,'३'),
-    (4174,462,4,'४'),
-    (4175,462,5,'५'),
-    (4176,462,6,'६'),
-    (4177,462,7,'७'),
-    (4178,462,8,'८'),
-    (4179,462,9,'९'),
-    (4180,463,1,'१'),
-    (4181,463,2,'२'),
-    (4182,463,3,'३'),
-    (4183,463,4,'४'),
-    (4184,463,5,'५'),
-    (4185,463,6,'६'),
-    (4186,463,7,'७'),
-    (4187,463,8,'८'),
-    (4188,463,9,'९'),
-    (4189,463,10,'१०'),
-    (4190,463,11,'११'),
-    (4191,463,12,'१२'),
-    (4192,463,13,'१३'),
-    (4193,463,14,'१४'),
-    (4194,464,1,'१'),
-    (4195,464,2,'२'),
-    (4196,464,3,'३'),
-    (4197,464,4,'४'),
-    (4198,464,5,'५'),
-    (4199,464,6,'६'),
-    (4200,464,7,'७'),
-    (4201,464,8,'८'),
-    (4202,464,9,'९'),
-    (4203,464,10,'१०'),
-    (4204,464,11,'११'),
-    (4205,465,1,'१'),
-    (4206,465,2,'२'),
-    (4207,465,3,'३'),
-    (4208,465,4,'४'),
-    (4209,465,5,'५'),
-    (4210,465,6,'६'),
-    (4211,466,1,'१'),
-    (4212,466,2,'२'),
-    (4213,466,3,'३'),
-    (4214,466,4,'४'),
-    (4215,466,5,'५'),
-    (4216,466,6,'६'),
-    (4217,467,1,'१'),
-    (4218,467,2,'२'),
-    (4219,467,3,'३'),
-    (4220,467,4,'४'),
-    (4221,467,5,'५'),
-    (4222,467,6,'६'),
-    (4223,467,7,'७'),
-    (4224,468,1,'१'),
-    (4225,468,2,'२'),
-    (4226,468,3,'३'),
-    (4227,468,4,'४'),
-    (4228,468,5,'५'),
-    (4229,468,6,'६'),
-    (4230,468,7,'७'),
-    (4231,468,8,'८'),
-    (4232,468,9,'९'),
-    (4233,468,10,'१०'),
-    (4234,468,11,'११'),
-    (4235,468,12,'१२'),
-    (4236,468,13,'१३'),
-    (4237,468,14,'१४'),
-    (4238,469,1,'१'),
-    (4239,469,2,'२'),
-    (4240,469,3,'३'),
-    (4241,469,4,'४'),
-    (4242,469,5,'५'),
-    (4243,469,6,'६'),
-    (4244,469,7,'७'),
-    (4245,469,8,'८'),
-    (4246,470,1,'१'),
-    (4247,470,2,'२'),
-    (4248,470,3,'३'),
-    (4249,470,4,'४'),
-    (4250,470,5,'५'),
-
-    (4251,471,1,'१'),
-    (4252,471,2,'२'),
-    (4253,471,3,'३'),
-    (4254,471,4,'४'),
-    (4255,471,5,'५'),
-    (4256,471,6,'६'),
-    (4257,472,1,'१'),
-    (4258,472,2,'२'),
-    (4259,472,3,'३'),
-    (4260,472,4,'४'),
-    (4261,472,5,'५'),
-    (4262,472,6,'६'),
-    (4263,472,7,'७'),
-    (4264,472,8,'८'),
-    (4265,472,9,'९'),
-    (4266,473,1,'१'),
-    (4267,473,2,'२'),
-    (4268,473,3,'३'),
-    (4269,473,4,'४'),
-    (4270,473,5,'५'),
-    (4271,473,6,'६'),
-    (4272,473,7,'७'),
-    (4273,474,1,'१'),
-    (4274,474,2,'२'),
-    (4275,474,3,'३'),
-    (4276,474,4,'४'),
-    (4277,474,5,'५'),
-    (4278,474,6,'६'),
-    (4279,474,7,'७'),
-    (4280,474,8,'८'),
-    (4281,474,9,'९'),
-    (4282,474,10,'१०'),
-    (4283,475,1,'१'),
-    (4284,475,2,'२'),
-    (4285,475,3,'३'),
-    (4286,475,4,'४'),
-    (4287,475,5,'५'),
-    (4288,475,6,'६'),
-    (4289,475,7,'७'),
-    (4290,475,8,'८'),
-    (4291,475,9,'९'),
-    (4292,475,10,'१०'),
-    (4293,475,11,'११'),
-    (4294,476,1,'१'),
-    (4295,476,2,'२'),
-    (4296,476,3,'३'),
-    (4297,476,4,'४'),
-    (4298,476,5,'५'),
-    (4299,477,1,'१'),
-    (4300,477,2,'२'),
-    (4301,477,3,'३'),
-    (4302,477,4,'४'),
-    (4303,477,5,'५'),
-    (4304,477,6,'६'),
-    (4305,477,7,'७'),
-    (4306,477,8,'८'),
-    (4307,477,9,'९'),
-    (4308,477,10,'१०'),
-    (4309,478,1,'१'),
-    (4310,478,2,'२'),
-    (4311,478,3,'३'),
-    (4312,478,4,'४'),
-    (4313,478,5,'५'),
-    (4314,478,6,'६'),
-    (4315,478,7,'७'),
-    (4316,478,8,'८'),
-    (4317,478,9,'९'),
-    (4318,478,10,'१०'),
-    (4319,478,11,'११'),
-    (4320,478,12,'१२'),
-    (4321,478,13,'१३'),
-    (4322,478,14,'१४'),
-    (4323,479,1,'१'),
-    (4324,479,2,'२'),
-    (4325,479,3,'३'),
-    (4326,479,4,'४'),
-    (4327,479,5,'५'),
-    (4328,479,6,'६'),
-    (4329,479,7,'७'),
-    (4330,479,8,'८'),
-    (4331,480,1,'१'),
-    (4332,480,2,'२'),
-    (4333,480,3,'३'),
-    (4334,480,4,'४'),
-    (4335,480,5,'५'),
-    (4336,480,6,'६'),
-    (4337,480,7,'७'),
-    (4338,480,8,'८'),
-    (4339,480,9,'९'),
-    (4340,481,1,'१'),
-    (4341,481,2,'२'),
-    (4342,481,3,'३'),
-    (4343,481,4,'४'),
-    (4344,481,5,'५'),
-    (4345,481,6,'६'),
-    (4346,481,7,'७'),
-    (4347,482,1,'१'),
-    (4348,482,2,'२'),
-    (4349,482,3,'३'),
-    (4350,482,4,'४'),
-    (4351,482,5,'५'),
-    (4352,483,1,'१'),
-    (4353,483,2,'२'),
-    (4354,483,3,'३'),
-    (4355,483,4,'४'),
-    (4356,483,5,'५'),
-    (4357,483,6,'६'),
-    (4358,484,1,'१'),
-    (4359,484,2,'२'),
-    (4360,484,3,'३'),
-    (4361,484,4,'४'),
-    (4362,484,5,'५'),
-    (4363,484,6,'६'),
-    (4364,484,7,'७'),
-    (4365,485,1,'१'),
-    (4366,485,2,'२'),
-    (4367,485,3,'३'),
-    (4368,485,4,'४'),
-    (4369,485,5,'५'),
-    (4370,485,6,'६'),
-    (4371,486,1,'१'),
-    (4372,486,2,'२'),
-    (4373,486,3,'३'),
-    (4374,486,4,'४'),
-    (4375,486,5,'५'),
-    (4376,486,6,'६'),
-    (4377,486,7,'७'),
-    (4378,487,1,'१'),
-    (4379,487,2,'२'),
-    (4380,487,3,'३'),
-    (4381,487,4,'४'),
-    (4382,487,5,'५'),
-    (4383,487,6,'६'),
-    (4384,487,7,'७'),
-    (4385,487,8,'८'),
-    (4386,487,9,'९'),
-    (4387,487,10,'१०'),
-    (4388,488,1,'१'),
-    (4389,488,2,'२'),
-    (4390,488,3,'३'),
-    (4391,488,4,'४'),
-    (4392,488,5,'५'),
-    (4393,488,6,'६'),
-    (4394,488,7,'७'),
-    (4395,488,8,'८'),
-    (4396,488,9,'९'),
-    (4397,489,1,'१'),
-    (4398,489,2,'२'),
-    (4399,489,3,'३'),
-    (4400,489,4,'४'),
-    (4401,489,5,'५'),
-    (4402,489,6,'६'),
-    (4403,489,7,'७'),
-    (4404,489,8,'८'),
-    (4405,490,1,'१'),
-    (4406,490,2,'२'),
-    (4407,490,3,'३'),
-    (4408,490,4,'४'),
-    (4409,490,5,'५'),
-    (4410,490,6,'६'),
-    (4411,490,7,'७'),
-    (4412,491,1,'१'),
-    (4413,491,2,'२'),
-    (4414,491,3,'३'),
-    (4415,491,4,'४'),
-    (4416,491,5,'५'),
-    (4417,491,6,'६'),
-    (4418,491,7,'७'),
-    (4419,492,1,'१'),
-    (4420,492,2,'२'),
-    (4421,492,3,'३'),
-    (4422,492,4,'४'),
-    (4423,492,5,'५'),
-    (4424,492,6,'६'),
-    (4425,492,7,'७'),
-    (4426,492,8,'८'),
-    (4427,493,1,'१'),
-    (4428,493,2,'२'),
-    (4429,493,3,'३'),
-    (4430,493,4,'४'),
-    (4431,493,5,'५'),
-    (4432,493,6,'६'),
-    (4433,493,7,'७'),
-    (4434,493,8,'८'),
-    (4435,494,1,'१'),
-    (4436,494,2,'२'),
-    (4437,494,3,'३'),
-    (4438,494,4,'४'),
-    (4439,494,5,'५'),
-    (4440,494,6,'६'),
-    (4441,494,7,'७'),
-    (4442,494,8,'८'),
-    (4443,494,9,'९'),
-    (4444,494,10,'१०'),
-    (4445,495,1,'१'),
-    (4446,495,2,'२'),
-    (4447,495,3,'३'),
-    (4448,495,4,'४'),
-    (4449,495,5,'५'),
-    (4450,495,6,'६'),
-    (4451,495,7,'७'),
-    (4452,495,8,'८'),
-    (4453,495,9,'९'),
-    (4454,496,1,'१'),
-    (4455,496,2,'२'),
-    (4456,496,3,'३'),
-    (4457,496,4,'४'),
-    (4458,496,5,'५'),
-    (4459,497,1,'१'),
-    (4460,497,2,'२'),
-    (4461,497,3,'३'),
-    (4462,497,4,'४'),
-    (4463,497,5,'५'),
-    (4464,498,1,'१'),
-    (4465,498,2,'२'),
-    (4466,498,3,'३'),
-    (4467,498,4,'४'),
-    (4468,498,5,'५'),
-    (4469,498,6,'६'),
-    (4470,499,1,'१'),
-    (4471,499,2,'२'),
-    (4472,499,3,'३'),
-    (4473,499,4,'४'),
-    (4474,499,5,'५'),
-    (4475,499,6,'६'),
-    (4476,500,1,'१'),
-    (4477,500,2,'२'),
-    (4478,500,3,'३'),
-    (4479,500,4,'४'),
-    (4480,500,5,'५'),
-    (4481,500,6,'६'),
-    (4482,500,7,'७'),
-    (4483,501,1,'१'),
-    (4484,501,2,'२'),
-    (4485,501,3,'३'),
-    (4486,501,4,'४'),
-    (4487,501,5,'५'),
-    (4488,501,6,'६'),
-    (4489,501,7,'७'),
-    (4490,501,8,'८'),
-    (4491,502,1,'१'),
-    (4492,502,2,'२'),
-    (4493,502,3,'३'),
-    (4494,502,4,'४'),
-    (4495,502,5,'५'),
-    (4496,502,6,'६'),
-    (4497,502,7,'७'),
-    (4498,502,8,'८'),
-    (4499,503,1,'१'),
-    (4500,503,2,'२'),
-
-    (4501,503,3,'३'),
-    (4502,503,4,'४'),
-    (4503,503,5,'५'),
-    (4504,503,6,'६'),
-    (4505,503,7,'७'),
-    (4506,503,8,'८'),
-    (4507,503,9,'९'),
-    (4508,504,1,'१'),
-    (4509,504,2,'२'),
-    (4510,504,3,'३'),
-    (4511,504,4,'४'),
-    (4512,504,5,'५'),
-    (4513,504,6,'६'),
-    (4514,505,1,'१'),
-    (4515,505,2,'२'),
-    (4516,505,3,'३'),
-    (4517,505,4,'४'),
-    (4518,505,5,'५'),
-    (4519,505,6,'६'),
-    (4520,505,7,'७'),
-    (4521,505,8,'८'),
-    (4522,506,1,'१'),
-    (4523,506,2,'२'),
-    (4524,506,3,'३'),
-    (4525,506,4,'४'),
-    (4526,506,5,'५'),
-    (4527,506,6,'६'),
-    (4528,506,7,'७'),
-    (4529,507,1,'१'),
-    (4530,507,2,'२'),
-    (4531,507,3,'३'),
-    (4532,507,4,'४'),
-    (4533,507,5,'५'),
-    (4534,507,6,'६'),
-    (4535,507,7,'७'),
-    (4536,508,1,'१'),
-    (4537,508,2,'२'),
-    (4538,508,3,'३'),
-    (4539,508,4,'४'),
-    (4540,508,5,'५'),
-    (4541,508,6,'६'),
-    (4542,508,7,'७'),
-    (4543,508,8,'८'),
-    (4544,508,9,'९'),
-    (4545,508,10,'१०'),
-    (4546,508,11,'११'),
-    (4547,508,12,'१२'),
-    (4548,508,13,'१३'),
-    (4549,508,14,'१४'),
-    (4550,509,1,'१'),
-    (4551,509,2,'२'),
-    (4552,509,3,'३'),
-    (4553,509,4,'४'),
-    (4554,509,5,'५'),
-    (4555,509,6,'६'),
-    (4556,509,7,'७'),
-    (4557,510,1,'१'),
-    (4558,510,2,'२'),
-    (4559,510,3,'३'),
-    (4560,510,4,'४'),
-    (4561,510,5,'५'),
-    (4562,510,6,'६'),
-    (4563,511,1,'१'),
-    (4564,511,2,'२'),
-    (4565,511,3,'३'),
-    (4566,511,4,'४'),
-    (4567,511,5,'५'),
-    (4568,511,6,'६'),
-    (4569,512,1,'१'),
-    (4570,512,2,'२'),
-    (4571,512,3,'३'),
-    (4572,512,4,'४'),
-    (4573,512,5,'५'),
-    (4574,512,6,'६'),
-    (4575,512,7,'७'),
-    (4576,512,8,'८'),
-    (4577,513,1,'१'),
-    (4578,513,2,'२'),
-    (4579,513,3,'३'),
-    (4580,513,4,'४'),
-    (4581,513,5,'५'),
-    (4582,513,6,'६'),
-    (4583,513,7,'७'),
-    (4584,513,8,'८'),
-    (4585,513,9,'९'),
-    (4586,514,1,'१'),
-    (4587,514,2,'२'),
-    (4588,514,3,'३'),
-    (4589,514,4,'४'),
-    (4590,514,5,'५'),
-    (4591,514,6,'६'),
-    (4592,514,7,'७'),
-    (4593,514,8,'८'),
-    (4594,514,9,'९'),
-    (4595,514,10,'१०'),
-    (4596,515,1,'१'),
-    (4597,515,2,'२'),
-    (4598,515,3,'३'),
-    (4599,515,4,'४'),
-    (4600,515,5,'५'),
-    (4601,515,6,'६'),
-    (4602,515,7,'७'),
-    (4603,515,8,'८'),
-    (4604,515,9,'९'),
-    (4605,515,10,'१०'),
-    (4606,515,11,'११'),
-    (4607,515,12,'१२'),
-    (4608,516,1,'१'),
-    (4609,516,2,'२'),
-    (4610,516,3,'३'),
-    (4611,516,4,'४'),
-    (4612,516,5,'५'),
-    (4613,516,6,'६'),
-    (4614,516,7,'७'),
-    (4615,516,8,'८'),
-    (4616,517,1,'१'),
-    (4617,517,2,'२'),
-    (4618,517,3,'३'),
-    (4619,517,4,'४'),
-    (4620,517,5,'५'),
-    (4621,517,6,'६'),
-    (4622,517,7,'७'),
-    (4623,517,8,'८'),
-    (4624,517,9,'९'),
-    (4625,517,10,'१०'),
-    (4626,517,11,'११'),
-    (4627,517,12,'१२'),
-    (4628,517,13,'१३'),
-    (4629,517,14,'१४'),
-    (4630,518,1,'१'),
-    (4631,518,2,'२'),
-    (4632,518,3,'३'),
-    (4633,518,4,'४'),
-    (4634,518,5,'५'),
-    (4635,518,6,'६'),
-    (4636,518,7,'७'),
-    (4637,518,8,'८'),
-    (4638,518,9,'९'),
-    (4639,518,10,'१०'),
-    (4640,519,1,'१'),
-    (4641,519,2,'२'),
-    (4642,519,3,'३'),
-    (4643,519,4,'४'),
-    (4644,519,5,'५'),
-    (4645,519,6,'६'),
-    (4646,520,1,'१'),
-    (4647,520,2,'२'),
-    (4648,520,3,'३'),
-    (4649,520,4,'४'),
-    (4650,520,5,'५'),
-    (4651,521,1,'१'),
-    (4652,521,2,'२'),
-    (4653,521,3,'३'),
-    (4654,521,4,'४'),
-    (4655,521,5,'५'),
-    (4656,521,6,'६'),
-    (4657,521,7,'७'),
-    (4658,521,8,'८'),
-    (4659,521,9,'९'),
-    (4660,522,1,'१'),
-    (4661,522,2,'२'),
-    (4662,522,3,'३'),
-    (4663,522,4,'४'),
-    (4664,522,5,'५'),
-    (4665,522,6,'६'),
-    (4666,522,7,'७'),
-    (4667,522,8,'८'),
-    (4668,522,9,'९'),
-    (4669,522,10,'१०'),
-    (4670,522,11,'११'),
-    (4671,522,12,'१२'),
-    (4672,522,13,'१३'),
-    (4673,522,14,'१४'),
-    (4674,523,1,'१'),
-    (4675,523,2,'२'),
-    (4676,523,3,'३'),
-    (4677,523,4,'४'),
-    (4678,523,5,'५'),
-    (4679,523,6,'६'),
-    (4680,523,7,'७'),
-    (4681,523,8,'८'),
-    (4682,524,1,'१'),
-    (4683,524,2,'२'),
-    (4684,524,3,'३'),
-    (4685,524,4,'४'),
-    (4686,524,5,'५'),
-    (4687,524,6,'६'),
-    (4688,524,7,'७'),
-    (4689,524,8,'८'),
-    (4690,525,1,'१'),
-    (4691,525,2,'२'),
-    (4692,525,3,'३'),
-    (4693,525,4,'४'),
-    (4694,525,5,'५'),
-    (4695,525,6,'६'),
-    (4696,526,1,'१'),
-    (4697,526,2,'२'),
-    (4698,526,3,'३'),
-    (4699,526,4,'४'),
-    (4700,526,5,'५'),
-    (4701,526,6,'६'),
-    (4702,526,7,'७'),
-    (4703,526,8,'८'),
-    (4704,527,1,'१'),
-    (4705,527,2,'२'),
-    (4706,527,3,'३'),
-    (4707,527,4,'४'),
-    (4708,527,5,'५'),
-    (4709,527,6,'६'),
-    (4710,527,7,'७'),
-    (4711,528,1,'१'),
-    (4712,528,2,'२'),
-    (4713,528,3,'३'),
-    (4714,528,4,'४'),
-    (4715,528,5,'५'),
-    (4716,528,6,'६'),
-    (4717,528,7,'७'),
-    (4718,528,8,'८'),
-    (4719,528,9,'९'),
-    (4720,528,10,'१०'),
-    (4721,528,11,'११'),
-    (4722,528,12,'१२'),
-    (4723,528,13,'१३'),
-    (4724,528,14,'१४'),
-    (4725,528,15,'१५'),
-    (4726,528,16,'१६'),
-    (4727,529,1,'१'),
-    (4728,529,2,'२'),
-    (4729,529,3,'३'),
-    (4730,529,4,'४'),
-    (4731,529,5,'५'),
-    (4732,529,6,'६'),
-    (4733,529,7,'७'),
-    (4734,529,8,'८'),
-    (4735,529,9,'९'),
-    (4736,529,10,'१०'),
-    (4737,529,11,'११'),
-    (4738,529,12,'१२'),
-    (4739,529,13,'१३'),
-    (4740,530,1,'१'),
-    (4741,530,2,'२'),
-    (4742,530,3,'३'),
-    (4743,530,4,'४'),
-    (4744,530,5,'५'),
-    (4745,530,6,'६'),
-    (4746,530,7,'७'),
-    (4747,530,8,'८'),
-    (4748,530,9,'९'),
-    (4749,530,10,'१०'),
-    (4750,530,11,'११'),
-
-    (4751,530,12,'१२'),
-    (4752,530,13,'१३'),
-    (4753,530,14,'१४'),
-    (4754,530,15,'१५'),
-    (4755,530,16,'१६'),
-    (4756,530,17,'१७'),
-    (4757,530,18,'१८'),
-    (4758,531,1,'१'),
-    (4759,531,2,'२'),
-    (4760,531,3,'३'),
-    (4761,531,4,'४'),
-    (4762,531,5,'५'),
-    (4763,531,6,'६'),
-    (4764,532,1,'१'),
-    (4765,532,2,'२'),
-    (4766,532,3,'३'),
-    (4767,532,4,'४'),
-    (4768,532,5,'५'),
-    (4769,532,6,'६'),
-    (4770,532,7,'७'),
-    (4771,533,1,'१'),
-    (4772,533,2,'२'),
-    (4773,533,3,'३'),
-    (4774,533,4,'४'),
-    (4775,533,5,'५'),
-    (4776,533,6,'६'),
-    (4777,533,7,'७'),
-    (4778,533,8,'८'),
-    (4779,533,9,'९'),
-    (4780,534,1,'१'),
-    (4781,534,2,'२'),
-    (4782,534,3,'३'),
-    (4783,534,4,'४'),
-    (4784,534,5,'५'),
-    (4785,535,1,'१'),
-    (4786,535,2,'२'),
-    (4787,535,3,'३'),
-    (4788,535,4,'४'),
-    (4789,535,5,'५'),
-    (4790,535,6,'६'),
-    (4791,535,7,'७'),
-    (4792,535,8,'८'),
-    (4793,535,9,'९'),
-    (4794,535,10,'१०'),
-    (4795,535,11,'११'),
-    (4796,535,12,'१२'),
-    (4797,536,1,'१'),
-    (4798,536,2,'२'),
-    (4799,536,3,'३'),
-    (4800,536,4,'४'),
-    (4801,536,5,'५'),
-    (4802,536,6,'६'),
-    (4803,536,7,'७'),
-    (4804,536,8,'८'),
-    (4805,536,9,'९'),
-    (4806,536,10,'१०'),
-    (4807,536,11,'११'),
-    (4808,536,12,'१२'),
-    (4809,536,13,'१३'),
-    (4810,536,14,'१४'),
-    (4811,536,15,'१५'),
-    (4812,536,16,'१६'),
-    (4813,536,17,'१७'),
-    (4814,536,18,'१८'),
-    (4815,536,19,'१९'),
-    (4816,537,1,'१'),
-    (4817,537,2,'२'),
-    (4818,537,3,'३'),
-    (4819,537,4,'४'),
-    (4820,537,5,'५'),
-    (4821,537,6,'६'),
-    (4822,537,7,'७'),
-    (4823,537,8,'८'),
-    (4824,537,9,'९'),
-    (4825,537,10,'१०'),
-    (4826,537,11,'११'),
-    (4827,538,1,'१'),
-    (4828,538,2,'२'),
-    (4829,538,3,'३'),
-    (4830,538,4,'४'),
-    (4831,538,5,'५'),
-    (4832,539,1,'१'),
-    (4833,539,2,'२'),
-    (4834,539,3,'३'),
-    (4835,539,4,'४'),
-    (4836,539,5,'५'),
-    (4837,539,6,'६'),
-    (4838,539,7,'७'),
-    (4839,539,8,'८'),
-    (4840,539,9,'९'),
-    (4841,540,1,'१'),
-    (4842,540,2,'२'),
-    (4843,540,3,'३'),
-    (4844,540,4,'४'),
-    (4845,540,5,'५'),
-    (4846,540,6,'६'),
-    (4847,540,7,'७'),
-    (4848,541,1,'१'),
-    (4849,541,2,'२'),
-    (4850,541,3,'३'),
-    (4851,541,4,'४'),
-    (4852,541,5,'५'),
-    (4853,541,6,'६'),
-    (4854,541,7,'७'),
-    (4855,542,1,'१'),
-    (4856,542,2,'२'),
-    (4857,542,3,'३'),
-    (4858,542,4,'४'),
-    (4859,542,5,'५'),
-    (4860,542,6,'६'),
-    (4861,542,7,'७'),
-    (4862,542,8,'८'),
-    (4863,542,9,'९'),
-    (4864,542,10,'१०'),
-    (4865,542,11,'११'),
-    (4866,542,12,'१२'),
-    (4867,542,13,'१३'),
-    (4868,542,14,'१४'),
-    (4869,542,15,'१५'),
-    (4870,542,16,'१६'),
-    (4871,542,17,'१७'),
-    (4872,543,1,'१'),
-    (4873,543,2,'२'),
-    (4874,543,3,'३'),
-    (4875,543,4,'४'),
-    (4876,543,5,'५'),
-    (4877,543,6,'६'),
-    (4878,544,1,'१'),
-    (4879,544,2,'२'),
-    (4880,544,3,'३'),
-    (4881,544,4,'४'),
-    (4882,544,5,'५'),
-    (4883,544,6,'६'),
-    (4884,544,7,'७'),
-    (4885,545,1,'१'),
-    (4886,545,2,'२'),
-    (4887,545,3,'३'),
-    (4888,545,4,'४'),
-    (4889,545,5,'५'),
-    (4890,545,6,'६'),
-    (4891,545,7,'७'),
-    (4892,545,8,'८'),
-    (4893,545,9,'९'),
-    (4894,545,10,'१०'),
-    (4895,545,11,'११'),
-    (4896,545,12,'१२'),
-    (4897,545,13,'१३'),
-    (4898,546,1,'१'),
-    (4899,546,2,'२'),
-    (4900,546,3,'३'),
-    (4901,546,4,'४'),
-    (4902,546,5,'५'),
-    (4903,546,6,'६'),
-    (4904,546,7,'७'),
-    (4905,546,8,'८'),
-    (4906,547,1,'१'),
-    (4907,547,2,'२'),
-    (4908,547,3,'३'),
-    (4909,547,4,'४'),
-    (4910,547,5,'५'),
-    (4911,547,6,'६'),
-    (4912,547,7,'७'),
-    (4913,547,8,'८'),
-    (4914,547,9,'९'),
-    (4915,547,10,'१०'),
-    (4916,547,11,'११'),
-    (4917,547,12,'१२'),
-    (4918,547,13,'१३'),
-    (4919,548,1,'१'),
-    (4920,548,2,'२'),
-    (4921,548,3,'३'),
-    (4922,548,4,'४'),
-    (4923,548,5,'५'),
-    (4924,548,6,'६'),
-    (4925,548,7,'७'),
-    (4926,549,1,'१'),
-    (4927,549,2,'२'),
-    (4928,549,3,'३'),
-    (4929,549,4,'४'),
-    (4930,549,5,'५'),
-    (4931,549,6,'६'),
-    (4932,549,7,'७'),
-    (4933,550,1,'१'),
-    (4934,550,2,'२'),
-    (4935,550,3,'३'),
-    (4936,550,4,'४'),
-    (4937,550,5,'५'),
-    (4938,550,6,'६'),
-    (4939,550,7,'७'),
-    (4940,551,1,'१'),
-    (4941,551,2,'२'),
-    (4942,551,3,'३'),
-    (4943,551,4,'४'),
-    (4944,551,5,'५'),
-    (4945,551,6,'६'),
-    (4946,551,7,'७'),
-    (4947,551,8,'८'),
-    (4948,551,9,'९'),
-    (4949,551,10,'१०'),
-    (4950,551,11,'११'),
-    (4951,552,1,'१'),
-    (4952,552,2,'२'),
-    (4953,552,3,'३'),
-    (4954,552,4,'४'),
-    (4955,552,5,'५'),
-    (4956,552,6,'६'),
-    (4957,552,7,'७'),
-    (4958,552,8,'८'),
-    (4959,552,9,'९'),
-    (4960,552,10,'१०'),
-    (4961,553,1,'१'),
-    (4962,553,2,'२'),
-    (4963,553,3,'३'),
-    (4964,553,4,'४'),
-    (4965,553,5,'५'),
-    (4966,553,6,'६'),
-    (4967,553,7,'७'),
-    (4968,553,8,'८'),
-    (4969,553,9,'९'),
-    (4970,553,10,'१०'),
-    (4971,553,11,'११'),
-    (4972,554,1,'१'),
-    (4973,554,2,'२'),
-    (4974,554,3,'३'),
-    (4975,554,4,'४'),
-    (4976,554,5,'५'),
-    (4977,554,6,'६'),
-    (4978,554,7,'७'),
-    (4979,555,1,'१'),
-    (4980,555,2,'२'),
-    (4981,555,3,'३'),
-    (4982,555,4,'४'),
-    (4983,555,5,'५'),
-    (4984,555,6,'६'),
-    (4985,555,7,'७'),
-    (4986,555,8,'८'),
-    (4987,555,9,'९'),
-    (4988,555,10,'१०'),
-    (4989,555,11,'११'),
-    (4990,555,12,'१२'),
-    (4991,556,1,'१'),
-    (4992,556,2,'२'),
-    (4993,556,3,'३'),
-    (4994,556,4,'४'),
-    (4995,556,5,'५'),
-    (4996,556,6,'६'),
-    (4997,556,7,'७'),
-    (4998,556,8,'८'),
-    (4999,556,9,'९'),
-    (5000,556,10,'१०'),
-    (5001,556,11,'११'),
-    (5002,557,1,'१'),
-    (5003,557,2,'२'),
-    (5004,557,3,'३'),
-    (5005,557,4,'४'),
-    (5006,557,5,'५'),
-    (5007,557,6,'६'),
-    (5008,557,7,'७'),
-    (5009,557,8,'८'),
-    (5010,557,9,'९'),
-    (5011,557,10,'१०'),
-    (5012,557,11,'११'),
-    (5013,557,12,'१२'),
-    (5014,558,1,'१'),
-    (5015,558,2,'२'),
-    (5016,558,3,'३'),
-    (5017,558,4,'४'),
-    (5018,558,5,'५'),
-    (5019,558,6,'६'),
-    (5020,558,7,'७'),
-    (5021,558,8,'८'),
-    (5022,559,1,'१'),
-    (5023,559,2,'२'),
-    (5024,559,3,'३'),
-    (5025,559,4,'४'),
-    (5026,559,5,'५'),
-    (5027,559,6,'६'),
-    (5028,559,7,'७'),
-    (5029,559,8,'८'),
-    (5030,560,1,'१'),
-    (5031,560,2,'२'),
-    (5032,560,3,'३'),
-    (5033,560,4,'४'),
-    (5034,560,5,'५'),
-    (5035,560,6,'६'),
-    (5036,561,1,'१'),
-    (5037,561,2,'२'),
-    (5038,561,3,'३'),
-    (5039,561,4,'४'),
-    (5040,561,5,'५'),
-    (5041,561,6,'६'),
-    (5042,561,7,'७'),
-    (5043,561,8,'८'),
-    (5044,562,1,'१'),
-    (5045,562,2,'२'),
-    (5046,562,3,'३'),
-    (5047,562,4,'४'),
-    (5048,562,5,'५'),
-    (5049,562,6,'६'),
-    (5050,562,7,'७'),
-    (5051,562,8,'८'),
-    (5052,562,9,'९'),
-    (5053,562,10,'१०'),
-    (5054,562,11,'११'),
-    (5055,562,12,'१२'),
-    (5056,562,13,'१३'),
-    (5057,562,14,'१४'),
-    (5058,562,15,'१५'),
-    (5059,562,16,'१६'),
-    (5060,562,17,'१७'),
-    (5061,562,18,'१८'),
-    (5062,562,19,'१९'),
-    (5063,563,1,'१'),
-    (5064,563,2,'२'),
-    (5065,563,3,'३'),
-    (5066,563,4,'४'),
-    (5067,563,5,'५'),
-    (5068,563,6,'६'),
-    (5069,563,7,'७'),
-    (5070,563,8,'८'),
-    (5071,563,9,'९'),
-    (5072,563,10,'१०'),
-    (5073,563,11,'११'),
-    (5074,563,12,'१२'),
-    (5075,563,13,'१३'),
-    (5076,563,14,'१४'),
-    (5077,563,15,'१५'),
-    (5078,563,16,'१६'),
-    (5079,563,17,'१७'),
-    (5080,563,18,'१८'),
-    (5081,563,19,'१९'),
-    (5082,564,1,'१'),
-    (5083,564,2,'२'),
-    (5084,564,3,'३'),
-    (5085,564,4,'४'),
-    (5086,564,5,'५'),
-    (5087,564,6,'६'),
-    (5088,564,7,'७'),
-    (5089,565,1,'१'),
-    (5090,565,2,'२'),
-    (5091,565,3,'३'),
-    (5092,565,4,'४'),
-    (5093,565,5,'५'),
-    (5094,565,6,'६'),
-    (5095,565,7,'७'),
-    (5096,566,1,'१'),
-    (5097,566,2,'२'),
-    (5098,566,3,'३'),
-    (5099,566,4,'४'),
-    (5100,566,5,'५'),
-    (5101,566,6,'६'),
-    (5102,566,7,'७'),
-    (5103,567,1,'१'),
-    (5104,567,2,'२'),
-    (5105,567,3,'३'),
-    (5106,567,4,'४'),
-    (5107,567,5,'५'),
-    (5108,567,6,'६'),
-    (5109,567,7,'७'),
-    (5110,567,8,'८'),
-    (5111,567,9,'९'),
-    (5112,568,1,'१'),
-    (5113,568,2,'२'),
-    (5114,568,3,'३'),
-    (5115,568,4,'४'),
-    (5116,568,5,'५'),
-    (5117,568,6,'६'),
-    (5118,568,7,'७'),
-    (5119,568,8,'८'),
-    (5120,568,9,'९'),
-    (5121,569,1,'१'),
-    (5122,569,2,'२'),
-    (5123,569,3,'३'),
-    (5124,569,4,'४'),
-    (5125,569,5,'५'),
-    (5126,569,6,'६'),
-    (5127,569,7,'७'),
-    (5128,569,8,'८'),
-    (5129,570,1,'१'),
-    (5130,570,2,'२'),
-    (5131,570,3,'३'),
-    (5132,570,4,'४'),
-    (5133,570,5,'५'),
-    (5134,570,6,'६'),
-    (5135,570,7,'७'),
-    (5136,571,1,'१'),
-    (5137,571,2,'२'),
-    (5138,571,3,'३'),
-    (5139,571,4,'४'),
-    (5140,571,5,'५'),
-    (5141,571,6,'६'),
-    (5142,571,7,'७'),
-    (5143,571,8,'८'),
-    (5144,571,9,'९'),
-    (5145,572,1,'१'),
-    (5146,572,2,'२'),
-    (5147,572,3,'३'),
-    (5148,572,4,'४'),
-    (5149,572,5,'५'),
-
-    (5150,572,6,'६'),
-    (5151,572,7,'७'),
-    (5152,572,8,'८'),
-    (5153,572,9,'९'),
-    (5154,572,10,'१०'),
-    (5155,572,11,'११'),
-    (5156,572,12,'१२'),
-    (5157,572,13,'१३'),
-    (5158,572,14,'१४'),
-    (5159,572,15,'१५'),
-    (5160,573,1,'१'),
-    (5161,573,2,'२'),
-    (5162,573,3,'३'),
-    (5163,573,4,'४'),
-    (5164,573,5,'५'),
-    (5165,573,6,'६'),
-    (5166,573,7,'७'),
-    (5167,573,8,'८'),
-    (5168,574,1,'१'),
-    (5169,574,2,'२'),
-    (5170,574,3,'३'),
-    (5171,574,4,'४'),
-    (5172,574,5,'५'),
-    (5173,574,6,'६'),
-    (5174,574,7,'७'),
-    (5175,574,8,'८'),
-    (5176,575,1,'१'),
-    (5177,575,2,'२'),
-    (5178,575,3,'३'),
-    (5179,575,4,'४'),
-    (5180,575,5,'५'),
-    (5181,575,6,'६'),
-    (5182,576,1,'१'),
-    (5183,576,2,'२'),
-    (5184,576,3,'३'),
-    (5185,576,4,'४'),
-    (5186,576,5,'५'),
-    (5187,576,6,'६'),
-    (5188,576,7,'७'),
-    (5189,576,8,'८'),
-    (5190,576,9,'९'),
-    (5191,576,10,'१०'),
-    (5192,576,11,'११'),
-    (5193,576,12,'१२'),
-    (5194,576,13,'१३'),
-    (5195,576,14,'१४'),
-    (5196,576,15,'१५'),
-    (5197,576,16,'१६'),
-    (5198,576,17,'१७'),
-    (5199,576,18,'१८'),
-    (5200,576,19,'१९'),
-    (5201,576,20,'२०'),
-    (5202,576,21,'२१'),
-    (5203,576,22,'२२'),
-    (5204,576,23,'२३'),
-    (5205,577,1,'१'),
-    (5206,577,2,'२'),
-    (5207,577,3,'३'),
-    (5208,577,4,'४'),
-    (5209,577,5,'५'),
-    (5210,577,6,'६'),
-    (5211,578,1,'१'),
-    (5212,578,2,'२'),
-    (5213,578,3,'३'),
-    (5214,578,4,'४'),
-    (5215,578,5,'५'),
-    (5216,578,6,'६'),
-    (5217,579,1,'१'),
-    (5218,579,2,'२'),
-    (5219,579,3,'३'),
-    (5220,579,4,'४'),
-    (5221,579,5,'५'),
-    (5222,579,6,'६'),
-    (5223,579,7,'७'),
-    (5224,579,8,'८'),
-    (5225,579,9,'९'),
-    (5226,580,1,'१'),
-    (5227,580,2,'२'),
-    (5228,580,3,'३'),
-    (5229,580,4,'४'),
-    (5230,580,5,'५'),
-    (5231,580,6,'६'),
-    (5232,580,7,'७'),
-    (5233,580,8,'८'),
-    (5234,580,9,'९'),
-    (5235,580,10,'१०'),
-    (5236,580,11,'११'),
-    (5237,581,1,'१'),
-    (5238,581,2,'२'),
-    (5239,581,3,'३'),
-    (5240,581,4,'४'),
-    (5241,581,5,'५'),
-    (5242,581,6,'६'),
-    (5243,581,7,'७'),
-    (5244,581,8,'८'),
-    (5245,581,9,'९'),
-    (5246,582,1,'१'),
-    (5247,582,2,'२'),
-    (5248,582,3,'३'),
-    (5249,582,4,'४'),
-    (5250,582,5,'५'),
-    (5251,582,6,'६'),
-    (5252,583,1,'१'),
-    (5253,583,2,'२'),
-    (5254,583,3,'३'),
-    (5255,583,4,'४'),
-    (5256,583,5,'५'),
-    (5257,583,6,'६'),
-    (5258,583,7,'७'),
-    (5259,583,8,'८'),
-    (5260,583,9,'९'),
-    (5261,583,10,'१०'),
-    (5262,584,1,'१'),
-    (5263,584,2,'२'),
-    (5264,584,3,'३'),
-    (5265,584,4,'४'),
-    (5266,584,5,'५'),
-    (5267,584,6,'६'),
-    (5268,584,7,'७'),
-    (5269,584,8,'८'),
-    (5270,584,9,'९'),
-    (5271,585,1,'१'),
-    (5272,585,2,'२'),
-    (5273,585,3,'३'),
-    (5274,585,4,'४'),
-    (5275,585,5,'५'),
-    (5276,585,6,'६'),
-    (5277,585,7,'७'),
-    (5278,585,8,'८'),
-    (5279,585,9,'९'),
-    (5280,585,10,'१०'),
-    (5281,585,11,'११'),
-    (5282,585,12,'१२'),
-    (5283,586,1,'१'),
-    (5284,586,2,'२'),
-    (5285,586,3,'३'),
-    (5286,586,4,'४'),
-    (5287,586,5,'५'),
-    (5288,586,6,'६'),
-    (5289,586,7,'७'),
-    (5290,586,8,'८'),
-    (5291,586,9,'९'),
-    (5292,587,1,'१'),
-    (5293,587,2,'२'),
-    (5294,587,3,'३'),
-    (5295,587,4,'४'),
-    (5296,587,5,'५'),
-    (5297,587,6,'६'),
-    (5298,588,1,'१'),
-    (5299,588,2,'२'),
-    (5300,588,3,'३'),
-    (5301,588,4,'४'),
-    (5302,588,5,'५'),
-    (5303,588,6,'६'),
-    (5304,588,7,'७'),
-    (5305,588,8,'८'),
-    (5306,588,9,'९'),
-    (5307,589,1,'१'),
-    (5308,589,2,'२'),
-    (5309,589,3,'३'),
-    (5310,589,4,'४'),
-    (5311,589,5,'५'),
-    (5312,589,6,'६'),
-    (5313,590,1,'१'),
-    (5314,590,2,'२'),
-    (5315,590,3,'३'),
-    (5316,590,4,'४'),
-    (5317,590,5,'५'),
-    (5318,590,6,'६'),
-    (5319,590,7,'७'),
-    (5320,590,8,'८'),
-    (5321,590,9,'९'),
-    (5322,591,1,'१'),
-    (5323,591,2,'२'),
-    (5324,591,3,'३'),
-    (5325,591,4,'४'),
-    (5326,591,5,'५'),
-    (5327,591,6,'६'),
-    (5328,591,7,'७'),
-    (5329,591,8,'८'),
-    (5330,591,9,'९'),
-    (5331,591,10,'१०'),
-    (5332,591,11,'११'),
-    (5333,592,1,'१'),
-    (5334,592,2,'२'),
-    (5335,592,3,'३'),
-    (5336,592,4,'४'),
-    (5337,592,5,'५'),
-    (5338,592,6,'६'),
-    (5339,592,7,'७'),
-    (5340,592,8,'८'),
-    (5341,592,9,'९'),
-    (5342,592,10,'१०'),
-    (5343,592,11,'११'),
-    (5344,593,1,'१'),
-    (5345,593,2,'२'),
-    (5346,593,3,'३'),
-    (5347,593,4,'४'),
-    (5348,593,5,'५'),
-    (5349,593,6,'६'),
-    (5350,593,7,'७'),
-    (5351,594,1,'१'),
-    (5352,594,2,'२'),
-    (5353,594,3,'३'),
-    (5354,594,4,'४'),
-    (5355,594,5,'५'),
-    (5356,594,6,'६'),
-    (5357,595,1,'१'),
-    (5358,595,2,'२'),
-    (5359,595,3,'३'),
-    (5360,595,4,'४'),
-    (5361,595,5,'५'),
-    (5362,595,6,'६'),
-    (5363,595,7,'७'),
-    (5364,595,8,'८'),
-    (5365,595,9,'९'),
-    (5366,596,1,'१'),
-    (5367,596,2,'२'),
-    (5368,596,3,'३'),
-    (5369,596,4,'४'),
-    (5370,596,5,'५'),
-    (5371,596,6,'६'),
-    (5372,596,7,'७'),
-    (5373,596,8,'८'),
-    (5374,596,9,'९'),
-    (5375,596,10,'१०'),
-    (5376,596,11,'११'),
-    (5377,596,12,'१२'),
-    (5378,596,13,'१३'),
-    (5379,596,14,'१४'),
-    (5380,597,1,'१'),
-    (5381,597,2,'२'),
-    (5382,597,3,'३'),
-    (5383,597,4,'४'),
-    (5384,597,5,'५'),
-    (5385,597,6,'६'),
-    (5386,597,7,'७'),
-    (5387,597,8,'८'),
-    (5388,597,9,'९'),
-    (5389,597,10,'१०'),
-    (5390,597,11,'११'),
-    (5391,598,1,'१'),
-    (5392,598,2,'२'),
-    (5393,598,3,'३'),
-    (5394,598,4,'४'),
-    (5395,598,5,'५'),
-    (5396,598,6,'६'),
-    (5397,598,7,'७'),
-    (5398,598,8,'८'),
-    (5399,598,9,'९'),
-
-    (5400,598,10,'१०'),
-    (5401,598,11,'११'),
-    (5402,599,1,'१'),
-    (5403,599,2,'२'),
-    (5404,599,3,'३'),
-    (5405,599,4,'४'),
-    (5406,599,5,'५'),
-    (5407,599,6,'६'),
-    (5408,600,1,'१'),
-    (5409,600,2,'२'),
-    (5410,600,3,'३'),
-    (5411,600,4,'४'),
-    (5412,600,5,'५'),
-    (5413,601,1,'१'),
-    (5414,601,2,'२'),
-    (5415,601,3,'३'),
-    (5416,601,4,'४'),
-    (5417,601,5,'५'),
-    (5418,601,6,'६'),
-    (5419,601,7,'७'),
-    (5420,601,8,'८'),
-    (5421,602,1,'१'),
-    (5422,602,2,'२'),
-    (5423,602,3,'३'),
-    (5424,602,4,'४'),
-    (5425,602,5,'५'),
-    (5426,602,6,'६'),
-    (5427,603,1,'१'),
-    (5428,603,2,'२'),
-    (5429,603,3,'३'),
-    (5430,603,4,'४'),
-    (5431,603,5,'५'),
-    (5432,603,6,'६'),
-    (5433,603,7,'७'),
-    (5434,603,8,'८'),
-    (5435,604,1,'१'),
-    (5436,604,2,'२'),
-    (5437,604,3,'३'),
-    (5438,604,4,'४'),
-    (5439,604,5,'५'),
-    (5440,604,6,'६'),
-    (5441,605,1,'१'),
-    (5442,605,2,'२'),
-    (5443,605,3,'३'),
-    (5444,605,4,'४'),
-    (5445,605,5,'५'),
-    (5446,606,1,'१'),
-    (5447,606,2,'२'),
-    (5448,606,3,'३'),
-    (5449,606,4,'४'),
-    (5450,606,5,'५'),
-    (5451,606,6,'६'),
-    (5452,606,7,'७'),
-    (5453,607,1,'१'),
-    (5454,607,2,'२'),
-    (5455,607,3,'३'),
-    (5456,607,4,'४'),
-    (5457,607,5,'५'),
-    (5458,607,6,'६'),
-    (5459,607,7,'७'),
-    (5460,607,8,'८'),
-    (5461,608,1,'१'),
-    (5462,608,2,'२'),
-    (5463,608,3,'३'),
-    (5464,608,4,'४'),
-    (5465,608,5,'५'),
-    (5466,608,6,'६'),
-    (5467,609,1,'१'),
-    (5468,609,2,'२'),
-    (5469,609,3,'३'),
-    (5470,609,4,'४'),
-    (5471,609,5,'५'),
-    (5472,609,6,'६'),
-    (5473,609,7,'७'),
-    (5474,609,8,'८'),
-    (5475,609,9,'९'),
-    (5476,609,10,'१०'),
-    (5477,610,1,'१'),
-    (5478,610,2,'२'),
-    (5479,610,3,'३'),
-    (5480,610,4,'४'),
-    (5481,610,5,'५'),
-    (5482,611,1,'१'),
-    (5483,611,2,'२'),
-    (5484,611,3,'३'),
-    (5485,611,4,'४'),
-    (5486,611,5,'५'),
-    (5487,611,6,'६'),
-    (5488,611,7,'७'),
-    (5489,611,8,'८'),
-    (5490,612,1,'१'),
-    (5491,612,2,'२'),
-    (5492,612,3,'३'),
-    (5493,612,4,'४'),
-    (5494,612,5,'५'),
-    (5495,612,6,'६'),
-    (5496,612,7,'७'),
-    (5497,612,8,'८'),
-    (5498,612,9,'९'),
-    (5499,613,1,'१'),
-    (5500,613,2,'२'),
-    (5501,613,3,'३'),
-    (5502,613,4,'४'),
-    (5503,613,5,'५'),
-    (5504,613,6,'६'),
-    (5505,613,7,'७'),
-    (5506,614,1,'१'),
-    (5507,614,2,'२'),
-    (5508,614,3,'३'),
-    (5509,614,4,'४'),
-    (5510,614,5,'५'),
-    (5511,614,6,'६'),
-    (5512,614,7,'७'),
-    (5513,614,8,'८'),
-    (5514,614,9,'९'),
-    (5515,615,1,'१'),
-    (5516,615,2,'२'),
-    (5517,615,3,'३'),
-    (5518,615,4,'४'),
-    (5519,615,5,'५'),
-    (5520,615,6,'६'),
-    (5521,615,7,'७'),
-    (5522,615,8,'८'),
-    (5523,615,9,'९'),
-    (5524,616,1,'१'),
-    (5525,616,2,'२'),
-    (5526,616,3,'३'),
-    (5527,616,4,'४'),
-    (5528,616,5,'५'),
-    (5529,616,6,'६'),
-    (5530,616,7,'७'),
-    (5531,616,8,'८'),
-    (5532,616,9,'९'),
-    (5533,617,1,'१'),
-    (5534,617,2,'२'),
-    (5535,617,3,'३'),
-    (5536,617,4,'४'),
-    (5537,617,5,'५'),
-    (5538,617,6,'६'),
-    (5539,617,7,'७'),
-    (5540,617,8,'८'),
-    (5541,617,9,'९'),
-    (5542,618,1,'१'),
-    (5543,618,2,'२'),
-    (5544,618,3,'३'),
-    (5545,618,4,'४'),
-    (5546,618,5,'५'),
-    (5547,618,6,'६'),
-    (5548,618,7,'७'),
-    (5549,618,8,'८'),
-    (5550,618,9,'९'),
-    (5551,619,1,'१'),
-    (5552,619,2,'२'),
-    (5553,619,3,'३'),
-    (5554,619,4,'४'),
-    (5555,619,5,'५'),
-    (5556,619,6,'६'),
-    (5557,619,7,'७'),
-    (5558,619,8,'८'),
-    (5559,619,9,'९'),
-    (5560,619,10,'१०'),
-    (5561,619,11,'११'),
-    (5562,620,1,'१'),
-    (5563,620,2,'२'),
-    (5564,620,3,'३'),
-    (5565,620,4,'४'),
-    (5566,620,5,'५'),
-    (5567,620,6,'६'),
-    (5568,620,7,'७'),
-    (5569,620,8,'८'),
-    (5570,620,9,'९'),
-    (5571,620,10,'१०'),
-    (5572,620,11,'११'),
-    (5573,621,1,'१'),
-    (5574,621,2,'२'),
-    (5575,621,3,'३'),
-    (5576,621,4,'४'),
-    (5577,621,5,'५'),
-    (5578,621,6,'६'),
-    (5579,621,7,'७'),
-    (5580,622,1,'१'),
-    (5581,622,2,'२'),
-    (5582,622,3,'३'),
-    (5583,622,4,'४'),
-    (5584,622,5,'५'),
-    (5585,622,6,'६'),
-    (5586,622,7,'७'),
-    (5587,622,8,'८'),
-    (5588,623,1,'१'),
-    (5589,623,2,'२'),
-    (5590,623,3,'३'),
-    (5591,623,4,'४'),
-    (5592,623,5,'५'),
-    (5593,623,6,'६'),
-    (5594,623,7,'७'),
-    (5595,623,8,'८'),
-    (5596,624,1,'१'),
-    (5597,624,2,'२'),
-    (5598,624,3,'३'),
-    (5599,624,4,'४'),
-    (5600,624,5,'५'),
-    (5601,624,6,'६'),
-    (5602,625,1,'१'),
-    (5603,625,2,'२'),
-    (5604,625,3,'३'),
-    (5605,625,4,'४'),
-    (5606,625,5,'५'),
-    (5607,625,6,'६'),
-    (5608,625,7,'७'),
-    (5609,626,1,'१'),
-    (5610,626,2,'२'),
-    (5611,626,3,'३'),
-    (5612,626,4,'४'),
-    (5613,626,5,'५'),
-    (5614,626,6,'६'),
-    (5615,627,1,'१'),
-    (5616,627,2,'२'),
-    (5617,627,3,'३'),
-    (5618,627,4,'४'),
-    (5619,627,5,'५'),
-    (5620,627,6,'६'),
-    (5621,627,7,'७'),
-    (5622,627,8,'८'),
-    (5623,627,9,'९'),
-    (5624,628,1,'१'),
-    (5625,628,2,'२'),
-    (5626,628,3,'३'),
-    (5627,628,4,'४'),
-    (5628,628,5,'५'),
-    (5629,628,6,'६'),
-    (5630,628,7,'७'),
-    (5631,628,8,'८'),
-    (5632,628,9,'९'),
-    (5633,629,1,'१'),
-    (5634,629,2,'२'),
-    (5635,629,3,'३'),
-    (5636,629,4,'४'),
-    (5637,629,5,'५'),
-    (5638,629,6,'६'),
-    (5639,629,7,'७'),
-    (5640,629,8,'८'),
-    (5641,629,9,'९'),
-    (5642,629,10,'१०'),
-    (5643,629,11,'११'),
-    (5644,629,12,'१२'),
-    (5645,629,13,'१३'),
-    (5646,630,1,'१'),
-    (5647,630,2,'२'),
-    (5648,630,3,'३'),
-    (5649,630,4,'४'),
-
-    (5650,630,5,'५'),
-    (5651,630,6,'६'),
-    (5652,630,7,'७'),
-    (5653,630,8,'८'),
-    (5654,630,9,'९'),
-    (5655,630,10,'१०'),
-    (5656,630,11,'११'),
-    (5657,631,1,'१'),
-    (5658,631,2,'२'),
-    (5659,631,3,'३'),
-    (5660,631,4,'४'),
-    (5661,631,5,'५'),
-    (5662,631,6,'६'),
-    (5663,631,7,'७'),
-    (5664,632,1,'१'),
-    (5665,632,2,'२'),
-    (5666,632,3,'३'),
-    (5667,632,4,'४'),
-    (5668,632,5,'५'),
-    (5669,632,6,'६'),
-    (5670,633,1,'१'),
-    (5671,633,2,'२'),
-    (5672,633,3,'३'),
-    (5673,633,4,'४'),
-    (5674,633,5,'५'),
-    (5675,633,6,'६'),
-    (5676,633,7,'७'),
-    (5677,633,8,'८'),
-    (5678,634,1,'१'),
-    (5679,634,2,'२'),
-    (5680,634,3,'३'),
-    (5681,634,4,'४'),
-    (5682,634,5,'५'),
-    (5683,634,6,'६'),
-    (5684,634,7,'७'),
-    (5685,634,8,'८'),
-    (5686,634,9,'९'),
-    (5687,635,1,'१'),
-    (5688,635,2,'२'),
-    (5689,635,3,'३'),
-    (5690,635,4,'४'),
-    (5691,635,5,'५'),
-    (5692,635,6,'६'),
-    (5693,635,7,'७'),
-    (5694,635,8,'८'),
-    (5695,635,9,'९'),
-    (5696,636,1,'१'),
-    (5697,636,2,'२'),
-    (5698,636,3,'३'),
-    (5699,636,4,'४'),
-    (5700,636,5,'५'),
-    (5701,636,6,'६'),
-    (5702,636,7,'७'),
-    (5703,636,8,'८'),
-    (5704,636,9,'९'),
-    (5705,636,10,'१०'),
-    (5706,636,11,'११'),
-    (5707,637,1,'१'),
-    (5708,637,2,'२'),
-    (5709,637,3,'३'),
-    (5710,637,4,'४'),
-    (5711,637,5,'५'),
-    (5712,637,6,'६'),
-    (5713,637,7,'७'),
-    (5714,637,8,'८'),
-    (5715,637,9,'९'),
-    (5716,637,10,'१०'),
-    (5717,637,11,'११'),
-    (5718,637,12,'१२'),
-    (5719,637,13,'१३'),
-    (5720,638,1,'१'),
-    (5721,638,2,'२'),
-    (5722,638,3,'३'),
-    (5723,638,4,'४'),
-    (5724,638,5,'५'),
-    (5725,638,6,'६'),
-    (5726,638,7,'७'),
-    (5727,638,8,'८'),
-    (5728,638,9,'९'),
-    (5729,639,1,'१'),
-    (5730,639,2,'२'),
-    (5731,639,3,'३'),
-    (5732,639,4,'४'),
-    (5733,639,5,'५'),
-    (5734,639,6,'६'),
-    (5735,639,7,'७'),
-    (5736,639,8,'८'),
-    (5737,639,9,'९'),
-    (5738,639,10,'१०'),
-    (5739,639,11,'११'),
-    (5740,639,12,'१२'),
-    (5741,639,13,'१३'),
-    (5742,640,1,'१'),
-    (5743,640,2,'२'),
-    (5744,640,3,'३'),
-    (5745,640,4,'४'),
-    (5746,640,5,'५'),
-    (5747,640,6,'६'),
-    (5748,640,7,'७'),
-    (5749,640,8,'८'),
-    (5750,640,9,'९'),
-    (5751,640,10,'१०'),
-    (5752,640,11,'११'),
-    (5753,640,12,'१२'),
-    (5754,640,13,'१३'),
-    (5755,641,1,'१'),
-    (5756,641,2,'२'),
-    (5757,641,3,'३'),
-    (5758,641,4,'४'),
-    (5759,641,5,'५'),
-    (5760,641,6,'६'),
-    (5761,641,7,'७'),
-    (5762,641,8,'८'),
-    (5763,641,9,'९'),
-    (5764,641,10,'१०'),
-    (5765,641,11,'११'),
-    (5766,641,12,'१२'),
-    (5767,641,13,'१३'),
-    (5768,641,14,'१४'),
-    (5769,642,1,'१'),
-    (5770,642,2,'२'),
-    (5771,642,3,'३'),
-    (5772,642,4,'४'),
-    (5773,642,5,'५'),
-    (5774,642,6,'६'),
-    (5775,642,7,'७'),
-    (5776,642,8,'८'),
-    (5777,642,9,'९'),
-    (5778,642,10,'१०'),
-    (5779,642,11,'११'),
-    (5780,643,1,'१'),
-    (5781,643,2,'२'),
-    (5782,643,3,'३'),
-    (5783,643,4,'४'),
-    (5784,643,5,'५'),
-    (5785,643,6,'६'),
-    (5786,643,7,'७'),
-    (5787,643,8,'८'),
-    (5788,643,9,'९'),
-    (5789,643,10,'१०'),
-    (5790,644,1,'१'),
-    (5791,644,2,'२'),
-    (5792,644,3,'३'),
-    (5793,644,4,'४'),
-    (5794,644,5,'५'),
-    (5795,644,6,'६'),
-    (5796,644,7,'७'),
-    (5797,644,8,'८'),
-    (5798,644,9,'९'),
-    (5799,644,10,'१०'),
-    (5800,644,11,'११'),
-    (5801,644,12,'१२'),
-    (5802,644,13,'१३'),
-    (5803,644,14,'१४'),
-    (5804,645,1,'१'),
-    (5805,645,2,'२'),
-    (5806,645,3,'३'),
-    (5807,645,4,'४'),
-    (5808,645,5,'५'),
-    (5809,645,6,'६'),
-    (5810,645,7,'७'),
-    (5811,645,8,'८'),
-    (5812,645,9,'९'),
-    (5813,645,10,'१०'),
-    (5814,646,1,'१'),
-    (5815,646,2,'२'),
-    (5816,646,3,'३'),
-    (5817,646,4,'४'),
-    (5818,646,5,'५'),
-    (5819,646,6,'६'),
-    (5820,646,7,'७'),
-    (5821,646,8,'८'),
-    (5822,646,9,'९'),
-    (5823,646,10,'१०'),
-    (5824,646,11,'११'),
-    (5825,646,12,'१२'),
-    (5826,646,13,'१३'),
-    (5827,646,14,'१४'),
-    (5828,647,1,'१'),
-    (5829,647,2,'२'),
-    (5830,647,3,'३'),
-    (5831,647,4,'४'),
-    (5832,647,5,'५'),
-    (5833,647,6,'६'),
-    (5834,648,1,'१'),
-    (5835,648,2,'२'),
-    (5836,648,3,'३'),
-    (5837,648,4,'४'),
-    (5838,648,5,'५'),
-    (5839,648,6,'६'),
-    (5840,648,7,'७'),
-    (5841,649,1,'१'),
-    (5842,649,2,'२'),
-    (5843,649,3,'३'),
-    (5844,649,4,'४'),
-    (5845,649,5,'५'),
-    (5846,649,6,'६'),
-    (5847,649,7,'७'),
-    (5848,649,8,'८'),
-    (5849,649,9,'९'),
-    (5850,649,10,'१०'),
-    (5851,649,11,'११'),
-    (5852,649,12,'१२'),
-    (5853,650,1,'१'),
-    (5854,650,2,'२'),
-    (5855,650,3,'३'),
-    (5856,650,4,'४'),
-    (5857,650,5,'५'),
-    (5858,651,1,'१'),
-    (5859,651,2,'२'),
-    (5860,651,3,'३'),
-    (5861,651,4,'४'),
-    (5862,651,5,'५'),
-    (5863,651,6,'६'),
-    (5864,651,7,'७'),
-    (5865,651,8,'८'),
-    (5866,651,9,'९'),
-    (5867,651,10,'१०'),
-    (5868,651,11,'११'),
-    (5869,651,12,'१२'),
-    (5870,652,1,'१'),
-    (5871,652,2,'२'),
-    (5872,652,3,'३'),
-    (5873,652,4,'४'),
-    (5874,652,5,'५'),
-    (5875,652,6,'६'),
-    (5876,652,7,'७'),
-    (5877,653,1,'१'),
-    (5878,653,2,'२'),
-    (5879,653,3,'३'),
-    (5880,653,4,'४'),
-    (5881,653,5,'५'),
-    (5882,653,6,'६'),
-    (5883,653,7,'७'),
-    (5884,653,8,'८'),
-    (5885,653,9,'९'),
-    (5886,653,10,'१०'),
-    (5887,653,11,'११'),
-    (5888,653,12,'१२'),
-    (5889,653,13,'१३'),
-    (5890,653,14,'१४'),
-    (5891,653,15,'१५'),
-    (5892,654,1,'१'),
-    (5893,654,2,'२'),
-    (5894,654,3,'३'),
-    (5895,654,4,'४'),
-    (5896,654,5,'५'),
-    (5897,654,6,'६'),
-    (5898,654,7,'७'),
-    (5899,655,1,'१'),
-
-    (5900,655,2,'२'),
-    (5901,655,3,'३'),
-    (5902,655,4,'४'),
-    (5903,655,5,'५'),
-    (5904,655,6,'६'),
-    (5905,656,1,'१'),
-    (5906,656,2,'२'),
-    (5907,656,3,'३'),
-    (5908,656,4,'४'),
-    (5909,656,5,'५'),
-    (5910,656,6,'६'),
-    (5911,657,1,'१'),
-    (5912,657,2,'२'),
-    (5913,657,3,'३'),
-    (5914,657,4,'४'),
-    (5915,657,5,'५'),
-    (5916,657,6,'६'),
-    (5917,657,7,'७'),
-    (5918,657,8,'८'),
-    (5919,657,9,'९'),
-    (5920,658,1,'१'),
-    (5921,658,2,'२'),
-    (5922,658,3,'३'),
-    (5923,658,4,'४'),
-    (5924,658,5,'५'),
-    (5925,658,6,'६'),
-    (5926,659,1,'१'),
-    (5927,659,2,'२'),
-    (5928,659,3,'३'),
-    (5929,659,4,'४'),
-    (5930,659,5,'५'),
-    (5931,659,6,'६'),
-    (5932,659,7,'७'),
-    (5933,659,8,'८'),
-    (5934,659,9,'९'),
-    (5935,659,10,'१०'),
-    (5936,660,1,'१'),
-    (5937,660,2,'२'),
-    (5938,660,3,'३'),
-    (5939,660,4,'४'),
-    (5940,660,5,'५'),
-    (5941,660,6,'६'),
-    (5942,660,7,'७'),
-    (5943,660,8,'८'),
-    (5944,660,9,'९'),
-    (5945,660,10,'१०'),
-    (5946,660,11,'११'),
-    (5947,660,12,'१२'),
-    (5948,660,13,'१३'),
-    (5949,660,14,'१४'),
-    (5950,661,1,'१'),
-    (5951,661,2,'२'),
-    (5952,661,3,'३'),
-    (5953,661,4,'४'),
-    (5954,661,5,'५'),
-    (5955,661,6,'६'),
-    (5956,661,7,'७'),
-    (5957,661,8,'८'),
-    (5958,661,9,'९'),
-    (5959,661,10,'१०'),
-    (5960,661,11,'११'),
-    (5961,661,12,'१२'),
-    (5962,661,13,'१३'),
-    (5963,662,1,'१'),
-    (5964,662,2,'२'),
-    (5965,662,3,'३'),
-    (5966,662,4,'४'),
-    (5967,662,5,'५'),
-    (5968,662,6,'६'),
-    (5969,662,7,'७'),
-    (5970,662,8,'८'),
-    (5971,662,9,'९'),
-    (5972,662,10,'१०'),
-    (5973,662,11,'११'),
-    (5974,662,12,'१२'),
-    (5975,662,13,'१३'),
-    (5976,662,14,'१४'),
-    (5977,662,15,'१५'),
-    (5978,662,16,'१६'),
-    (5979,663,1,'१'),
-    (5980,663,2,'२'),
-    (5981,663,3,'३'),
-    (5982,663,4,'४'),
-    (5983,663,5,'५'),
-    (5984,663,6,'६'),
-    (5985,663,7,'७'),
-    (5986,663,8,'८'),
-    (5987,663,9,'९'),
-    (5988,663,10,'१०'),
-    (5989,664,1,'१'),
-    (5990,664,2,'२'),
-    (5991,664,3,'३'),
-    (5992,664,4,'४'),
-    (5993,664,5,'५'),
-    (5994,664,6,'६'),
-    (5995,664,7,'७'),
-    (5996,664,8,'८'),
-    (5997,664,9,'९'),
-    (5998,664,10,'१०'),
-    (5999,664,11,'११'),
-    (6000,665,1,'१'),
-    (6001,665,2,'२'),
-    (6002,665,3,'३'),
-    (6003,665,4,'४'),
-    (6004,665,5,'५'),
-    (6005,665,6,'६'),
-    (6006,665,7,'७'),
-    (6007,665,8,'८'),
-    (6008,665,9,'९'),
-    (6009,665,10,'१०'),
-    (6010,666,1,'१'),
-    (6011,666,2,'२'),
-    (6012,666,3,'३'),
-    (6013,666,4,'४'),
-    (6014,666,5,'५'),
-    (6015,666,6,'६'),
-    (6016,666,7,'७'),
-    (6017,667,1,'१'),
-    (6018,667,2,'२'),
-    (6019,667,3,'३'),
-    (6020,667,4,'४'),
-    (6021,667,5,'५'),
-    (6022,667,6,'६'),
-    (6023,668,1,'१'),
-    (6024,668,2,'२'),
-    (6025,668,3,'३'),
-    (6026,668,4,'४'),
-    (6027,668,5,'५'),
-    (6028,668,6,'६'),
-    (6029,668,7,'७'),
-    (6030,668,8,'८'),
-    (6031,668,9,'९'),
-    (6032,668,10,'१०'),
-    (6033,669,1,'१'),
-    (6034,669,2,'२'),
-    (6035,669,3,'३'),
-    (6036,669,4,'४'),
-    (6037,669,5,'५'),
-    (6038,670,1,'१'),
-    (6039,670,2,'२'),
-    (6040,670,3,'३'),
-    (6041,670,4,'४'),
-    (6042,670,5,'५'),
-    (6043,670,6,'६'),
-    (6044,671,1,'१'),
-    (6045,671,2,'२'),
-    (6046,671,3,'३'),
-    (6047,671,4,'४'),
-    (6048,671,5,'५'),
-    (6049,671,6,'६'),
-    (6050,671,7,'७'),
-    (6051,671,8,'८'),
-    (6052,671,9,'९'),
-    (6053,672,1,'१'),
-    (6054,672,2,'२'),
-    (6055,672,3,'३'),
-    (6056,672,4,'४'),
-    (6057,672,5,'५'),
-    (6058,672,6,'६'),
-    (6059,672,7,'७'),
-    (6060,673,1,'१'),
-    (6061,673,2,'२'),
-    (6062,673,3,'३'),
-    (6063,673,4,'४'),
-    (6064,673,5,'५'),
-    (6065,673,6,'६'),
-    (6066,673,7,'७'),
-    (6067,673,8,'८'),
-    (6068,673,9,'९'),
-    (6069,673,10,'१०'),
-    (6070,674,1,'१'),
-    (6071,674,2,'२'),
-    (6072,674,3,'३'),
-    (6073,674,4,'४'),
-    (6074,674,5,'५'),
-    (6075,674,6,'६'),
-    (6076,674,7,'७'),
-    (6077,674,8,'८'),
-    (6078,674,9,'९'),
-    (6079,675,1,'१'),
-    (6080,675,2,'२'),
-    (6081,675,3,'३'),
-    (6082,675,4,'४'),
-    (6083,675,5,'५'),
-    (6084,676,1,'१'),
-    (6085,676,2,'२'),
-    (6086,676,3,'३'),
-    (6087,676,4,'४'),
-    (6088,676,5,'५'),
-    (6089,676,6,'६'),
-    (6090,676,7,'७'),
-    (6091,676,8,'८'),
-    (6092,676,9,'९'),
-    (6093,676,10,'१०'),
-    (6094,676,11,'११'),
-    (6095,677,1,'१'),
-    (6096,677,2,'२'),
-    (6097,677,3,'३'),
-    (6098,677,4,'४'),
-    (6099,677,5,'५'),
-    (6100,678,1,'१'),
-    (6101,678,2,'२'),
-    (6102,678,3,'३'),
-    (6103,678,4,'४'),
-    (6104,678,5,'५'),
-    (6105,678,6,'६'),
-    (6106,678,7,'७'),
-    (6107,679,1,'१'),
-    (6108,679,2,'२'),
-    (6109,679,3,'३'),
-    (6110,679,4,'४'),
-    (6111,679,5,'५'),
-    (6112,679,6,'६'),
-    (6113,679,7,'७'),
-    (6114,680,1,'१'),
-    (6115,680,2,'२'),
-    (6116,680,3,'३'),
-    (6117,680,4,'४'),
-    (6118,680,5,'५'),
-    (6119,680,6,'६'),
-    (6120,680,7,'७'),
-    (6121,680,8,'८'),
-    (6122,680,9,'९'),
-    (6123,680,10,'१०'),
-    (6124,680,11,'११'),
-    (6125,681,1,'१'),
-    (6126,681,2,'२'),
-    (6127,681,3,'३'),
-    (6128,681,4,'४'),
-    (6129,681,5,'५'),
-    (6130,681,6,'६'),
-    (6131,681,7,'७'),
-    (6132,682,1,'१'),
-    (6133,682,2,'२'),
-    (6134,682,3,'३'),
-    (6135,682,4,'४'),
-    (6136,682,5,'५'),
-    (6137,682,6,'६'),
-    (6138,682,7,'७'),
-    (6139,683,1,'१'),
-    (6140,683,2,'२'),
-    (6141,683,3,'३'),
-    (6142,683,4,'४'),
-    (6143,683,5,'५'),
-    (6144,683,6,'६'),
-    (6145,683,7,'७'),
-    (6146,683,8,'८'),
-    (6147,683,9,'९'),
-    (6148,684,1,'१'),
-    (6149,684,2,'२'),
-
-    (6150,684,3,'३'),
-    (6151,684,4,'४'),
-    (6152,684,5,'५'),
-    (6153,684,6,'६'),
-    (6154,684,7,'७'),
-    (6155,684,8,'८'),
-    (6156,684,9,'९'),
-    (6157,685,1,'१'),
-    (6158,685,2,'२'),
-    (6159,685,3,'३'),
-    (6160,685,4,'४'),
-    (6161,685,5,'५'),
-    (6162,685,6,'६'),
-    (6163,685,7,'७'),
-    (6164,685,8,'८'),
-    (6165,685,9,'९'),
-    (6166,686,1,'१'),
-    (6167,686,2,'२'),
-    (6168,686,3,'३'),
-    (6169,686,4,'४'),
-    (6170,686,5,'५'),
-    (6171,686,6,'६'),
-    (6172,686,7,'७'),
-    (6173,687,1,'१'),
-    (6174,687,2,'२'),
-    (6175,687,3,'३'),
-    (6176,687,4,'४'),
-    (6177,687,5,'५'),
-    (6178,687,6,'६'),
-    (6179,688,1,'१'),
-    (6180,688,2,'२'),
-    (6181,688,3,'३'),
-    (6182,688,4,'४'),
-    (6183,688,5,'५'),
-    (6184,689,1,'१'),
-    (6185,689,2,'२'),
-    (6186,689,3,'३'),
-    (6187,689,4,'४'),
-    (6188,689,5,'५'),
-    (6189,689,6,'६'),
-    (6190,689,7,'७'),
-    (6191,689,8,'८'),
-    (6192,689,9,'९'),
-    (6193,690,1,'१'),
-    (6194,690,2,'२'),
-    (6195,690,3,'३'),
-    (6196,690,4,'४'),
-    (6197,690,5,'५'),
-    (6198,690,6,'६'),
-    (6199,691,1,'१'),
-    (6200,691,2,'२'),
-    (6201,691,3,'३'),
-    (6202,691,4,'४'),
-    (6203,691,5,'५'),
-    (6204,691,6,'६'),
-    (6205,692,1,'१'),
-    (6206,692,2,'२'),
-    (6207,692,3,'३'),
-    (6208,692,4,'४'),
-    (6209,692,5,'५'),
-    (6210,692,6,'६'),
-    (6211,693,1,'१'),
-    (6212,693,2,'२'),
-    (6213,693,3,'३'),
-    (6214,693,4,'४'),
-    (6215,693,5,'५'),
-    (6216,693,6,'६'),
-    (6217,693,7,'७'),
-    (6218,693,8,'८'),
-    (6219,693,9,'९'),
-    (6220,694,1,'१'),
-    (6221,694,2,'२'),
-    (6222,694,3,'३'),
-    (6223,694,4,'४'),
-    (6224,694,5,'५'),
-    (6225,694,6,'६'),
-    (6226,694,7,'७'),
-    (6227,694,8,'८'),
-    (6228,695,1,'१'),
-    (6229,695,2,'२'),
-    (6230,695,3,'३'),
-    (6231,695,4,'४'),
-    (6232,695,5,'५'),
-    (6233,695,6,'६'),
-    (6234,696,1,'१'),
-    (6235,696,2,'२'),
-    (6236,696,3,'३'),
-    (6237,696,4,'४'),
-    (6238,696,5,'५'),
-    (6239,696,6,'६'),
-    (6240,696,7,'७'),
-    (6241,697,1,'१'),
-    (6242,697,2,'२'),
-    (6243,697,3,'३'),
-    (6244,697,4,'४'),
-    (6245,697,5,'५'),
-    (6246,697,6,'६'),
-    (6247,697,7,'७'),
-    (6248,697,8,'८'),
-    (6249,698,1,'१'),
-    (6250,698,2,'२'),
-    (6251,698,3,'३'),
-    (6252,698,4,'४'),
-    (6253,698,5,'५'),
-    (6254,698,6,'६'),
-    (6255,698,7,'७'),
-    (6256,698,8,'८'),
-    (6257,698,9,'९'),
-    (6258,698,10,'१०'),
-    (6259,699,1,'१'),
-    (6260,699,2,'२'),
-    (6261,699,3,'३'),
-    (6262,699,4,'४'),
-    (6263,699,5,'५'),
-    (6264,699,6,'६'),
-    (6265,699,7,'७'),
-    (6266,699,8,'८'),
-    (6267,700,1,'१'),
-    (6268,700,2,'२'),
-    (6269,700,3,'३'),
-    (6270,700,4,'४'),
-    (6271,700,5,'५'),
-    (6272,700,6,'६'),
-    (6273,700,7,'७'),
-    (6274,700,8,'८'),
-    (6275,700,9,'९'),
-    (6276,700,10,'१०'),
-    (6277,700,11,'११'),
-    (6278,701,1,'१'),
-    (6279,701,2,'२'),
-    (6280,701,3,'३'),
-    (6281,701,4,'४'),
-    (6282,701,5,'५'),
-    (6283,701,6,'६'),
-    (6284,702,1,'१'),
-    (6285,702,2,'२'),
-    (6286,702,3,'३'),
-    (6287,702,4,'४'),
-    (6288,702,5,'५'),
-    (6289,702,6,'६'),
-    (6290,703,1,'१'),
-    (6291,703,2,'२'),
-    (6292,703,3,'३'),
-    (6293,703,4,'४'),
-    (6294,703,5,'५'),
-    (6295,703,6,'६'),
-    (6296,703,7,'७'),
-    (6297,703,8,'८'),
-    (6298,703,9,'९'),
-    (6299,704,1,'१'),
-    (6300,704,2,'२'),
-    (6301,704,3,'३'),
-    (6302,704,4,'४'),
-    (6303,704,5,'५'),
-    (6304,704,6,'६'),
-    (6305,704,7,'७'),
-    (6306,704,8,'८'),
-    (6307,704,9,'९'),
-    (6308,704,10,'१०'),
-    (6309,705,1,'१'),
-    (6310,705,2,'२'),
-    (6311,705,3,'३'),
-    (6312,705,4,'४'),
-    (6313,705,5,'५'),
-    (6314,705,6,'६'),
-    (6315,705,7,'७'),
-    (6316,705,8,'८'),
-    (6317,705,9,'९'),
-    (6318,706,1,'१'),
-    (6319,706,2,'२'),
-    (6320,706,3,'३'),
-    (6321,706,4,'४'),
-    (6322,706,5,'५'),
-    (6323,707,1,'१'),
-    (6324,707,2,'२'),
-    (6325,707,3,'३'),
-    (6326,707,4,'४'),
-    (6327,707,5,'५'),
-    (6328,707,6,'६'),
-    (6329,707,7,'७'),
-    (6330,707,8,'८'),
-    (6331,707,9,'९'),
-    (6332,707,10,'१०'),
-    (6333,707,11,'११'),
-    (6334,708,1,'१'),
-    (6335,708,2,'२'),
-    (6336,708,3,'३'),
-    (6337,708,4,'४'),
-    (6338,708,5,'५'),
-    (6339,708,6,'६'),
-    (6340,709,1,'१'),
-    (6341,709,2,'२'),
-    (6342,709,3,'३'),
-    (6343,709,4,'४'),
-    (6344,709,5,'५'),
-    (6345,710,1,'१'),
-    (6346,710,2,'२'),
-    (6347,710,3,'३'),
-    (6348,710,4,'४'),
-    (6349,710,5,'५'),
-    (6350,710,6,'६'),
-    (6351,710,7,'७'),
-    (6352,710,8,'८'),
-    (6353,710,9,'९'),
-    (6354,710,10,'१०'),
-    (6355,710,11,'११'),
-    (6356,710,12,'१२'),
-    (6357,711,1,'१'),
-    (6358,711,2,'२'),
-    (6359,711,3,'३'),
-    (6360,711,4,'४'),
-    (6361,711,5,'५'),
-    (6362,711,6,'६'),
-    (6363,711,7,'७'),
-    (6364,711,8,'८'),
-    (6365,712,1,'१'),
-    (6366,712,2,'२'),
-    (6367,712,3,'३'),
-    (6368,712,4,'४'),
-    (6369,712,5,'५'),
-    (6370,713,1,'१'),
-    (6371,713,2,'२'),
-    (6372,713,3,'३'),
-    (6373,713,4,'४'),
-    (6374,713,5,'५'),
-    (6375,713,6,'६'),
-    (6376,713,7,'७'),
-    (6377,714,1,'१'),
-    (6378,714,2,'२'),
-    (6379,714,3,'३'),
-    (6380,714,4,'४'),
-    (6381,714,5,'५'),
-    (6382,714,6,'६'),
-    (6383,715,1,'१'),
-    (6384,715,2,'२'),
-    (6385,715,3,'३'),
-    (6386,715,4,'४'),
-    (6387,715,5,'५'),
-    (6388,715,6,'६'),
-    (6389,715,7,'७'),
-    (6390,716,1,'१'),
-    (6391,716,2,'२'),
-    (6392,716,3,'३'),
-    (6393,716,4,'४'),
-    (6394,716,5,'५'),
-    (6395,716,6,'६'),
-    (6396,716,7,'७'),
-    (6397,716,8,'८'),
-    (6398,716,9,'९'),
-    (6399,716,10,'१०'),
-
-    (6400,716,11,'११'),
-    (6401,717,1,'१'),
-    (6402,717,2,'२'),
-    (6403,717,3,'३'),
-    (6404,717,4,'४'),
-    (6405,717,5,'५'),
-    (6406,717,6,'६'),
-    (6407,717,7,'७'),
-    (6408,717,8,'८'),
-    (6409,717,9,'९'),
-    (6410,718,1,'१'),
-    (6411,718,2,'२'),
-    (6412,718,3,'३'),
-    (6413,718,4,'४'),
-    (6414,718,5,'५'),
-    (6415,718,6,'६'),
-    (6416,718,7,'७'),
-    (6417,719,1,'१'),
-    (6418,719,2,'२'),
-    (6419,719,3,'३'),
-    (6420,719,4,'४'),
-    (6421,719,5,'५'),
-    (6422,719,6,'६'),
-    (6423,719,7,'७'),
-    (6424,720,1,'१'),
-    (6425,720,2,'२'),
-    (6426,720,3,'३'),
-    (6427,720,4,'४'),
-    (6428,720,5,'५'),
-    (6429,721,1,'१'),
-    (6430,721,2,'२'),
-    (6431,721,3,'३'),
-    (6432,721,4,'४'),
-    (6433,721,5,'५'),
-    (6434,721,6,'६'),
-    (6435,722,1,'१'),
-    (6436,722,2,'२'),
-    (6437,722,3,'३'),
-    (6438,722,4,'४'),
-    (6439,722,5,'५'),
-    (6440,722,6,'६'),
-    (6441,722,7,'७'),
-    (6442,722,8,'८'),
-    (6443,722,9,'९'),
-    (6444,723,1,'१'),
-    (6445,723,2,'२'),
-    (6446,723,3,'३'),
-    (6447,723,4,'४'),
-    (6448,723,5,'५'),
-    (6449,723,6,'६'),
-    (6450,723,7,'७'),
-    (6451,724,1,'१'),
-    (6452,724,2,'२'),
-    (6453,724,3,'३'),
-    (6454,724,4,'४'),
-    (6455,724,5,'५'),
-    (6456,724,6,'६'),
-    (6457,724,7,'७'),
-    (6458,724,8,'८'),
-    (6459,725,1,'१'),
-    (6460,725,2,'२'),
-    (6461,725,3,'३'),
-    (6462,725,4,'४'),
-    (6463,725,5,'५'),
-    (6464,725,6,'६'),
-    (6465,725,7,'७'),
-    (6466,725,8,'८'),
-    (6467,725,9,'९'),
-    (6468,725,10,'१०'),
-    (6469,725,11,'११'),
-    (6470,725,12,'१२'),
-    (6471,725,13,'१३'),
-    (6472,725,14,'१४'),
-    (6473,726,1,'१'),
-    (6474,726,2,'२'),
-    (6475,726,3,'३'),
-    (6476,726,4,'४'),
-    (6477,726,5,'५'),
-    (6478,726,6,'६'),
-    (6479,726,7,'७'),
-    (6480,727,1,'१'),
-    (6481,727,2,'२'),
-    (6482,727,3,'३'),
-    (6483,727,4,'४'),
-    (6484,727,5,'५'),
-    (6485,727,6,'६'),
-    (6486,727,7,'७'),
-    (6487,727,8,'८'),
-    (6488,727,9,'९'),
-    (6489,727,10,'१०'),
-    (6490,727,11,'११'),
-    (6491,727,12,'१२'),
-    (6492,727,13,'१३'),
-    (6493,727,14,'१४'),
-    (6494,728,1,'१'),
-    (6495,728,2,'२'),
-    (6496,728,3,'३'),
-    (6497,728,4,'४'),
-    (6498,728,5,'५'),
-    (6499,728,6,'६'),
-    (6500,729,1,'१'),
-    (6501,729,2,'२'),
-    (6502,729,3,'३'),
-    (6503,729,4,'४'),
-    (6504,729,5,'५'),
-    (6505,729,6,'६'),
-    (6506,729,7,'७'),
-    (6507,729,8,'८'),
-    (6508,729,9,'९'),
-    (6509,729,10,'१०'),
-    (6510,730,1,'१'),
-    (6511,730,2,'२'),
-    (6512,730,3,'३'),
-    (6513,730,4,'४'),
-    (6514,730,5,'५'),
-    (6515,730,6,'६'),
-    (6516,730,7,'७'),
-    (6517,730,8,'८'),
-    (6518,731,1,'१'),
-    (6519,731,2,'२'),
-    (6520,731,3,'३'),
-    (6521,731,4,'४'),
-    (6522,731,5,'५'),
-    (6523,731,6,'६'),
-    (6524,731,7,'७'),
-    (6525,731,8,'८'),
-    (6526,732,1,'१'),
-    (6527,732,2,'२'),
-    (6528,732,3,'३'),
-    (6529,732,4,'४'),
-    (6530,732,5,'५'),
-    (6531,732,6,'६'),
-    (6532,732,7,'७'),
-    (6533,733,1,'१'),
-    (6534,733,2,'२'),
-    (6535,733,3,'३'),
-    (6536,733,4,'४'),
-    (6537,733,5,'५'),
-    (6538,733,6,'६'),
-    (6539,734,1,'१'),
-    (6540,734,2,'२'),
-    (6541,734,3,'३'),
-    (6542,734,4,'४'),
-    (6543,734,5,'५'),
-    (6544,734,6,'६'),
-    (6545,734,7,'७'),
-    (6546,734,8,'८'),
-    (6547,734,9,'९'),
-    (6548,734,10,'१०'),
-    (6549,734,11,'११'),
-    (6550,734,12,'१२'),
-    (6551,735,1,'१'),
-    (6552,735,2,'२'),
-    (6553,735,3,'३'),
-    (6554,735,4,'४'),
-    (6555,735,5,'५'),
-    (6556,735,6,'६'),
-    (6557,735,7,'७'),
-    (6558,735,8,'८'),
-    (6559,735,9,'९'),
-    (6560,735,10,'१०'),
-    (6561,735,11,'११'),
-    (6562,736,1,'१'),
-    (6563,736,2,'२'),
-    (6564,736,3,'३'),
-    (6565,736,4,'४'),
-    (6566,736,5,'५'),
-    (6567,736,6,'६'),
-    (6568,736,7,'७'),
-    (6569,736,8,'८'),
-    (6570,736,9,'९'),
-    (6571,736,10,'१०'),
-    (6572,736,11,'११'),
-    (6573,736,12,'१२'),
-    (6574,737,1,'१'),
-    (6575,737,2,'२'),
-    (6576,737,3,'३'),
-    (6577,737,4,'४'),
-    (6578,737,5,'५'),
-    (6579,737,6,'६'),
-    (6580,738,1,'१'),
-    (6581,738,2,'२'),
-    (6582,738,3,'३'),
-    (6583,738,4,'४'),
-    (6584,738,5,'५'),
-    (6585,738,6,'६'),
-    (6586,738,7,'७'),
-    (6587,738,8,'८'),
-    (6588,738,9,'९'),
-    (6589,738,10,'१०'),
-    (6590,739,1,'१'),
-    (6591,739,2,'२'),
-    (6592,739,3,'३'),
-    (6593,739,4,'४'),
-    (6594,739,5,'५'),
-    (6595,739,6,'६'),
-    (6596,739,7,'७'),
-    (6597,739,8,'८'),
-    (6598,739,9,'९'),
-    (6599,740,1,'१'),
-    (6600,740,2,'२'),
-    (6601,740,3,'३'),
-    (6602,740,4,'४'),
-    (6603,740,5,'५'),
-    (6604,740,6,'६'),
-    (6605,740,7,'७'),
-    (6606,741,1,'१'),
-    (6607,741,2,'२'),
-    (6608,741,3,'३'),
-    (6609,741,4,'४'),
-    (6610,741,5,'५'),
-    (6611,741,6,'६'),
-    (6612,741,7,'७'),
-    (6613,741,8,'८'),
-    (6614,741,9,'९'),
-    (6615,742,1,'१'),
-    (6616,742,2,'२'),
-    (6617,742,3,'३'),
-    (6618,742,4,'४'),
-    (6619,742,5,'५'),
-    (6620,742,6,'६'),
-    (6621,742,7,'७'),
-    (6622,742,8,'८'),
-    (6623,742,9,'९'),
-    (6624,743,1,'१'),
-    (6625,743,2,'२'),
-    (6626,743,3,'३'),
-    (6627,743,4,'४'),
-    (6628,743,5,'५'),
-    (6629,743,6,'६'),
-    (6630,743,7,'७'),
-    (6631,743,8,'८'),
-    (6632,743,9,'९'),
-    (6633,744,1,'१'),
-    (6634,744,2,'२'),
-    (6635,744,3,'३'),
-    (6636,744,4,'४'),
-    (6637,744,5,'५'),
-    (6638,744,6,'६'),
-    (6639,744,7,'७'),
-    (6640,744,8,'८'),
-    (6641,744,9,'९'),
-    (6642,744,10,'१०'),
-    (6643,744,11,'११'),
-    (6644,744,12,'१२'),
-    (6645,744,13,'१३'),
-    (6646,744,14,'१४'),
-    (6647,744,15,'१५'),
-    (6648,744,16,'१६'),
-    (6649,744,17,'१७'),
-
-    (6650,744,18,'१८'),
-    (6651,744,19,'१९'),
-    (6652,745,1,'१'),
-    (6653,745,2,'२'),
-    (6654,745,3,'३'),
-    (6655,745,4,'४'),
-    (6656,745,5,'५'),
-    (6657,745,6,'६'),
-    (6658,745,7,'७'),
-    (6659,745,8,'८'),
-    (6660,745,9,'९'),
-    (6661,746,1,'१'),
-    (6662,746,2,'२'),
-    (6663,746,3,'३'),
-    (6664,746,4,'४'),
-    (6665,746,5,'५'),
-    (6666,746,6,'६'),
-    (6667,746,7,'७'),
-    (6668,746,8,'८'),
-    (6669,746,9,'९'),
-    (6670,746,10,'१०'),
-    (6671,746,11,'११'),
-    (6672,746,12,'१२'),
-    (6673,747,1,'१'),
-    (6674,747,2,'२'),
-    (6675,747,3,'३'),
-    (6676,747,4,'४'),
-    (6677,747,5,'५'),
-    (6678,747,6,'६'),
-    (6679,747,7,'७'),
-    (6680,747,8,'८'),
-    (6681,747,9,'९'),
-    (6682,747,10,'१०'),
-    (6683,748,1,'१'),
-    (6684,748,2,'२'),
-    (6685,748,3,'३'),
-    (6686,748,4,'४'),
-    (6687,748,5,'५'),
-    (6688,748,6,'६'),
-    (6689,748,7,'७'),
-    (6690,748,8,'८'),
-    (6691,748,9,'९'),
-    (6692,748,10,'१०'),
-    (6693,748,11,'११'),
-    (6694,748,12,'१२'),
-    (6695,748,13,'१३'),
-    (6696,748,14,'१४'),
-    (6697,748,15,'१५'),
-    (6698,748,16,'१६'),
-    (6699,748,17,'१७'),
-    (6700,748,18,'१८'),
-    (6701,748,19,'१९'),
-    (6702,749,1,'१'),
-    (6703,749,2,'२'),
-    (6704,749,3,'३'),
-    (6705,749,4,'४'),
-    (6706,749,5,'५'),
-    (6707,749,6,'६'),
-    (6708,749,7,'७'),
-    (6709,749,8,'८'),
-    (6710,749,9,'९'),
-    (6711,749,10,'१०'),
-    (6712,750,1,'१'),
-    (6713,750,2,'२'),
-    (6714,750,3,'३'),
-    (6715,750,4,'४'),
-    (6716,750,5,'५'),
-    (6717,750,6,'६'),
-    (6718,751,1,'१'),
-    (6719,751,2,'२'),
-    (6720,751,3,'३'),
-    (6721,751,4,'४'),
-    (6722,751,5,'५'),
-    (6723,751,6,'६'),
-    (6724,751,7,'७'),
-    (6725,751,8,'८'),
-    (6726,751,9,'९'),
-    (6727,751,10,'१०'),
-    (6728,751,11,'११'),
-    (6729,752,1,'१'),
-    (6730,752,2,'२'),
-    (6731,752,3,'३'),
-    (6732,752,4,'४'),
-    (6733,752,5,'५'),
-    (6734,752,6,'६'),
-    (6735,752,7,'७'),
-    (6736,752,8,'८'),
-    (6737,752,9,'९'),
-    (6738,752,10,'१०'),
-    (6739,753,1,'१'),
-    (6740,753,2,'२'),
-    (6741,753,3,'३'),
-    (6742,753,4,'४'),
-    (6743,753,5,'५'),
-    (6744,38,7,'७');
\ No newline at end of file
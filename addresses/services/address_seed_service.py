@@ -0,0 +1,174 @@
+import gzip
+from pathlib import Path
+
+from django.db import connection, transaction
+
+from addresses.models import District, Municipality, Province, Ward
+
+
+DEFAULT_SEED_FILE = Path(__file__).resolve().parent.parent / "seeds" / "addresses.tsv.gz"
+
+
+class AddressSeedService:
+    """
+    Loads the bundled Nepal address data with COPY + upsert.
+
+    The seed file is gzipped PostgreSQL COPY text: a "#<level>" line
+    starts each section, followed by one tab-separated row per line in
+    COLUMNS order. Parents come before children.
+    """
+
+    # (level, model, columns, parent column, parent level)
+    LEVELS = (
+        ("province", Province, ("id", "title", "title_nepali", "code"), None, None),
+        ("district", District, ("id", "province_id", "title", "title_nepali", "code"), "province_id", "province"),
+        ("municipality", Municipality, ("id", "district_id", "title", "title_nepali", "code"), "district_id", "district"),
+        ("ward", Ward, ("id", "municipality_id", "number", "number_nepali"), "municipality_id", "municipality"),
+    )
+
+    # -------------------------
+    # FILE
+    # -------------------------
+    @staticmethod
+    def read_sections(path=DEFAULT_SEED_FILE):
+        sections = {}
+        current = None
+
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                if line.startswith(b"#"):
+                    current = sections.setdefault(line[1:].strip().decode(), [])
+                elif current is not None and line.strip():
+                    current.append(line)
+
+        return {level: b"".join(lines) for level, lines in sections.items()}
+
+    @staticmethod
+    def export(path=DEFAULT_SEED_FILE):
+        """
+        Write the current address tables to a seed file.
+        """
+        counts = {}
+
+        with gzip.open(path, "wb", compresslevel=9) as f, connection.cursor() as cursor:
+            for level, model, columns, _, _ in AddressSeedService.LEVELS:
+                f.write(f"#{level}\n".encode())
+
+                sql = "COPY (SELECT {} FROM {} ORDER BY id) TO STDOUT".format(
+                    ", ".join(columns), model._meta.db_table
+                )
+                with cursor.copy(sql) as copy:
+                    for chunk in copy:
+                        f.write(chunk)
+
+                counts[level] = model.objects.count()
+
+        return counts
+
+    # -------------------------
+    # LOAD
+    # -------------------------
+    @staticmethod
+    def _staging(level):
+        return f"seed_{level}"
+
+    @staticmethod
+    def _table(level):
+        for name, model, *_ in AddressSeedService.LEVELS:
+            if name == level:
+                return model._meta.db_table
+
+    @staticmethod
+    def _check_parents(cursor, level, parent_column, parent_level):
+        """
+        Rows whose parent is neither in the file nor already in the table.
+        """
+        parent_table = AddressSeedService._table(parent_level)
+
+        cursor.execute(
+            f"""
+            SELECT s.id, s.{parent_column}
+            FROM {AddressSeedService._staging(level)} s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {AddressSeedService._staging(parent_level)} p
+                WHERE p.id = s.{parent_column}
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM {parent_table} t WHERE t.id = s.{parent_column}
+            )
+            LIMIT 5
+            """
+        )
+        return cursor.fetchall()
+
+    @staticmethod
+    def _upsert(cursor, level, model, columns):
+        table = model._meta.db_table
+        staging = AddressSeedService._staging(level)
+        column_list = ", ".join(columns)
+        updates = [column for column in columns if column != "id"]
+
+        cursor.execute(
+            f"""
+            INSERT INTO {table} ({column_list})
+            SELECT {column_list} FROM {staging}
+            ON CONFLICT (id) DO UPDATE SET
+                {", ".join(f"{column} = EXCLUDED.{column}" for column in updates)}
+            WHERE ({", ".join(f"{table}.{column}" for column in updates)})
+                IS DISTINCT FROM
+                ({", ".join(f"EXCLUDED.{column}" for column in updates)})
+            """
+        )
+        changed = cursor.rowcount
+
+        # Explicit ids bypass the sequence
+        cursor.execute(
+            f"""
+            SELECT setval(
+                pg_get_serial_sequence('{table}', 'id'),
+                GREATEST((SELECT MAX(id) FROM {table}), 1)
+            )
+            """
+        )
+        return changed
+
+    @staticmethod
+    @transaction.atomic
+    def load(path=DEFAULT_SEED_FILE):
+        """
+        Idempotent: inserts missing rows and updates changed ones.
+        Returns {level: (rows in file, rows inserted or updated)}.
+        Raises ValueError when a row's parent exists nowhere.
+        """
+        sections = AddressSeedService.read_sections(path)
+        result = {}
+
+        with connection.cursor() as cursor:
+            for level, model, columns, _, _ in AddressSeedService.LEVELS:
+                staging = AddressSeedService._staging(level)
+
+                cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+                cursor.execute(
+                    f"CREATE TEMP TABLE {staging} "
+                    f"(LIKE {model._meta.db_table} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                with cursor.copy(f"COPY {staging} ({', '.join(columns)}) FROM STDIN") as copy:
+                    copy.write(sections.get(level, b""))
+
+            for level, model, columns, parent_column, parent_level in AddressSeedService.LEVELS:
+                if parent_column:
+                    orphans = AddressSeedService._check_parents(
+                        cursor, level, parent_column, parent_level
+                    )
+                    if orphans:
+                        raise ValueError(
+                            f"{level} rows with unknown {parent_level}: "
+                            + ", ".join(f"{row_id} -> {parent_id}" for row_id, parent_id in orphans)
+                        )
+
+            for level, model, columns, _, _ in AddressSeedService.LEVELS:
+                cursor.execute(f"SELECT COUNT(*) FROM {AddressSeedService._staging(level)}")
+                total = cursor.fetchone()[0]
+                result[level] = (total, AddressSeedService._upsert(cursor, level, model, columns))
+
+        return result
@@ -1,26 +1,29 @@
 from rest_framework.exceptions import ValidationError
-from addresses.models import (
-    Province, District, Municipality, Ward, Address
-)
+
+from addresses.models import Address
+from addresses.services.address_tree import get_address_tree
+
 
 class AddressService:
 
     @staticmethod
     def validate(data):
+        """
+        {"province_id": .., "district_id": .., "municipality_id": .., "ward_id": ..}
+        when the ids form a valid hierarchy, else None. Checked in memory.
+        """
         try:
-            province = Province.objects.get(id=data["province"])
-            district = District.objects.get(id=data["district"], province=province)
-            municipality = Municipality.objects.get(id=data["municipality"], district=district)
-            ward = Ward.objects.get(id=data["ward"], municipality=municipality)
-        except Exception:
+            ids = {
+                level: int(data[level])
+                for level in ("province", "district", "municipality", "ward")
+            }
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if not get_address_tree().is_valid(**ids):
             return None
 
-        return {
-            "province": province,
-            "district": district,
-            "municipality": municipality,
-            "ward": ward,
-        }
+        return {f"{level}_id": value for level, value in ids.items()}
 
     @staticmethod
     def create(data):
@@ -29,3 +32,16 @@ class AddressService:
             raise ValidationError("Invalid address hierarchy")
 
         return Address.objects.create(**validated)
+
+    @staticmethod
+    def update(address_id, data):
+        validated = AddressService.validate(data)
+        if not validated:
+            raise ValidationError("Invalid address hierarchy")
+
+        address = Address.objects.get(id=address_id)
+        for field, value in validated.items():
+            setattr(address, field, value)
+        address.save()
+
+        return address
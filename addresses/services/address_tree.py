@@ -0,0 +1,341 @@
+import gzip
+import hashlib
+import json
+import threading
+import time
+from array import array
+
+import brotli
+from django.conf import settings
+
+from addresses.models import District, Municipality, Province, Ward
+from base.cache import bump_generation, get_generation
+
+
+class AddressLevel:
+    """
+    One level of the tree as parallel arrays.
+
+    Rows are sorted by parent, so the children of a parent form one
+    contiguous slice of the next level. `parents` holds the index of
+    each row's parent in the level above.
+    """
+
+    __slots__ = ("ids", "parents", "codes", "labels", "labels_nepali", "position")
+
+    def __init__(self, rows, parent_level=None):
+        # rows: (id, parent_id, code, label, label_nepali), sorted by parent
+        self.ids = array("q", (row[0] for row in rows))
+        self.parents = array(
+            "i",
+            (parent_level.position[row[1]] if parent_level else -1 for row in rows),
+        )
+        self.codes = array("q", (row[2] for row in rows))
+        self.labels = tuple(row[3] for row in rows)
+        self.labels_nepali = tuple(row[4] for row in rows)
+        self.position = {row_id: i for i, row_id in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def _child_ranges(parent_count, child_parents):
+    start = array("i", [0] * parent_count)
+    end = array("i", [0] * parent_count)
+
+    for i, parent in enumerate(child_parents):
+        if end[parent] == 0:
+            start[parent] = i
+        end[parent] = i + 1
+
+    return start, end
+
+
+class AddressTree:
+    """
+    Immutable Province -> District -> Municipality -> Ward index.
+
+    The address master data only changes when the seeds are reloaded,
+    so each process loads it once (four queries) and serves lookups and
+    list payloads from memory. `version` is a hash of the content.
+    """
+
+    def __init__(self, provinces, districts, municipalities, wards):
+        self.provinces = AddressLevel(provinces)
+        self.districts = AddressLevel(districts, self.provinces)
+        self.municipalities = AddressLevel(municipalities, self.districts)
+        self.wards = AddressLevel(wards, self.municipalities)
+
+        self._children = {
+            "provinces": _child_ranges(len(self.provinces), self.districts.parents),
+            "districts": _child_ranges(len(self.districts), self.municipalities.parents),
+            "municipalities": _child_ranges(len(self.municipalities), self.wards.parents),
+        }
+
+        self._encoded = {}
+
+        digest = hashlib.md5()
+        for rows in (provinces, districts, municipalities, wards):
+            digest.update(repr(rows).encode())
+        self.version = digest.hexdigest()
+
+    @classmethod
+    def load(cls):
+        provinces = [
+            (row_id, None, code, title, title_nepali)
+            for row_id, code, title, title_nepali in (
+                Province.objects.order_by("code")
+                .values_list("id", "code", "title", "title_nepali")
+            )
+        ]
+
+        districts = list(
+            District.objects.order_by("province_id", "title", "id")
+            .values_list("id", "province_id", "code", "title", "title_nepali")
+        )
+        municipalities = list(
+            Municipality.objects.order_by("district_id", "title", "id")
+            .values_list("id", "district_id", "code", "title", "title_nepali")
+        )
+        # Wards have no code: the number doubles as code and label
+        wards = [
+            (row_id, municipality_id, number, str(number), number_nepali)
+            for row_id, municipality_id, number, number_nepali in (
+                Ward.objects.order_by("municipality_id", "number", "id")
+                .values_list("id", "municipality_id", "number", "number_nepali")
+            )
+        ]
+
+        return cls(provinces, districts, municipalities, wards)
+
+    # -------------------------
+    # LOOKUPS
+    # -------------------------
+    def _children_of(self, level_name, level, parent_id):
+        i = level.position.get(parent_id)
+        if i is None:
+            return range(0)
+
+        start, end = self._children[level_name]
+        return range(start[i], end[i])
+
+    @staticmethod
+    def _rows(level, indexes):
+        return [
+            {
+                "id": level.ids[i],
+                "title": level.labels[i],
+                "title_nepali": level.labels_nepali[i],
+                "code": level.codes[i],
+            }
+            for i in indexes
+        ]
+
+    def province_list(self):
+        return self._rows(self.provinces, range(len(self.provinces)))
+
+    def district_list(self, province_id):
+        return self._rows(
+            self.districts,
+            self._children_of("provinces", self.provinces, province_id),
+        )
+
+    def municipality_list(self, district_id):
+        return self._rows(
+            self.municipalities,
+            self._children_of("districts", self.districts, district_id),
+        )
+
+    def ward_list(self, municipality_id):
+        return [
+            {
+                "id": self.wards.ids[i],
+                "number": self.wards.codes[i],
+                "number_nepali": self.wards.labels_nepali[i],
+            }
+            for i in self._children_of("municipalities", self.municipalities, municipality_id)
+        ]
+
+    def lineage(self, province=None, district=None, municipality=None):
+        """
+        (province_id, district_id, municipality_id) from the most specific
+        id given, parents filled in; None when that id is unknown.
+        """
+        if municipality is not None:
+            m = self.municipalities.position.get(municipality)
+            if m is None:
+                return None
+            d = self.municipalities.parents[m]
+            p = self.districts.parents[d]
+            return self.provinces.ids[p], self.districts.ids[d], self.municipalities.ids[m]
+
+        if district is not None:
+            d = self.districts.position.get(district)
+            if d is None:
+                return None
+            p = self.districts.parents[d]
+            return self.provinces.ids[p], self.districts.ids[d], None
+
+        if province is not None:
+            p = self.provinces.position.get(province)
+            if p is None:
+                return None
+            return self.provinces.ids[p], None, None
+
+        return None, None, None
+
+    def is_valid(self, province, district, municipality, ward):
+        """
+        True when the ward belongs to the municipality, the municipality
+        to the district and the district to the province.
+        """
+        i = self.wards.position.get(ward)
+        if i is None:
+            return False
+
+        expected = (
+            (self.municipalities, municipality),
+            (self.districts, district),
+            (self.provinces, province),
+        )
+        level = self.wards
+
+        for parent_level, parent_id in expected:
+            i = level.parents[i]
+            if parent_level.ids[i] != parent_id:
+                return False
+            level = parent_level
+
+        return True
+
+    # -------------------------
+    # COMPACT TREE PAYLOAD
+    # -------------------------
+    # Nodes are positional arrays; FIELDS names the columns per level.
+    FIELDS = {
+        "province": ["id", "title", "title_nepali", "code", "districts"],
+        "district": ["id", "title", "title_nepali", "code", "municipalities"],
+        "municipality": ["id", "title", "title_nepali", "code", "wards"],
+        "ward": ["id", "number", "number_nepali"],
+    }
+
+    def _ward_node(self, i):
+        wards = self.wards
+        return [wards.ids[i], wards.codes[i], wards.labels_nepali[i]]
+
+    def _municipality_node(self, i):
+        level = self.municipalities
+        start, end = self._children["municipalities"]
+        return [
+            level.ids[i], level.labels[i], level.labels_nepali[i], level.codes[i],
+            [self._ward_node(j) for j in range(start[i], end[i])],
+        ]
+
+    def _district_node(self, i):
+        level = self.districts
+        start, end = self._children["districts"]
+        return [
+            level.ids[i], level.labels[i], level.labels_nepali[i], level.codes[i],
+            [self._municipality_node(j) for j in range(start[i], end[i])],
+        ]
+
+    def _province_node(self, i):
+        level = self.provinces
+        start, end = self._children["provinces"]
+        return [
+            level.ids[i], level.labels[i], level.labels_nepali[i], level.codes[i],
+            [self._district_node(j) for j in range(start[i], end[i])],
+        ]
+
+    def subtree(self, province=None, district=None, municipality=None):
+        """
+        {"version", "level", "fields", "nodes"} for the whole tree, or the
+        subtree under the most specific id given; None when it is unknown.
+        """
+        for level_name, row_id, level, build in (
+            ("municipality", municipality, self.municipalities, self._municipality_node),
+            ("district", district, self.districts, self._district_node),
+            ("province", province, self.provinces, self._province_node),
+        ):
+            if row_id is None:
+                continue
+
+            i = level.position.get(row_id)
+            if i is None:
+                return None
+            nodes = [build(i)]
+            break
+        else:
+            level_name = "province"
+            nodes = [self._province_node(i) for i in range(len(self.provinces))]
+
+        return {
+            "version": self.version,
+            "level": level_name,
+            "fields": self.FIELDS,
+            "nodes": nodes,
+        }
+
+    def encoded(self, province=None, district=None, municipality=None):
+        """
+        subtree() as UTF-8 JSON, precompressed once per tree:
+        {"identity": bytes, "gzip": bytes, "br": bytes}, or None.
+        """
+        key = (province, district, municipality)
+        if key in self._encoded:
+            return self._encoded[key]
+
+        payload = self.subtree(province, district, municipality)
+        if payload is None:
+            return None
+
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+        encodings = {
+            "identity": body,
+            "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+            "br": brotli.compress(body),
+        }
+
+        self._encoded[key] = encodings
+        return encodings
+
+
+# ---------------------------------------------------
+# Per-process instance
+# ---------------------------------------------------
+#
+# Seeding bumps a shared generation (reset_address_tree); processes
+# compare it at most every ADDRESS_TREE_CHECK_INTERVAL seconds and
+# reload when it moved.
+
+_GENERATION_NAMESPACE = "addresses"
+_GENERATION_SCOPE = "tree"
+
+_lock = threading.Lock()
+_state = {"tree": None, "generation": None, "checked_at": 0.0}
+
+
+def get_address_tree():
+    now = time.monotonic()
+    tree = _state["tree"]
+
+    if tree is not None and now - _state["checked_at"] < settings.ADDRESS_TREE_CHECK_INTERVAL:
+        return tree
+
+    generation = get_generation(_GENERATION_NAMESPACE, _GENERATION_SCOPE)
+
+    with _lock:
+        if _state["tree"] is None or _state["generation"] != generation:
+            _state["tree"] = AddressTree.load()
+            _state["generation"] = generation
+        _state["checked_at"] = now
+        return _state["tree"]
+
+
+def reset_address_tree():
+    """
+    Call after (re)seeding the address tables.
+    """
+    with _lock:
+        _state["tree"] = None
+    bump_generation(_GENERATION_NAMESPACE, _GENERATION_SCOPE)
@@ -0,0 +1,79 @@
+import gzip
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, TestCase
+
+from addresses.models import District, Municipality, Province, Ward
+from addresses.api.views import accepted_encodings
+from addresses.services.address_seed_service import AddressSeedService
+from addresses.services.address_tree import reset_address_tree
+
+
+class AddressSeedTests(TestCase):
+
+    def test_load_is_idempotent(self):
+        first = AddressSeedService.load()
+
+        self.assertEqual(Province.objects.count(), 7)
+        self.assertEqual(District.objects.count(), 77)
+        self.assertEqual(Municipality.objects.count(), 753)
+        self.assertEqual(Ward.objects.count(), 6744)
+        self.assertEqual(first["ward"], (6744, 6744))
+
+        second = AddressSeedService.load()
+        self.assertTrue(all(changed == 0 for _, changed in second.values()))
+
+    def test_changed_rows_are_updated(self):
+        AddressSeedService.load()
+        Province.objects.filter(code=3).update(title="Renamed")
+
+        result = AddressSeedService.load()
+
+        self.assertEqual(result["province"], (7, 1))
+        self.assertNotEqual(Province.objects.get(code=3).title, "Renamed")
+
+    def test_orphans_are_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "orphan.tsv.gz"
+            with gzip.open(path, "wb") as f:
+                f.write("#province\n1\tKoshi\tकोशी\t1\n".encode())
+                f.write("#district\n1\t99\tTaplejung\tताप्लेजुङ\t1\n".encode())
+
+            with self.assertRaisesMessage(ValueError, "district rows with unknown province"):
+                AddressSeedService.load(path)
+
+        self.assertFalse(Province.objects.exists())
+
+
+class AddressTreeEncodingTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        AddressSeedService.load()
+
+    def setUp(self):
+        reset_address_tree()
+        self.addCleanup(reset_address_tree)
+
+    def encoding(self, accept):
+        response = self.client.get("/api/addresses/tree/?province=3", HTTP_ACCEPT_ENCODING=accept)
+        self.assertEqual(response.status_code, 200)
+        return response.get("Content-Encoding", "identity")
+
+    def test_negotiation(self):
+        self.assertEqual(self.encoding("gzip, deflate, br"), "br")
+        self.assertEqual(self.encoding("gzip"), "gzip")
+        self.assertEqual(self.encoding("br;q=0.5, gzip"), "gzip")
+        self.assertEqual(self.encoding("gzip;q=0"), "identity")
+        self.assertEqual(self.encoding("*;q=0.1"), "br")
+        self.assertEqual(self.encoding(""), "identity")
+
+
+class AcceptEncodingTests(SimpleTestCase):
+
+    def test_qvalues(self):
+        self.assertEqual(
+            accepted_encodings("GZIP;q=0, br ; q=0.8,identity,x;q=bad"),
+            {"gzip": 0.0, "br": 0.8, "identity": 1.0, "x": 0.0},
+        )
@@ -7,6 +7,7 @@ from addresses.api.views import (
     DistrictListView,
     MunicipalityListView,
     WardListView,
+    AddressTreeView,
 )
 
 urlpatterns = [
@@ -14,6 +15,13 @@ urlpatterns = [
     # READ-ONLY ADDRESS MASTER DATA
     # -------------------------
 
+    # Whole hierarchy / subtree
+    path(
+        "tree/",
+        AddressTreeView.as_view(),
+        name="address-tree",
+    ),
+
     # Provinces
     path(
         "provinces/",
@@ -1,6 +1,7 @@
 from django.contrib import admin
-from .models import AIQueryHistory
+from .models import AIQueryHistory, AIQueryJob
 
 # Register your models here.
 
-admin.site.register(AIQueryHistory)
\ No newline at end of file
+admin.site.register(AIQueryHistory)
+admin.site.register(AIQueryJob)
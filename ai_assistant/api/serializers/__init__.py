@@ -0,0 +1,7 @@
+from .ai_query_job_serializers import (
+    AIQueryJobSerializer,
+)
+
+__all__ = [
+    "AIQueryJobSerializer",
+]
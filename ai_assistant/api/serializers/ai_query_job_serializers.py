@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from ai_assistant.models import AIQueryJob
+
+
+class AIQueryJobSerializer(serializers.ModelSerializer):
+    """
+    `result` has the same shape as the synchronous AIQueryView response.
+    """
+
+    class Meta:
+        model = AIQueryJob
+        fields = (
+            "id",
+            "query",
+            "status",
+            "result",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+        read_only_fields = fields
@@ -1,9 +1,11 @@
 from .ai_views import (
     AIQueryView,
+    AIQueryJobDetailView,
     AIQueryHistoryListView
     )
 
 __all__ = [
     "AIQueryView", 
+    "AIQueryJobDetailView",
     "AIQueryHistoryListView"
     ]
\ No newline at end of file
@@ -1,26 +1,31 @@
+from asgiref.sync import sync_to_async
+from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 
-from base.constants.user_roles import UserRoles
-from base.constants.verification import VerificationStatus
 from base.constants.ai_query_types import QueryType
+from base.views import AsyncAPIView
 
 from accounts.permissions import IsVerifiedClientLawyerOrFirm
 
-from ai_assistant.models import AIQueryHistory
-from ai_assistant.services.ai_services import call_ai_service
+from ai_assistant.models import AIQueryHistory, AIQueryJob
+from ai_assistant.api.serializers import AIQueryJobSerializer
+from ai_assistant.services.ai_gateway import AIServiceUnavailable, get_ai_gateway
+from ai_assistant.services.ai_query_job_service import AIQueryJobService, AIQueueFull
+from ai_assistant.services.ai_query_service import AIQueryService
+from ai_assistant.services.answer_cache import AIAnswerCache
 
-from cases.models import CaseCategory
-from lawyers.models import Lawyer
-from firms.models import Firm
-from lawyers.api.serializers import LawyerPublicSerializer
-from firms.api.serializers import FirmPublicSerializer
 from base.pagination import DefaultPageNumberPagination
 
-class AIQueryView(APIView):
+class AIQueryView(AsyncAPIView):
+    """
+    Async: the AI round trip is awaited on the event loop, so a slow
+    model answer does not hold a worker thread.
+    """
+
     permission_classes = [
         IsAuthenticated,
         IsVerifiedClientLawyerOrFirm,
@@ -28,141 +33,116 @@ class AIQueryView(APIView):
 
     @extend_schema(
         summary="Ask AI legal assistant",
-        description="Verified users can ask legal questions. Only clients receive lawyer/firm recommendations.",
+        description=(
+            "Verified users can ask legal questions. Only clients receive lawyer/firm recommendations.\n\n"
+            "**Async mode** (`\"async\": true`): returns 202 with a job right away. "
+            "The answer is computed in the background; poll `jobs/<id>/` or listen for the "
+            "`ai_query_job` WebSocket event, whose `result` has the same shape as the 200 body."
+        ),
         request={
             "application/json": {
                 "type": "object",
                 "properties": {
-                    "query": {"type": "string"}
+                    "query": {"type": "string"},
+                    "async": {"type": "boolean", "default": False},
                 },
                 "required": ["query"]
             }
         },
         responses={
             200: OpenApiResponse(description="AI response"),
+            202: AIQueryJobSerializer,
             400: OpenApiResponse(description="Invalid input"),
-            503: OpenApiResponse(description="AI service unavailable"),
+            503: OpenApiResponse(description="AI service unavailable or job queue full"),
         },
         tags=["ai-assistant"],
     )
-    def post(self, request):
+    async def post(self, request):
         query = request.data.get("query")
 
         if not query:
             return Response({"error": "Query is required"}, status=400)
 
-        # Role context
-        user_role = request.user.role
-        is_client = user_role == UserRoles.CLIENT
-
-        # Call AI service with ROLE
-        try:
-            ai_data = call_ai_service(
-                {
-                    "question": query,
-                    "user_id": str(request.user.id),
-                    "user_role": user_role,
-                }
-            )
-        except Exception:
-            return Response(
-                {"error": "AI service unavailable"},
-                status=503
-            )
-
-        # Normalize AI response
-        answer = ai_data.get("answer", "")
-        raw_query_type = ai_data.get("query_type", "")
-        query_type = raw_query_type.strip().lower().split()[0]
-        case_category_name = ai_data.get("case_category") or None
-
-        # Store history
-        history = AIQueryHistory.objects.create(
-            user=request.user,
-            query=query,
-            query_type=query_type,
-            answer=answer,
-            raw_ai_response=ai_data,
-        )
-
-        response_payload = {
-            "answer": answer,
-            "query_type": query_type,
-            "recommendations": {
-                "case_category": None,
-                "lawyers": [],
-                "firms": [],
-            },
-            "created_at": history.created_at,
-        }
+        # Async mode: answered by the AI job pool
+        if request.data.get("async") in (True, "true", "1"):
+            try:
+                job = await sync_to_async(AIQueryJobService.enqueue)(request.user, query)
+            except AIQueueFull:
+                return Response(
+                    {"error": "AI assistant is busy, try again shortly"},
+                    status=503
+                )
 
-        # Recommendation logic (CLIENT ONLY)
-        if (
-            is_client
-            and query_type == QueryType.RECOMMENDATION
-            and case_category_name
-        ):
-            case_category = CaseCategory.objects.filter(
-                name__iexact=case_category_name
-            ).first()
+            return Response(AIQueryJobSerializer(job).data, status=202)
 
-            if case_category:
-                history.case_category = case_category
-                history.save(update_fields=["case_category"])
+        # Repeated question: reuse a recent answer
+        ai_data, _ = await sync_to_async(AIAnswerCache.lookup)(request.user.role, query)
 
-                lawyers = (
-                    Lawyer.objects
-                    .filter(
-                        services=case_category,
-                        user__bar_verification__status=VerificationStatus.VERIFIED,
-                    )
-                    .select_related("user", "address", "user__bar_verification")
-                    .prefetch_related("services")
-                    .distinct()[:5]
+        # Call AI service with ROLE
+        if ai_data is None:
+            try:
+                ai_data = await get_ai_gateway().query(
+                    {
+                        "question": query,
+                        "user_id": str(request.user.id),
+                        "user_role": request.user.role,
+                    }
                 )
-
-                firms = (
-                    Firm.objects
-                    .filter(
-                        services=case_category,
-                        user__firm_verification__status=VerificationStatus.VERIFIED,
-                    )
-                    .select_related("user", "address", "user__firm_verification")
-                    .prefetch_related("services")
-                    .distinct()[:5]
+            except AIServiceUnavailable:
+                return Response(
+                    {"error": "AI service unavailable"},
+                    status=503
                 )
 
-                history.recommended_lawyers.set(lawyers)
-                history.recommended_firms.set(firms)
+            await sync_to_async(AIAnswerCache.store)(request.user.role, query, ai_data)
 
-                response_payload["recommendations"] = {
-                    "case_category": case_category.name,
-                    "lawyers": LawyerPublicSerializer(
-                        [
-                            {
-                                "user": l.user,
-                                "profile": l,
-                                "verification": l.user.bar_verification,
-                            }
-                            for l in lawyers
-                        ],
-                        many=True,
-                    ).data,
-                    "firms": FirmPublicSerializer(
-                        [
-                            {
-                                "user": f.user,
-                                "profile": f,
-                                "verification": f.user.firm_verification,
-                            }
-                            for f in firms
-                        ],
-                        many=True,
-                    ).data,
-                }
+        # Store history + recommendations (CLIENT ONLY)
+        _, response_payload = await sync_to_async(AIQueryService.record)(
+            request.user, query, ai_data
+        )
 
         return Response(response_payload, status=200)
 
+class AIQueryJobDetailView(APIView):
+    permission_classes = [
+        IsAuthenticated,
+        IsVerifiedClientLawyerOrFirm,
+    ]
+
+    @extend_schema(
+        summary="Get AI query job",
+        description=(
+            "Status of a question asked in async mode. "
+            "`result` is set once the job is completed, `error` if it failed. "
+            "A job that outlived AI_JOB_TIMEOUT (e.g. its server restarted) "
+            "is reported as failed."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="job_id",
+                type=str,
+                location=OpenApiParameter.PATH,
+                description="UUID of the AI query job",
+            ),
+        ],
+        responses={
+            200: AIQueryJobSerializer,
+            404: OpenApiResponse(description="Job not found"),
+        },
+        tags=["ai-assistant"],
+    )
+    def get(self, request, job_id):
+        # A job whose process exited would stay pending / running forever
+        AIQueryJobService.expire(AIQueryJob.objects.filter(id=job_id))
+
+        job = get_object_or_404(
+            AIQueryJob,
+            id=job_id,
+            user=request.user
+        )
+
+        return Response(AIQueryJobSerializer(job).data)
+
 class AIQueryHistoryListView(APIView):
     """
     Chat-style AI history listing.
@@ -237,31 +217,11 @@ class AIQueryHistoryListView(APIView):
                 history.query_type == QueryType.RECOMMENDATION
                 and history.case_category
             ):
-                ai_message["recommendations"] = {
-                    "case_category": history.case_category.name,
-                    "lawyers": LawyerPublicSerializer(
-                        [
-                            {
-                                "user": lawyer.user,
-                                "profile": lawyer,
-                                "verification": lawyer.user.bar_verification,
-                            }
-                            for lawyer in history.recommended_lawyers.all()
-                        ],
-                        many=True,
-                    ).data,
-                    "firms": FirmPublicSerializer(
-                        [
-                            {
-                                "user": firm.user,
-                                "profile": firm,
-                                "verification": firm.user.firm_verification,
-                            }
-                            for firm in history.recommended_firms.all()
-                        ],
-                        many=True,
-                    ).data,
-                }
+                ai_message["recommendations"] = AIQueryService.recommendations(
+                    history.case_category,
+                    history.recommended_lawyers.all(),
+                    history.recommended_firms.all(),
+                )
 
             messages.append(ai_message)
 
@@ -0,0 +1,50 @@
+# ai_assistant/management/commands/run_ai_stub.py
+
+from django.core.management.base import BaseCommand
+
+from ai_assistant.stub_server import StubAIServer
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local stub of the AI service (/query/ and /query/stream/) "
+        "for development. Point AI_SERVICE_BASE_URL at it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8001)
+        parser.add_argument(
+            "--token-delay",
+            type=float,
+            default=0.05,
+            help="Seconds between streamed tokens",
+        )
+        parser.add_argument(
+            "--case-category",
+            help="Answer every question as a recommendation for this case category",
+        )
+
+    def handle(self, *args, **options):
+        reply = {}
+        if options["case_category"]:
+            reply = {
+                "query_type": "recommendation",
+                "case_category": options["case_category"],
+            }
+
+        server = StubAIServer(
+            host=options["host"],
+            port=options["port"],
+            token_delay=options["token_delay"],
+            reply=reply,
+            verbose=True,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Stub AI service on {server.url}"))
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
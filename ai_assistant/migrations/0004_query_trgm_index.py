@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:50
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_assistant', '0003_alter_aiqueryhistory_query_type'),
+    ]
+
+    operations = [
+        # Shared with the directory's trigram indexes: never dropped on rollback
+        migrations.RunSQL("CREATE EXTENSION IF NOT EXISTS pg_trgm", migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='aiqueryhistory',
+            index=django.contrib.postgres.indexes.GistIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Lower('query'), name='gist_trgm_ops'), name='ai_query_knn'),
+        ),
+    ]
@@ -1,8 +1,11 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GistIndex, OpClass
 from django.db import models
+from django.db.models.functions import Lower
 
 from base.models import AbstractBaseModel
 from base.constants.ai_query_types import QueryType
+from base.constants.ai_query_job_status import AIQueryJobStatus
 
 User = settings.AUTH_USER_MODEL
 
@@ -62,5 +65,64 @@ class AIQueryHistory(AbstractBaseModel):
         blank=True
     )
 
+    class Meta:
+        indexes = [
+            # Nearest-question lookup for the similar-answer cache
+            GistIndex(
+                OpClass(Lower("query"), name="gist_trgm_ops"),
+                name="ai_query_knn",
+            ),
+        ]
+
     def __str__(self):
         return f"AIQueryHistory(user={self.user}, type={self.query_type})"
+
+
+class AIQueryJob(AbstractBaseModel):
+    """
+    A question asked in async mode: answered by the AI job pool,
+    which writes the AIQueryHistory row and pushes the result.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="ai_query_jobs"
+    )
+
+    query = models.TextField()
+
+    status = models.CharField(
+        max_length=20,
+        choices=AIQueryJobStatus.choices,
+        default=AIQueryJobStatus.PENDING
+    )
+
+    # Set once completed
+    history = models.OneToOneField(
+        AIQueryHistory,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="job"
+    )
+
+    # Same body as the synchronous AIQueryView response
+    result = models.JSONField(
+        null=True,
+        blank=True
+    )
+
+    error = models.TextField(
+        blank=True,
+        null=True
+    )
+
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"AIQueryJob(user={self.user}, status={self.status})"
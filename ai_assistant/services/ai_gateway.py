@@ -0,0 +1,292 @@
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+import weakref
+
+import httpx
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AIServiceUnavailable(Exception):
+    """
+    The AI service failed, ran past the deadline, or its circuit is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failed attempts; while open,
+    calls fail fast. After `reset_after` seconds a single trial call is
+    let through: success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, threshold, reset_after):
+        self.threshold = threshold
+        self.reset_after = reset_after
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self._opened_at < self.reset_after:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_abandoned(self):
+        """
+        The call ended without an outcome (e.g. cancelled); a trial may
+        be retried by the next call.
+        """
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial = False
+            if self._opened_at is not None or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+class AIGateway:
+    """
+    Non-blocking client for the AI service.
+
+    - one pooled httpx.AsyncClient per event loop (keep-alive, capped
+      connections)
+    - an overall deadline across all attempts, not per attempt
+    - retries on transport errors, timeouts and 429/5xx, with
+      exponential backoff and full jitter
+    - a circuit breaker shared by the process
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        base_url,
+        deadline,
+        connect_timeout,
+        retries,
+        backoff,
+        backoff_max,
+        max_connections,
+        breaker,
+        transport=None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.deadline = deadline
+        self.connect_timeout = connect_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.max_connections = max_connections
+        self.breaker = breaker
+        self.transport = transport
+
+        self._clients = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def from_settings(cls):
+        return cls(
+            base_url=settings.AI_SERVICE_URL,
+            deadline=settings.AI_SERVICE_DEADLINE,
+            connect_timeout=settings.AI_SERVICE_CONNECT_TIMEOUT,
+            retries=settings.AI_SERVICE_RETRIES,
+            backoff=settings.AI_SERVICE_BACKOFF,
+            backoff_max=settings.AI_SERVICE_BACKOFF_MAX,
+            max_connections=settings.AI_SERVICE_MAX_CONNECTIONS,
+            breaker=CircuitBreaker(
+                settings.AI_CIRCUIT_FAILURES,
+                settings.AI_CIRCUIT_RESET,
+            ),
+        )
+
+    def client(self):
+        """
+        The pooled client of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+
+        if client is None:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.deadline, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self.transport,
+            )
+            self._clients[loop] = client
+
+        return client
+
+    def _delay(self, attempt):
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt))
+
+    async def _send(self, path, params, deadline, stream=False):
+        """
+        POST with retries until a non-retryable response arrives.
+        Returns a 2xx response (unread when `stream`).
+        """
+        loop = asyncio.get_running_loop()
+        error = None
+
+        for attempt in range(self.retries + 1):
+            if not self.breaker.allow():
+                raise AIServiceUnavailable("AI service circuit is open") from error
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            client = self.client()
+            request = client.build_request("POST", path, params=params)
+
+            try:
+                response = await asyncio.wait_for(
+                    client.send(request, stream=stream),
+                    remaining,
+                )
+            except (httpx.TransportError, asyncio.TimeoutError) as exc:
+                error = exc
+            except BaseException:
+                # Cancelled (client went away): without this a half-open
+                # trial would never finish and the circuit stay open
+                self.breaker.record_abandoned()
+                raise
+            else:
+                if response.status_code not in self.RETRY_STATUSES:
+                    # 4xx: the service is up, the request is wrong
+                    self.breaker.record_success()
+                    if response.is_error:
+                        await response.aclose()
+                        raise AIServiceUnavailable(
+                            f"AI service returned {response.status_code}"
+                        )
+                    return response
+
+                await response.aclose()
+                error = httpx.HTTPStatusError(
+                    f"AI service returned {response.status_code}",
+                    request=request,
+                    response=response,
+                )
+
+            self.breaker.record_failure()
+            logger.warning(
+                "AI service call failed (attempt %s/%s) url=%s%s params=%s",
+                attempt + 1,
+                self.retries + 1,
+                self.base_url,
+                path,
+                params,
+                exc_info=error,
+            )
+
+            if attempt < self.retries:
+                delay = self._delay(attempt)
+                if loop.time() + delay >= deadline:
+                    break
+                await asyncio.sleep(delay)
+
+        raise AIServiceUnavailable("AI service unavailable") from error
+
+    async def query(self, params):
+        """
+        POST /query/ and return the decoded JSON.
+        Raises AIServiceUnavailable.
+        """
+        deadline = asyncio.get_running_loop().time() + self.deadline
+        response = await self._send("/query/", params, deadline)
+
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise AIServiceUnavailable("AI service returned invalid JSON") from exc
+
+    async def stream(self, params):
+        """
+        POST /query/stream/ and yield ("token", text) for each chunk as
+        it arrives, then ("done", ai_data) with the fields /query/
+        returns. The reply is newline-delimited JSON: {"token": ...}
+        lines, then {"done": true, "answer": ..., ...}.
+
+        Connecting is retried like query(); a stream that breaks after
+        it started is not. Raises AIServiceUnavailable.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        response = await self._send("/query/stream/", params, deadline, stream=True)
+
+        try:
+            lines = response.aiter_lines()
+
+            while True:
+                try:
+                    line = await asyncio.wait_for(
+                        lines.__anext__(),
+                        max(deadline - loop.time(), 0),
+                    )
+                except StopAsyncIteration:
+                    break
+                except (httpx.TransportError, asyncio.TimeoutError) as exc:
+                    self.breaker.record_failure()
+                    raise AIServiceUnavailable("AI stream interrupted") from exc
+
+                if not line.strip():
+                    continue
+
+                try:
+                    event = json.loads(line)
+                except ValueError as exc:
+                    raise AIServiceUnavailable("AI service returned invalid JSON") from exc
+
+                if event.pop("done", False):
+                    yield "done", event
+                    return
+
+                yield "token", event.get("token", "")
+
+            raise AIServiceUnavailable("AI stream ended without a result")
+
+        finally:
+            await response.aclose()
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_ai_gateway():
+    global _gateway
+
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = AIGateway.from_settings()
+
+    return _gateway
@@ -0,0 +1,274 @@
+import asyncio
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from ai_assistant.models import AIQueryJob
+from ai_assistant.services.ai_gateway import AIServiceUnavailable, get_ai_gateway
+from ai_assistant.services.ai_query_service import AIQueryService
+from ai_assistant.services.answer_cache import AIAnswerCache
+from base.constants.ai_query_job_status import AIQueryJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class AIQueueFull(Exception):
+    """
+    Every worker is busy and the wait queue is full.
+    """
+
+
+class AIJobPool:
+    """
+    Bounded pool for async-mode AI questions.
+
+    At most `workers` questions are in flight per process, each worker
+    thread keeping its own event loop, so the AI gateway's pooled client
+    is reused across jobs. Up to `queue_size` more may wait; reserve()
+    raises AIQueueFull beyond that.
+    """
+
+    def __init__(self, workers, queue_size):
+        self.capacity = workers + queue_size
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._reserved = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="ai-job",
+            initializer=self._start_worker,
+        )
+
+    def _start_worker(self):
+        self._local.loop = asyncio.new_event_loop()
+
+    @property
+    def full(self):
+        return self._reserved >= self.capacity
+
+    def run_async(self, coroutine):
+        """
+        Run a coroutine on the calling worker's loop, or through
+        async_to_sync outside the pool.
+        """
+        loop = getattr(self._local, "loop", None)
+        if loop is None:
+            return async_to_sync(_await)(coroutine)
+        return loop.run_until_complete(coroutine)
+
+    def reserve(self):
+        with self._lock:
+            if self._reserved >= self.capacity:
+                raise AIQueueFull()
+            self._reserved += 1
+
+    def release(self):
+        with self._lock:
+            self._reserved -= 1
+
+    def submit(self, fn, *args):
+        """
+        Run fn(*args) on a worker; frees the slot taken by reserve().
+        """
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self.release())
+        return future
+
+
+async def _await(coroutine):
+    return await coroutine
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_ai_job_pool():
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = AIJobPool(settings.AI_JOB_WORKERS, settings.AI_JOB_QUEUE_SIZE)
+
+    return _pool
+
+
+class AIQueryJobService:
+    """
+    Async mode of AIQueryView: the question is stored as an AIQueryJob
+    and answered by the job pool, which writes AIQueryHistory and pushes
+    an `ai_query_job` event to the asker's user_<id> group.
+
+    Jobs of a process that exits are never finished; expire() marks them
+    failed once they are overdue (see AI_JOB_TIMEOUT).
+    """
+
+    # Seconds past the AI deadline before a running job counts as lost
+    RUNNING_GRACE = 30
+
+    @staticmethod
+    def enqueue(user, query):
+        """
+        Raises AIQueueFull when the pool cannot take another job.
+
+        The pool slot is taken at commit, so a rolled back request holds
+        none. Should the pool fill up in between, the job fails with
+        "AI service busy".
+        """
+        if get_ai_job_pool().full:
+            raise AIQueueFull()
+
+        job = AIQueryJob.objects.create(user=user, query=query)
+
+        transaction.on_commit(lambda: AIQueryJobService.dispatch(job))
+        return job
+
+    @staticmethod
+    def dispatch(job):
+        pool = get_ai_job_pool()
+
+        try:
+            pool.reserve()
+        except AIQueueFull:
+            logger.warning("AI job queue full, failing job %s", job.id)
+            AIQueryJobService._finish(job, status=AIQueryJobStatus.FAILED, error="AI service busy")
+            return
+
+        pool.submit(AIQueryJobService.run, job.id)
+
+    @staticmethod
+    def expire(qs=None):
+        """
+        Mark overdue pending / running jobs failed; returns how many.
+        """
+        now = timezone.now()
+        running_for = settings.AI_SERVICE_DEADLINE + AIQueryJobService.RUNNING_GRACE
+
+        qs = AIQueryJob.objects.all() if qs is None else qs
+
+        return qs.filter(
+            Q(
+                status=AIQueryJobStatus.PENDING,
+                created_at__lt=now - timedelta(seconds=settings.AI_JOB_TIMEOUT),
+            ) |
+            Q(
+                status=AIQueryJobStatus.RUNNING,
+                started_at__lt=now - timedelta(seconds=running_for),
+            )
+        ).update(
+            status=AIQueryJobStatus.FAILED,
+            error="AI query job lost",
+            finished_at=now,
+            updated_at=now,
+        )
+
+    @staticmethod
+    def run(job_id):
+        try:
+            AIQueryJobService._run(job_id)
+        except Exception:
+            logger.exception("AI query job %s crashed", job_id)
+            AIQueryJob.objects.filter(
+                pk=job_id,
+                status__in=[AIQueryJobStatus.PENDING, AIQueryJobStatus.RUNNING],
+            ).update(
+                status=AIQueryJobStatus.FAILED,
+                error="Internal error",
+                finished_at=timezone.now(),
+            )
+        finally:
+            # Pool threads hold no DB connection between jobs
+            connections.close_all()
+
+    @staticmethod
+    def _run(job_id):
+        pool = get_ai_job_pool()
+        started_at = timezone.now()
+
+        # Already expired while waiting
+        if not AIQueryJob.objects.filter(
+            pk=job_id, status=AIQueryJobStatus.PENDING
+        ).update(
+            status=AIQueryJobStatus.RUNNING,
+            started_at=started_at,
+            updated_at=started_at,
+        ):
+            return
+
+        job = AIQueryJob.objects.select_related("user").get(pk=job_id)
+        user = job.user
+
+        ai_data, _ = AIAnswerCache.lookup(user.role, job.query)
+
+        if ai_data is None:
+            try:
+                ai_data = pool.run_async(get_ai_gateway().query(
+                    {
+                        "question": job.query,
+                        "user_id": str(user.id),
+                        "user_role": user.role,
+                    }
+                ))
+            except AIServiceUnavailable:
+                AIQueryJobService._finish(
+                    job,
+                    status=AIQueryJobStatus.FAILED,
+                    error="AI service unavailable",
+                )
+                return
+
+            AIAnswerCache.store(user.role, job.query, ai_data)
+
+        history, payload = AIQueryService.record(user, job.query, ai_data)
+
+        AIQueryJobService._finish(
+            job,
+            status=AIQueryJobStatus.COMPLETED,
+            history=history,
+            result=json.loads(json.dumps(payload, cls=DjangoJSONEncoder)),
+        )
+
+    @staticmethod
+    def _finish(job, status, history=None, result=None, error=None):
+        now = timezone.now()
+
+        # expire() may already have failed a slow job, and a poller seen
+        # that; the late outcome must not overwrite it or push again
+        if not AIQueryJob.objects.filter(
+            pk=job.pk, status=AIQueryJobStatus.RUNNING
+        ).update(
+            status=status,
+            history=history,
+            result=result,
+            error=error,
+            finished_at=now,
+            updated_at=now,
+        ):
+            return
+
+        try:
+            get_ai_job_pool().run_async(get_channel_layer().group_send(
+                f"user_{job.user_id}",
+                {
+                    "type": "ai_query_job",
+                    "job_id": str(job.id),
+                    "status": status,
+                    "result": result,
+                    "error": error,
+                },
+            ))
+        except Exception:
+            # Still available by polling
+            logger.exception("Could not push AI query job %s", job.id)
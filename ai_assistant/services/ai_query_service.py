@@ -0,0 +1,159 @@
+from base.constants.user_roles import UserRoles
+from base.constants.ai_query_types import QueryType
+
+from ai_assistant.models import AIQueryHistory
+
+from cases.models import CaseCategory
+from clients.models import Client
+from directory.constants import DirectoryEntryKind
+from directory.services import RecommendationService
+from lawyers.models import Lawyer
+from firms.models import Firm
+from lawyers.api.serializers import LawyerPublicSerializer
+from firms.api.serializers import FirmPublicSerializer
+
+
+class AIQueryService:
+    """
+    Turns an AI service reply into an AIQueryHistory row and the
+    response payload (answer, query type and, for clients,
+    lawyer / firm recommendations).
+    """
+
+    @staticmethod
+    def normalize(ai_data):
+        raw_query_type = ai_data.get("query_type", "")
+        query_type = (raw_query_type.strip().lower().split() or [""])[0]
+
+        return {
+            "answer": ai_data.get("answer", ""),
+            "query_type": query_type,
+            "case_category": ai_data.get("case_category") or None,
+        }
+
+    @staticmethod
+    def location(user):
+        """
+        (province_id, district_id, municipality_id) of the client's
+        address, or None.
+        """
+        return (
+            Client.objects
+            .filter(user=user, address__isnull=False)
+            .values_list(
+                "address__province_id",
+                "address__district_id",
+                "address__municipality_id",
+            )
+            .first()
+        )
+
+    @staticmethod
+    def candidates(model, verification, ids):
+        """
+        Profiles of the given ids, in that order.
+        """
+        profiles = (
+            model.objects
+            .filter(pk__in=ids)
+            .select_related("user", "address", f"user__{verification}")
+            .prefetch_related("services")
+            .in_bulk()
+        )
+        return [profiles[pk] for pk in ids if pk in profiles]
+
+    @staticmethod
+    def recommendations(case_category, lawyers, firms):
+        return {
+            "case_category": case_category.name,
+            "lawyers": LawyerPublicSerializer(
+                [
+                    {
+                        "user": l.user,
+                        "profile": l,
+                        "verification": l.user.bar_verification,
+                    }
+                    for l in lawyers
+                ],
+                many=True,
+            ).data,
+            "firms": FirmPublicSerializer(
+                [
+                    {
+                        "user": f.user,
+                        "profile": f,
+                        "verification": f.user.firm_verification,
+                    }
+                    for f in firms
+                ],
+                many=True,
+            ).data,
+        }
+
+    @staticmethod
+    def record(user, query, ai_data):
+        """
+        (AIQueryHistory, response payload)
+        """
+        normalized = AIQueryService.normalize(ai_data)
+
+        # Store history
+        history = AIQueryHistory.objects.create(
+            user=user,
+            query=query,
+            query_type=normalized["query_type"],
+            answer=normalized["answer"],
+            raw_ai_response=ai_data,
+        )
+
+        response_payload = {
+            "answer": normalized["answer"],
+            "query_type": normalized["query_type"],
+            "recommendations": {
+                "case_category": None,
+                "lawyers": [],
+                "firms": [],
+            },
+            "created_at": history.created_at,
+        }
+
+        # Recommendation logic (CLIENT ONLY)
+        if (
+            user.role == UserRoles.CLIENT
+            and normalized["query_type"] == QueryType.RECOMMENDATION
+            and normalized["case_category"]
+        ):
+            case_category = CaseCategory.objects.filter(
+                name__iexact=normalized["case_category"]
+            ).first()
+
+            if case_category:
+                history.case_category = case_category
+                history.save(update_fields=["case_category"])
+
+                # Precomputed per category pools (directory.RecommendationService)
+                location = AIQueryService.location(user)
+
+                lawyers = AIQueryService.candidates(
+                    Lawyer,
+                    "bar_verification",
+                    RecommendationService.recommend(
+                        DirectoryEntryKind.LAWYER, case_category.id, location
+                    ),
+                )
+                firms = AIQueryService.candidates(
+                    Firm,
+                    "firm_verification",
+                    RecommendationService.recommend(
+                        DirectoryEntryKind.FIRM, case_category.id, location
+                    ),
+                )
+
+                history.recommended_lawyers.set(lawyers)
+                history.recommended_firms.set(firms)
+
+                response_payload["recommendations"] = AIQueryService.recommendations(
+                    case_category, lawyers, firms
+                )
+
+        return history, response_payload
@@ -0,0 +1,154 @@
+import hashlib
+import re
+import unicodedata
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramDistance
+from django.core.cache import cache
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from ai_assistant.models import AIQueryHistory
+from ai_assistant.services.ai_query_service import AIQueryService
+from base.constants.ai_query_types import QueryType
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+
+
+class AIAnswerCache:
+    """
+    Reuses AI service replies for repeated questions.
+
+    Exact mode: the reply is cached under (model, role, fingerprint of
+    the normalized question) for AI_ANSWER_CACHE_TIMEOUT seconds.
+
+    Similar mode (AI_ANSWER_CACHE_SIMILARITY > 0): on an exact miss, the
+    closest recent AIQueryHistory question from a user with the same
+    role is reused when its trigram similarity reaches the threshold.
+
+    Entries are versioned by the model that produced them (the "model" /
+    "model_version" / "version" fields of the reply). The latest model
+    seen becomes current, so a model upgrade retires older answers.
+
+    Only general questions are reused; case-based and predictive answers
+    depend on the asker's facts.
+    """
+
+    CACHEABLE_TYPES = {
+        QueryType.LOOKUP,
+        QueryType.INTERPRETATION,
+        QueryType.GENERAL,
+        QueryType.NOT_LEGAL,
+        QueryType.RECOMMENDATION,
+    }
+
+    MODEL_KEY = "ai-answer:model"
+    SIMILAR_CANDIDATES = 5
+
+    @staticmethod
+    def normalize(query):
+        query = unicodedata.normalize("NFKC", query).lower()
+        query = _PUNCTUATION.sub(" ", query)
+        return _SPACES.sub(" ", query).strip()
+
+    @staticmethod
+    def fingerprint(query):
+        return hashlib.sha1(AIAnswerCache.normalize(query).encode()).hexdigest()
+
+    @staticmethod
+    def model_of(ai_data):
+        return "/".join(
+            str(ai_data[field])
+            for field in ("model", "model_version", "version")
+            if ai_data.get(field)
+        )
+
+    @staticmethod
+    def key(model, role, query):
+        model = hashlib.sha1(model.encode()).hexdigest()[:12]
+        return f"ai-answer:{model}:{role}:{AIAnswerCache.fingerprint(query)}"
+
+    @staticmethod
+    def is_cacheable(ai_data):
+        normalized = AIQueryService.normalize(ai_data)
+        return (
+            normalized["query_type"] in AIAnswerCache.CACHEABLE_TYPES
+            and bool(normalized["answer"])
+        )
+
+    # -------------------------
+    # READ
+    # -------------------------
+    @staticmethod
+    def lookup(role, query):
+        """
+        (ai_data, "exact" | "similar") for a reusable reply, else (None, None).
+        """
+        if not settings.AI_ANSWER_CACHE_TIMEOUT:
+            return None, None
+
+        model = cache.get(AIAnswerCache.MODEL_KEY)
+        if model is None:
+            return None, None
+
+        ai_data = cache.get(AIAnswerCache.key(model, role, query))
+        if ai_data is not None:
+            return ai_data, "exact"
+
+        if settings.AI_ANSWER_CACHE_SIMILARITY > 0:
+            ai_data = AIAnswerCache.similar(model, role, query)
+            if ai_data is not None:
+                return ai_data, "similar"
+
+        return None, None
+
+    @staticmethod
+    def similar(model, role, query):
+        """
+        Closest recent answered question, nearest first via the GiST
+        trigram index on lower(query).
+        """
+        term = AIAnswerCache.normalize(query)
+        threshold = settings.AI_ANSWER_CACHE_SIMILARITY
+        since = timezone.now() - timedelta(seconds=settings.AI_ANSWER_CACHE_TIMEOUT)
+
+        candidates = (
+            AIQueryHistory.objects
+            .filter(
+                user__role=role,
+                created_at__gte=since,
+                query_type__in=AIAnswerCache.CACHEABLE_TYPES,
+                raw_ai_response__isnull=False,
+            )
+            .annotate(distance=TrigramDistance(Lower("query"), term))
+            .order_by("distance")
+            .values_list("distance", "raw_ai_response")[:AIAnswerCache.SIMILAR_CANDIDATES]
+        )
+
+        for distance, ai_data in candidates:
+            if 1 - distance < threshold:
+                break
+            if AIAnswerCache.model_of(ai_data) == model and AIAnswerCache.is_cacheable(ai_data):
+                return ai_data
+
+        return None
+
+    # -------------------------
+    # WRITE
+    # -------------------------
+    @staticmethod
+    def store(role, query, ai_data):
+        if not settings.AI_ANSWER_CACHE_TIMEOUT or not AIAnswerCache.is_cacheable(ai_data):
+            return
+
+        model = AIAnswerCache.model_of(ai_data)
+        if cache.get(AIAnswerCache.MODEL_KEY) != model:
+            cache.set(AIAnswerCache.MODEL_KEY, model, timeout=None)
+
+        cache.set(
+            AIAnswerCache.key(model, role, query),
+            ai_data,
+            timeout=settings.AI_ANSWER_CACHE_TIMEOUT,
+        )
@@ -0,0 +1,100 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StubAIRequestHandler(BaseHTTPRequestHandler):
+    """
+    Speaks the AI service protocol used by AIGateway:
+
+    - POST /query/         -> one JSON reply
+    - POST /query/stream/  -> NDJSON: {"token": ...} lines, then
+                              {"done": true, **reply}
+    """
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        reply = self.server.reply_for(params)
+
+        if url.path == "/query/":
+            body = json.dumps(reply).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        elif url.path == "/query/stream/":
+            # HTTP/1.0: the body ends when the connection closes
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+
+            try:
+                for token in self.server.tokens(reply["answer"]):
+                    self.wfile.write(json.dumps({"token": token}).encode() + b"\n")
+                    self.wfile.flush()
+                    time.sleep(self.server.token_delay)
+
+                self.wfile.write(json.dumps({"done": True, **reply}).encode() + b"\n")
+            except (BrokenPipeError, ConnectionResetError):
+                # Client gave up mid-stream
+                pass
+
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class StubAIServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the AI service, for development and tests.
+
+    Replies echo the question. Set `reply` to override fields of every
+    reply (e.g. {"query_type": "recommendation", "case_category": "Civil"}).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, token_delay=0.0, reply=None, verbose=False):
+        super().__init__((host, port), StubAIRequestHandler)
+        self.token_delay = token_delay
+        self.reply = reply or {}
+        self.verbose = verbose
+        self.requests = []
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reply_for(self, params):
+        self.requests.append(params)
+        return {
+            "answer": f"Stub answer to: {params.get('question', '')}",
+            "query_type": "general",
+            "case_category": None,
+            "model": "stub",
+            **self.reply,
+        }
+
+    @staticmethod
+    def tokens(answer):
+        words = answer.split(" ")
+        return [word + " " for word in words[:-1]] + words[-1:]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
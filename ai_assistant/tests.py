@@ -0,0 +1,520 @@
+import asyncio
+import json
+import time
+from datetime import timedelta
+from unittest import mock
+
+import httpx
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from ai_assistant.models import AIQueryHistory, AIQueryJob
+from ai_assistant.services import ai_gateway, ai_query_job_service
+from ai_assistant.services.ai_gateway import AIGateway, AIServiceUnavailable, CircuitBreaker
+from ai_assistant.services.ai_query_job_service import AIJobPool, AIQueryJobService, AIQueueFull
+from ai_assistant.services.answer_cache import AIAnswerCache
+from ai_assistant.stub_server import StubAIServer
+from base.constants.ai_query_job_status import AIQueryJobStatus
+from base.constants.client_id_type import ClientIDType
+from base.constants.user_roles import UserRoles
+from base.constants.verification import VerificationStatus
+from cases.models import CaseCategory
+from chat import consumers
+from chat.consumers import SocketConsumer
+from clients.models import IDVerification
+from media.models import Image
+
+
+def make_gateway(handler=None, **overrides):
+    options = {
+        "base_url": "http://ai.test",
+        "deadline": 2,
+        "connect_timeout": 1,
+        "retries": 2,
+        "backoff": 0.01,
+        "backoff_max": 0.02,
+        "max_connections": 4,
+        "breaker": CircuitBreaker(threshold=3, reset_after=60),
+        "transport": httpx.MockTransport(handler) if handler else None,
+    }
+    options.update(overrides)
+    return AIGateway(**options)
+
+
+class AIGatewayTests(SimpleTestCase):
+
+    def query(self, gateway):
+        return async_to_sync(gateway.query)({"question": "q"})
+
+    def test_retries_server_errors(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"answer": "ok"})
+
+        with self.assertLogs(ai_gateway.logger, "WARNING"):
+            self.assertEqual(self.query(make_gateway(handler)), {"answer": "ok"})
+        self.assertEqual(len(calls), 3)
+
+    def test_client_errors_are_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(422)
+
+        gateway = make_gateway(handler)
+        with self.assertRaises(AIServiceUnavailable):
+            self.query(gateway)
+
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(gateway.breaker.is_open)
+
+    def test_deadline_covers_all_attempts(self):
+        async def handler(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={})
+
+        gateway = make_gateway(handler, deadline=0.2)
+
+        started = time.monotonic()
+        with self.assertRaises(AIServiceUnavailable), self.assertLogs(ai_gateway.logger):
+            self.query(gateway)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_circuit_opens_and_fails_fast(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        gateway = make_gateway(handler)
+
+        with self.assertRaises(AIServiceUnavailable), self.assertLogs(ai_gateway.logger):
+            self.query(gateway)
+        self.assertTrue(gateway.breaker.is_open)
+
+        with self.assertRaisesMessage(AIServiceUnavailable, "circuit is open"):
+            self.query(gateway)
+        self.assertEqual(len(calls), 3)
+
+    def test_half_open_trial_closes_circuit(self):
+        breaker = CircuitBreaker(threshold=1, reset_after=0)
+        breaker.record_failure()
+
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+
+    def test_cancelled_trial_does_not_wedge_circuit(self):
+        async def handler(request):
+            await asyncio.sleep(10)
+
+        gateway = make_gateway(handler, breaker=CircuitBreaker(threshold=1, reset_after=0))
+        gateway.breaker.record_failure()
+
+        async def cancel_trial():
+            task = asyncio.ensure_future(gateway.query({"question": "q"}))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        async_to_sync(cancel_trial)()
+
+        self.assertTrue(gateway.breaker.is_open)
+        self.assertTrue(gateway.breaker.allow())
+
+
+class AIGatewayStreamTests(SimpleTestCase):
+
+    def setUp(self):
+        self.server = StubAIServer().start()
+        self.addCleanup(self.server.stop)
+
+    def collect(self, gateway):
+        async def run():
+            return [event async for event in gateway.stream({"question": "How do I file?"})]
+        return async_to_sync(run)()
+
+    def test_tokens_then_result(self):
+        events = self.collect(make_gateway(base_url=self.server.url))
+
+        tokens = [value for kind, value in events if kind == "token"]
+        self.assertEqual("".join(tokens), "Stub answer to: How do I file?")
+        self.assertGreater(len(tokens), 1)
+
+        kind, ai_data = events[-1]
+        self.assertEqual(kind, "done")
+        self.assertEqual(ai_data["answer"], "Stub answer to: How do I file?")
+        self.assertEqual(self.server.requests, [{"question": "How do I file?"}])
+
+    def test_stream_past_deadline(self):
+        self.server.token_delay = 0.2
+        gateway = make_gateway(base_url=self.server.url, deadline=0.3)
+
+        with self.assertRaises(AIServiceUnavailable):
+            self.collect(gateway)
+
+
+class AIQueryTestMixin:
+
+    @classmethod
+    def create_client(cls):
+        cls.user = User.objects.create_user(
+            email="client@example.com", password="x", role=UserRoles.CLIENT
+        )
+        IDVerification.objects.create(
+            user=cls.user,
+            full_name="Client",
+            date_of_birth="1990-01-01",
+            id_type=ClientIDType.values[0],
+            passport_size_photo=Image.objects.create(url="https://example.com/p.jpg"),
+            photo_front=Image.objects.create(url="https://example.com/f.jpg"),
+            photo_back=Image.objects.create(url="https://example.com/b.jpg"),
+            status=VerificationStatus.VERIFIED,
+        )
+
+    def use_gateway(self, gateway):
+        cache.clear()
+        previous = ai_gateway._gateway
+        ai_gateway._gateway = gateway
+        self.addCleanup(setattr, ai_gateway, "_gateway", previous)
+
+
+class AIQueryViewTests(AIQueryTestMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_client()
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def test_answer_is_recorded(self):
+        self.use_gateway(make_gateway(
+            lambda request: httpx.Response(
+                200, json={"answer": "File at the district court.", "query_type": "General"}
+            )
+        ))
+
+        response = self.api.post("/api/ai-assistant/query/", {"query": "How do I file?"}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["query_type"], "general")
+        self.assertEqual(AIQueryHistory.objects.get().answer, "File at the district court.")
+
+    def test_unavailable(self):
+        self.use_gateway(make_gateway(lambda request: httpx.Response(503), retries=0))
+
+        with self.assertLogs(ai_gateway.logger):
+            response = self.api.post(
+                "/api/ai-assistant/query/", {"query": "How do I file?"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(AIQueryHistory.objects.exists())
+
+
+class AIAnswerCacheTests(AIQueryTestMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_client()
+
+    def setUp(self):
+        self.calls = []
+        self.reply = {"answer": "File a petition.", "query_type": "General", "model": "m1"}
+
+        def handler(request):
+            self.calls.append(request)
+            return httpx.Response(200, json=self.reply)
+
+        self.use_gateway(make_gateway(handler))
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def ask(self, query):
+        response = self.api.post("/api/ai-assistant/query/", {"query": query}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_normalize(self):
+        self.assertEqual(
+            AIAnswerCache.normalize("  How do I file for DIVORCE?? "),
+            AIAnswerCache.normalize("how do i file, for divorce"),
+        )
+
+    def test_repeated_question_is_answered_from_cache(self):
+        self.ask("How do I file for divorce?")
+        data = self.ask("how do i file for divorce")
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(data["answer"], "File a petition.")
+        # Every question is still recorded
+        self.assertEqual(AIQueryHistory.objects.count(), 2)
+
+    def test_fact_specific_answers_are_not_cached(self):
+        self.reply["query_type"] = "case_based"
+
+        self.ask("Will I win my case?")
+        self.ask("Will I win my case?")
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_scoped_by_role(self):
+        AIAnswerCache.store("client", "How do I file?", self.reply)
+
+        self.assertEqual(AIAnswerCache.lookup("client", "How do I file?")[1], "exact")
+        self.assertEqual(AIAnswerCache.lookup("lawyer", "How do I file?"), (None, None))
+
+    def test_new_model_retires_old_answers(self):
+        AIAnswerCache.store("client", "How do I file?", self.reply)
+        AIAnswerCache.store("client", "What is bail?", {**self.reply, "model": "m2"})
+
+        self.assertEqual(AIAnswerCache.lookup("client", "How do I file?"), (None, None))
+        self.assertIsNotNone(AIAnswerCache.lookup("client", "What is bail?")[0])
+
+    @override_settings(AI_ANSWER_CACHE_SIMILARITY=0.6)
+    def test_similar_question_reuses_history(self):
+        self.ask("How do I file for divorce in Nepal?")
+
+        ai_data, source = AIAnswerCache.lookup("client", "How can I file for a divorce in Nepal")
+        self.assertEqual(source, "similar")
+        self.assertEqual(ai_data["answer"], "File a petition.")
+
+        self.assertEqual(AIAnswerCache.lookup("client", "What is the bail process?"), (None, None))
+
+    @override_settings(AI_ANSWER_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        self.ask("How do I file for divorce?")
+        self.ask("How do I file for divorce?")
+
+        self.assertEqual(len(self.calls), 2)
+
+
+@override_settings(CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}})
+class AIQuerySocketTests(AIQueryTestMixin, TransactionTestCase):
+    # The consumer's DB calls close old connections, which a TestCase
+    # transaction does not survive
+
+    def setUp(self):
+        self.create_client()
+        self.server = StubAIServer(
+            reply={"query_type": "Recommendation", "case_category": "civil"}
+        ).start()
+        self.addCleanup(self.server.stop)
+        self.use_gateway(make_gateway(base_url=self.server.url))
+
+        CaseCategory.objects.create(name="Civil")
+
+    async def ask(self, query):
+        # Plain ASGI communicator: channels.testing needs daphne
+        socket = ApplicationCommunicator(
+            SocketConsumer.as_asgi(),
+            {"type": "websocket", "path": "/ws/socket/", "user": self.user},
+        )
+
+        async def receive():
+            message = await socket.receive_output(timeout=5)
+            return json.loads(message["text"])
+
+        await socket.send_input({"type": "websocket.connect"})
+        self.assertEqual((await socket.receive_output())["type"], "websocket.accept")
+        self.assertEqual((await receive())["type"], "unread_count")
+
+        await socket.send_input({
+            "type": "websocket.receive",
+            "text": json.dumps({"action": "ai_query", "query": query, "request_id": "r1"}),
+        })
+
+        events = []
+        while not events or events[-1]["type"] not in ("ai_query_completed", "ai_query_error"):
+            events.append(await receive())
+
+        await socket.send_input({"type": "websocket.disconnect", "code": 1000})
+        await socket.wait(timeout=5)
+        return events
+
+    async def test_streams_tokens_and_records_history(self):
+        events = await self.ask("I need a lawyer for a land dispute")
+
+        self.assertEqual(events[0], {"type": "ai_query_started", "request_id": "r1"})
+
+        tokens = [event["token"] for event in events if event["type"] == "ai_token"]
+        self.assertEqual("".join(tokens), "Stub answer to: I need a lawyer for a land dispute")
+
+        completed = events[-1]
+        self.assertEqual(completed["type"], "ai_query_completed")
+        self.assertEqual(completed["answer"], "".join(tokens))
+        self.assertEqual(completed["query_type"], "recommendation")
+        self.assertEqual(completed["recommendations"]["case_category"], "Civil")
+
+        history = await AIQueryHistory.objects.select_related("case_category").aget()
+        self.assertEqual(history.answer, completed["answer"])
+        self.assertEqual(history.case_category.name, "Civil")
+
+    async def test_unavailable(self):
+        self.server.stop()
+
+        with self.assertLogs(ai_gateway.logger):
+            events = await self.ask("How do I file?")
+
+        self.assertEqual(events[-1]["type"], "ai_query_error")
+        self.assertFalse(await AIQueryHistory.objects.aexists())
+
+    async def test_unexpected_failure_ends_the_request(self):
+        failing = mock.patch.object(
+            SocketConsumer, "record_ai_query", mock.AsyncMock(side_effect=RuntimeError("boom"))
+        )
+
+        with failing, self.assertLogs(consumers.logger, "ERROR"):
+            events = await self.ask("How do I file?")
+
+        self.assertEqual(
+            events[-1],
+            {"type": "ai_query_error", "request_id": "r1", "error": "AI query failed"},
+        )
+
+
+@override_settings(CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}})
+class AIQueryJobTests(AIQueryTestMixin, TransactionTestCase):
+    # Jobs run on pool threads, which need committed rows
+
+    def setUp(self):
+        self.create_client()
+
+        self.server = StubAIServer().start()
+        self.addCleanup(self.server.stop)
+        self.use_gateway(make_gateway(base_url=self.server.url))
+
+        self.pool = AIJobPool(workers=2, queue_size=0)
+        self.addCleanup(self.pool._executor.shutdown)
+        previous = ai_query_job_service._pool
+        ai_query_job_service._pool = self.pool
+        self.addCleanup(setattr, ai_query_job_service, "_pool", previous)
+
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+        layer = get_channel_layer()
+        self.channel = async_to_sync(layer.new_channel)()
+        async_to_sync(layer.group_add)(f"user_{self.user.id}", self.channel)
+
+    def ask_async(self, query):
+        return self.api.post(
+            "/api/ai-assistant/query/", {"query": query, "async": True}, format="json"
+        )
+
+    def wait(self, job_id):
+        for _ in range(100):
+            data = self.api.get(f"/api/ai-assistant/jobs/{job_id}/").data
+            if data["status"] in (AIQueryJobStatus.COMPLETED, AIQueryJobStatus.FAILED):
+                return data
+            time.sleep(0.05)
+        self.fail("AI query job did not finish")
+
+    def test_job_answers_and_pushes_result(self):
+        response = self.ask_async("How do I file?")
+        self.assertEqual(response.status_code, 202)
+        self.assertIn(response.data["status"], (AIQueryJobStatus.PENDING, AIQueryJobStatus.RUNNING))
+
+        data = self.wait(response.data["id"])
+        self.assertEqual(data["status"], AIQueryJobStatus.COMPLETED)
+        self.assertEqual(data["result"]["answer"], "Stub answer to: How do I file?")
+
+        job = AIQueryJob.objects.get()
+        self.assertEqual(job.history, AIQueryHistory.objects.get())
+
+        event = async_to_sync(get_channel_layer().receive)(self.channel)
+        self.assertEqual(event["type"], "ai_query_job")
+        self.assertEqual(event["job_id"], str(job.id))
+        self.assertEqual(event["result"], data["result"])
+
+    def test_failed_job(self):
+        self.server.stop()
+
+        with self.assertLogs(ai_gateway.logger):
+            response = self.ask_async("How do I file?")
+            data = self.wait(response.data["id"])
+
+        self.assertEqual(data["status"], AIQueryJobStatus.FAILED)
+        self.assertEqual(data["error"], "AI service unavailable")
+        self.assertFalse(AIQueryHistory.objects.exists())
+
+    def test_full_queue_is_refused(self):
+        self.pool.reserve()
+        self.pool.reserve()
+
+        with self.assertRaises(AIQueueFull):
+            self.pool.reserve()
+
+        response = self.ask_async("How do I file?")
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(AIQueryJob.objects.exists())
+
+    def test_rolled_back_request_holds_no_slot(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            AIQueryJobService.enqueue(self.user, "How do I file?")
+            raise RuntimeError()
+
+        self.assertFalse(AIQueryJob.objects.exists())
+        self.assertEqual(self.pool._reserved, 0)
+
+    def test_lost_job_fails_on_poll(self):
+        job = AIQueryJob.objects.create(user=self.user, query="How do I file?")
+        AIQueryJob.objects.filter(pk=job.pk).update(
+            created_at=timezone.now() - timedelta(seconds=settings.AI_JOB_TIMEOUT + 1)
+        )
+
+        data = self.api.get(f"/api/ai-assistant/jobs/{job.id}/").data
+
+        self.assertEqual(data["status"], AIQueryJobStatus.FAILED)
+        self.assertEqual(data["error"], "AI query job lost")
+
+        # A worker that reaches it later leaves it alone
+        AIQueryJobService.run(job.id)
+        self.assertFalse(AIQueryHistory.objects.exists())
+
+    def test_late_result_keeps_expired_job_failed(self):
+        job = AIQueryJob.objects.create(
+            user=self.user,
+            query="How do I file?",
+            status=AIQueryJobStatus.RUNNING,
+            started_at=timezone.now() - timedelta(seconds=settings.AI_SERVICE_DEADLINE + 60),
+        )
+        self.assertEqual(AIQueryJobService.expire(), 1)
+
+        with mock.patch.object(ai_query_job_service, "get_channel_layer") as layer:
+            AIQueryJobService._finish(
+                job, status=AIQueryJobStatus.COMPLETED, result={"answer": "Late"}
+            )
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, AIQueryJobStatus.FAILED)
+        self.assertEqual(job.error, "AI query job lost")
+        layer.assert_not_called()
+
+    def test_other_users_job_is_hidden(self):
+        other = User.objects.create_user(
+            email="other@example.com", password="x", role=UserRoles.CLIENT
+        )
+        job = AIQueryJob.objects.create(user=other, query="Private")
+
+        response = self.api.get(f"/api/ai-assistant/jobs/{job.id}/")
+        self.assertEqual(response.status_code, 404)
@@ -1,9 +1,10 @@
 from django.urls import path
 from ai_assistant.api.views import (
-    AIQueryView, AIQueryHistoryListView)
+    AIQueryView, AIQueryJobDetailView, AIQueryHistoryListView)
 
 urlpatterns = [
     path("query/", AIQueryView.as_view(), name="ai-query"),
+    path("jobs/<uuid:job_id>/", AIQueryJobDetailView.as_view(), name="ai-query-job"),
         path("history/", AIQueryHistoryListView.as_view(), name="ai-history"),
 
 ]
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 
 import os
+import sys
 from dotenv import load_dotenv
 import dj_database_url
 
@@ -56,6 +57,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 
     "corsheaders",
 
@@ -73,17 +75,21 @@ INSTALLED_APPS = [
     "ai_assistant",
     "channels",
     "notifications",
-    "chat"
+    "chat",
+    "dashboards",
+    "directory",
 ]
 
 AUTH_USER_MODEL = "accounts.User"
 ASGI_APPLICATION = "backend.asgi.application"
 
+REDIS_URL = os.environ.get("REDIS_URL", "redis://127.0.0.1:6379")
+
 CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
         "CONFIG": {
-            "hosts": [os.environ.get("REDIS_URL", "redis://127.0.0.1:6379")],
+            "hosts": [REDIS_URL],
         },
     },
 }
@@ -162,12 +168,99 @@ WSGI_APPLICATION = "backend.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Served over ASGI: persistent connections are not reused across the
+# per-request sync threads and would pile up, so connections are borrowed
+# from a per-process psycopg pool instead (requires conn_max_age=0)
 DATABASES = {
     "default": dj_database_url.parse(
         os.environ["DATABASE_URL"],
-        conn_max_age=600
+        conn_max_age=0
     )
 }
+DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+    "min_size": int(os.environ.get("DATABASE_POOL_MIN_SIZE", 2)),
+    "max_size": int(os.environ.get("DATABASE_POOL_MAX_SIZE", 10)),
+}
+
+# Directory fuzzy search: minimum pg_trgm word similarity for a match.
+# Applied per search transaction (DirectoryService.word_similarity) so the
+# `%>` operator keeps using the GIN index.
+DIRECTORY_WORD_SIMILARITY = float(os.environ.get("DIRECTORY_WORD_SIMILARITY", "0.4"))
+
+# Cache
+# Shared Redis (the channel layer's) so generation bumps and invalidations
+# reach every worker process; per-process memory only under `manage.py test`
+
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
+if not TESTING:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "trilex",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "trilex",
+        }
+    }
+
+CASE_LIST_CACHE_TIMEOUT = int(os.environ.get("CASE_LIST_CACHE_TIMEOUT", 300))
+
+# Dashboards read the DashboardStat rollups; set to False to compute live
+DASHBOARD_USE_ROLLUPS = os.environ.get("DASHBOARD_USE_ROLLUPS", "true").lower() == "true"
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get("DASHBOARD_CACHE_TIMEOUT", 60))
+
+# Public lawyer / firm profiles: served fresh for FRESH seconds, then stale
+# (while refreshed in the background) for up to STALE more seconds
+PUBLIC_PROFILE_CACHE_FRESH = int(os.environ.get("PUBLIC_PROFILE_CACHE_FRESH", 300))
+PUBLIC_PROFILE_CACHE_STALE = int(os.environ.get("PUBLIC_PROFILE_CACHE_STALE", 86400))
+# Not found (unknown / unverified id): kept briefly, as anyone can request any id
+PUBLIC_PROFILE_CACHE_MISSING = int(os.environ.get("PUBLIC_PROFILE_CACHE_MISSING", 60))
+
+# Address master data is held in memory per process; seconds between
+# checks for a reseed, and browser/CDN max-age of the address endpoints
+ADDRESS_TREE_CHECK_INTERVAL = int(os.environ.get("ADDRESS_TREE_CHECK_INTERVAL", 60))
+ADDRESS_CACHE_MAX_AGE = int(os.environ.get("ADDRESS_CACHE_MAX_AGE", 3600))
+
+# AI service gateway: overall deadline per question (all attempts), retries
+# with exponential backoff + jitter, pooled connections per process, and a
+# circuit breaker that fails fast after consecutive failures
+AI_SERVICE_DEADLINE = float(os.environ.get("AI_SERVICE_DEADLINE", 60))
+AI_SERVICE_CONNECT_TIMEOUT = float(os.environ.get("AI_SERVICE_CONNECT_TIMEOUT", 5))
+AI_SERVICE_RETRIES = int(os.environ.get("AI_SERVICE_RETRIES", 2))
+AI_SERVICE_BACKOFF = float(os.environ.get("AI_SERVICE_BACKOFF", 0.5))
+AI_SERVICE_BACKOFF_MAX = float(os.environ.get("AI_SERVICE_BACKOFF_MAX", 4))
+AI_SERVICE_MAX_CONNECTIONS = int(os.environ.get("AI_SERVICE_MAX_CONNECTIONS", 20))
+AI_CIRCUIT_FAILURES = int(os.environ.get("AI_CIRCUIT_FAILURES", 5))
+AI_CIRCUIT_RESET = float(os.environ.get("AI_CIRCUIT_RESET", 30))
+
+# Reuse of AI answers for repeated questions: seconds an answer stays
+# reusable (0 disables), and the trigram similarity (0-1) at which a past
+# question counts as the same one (0 = exact normalized matches only)
+AI_ANSWER_CACHE_TIMEOUT = int(os.environ.get("AI_ANSWER_CACHE_TIMEOUT", 86400))
+AI_ANSWER_CACHE_SIMILARITY = float(os.environ.get("AI_ANSWER_CACHE_SIMILARITY", 0))
+
+# Async-mode AI questions: per-process worker threads (= max concurrent
+# AI calls) and how many more may wait before new jobs are refused
+AI_JOB_WORKERS = int(os.environ.get("AI_JOB_WORKERS", 4))
+AI_JOB_QUEUE_SIZE = int(os.environ.get("AI_JOB_QUEUE_SIZE", 100))
+# Seconds after which a job still pending counts as lost (its process
+# exited); by default the longest the queue can take to reach it
+AI_JOB_TIMEOUT = int(os.environ.get(
+    "AI_JOB_TIMEOUT",
+    (AI_JOB_QUEUE_SIZE // AI_JOB_WORKERS + 1) * AI_SERVICE_DEADLINE + 60,
+))
+
+# AI lawyer / firm recommendations: candidates read per case category pool,
+# how many of the best take turns being recommended, and pool cache lifetime
+RECOMMENDATION_POOL_SIZE = int(os.environ.get("RECOMMENDATION_POOL_SIZE", 50))
+RECOMMENDATION_ROTATION_WINDOW = int(os.environ.get("RECOMMENDATION_ROTATION_WINDOW", 15))
+RECOMMENDATION_CACHE_TIMEOUT = int(os.environ.get("RECOMMENDATION_CACHE_TIMEOUT", 3600))
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -0,0 +1,201 @@
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.db import connections
+
+
+# ---------------------------------------------------
+# Generation counters
+# ---------------------------------------------------
+#
+# Cached entries embed the generation of their scope in the key.
+# Bumping the generation makes every older entry unreachable at once;
+# they expire on their own TTL.
+#
+# New counters start at the current time in ns instead of 1, so a
+# counter lost to eviction / restart never repeats an old value.
+
+def _generation_key(namespace, scope):
+    return f"gen:{namespace}:{scope}"
+
+
+def get_generations(namespace, scopes):
+    """
+    {scope: generation} for all scopes in one round trip.
+    """
+    keys = {_generation_key(namespace, scope): scope for scope in scopes}
+    found = cache.get_many(keys)
+
+    missing = {key: time.time_ns() for key in keys if key not in found}
+    if missing:
+        for key, value in missing.items():
+            cache.add(key, value, timeout=None)
+        found.update(cache.get_many(missing))
+
+    return {
+        scope: found.get(key, missing.get(key))
+        for key, scope in keys.items()
+    }
+
+
+def get_generation(namespace, scope):
+    return get_generations(namespace, [scope])[scope]
+
+
+def bump_generations(namespace, scopes):
+    for scope in set(scopes):
+        key = _generation_key(namespace, scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_generation(namespace, scope):
+    bump_generations(namespace, [scope])
+
+
+def params_fingerprint(params):
+    """
+    Stable short hash of a QueryDict / mapping, independent of key order.
+    """
+    if hasattr(params, "lists"):
+        items = sorted((key, sorted(values)) for key, values in params.lists())
+    else:
+        items = sorted(params.items())
+
+    return hashlib.md5(repr(items).encode()).hexdigest()
+
+
+# ---------------------------------------------------
+# Single-flight cache fill
+# ---------------------------------------------------
+
+def get_or_compute(key, compute, timeout, lock_timeout=10, wait=0.5, poll=0.01, max_poll=0.1):
+    """
+    cache.get(key), computing and storing the value on a miss.
+
+    Concurrent misses are coalesced: the first caller takes a short
+    lock (cache.add) and computes; the others poll for the value
+    instead of running the same work. `wait` should be about the
+    expected compute time: past it the waiter stops holding its request
+    and computes on its own. Polls back off from `poll` to `max_poll`.
+
+    `timeout` is in seconds, or a callable(value) -> seconds.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f"{key}:lock"
+
+    if cache.add(lock_key, 1, timeout=lock_timeout):
+        try:
+            value = compute()
+            cache.set(key, value, timeout=timeout(value) if callable(timeout) else timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + wait
+    while (remaining := deadline - time.monotonic()) > 0:
+        time.sleep(min(poll, remaining))
+        poll = min(poll * 2, max_poll)
+
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+    return compute()
+
+
+# ---------------------------------------------------
+# Stale-while-revalidate
+# ---------------------------------------------------
+#
+# Entries are stored as {"value": ..., "fresh_until": ts} and kept for
+# `fresh_for + stale_for`. Past `fresh_until` the stale value is still
+# returned while a small shared executor recomputes it, so readers only
+# wait on the database when there is no entry at all.
+#
+# A None value (e.g. not found) is only kept for `missing_for`, so
+# lookups of arbitrary ids don't fill the cache with long-lived misses.
+#
+# At most REVALIDATE_WORKERS recomputes run at once per process, and at
+# most REVALIDATE_BACKLOG wait; beyond that the stale value is served
+# and a later read retries.
+
+REVALIDATE_WORKERS = 2
+REVALIDATE_BACKLOG = 32
+
+_revalidate_slots = threading.BoundedSemaphore(REVALIDATE_WORKERS + REVALIDATE_BACKLOG)
+_revalidate_executor = None
+_revalidate_lock = threading.Lock()
+
+
+def _get_revalidate_executor():
+    global _revalidate_executor
+
+    if _revalidate_executor is None:
+        with _revalidate_lock:
+            if _revalidate_executor is None:
+                _revalidate_executor = ThreadPoolExecutor(
+                    max_workers=REVALIDATE_WORKERS,
+                    thread_name_prefix="cache-revalidate",
+                )
+
+    return _revalidate_executor
+
+
+def _revalidate(key, compute, fresh_for, stale_for, missing_for, lock_key):
+    try:
+        entry = _stamped(compute(), fresh_for, missing_for)
+        cache.set(key, entry, timeout=_entry_timeout(entry, fresh_for, stale_for, missing_for))
+    finally:
+        cache.delete(lock_key)
+        _revalidate_slots.release()
+        connections.close_all()
+
+
+def _stamped(value, fresh_for, missing_for):
+    if value is None:
+        fresh_for = missing_for
+    return {"value": value, "fresh_until": time.time() + fresh_for}
+
+
+def _entry_timeout(entry, fresh_for, stale_for, missing_for):
+    return missing_for if entry["value"] is None else fresh_for + stale_for
+
+
+def get_or_revalidate(key, compute, fresh_for, stale_for, missing_for=60, lock_timeout=10):
+    """
+    compute() result behind a stale-while-revalidate cache entry.
+    `compute` may return None (e.g. not found); that is cached for
+    `missing_for` seconds only.
+    """
+    entry = cache.get(key)
+
+    if entry is None:
+        entry = get_or_compute(
+            key,
+            lambda: _stamped(compute(), fresh_for, missing_for),
+            timeout=lambda entry: _entry_timeout(entry, fresh_for, stale_for, missing_for),
+            lock_timeout=lock_timeout,
+        )
+        return entry["value"]
+
+    lock_key = f"{key}:lock"
+
+    if entry["fresh_until"] <= time.time() and cache.add(lock_key, 1, timeout=lock_timeout):
+        if _revalidate_slots.acquire(blocking=False):
+            _get_revalidate_executor().submit(
+                _revalidate, key, compute, fresh_for, stale_for, missing_for, lock_key
+            )
+        else:
+            # Backlog full
+            cache.delete(lock_key)
+
+    return entry["value"]
@@ -37,3 +37,21 @@ class CaseDateType(models.TextChoices):
 class CaseDocumentScope(models.TextChoices):
     INTERNAL = "internal", "Internal / My File"
     CLIENT = "client", "Client File"
+
+class CaseImportFormat(models.TextChoices):
+    CSV = "csv", "CSV"
+    JSONL = "jsonl", "JSON Lines"
+
+class CaseImportStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
+
+class CaseEventType(models.TextChoices):
+    CASE_CREATED = "case_created", "Case Created"
+    CASE_IMPORTED = "case_imported", "Case Imported"
+    CASE_UPDATED = "case_updated", "Case Updated"
+    DOCUMENT_UPLOADED = "document_uploaded", "Document Uploaded"
+    DATE_ADDED = "date_added", "Date Added"
+    LAWYER_ASSIGNED = "lawyer_assigned", "Lawyer Assigned"
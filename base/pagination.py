@@ -1,6 +1,25 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 class DefaultPageNumberPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
-    max_page_size = 100
\ No newline at end of file
+    max_page_size = 100
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    Keyset pagination on created_at for large, append-heavy lists.
+    No COUNT(*); each page is an index range scan regardless of depth.
+    """
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
+
+class DateCursorPagination(DefaultCursorPagination):
+    """
+    Keyset pagination on a date column, oldest first. Rows sharing a
+    date are told apart by the tie-breaking columns.
+    """
+    page_size = 100
+    max_page_size = 500
+    ordering = ("date", "case_id", "id")
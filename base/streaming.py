@@ -0,0 +1,46 @@
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+
+
+def _next_batch(iterator, size):
+    return list(islice(iterator, size))
+
+
+def _close(iterator):
+    close = getattr(iterator, "close", None)
+    if close:
+        close()
+
+
+async def aiter_batches(iterable, batch_size=100):
+    """
+    Async iterator over a sync iterable (e.g. one reading a queryset with
+    .iterator()), pulling `batch_size` items per hop to the sync thread,
+    so at most one batch is held in memory.
+    """
+    iterator = iter(iterable)
+    next_batch = sync_to_async(_next_batch)
+
+    try:
+        while batch := await next_batch(iterator, batch_size):
+            for item in batch:
+                yield item
+    finally:
+        # Client went away: release the server-side cursor now
+        await sync_to_async(_close)(iterator)
+
+
+def streaming_content(request, iterable, batch_size=100):
+    """
+    Content for a StreamingHttpResponse.
+
+    Under ASGI, Django reads a sync iterator into a list before sending
+    it, so the iterable is wrapped in aiter_batches(); under WSGI it is
+    returned as is.
+    """
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        return aiter_batches(iterable, batch_size)
+
+    return iterable
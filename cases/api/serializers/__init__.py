@@ -4,8 +4,19 @@ from .case_document_serializers import (
     CaseDocumentCreateSerializer,
     CaseDocumentSerializer,
 )
-from .case_date_serailizers import CaseDateCreateSerializer, CaseDateSerializer
+from .case_date_serailizers import (
+    CaseDateCreateSerializer,
+    CaseDateSerializer,
+    CaseCalendarEntrySerializer,
+    CaseCalendarFeedSerializer,
+)
 from .case_lawyer_serializers import CaseLawyerAssignSerializer
+from .case_event_serializers import CaseEventSerializer
+from .case_import_serializers import (
+    CaseImportRowSerializer,
+    CaseImportUploadSerializer,
+    CaseImportJobSerializer,
+)
 
 __all__ = [
     "CaseCreateSerializer",
@@ -15,5 +26,11 @@ __all__ = [
     "CaseDocumentSerializer",
     "CaseDateCreateSerializer",
     "CaseDateSerializer",
+    "CaseCalendarEntrySerializer",
+    "CaseCalendarFeedSerializer",
     "CaseLawyerAssignSerializer",   
+    "CaseImportRowSerializer",
+    "CaseImportUploadSerializer",
+    "CaseImportJobSerializer",
+    "CaseEventSerializer",
 ]
\ No newline at end of file
@@ -23,3 +23,27 @@ class CaseDateSerializer(serializers.ModelSerializer):
             "assigned_to_name",
             "created_at",
         )
+
+class CaseCalendarEntrySerializer(serializers.ModelSerializer):
+    case_id = serializers.UUIDField(source="case.id", read_only=True)
+    case_title = serializers.CharField(source="case.title", read_only=True)
+    case_status = serializers.CharField(source="case.status", read_only=True)
+    court_type = serializers.CharField(source="case.court_type", read_only=True)
+
+    class Meta:
+        model = CaseDate
+        fields = (
+            "id",
+            "date_type",
+            "date",
+            "remark",
+            "assigned_to_name",
+            "case_id",
+            "case_title",
+            "case_status",
+            "court_type",
+        )
+
+
+class CaseCalendarFeedSerializer(serializers.Serializer):
+    url = serializers.URLField(read_only=True)
@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+from cases.models import CaseEvent
+
+
+class CaseEventSerializer(serializers.ModelSerializer):
+    actor_email = serializers.EmailField(
+        source="actor.email",
+        read_only=True,
+        default=None
+    )
+
+    class Meta:
+        model = CaseEvent
+        fields = (
+            "id",
+            "event_type",
+            "actor",
+            "actor_email",
+            "actor_role",
+            "target_id",
+            "payload",
+            "created_at",
+        )
+
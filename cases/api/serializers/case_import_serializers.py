@@ -0,0 +1,89 @@
+from rest_framework import serializers
+
+from cases.models import CaseDocument, CaseImportJob
+from cases.models.case import CourtType, CaseStatus
+from cases.api.serializers.case_date_serailizers import CaseDateCreateSerializer
+from cases.api.serializers.case_client_details_serializers import CaseClientDetailsCreateSerializer
+from cases.api.serializers.case_waris_serializers import CaseWarisCreateSerializer
+from base.constants.case import CaseDocumentScope, CaseImportFormat
+
+
+class CaseImportDocumentSerializer(serializers.ModelSerializer):
+    """
+    Document reference inside an import row.
+    `file` is an already uploaded Image id, resolved per chunk.
+    """
+
+    file = serializers.UUIDField()
+
+    document_scope = serializers.ChoiceField(
+        choices=CaseDocumentScope.choices,
+        default=CaseDocumentScope.INTERNAL
+    )
+
+    class Meta:
+        model = CaseDocument
+        fields = (
+            "title",
+            "description",
+            "file",
+            "file_type",
+            "document_scope",
+        )
+
+
+class CaseImportRowSerializer(serializers.Serializer):
+    """
+    One case in an import file.
+    Relations are plain ids here; the import service resolves them
+    for the whole chunk at once instead of one query per row.
+    """
+
+    title = serializers.CharField(max_length=255)
+    case_category = serializers.UUIDField()
+    court_type = serializers.ChoiceField(choices=CourtType.choices)
+    status = serializers.ChoiceField(
+        choices=CaseStatus.choices,
+        default=CaseStatus.DRAFT
+    )
+    description = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        default=""
+    )
+    client = serializers.UUIDField(required=False, allow_null=True)
+
+    client_details = CaseClientDetailsCreateSerializer(required=True)
+    waris = CaseWarisCreateSerializer(required=False, allow_null=True)
+    documents = CaseImportDocumentSerializer(many=True, required=False)
+    dates = CaseDateCreateSerializer(many=True, required=False)
+
+
+class CaseImportUploadSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(
+        choices=CaseImportFormat.choices,
+        required=False
+    )
+    job = serializers.UUIDField(
+        required=False,
+        help_text="Resume an existing import job with the same file"
+    )
+
+
+class CaseImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CaseImportJob
+        fields = (
+            "id",
+            "file_name",
+            "file_format",
+            "status",
+            "rows_processed",
+            "rows_imported",
+            "rows_failed",
+            "errors",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = fields
@@ -1,8 +1,11 @@
+from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 
 from drf_spectacular.utils import (
     extend_schema,
@@ -14,8 +17,38 @@ from cases.models import Case, CaseDate
 from cases.api.serializers import (
     CaseDateCreateSerializer,
     CaseDateSerializer,
+    CaseCalendarEntrySerializer,
+    CaseCalendarFeedSerializer,
 )
 from cases.permissions import CanManageCaseDates
+from cases.services.case_calendar_service import CaseCalendarService
+from cases.services.case_event_service import CaseEventService
+from base.constants.case import CaseDateType
+from base.pagination import DateCursorPagination
+from base.streaming import streaming_content
+
+
+CALENDAR_PARAMETERS = [
+    OpenApiParameter(
+        name="date_from",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description="Start date YYYY-MM-DD (default today)",
+    ),
+    OpenApiParameter(
+        name="date_to",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description="End date YYYY-MM-DD, inclusive (default start + 14 days)",
+    ),
+    OpenApiParameter(
+        name="date_type",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        enum=[value for value, _ in CaseDateType.choices],
+        description="Filter by date type",
+    ),
+]
 
 
 class CaseDateCreateView(APIView):
@@ -54,6 +87,7 @@ class CaseDateCreateView(APIView):
         },
         tags=["cases"],
     )
+    @transaction.atomic
     def post(self, request, case_id):
         case = get_object_or_404(Case, id=case_id)
         self.check_object_permissions(request, case)
@@ -65,8 +99,192 @@ class CaseDateCreateView(APIView):
             case=case,
             **serializer.validated_data
         )
+        CaseEventService.date_added(case, case_date, request.user)
 
         return Response(
             CaseDateSerializer(case_date).data,
             status=201
         )
+
+
+class CaseCalendarView(APIView):
+    """
+    Upcoming case dates across every case visible to the user.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Case calendar",
+        description=(
+            "Returns hearings and deadlines of all cases visible to the "
+            "authenticated user within a date window.\n\n"
+            "**Visibility:**\n"
+            "- Same rules as the case list (owner, assigned, firm admin, client)\n\n"
+            "**Window:**\n"
+            "- Defaults to today → today + 14 days\n"
+            "- Maximum 366 days\n\n"
+            "Ordered by date, then case.\n\n"
+            "**Pagination:** cursor based, follow `next` / `previous`. "
+            "Use the iCal endpoints for the whole window in one response."
+        ),
+        parameters=CALENDAR_PARAMETERS + [
+            OpenApiParameter(
+                name="cursor",
+                type=str,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="page_size",
+                type=int,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={
+            200: CaseCalendarEntrySerializer(many=True),
+            400: OpenApiResponse(description="Invalid date window"),
+        },
+        tags=["cases"],
+    )
+    def get(self, request):
+        start, end = CaseCalendarService.parse_window(
+            request.query_params.get("date_from"),
+            request.query_params.get("date_to"),
+        )
+
+        dates = CaseCalendarService.get_dates(
+            request.user,
+            start,
+            end,
+            date_type=request.query_params.get("date_type"),
+        )
+
+        paginator = DateCursorPagination()
+        page = paginator.paginate_queryset(dates, request, view=self)
+
+        return Response({
+            "date_from": start,
+            "date_to": end,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+            "results": CaseCalendarEntrySerializer(page, many=True).data,
+        })
+
+
+def ical_response(request, user):
+    start, end = CaseCalendarService.parse_window(
+        request.query_params.get("date_from"),
+        request.query_params.get("date_to"),
+    )
+
+    dates = CaseCalendarService.get_dates(
+        user,
+        start,
+        end,
+        date_type=request.query_params.get("date_type"),
+    )
+
+    response = StreamingHttpResponse(
+        streaming_content(request, CaseCalendarService.iter_ical(dates)),
+        content_type="text/calendar; charset=utf-8",
+    )
+    response["Content-Disposition"] = 'attachment; filename="trilex-calendar.ics"'
+    return response
+
+
+class CaseCalendarICalView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Case calendar (iCal)",
+        description=(
+            "Same dates as the case calendar, as an iCalendar (.ics) feed "
+            "of all-day events. For calendar app subscriptions use the "
+            "feed URL instead, which needs no Authorization header."
+        ),
+        parameters=CALENDAR_PARAMETERS,
+        responses={
+            (200, "text/calendar"): OpenApiResponse(description="iCalendar feed"),
+            400: OpenApiResponse(description="Invalid date window"),
+        },
+        tags=["cases"],
+    )
+    def get(self, request):
+        return ical_response(request, request.user)
+
+
+class CaseCalendarFeedView(APIView):
+    """
+    Subscription URL of the user's iCal feed.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def feed_url(self, request, rotate=False):
+        token = CaseCalendarService.feed_token(request.user, rotate=rotate)
+        url = request.build_absolute_uri(reverse("cases-calendar-feed-ical", args=[token]))
+        return CaseCalendarFeedSerializer({"url": url}).data
+
+    @extend_schema(
+        summary="Get calendar feed URL",
+        description=(
+            "Secret URL of the user's iCal feed, for subscribing from a "
+            "calendar app. Anyone with the URL can read the feed; rotate "
+            "or revoke it if it leaks. Accepts the calendar filters as "
+            "query parameters on the feed URL."
+        ),
+        responses={200: CaseCalendarFeedSerializer},
+        tags=["cases"],
+    )
+    def get(self, request):
+        return Response(self.feed_url(request))
+
+    @extend_schema(
+        summary="Rotate calendar feed URL",
+        description="Issues a new feed URL; earlier URLs stop working.",
+        request=None,
+        responses={200: CaseCalendarFeedSerializer},
+        tags=["cases"],
+    )
+    def post(self, request):
+        return Response(self.feed_url(request, rotate=True))
+
+    @extend_schema(
+        summary="Revoke calendar feed URL",
+        description="Earlier feed URLs stop working until a new one is requested.",
+        responses={204: OpenApiResponse(description="Revoked")},
+        tags=["cases"],
+    )
+    def delete(self, request):
+        CaseCalendarService.revoke_feed(request.user)
+        return Response(status=204)
+
+
+class CaseCalendarFeedICalView(APIView):
+    """
+    iCal feed authenticated by the signed token in its URL.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        summary="Case calendar feed (iCal)",
+        description=(
+            "The case calendar of the feed's owner as iCalendar, "
+            "for calendar app subscriptions."
+        ),
+        parameters=CALENDAR_PARAMETERS,
+        responses={
+            (200, "text/calendar"): OpenApiResponse(description="iCalendar feed"),
+            400: OpenApiResponse(description="Invalid date window"),
+            404: OpenApiResponse(description="Unknown, rotated or revoked feed"),
+        },
+        tags=["cases"],
+    )
+    def get(self, request, token):
+        user = CaseCalendarService.feed_user(token)
+        if user is None:
+            raise Http404
+
+        return ical_response(request, user)
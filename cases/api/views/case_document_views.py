@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from rest_framework.views import APIView
@@ -15,10 +16,18 @@ from cases.api.serializers import (
     CaseDocumentCreateSerializer,
     CaseDocumentSerializer,
 )
-from cases.permissions import CanUploadCaseDocument, CanViewCaseDocuments
+from cases.permissions import (
+    CanUploadCaseDocument,
+    CanViewCaseDocuments,
+    get_case_access,
+)
+from cases.services.case_event_service import CaseEventService
 from base.constants.user_roles import UserRoles
 from base.constants.case import CaseDocumentScope
-from base.pagination import DefaultPageNumberPagination
+from base.pagination import (
+    DefaultCursorPagination,
+    DefaultPageNumberPagination,
+)
 
 
 class CaseDocumentCreateView(APIView):
@@ -49,6 +58,7 @@ class CaseDocumentCreateView(APIView):
         },
         tags=["cases"],
     )
+    @transaction.atomic
     def post(self, request, case_id):
         case = get_object_or_404(Case, id=case_id)
         self.check_object_permissions(request, case)
@@ -71,6 +81,7 @@ class CaseDocumentCreateView(APIView):
             uploaded_by_user=user,
             **serializer.validated_data
         )
+        CaseEventService.document_uploaded(case, document, user)
 
         return Response(
             CaseDocumentSerializer(document).data,
@@ -112,9 +123,11 @@ class CaseDocumentListView(APIView):
             "If no scope is provided:\n"
             "- All documents visible to the role are returned.\n\n"
             "--------------------------------------------\n"
-            " PAGINATION SUPPORTED\n"
-            "- page\n"
+            " PAGINATION\n"
+            "- Page-number based by default (`page`, `count`)\n"
             "- page_size\n"
+            "- `paginate=cursor` switches to cursor pagination: no\n"
+            "  `count`, follow `next` / `previous` (cheaper on long lists)\n"
         ),
         parameters=[
             OpenApiParameter(
@@ -129,10 +142,24 @@ class CaseDocumentListView(APIView):
                 location=OpenApiParameter.QUERY,
                 description="Filter by scope: my | firm | client",
             ),
+            OpenApiParameter(
+                name="paginate",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                enum=["page", "cursor"],
+                description="Pagination style (default page)",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Opaque cursor from `next` / `previous` (cursor pagination)",
+            ),
             OpenApiParameter(
                 name="page",
                 type=int,
                 location=OpenApiParameter.QUERY,
+                description="Page number (page pagination)",
             ),
             OpenApiParameter(
                 name="page_size",
@@ -161,7 +188,8 @@ class CaseDocumentListView(APIView):
         ).order_by("-created_at")
 
         # CLIENT USER (STRICT VISIBILITY)
-        if user.role == UserRoles.CLIENT:
+        # Reuses the access resolved by the permission check above.
+        if get_case_access(request, case).is_client:
             queryset = queryset.filter(
                 uploaded_by_type="client",
                 uploaded_by_user=user
@@ -198,8 +226,16 @@ class CaseDocumentListView(APIView):
 
             # If scope is None : return all documents
 
-        paginator = DefaultPageNumberPagination()
-        page = paginator.paginate_queryset(queryset, request)
+        # Cursor pagination is opt-in; existing clients rely on `count`
+        if (
+            request.query_params.get("paginate") == "cursor"
+            or "cursor" in request.query_params
+        ):
+            paginator = DefaultCursorPagination()
+        else:
+            paginator = DefaultPageNumberPagination()
+
+        page = paginator.paginate_queryset(queryset, request, view=self)
 
         serializer = CaseDocumentSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
@@ -0,0 +1,84 @@
+from django.shortcuts import get_object_or_404
+
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiResponse,
+    OpenApiParameter,
+)
+
+from cases.models import Case
+from cases.api.serializers import CaseEventSerializer
+from cases.permissions import CanViewCase, get_case_access
+from base.constants.case import CaseEventType
+from base.pagination import DefaultCursorPagination
+
+
+class CaseTimelineView(APIView):
+    """
+    Activity timeline of a case, newest first.
+    """
+
+    permission_classes = [IsAuthenticated, CanViewCase]
+
+    @extend_schema(
+        summary="Case activity timeline",
+        description=(
+            "Append-only history of a case: creation / import, field "
+            "updates, document uploads, dates and lawyer assignments.\n\n"
+            "**Visibility:**\n"
+            "- Lawyers / firm admins see every event\n"
+            "- Clients do not see lawyer / firm document uploads\n\n"
+            "**Pagination:** cursor based, follow `next` / `previous`."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="case_id",
+                type=str,
+                location=OpenApiParameter.PATH,
+                description="UUID of the case",
+            ),
+            OpenApiParameter(
+                name="event_type",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                enum=[value for value, _ in CaseEventType.choices],
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=str,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="page_size",
+                type=int,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={
+            200: CaseEventSerializer(many=True),
+            403: OpenApiResponse(description="Permission denied"),
+            404: OpenApiResponse(description="Case not found"),
+        },
+        tags=["cases"],
+    )
+    def get(self, request, case_id):
+        case = get_object_or_404(Case, id=case_id)
+        self.check_object_permissions(request, case)
+
+        queryset = case.events.select_related("actor")
+
+        if get_case_access(request, case).is_client:
+            queryset = queryset.filter(client_visible=True)
+
+        event_type = request.query_params.get("event_type")
+        if event_type:
+            queryset = queryset.filter(event_type=event_type)
+
+        paginator = DefaultCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+
+        serializer = CaseEventSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
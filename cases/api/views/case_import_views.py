@@ -0,0 +1,122 @@
+import io
+
+from django.shortcuts import get_object_or_404
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.parsers import MultiPartParser, FormParser
+
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiResponse,
+    OpenApiParameter,
+)
+
+from accounts.permissions import IsVerifiedLawyerOrFirm
+from cases.models import CaseImportJob
+from cases.api.serializers import (
+    CaseImportUploadSerializer,
+    CaseImportJobSerializer,
+)
+from cases.services.case_import_service import CaseImportService
+
+
+class CaseImportView(APIView):
+    """
+    Bulk import cases for the authenticated lawyer / firm.
+    """
+
+    permission_classes = [IsAuthenticated, IsVerifiedLawyerOrFirm]
+    parser_classes = [MultiPartParser, FormParser]
+
+    @extend_schema(
+        summary="Bulk import cases",
+        description=(
+            "Import many cases from a CSV or JSONL file.\n\n"
+            "**Row format:**\n"
+            "- Same fields as case creation: title, case_category, court_type, "
+            "description, status, client, client_details, waris, dates, documents\n"
+            "- JSONL: one JSON object per line\n"
+            "- CSV: nested fields as `client_details.full_name`, `waris.phone`, ...; "
+            "`dates` and `documents` columns hold JSON arrays\n"
+            "- Documents reference already uploaded media ids (`file`)\n\n"
+            "**Behavior:**\n"
+            "- The file is read as a stream and processed in chunks\n"
+            "- Each chunk is validated and inserted in batches\n"
+            "- Invalid rows are skipped and reported per row\n"
+            "- Case ownership is derived from logged-in user\n\n"
+            "**Resuming:**\n"
+            "- Pass `job` with the same file to continue an interrupted import\n"
+            "- Rows already processed by that job are skipped"
+        ),
+        request={"multipart/form-data": CaseImportUploadSerializer},
+        responses={
+            201: CaseImportJobSerializer,
+            400: OpenApiResponse(description="Validation error"),
+            403: OpenApiResponse(description="Permission denied"),
+            404: OpenApiResponse(description="Import job not found"),
+        },
+        tags=["cases"],
+    )
+    def post(self, request):
+        serializer = CaseImportUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+        upload = data["file"]
+
+        if job_id := data.get("job"):
+            job = get_object_or_404(
+                CaseImportJob,
+                id=job_id,
+                created_by=request.user
+            )
+        else:
+            job = CaseImportService.create_job(
+                user=request.user,
+                file_name=upload.name,
+                file_format=(
+                    data.get("file_format")
+                    or CaseImportService.detect_format(upload.name)
+                ),
+            )
+
+        stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        CaseImportService.run(job, stream)
+
+        return Response(CaseImportJobSerializer(job).data, status=201)
+
+
+class CaseImportJobDetailView(APIView):
+    permission_classes = [IsAuthenticated, IsVerifiedLawyerOrFirm]
+
+    @extend_schema(
+        summary="Get case import job",
+        description=(
+            "Returns progress and per-row errors of a bulk import job "
+            "started by the authenticated user. Only the first 200 failed "
+            "rows are listed in `errors`; `rows_failed` counts all of them."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="job_id",
+                type=str,
+                location=OpenApiParameter.PATH,
+                description="UUID of the import job",
+            ),
+        ],
+        responses={
+            200: CaseImportJobSerializer,
+            404: OpenApiResponse(description="Import job not found"),
+        },
+        tags=["cases"],
+    )
+    def get(self, request, job_id):
+        job = get_object_or_404(
+            CaseImportJob,
+            id=job_id,
+            created_by=request.user
+        )
+
+        return Response(CaseImportJobSerializer(job).data)
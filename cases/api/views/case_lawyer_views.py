@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from rest_framework.views import APIView
@@ -13,8 +14,9 @@ from drf_spectacular.utils import (
 from cases.models import Case, CaseLawyer
 from cases.api.serializers import CaseLawyerAssignSerializer
 from cases.permissions import CanAssignCaseLawyers
+from cases.services.case_event_service import CaseEventService
 from firms.models import FirmMember
-from base.constants.case import CaseLawyerRole
+from base.constants.case import CaseEventType, CaseLawyerRole
 
 
 class CaseLawyerAssignView(APIView):
@@ -56,6 +58,7 @@ class CaseLawyerAssignView(APIView):
         },
         tags=["cases"],
     )
+    @transaction.atomic
     def post(self, request, case_id):
 
         case = get_object_or_404(Case, id=case_id)
@@ -87,13 +90,25 @@ class CaseLawyerAssignView(APIView):
             )
 
         # Auto-assign role + permissions
-        CaseLawyer.objects.create(
+        case_lawyer = CaseLawyer.objects.create(
             case=case,
             lawyer=lawyer,
             role=CaseLawyerRole.ASSISTANT,
             can_edit=True,
         )
 
+        CaseEventService.record(
+            case,
+            CaseEventType.LAWYER_ASSIGNED,
+            actor=request.user,
+            target=case_lawyer,
+            payload={
+                "lawyer_id": lawyer.id,
+                "role": case_lawyer.role,
+                "can_edit": case_lawyer.can_edit,
+            },
+        )
+
         return Response(
             {"message": "Lawyer assigned successfully"},
             status=201
@@ -1,8 +1,14 @@
 # cases/views.py
 
+import hashlib
+
 from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.db.models import Q, Count, Prefetch
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -14,8 +20,10 @@ from drf_spectacular.utils import (
     OpenApiParameter,
 )
 
+from base.constants.case import CaseEventType
 from base.constants.user_roles import UserRoles
 from base.pagination import DefaultPageNumberPagination
+from base.streaming import streaming_content
 
 from cases.models import (
     Case,
@@ -31,6 +39,10 @@ from cases.api.serializers import (
 from cases.models.case_date import CaseDate
 from cases.models.case_document import CaseDocument
 from cases.permissions import CanViewCase, CanEditCase
+from cases.services.case_event_service import CaseEventService
+from cases.selectors.case_selector import get_case_versions, get_visible_cases
+from cases.services.case_cache_service import CaseCacheService
+from cases.services.case_export_service import CaseExportService
 
 from lawyers.models import Lawyer
 from firms.models import Firm
@@ -148,22 +160,35 @@ class CaseCreateView(APIView):
         # -------------------------------------------------
         # Create Documents (optional, append-only)
         # -------------------------------------------------
+        CaseEventService.record(
+            case,
+            CaseEventType.CASE_CREATED,
+            actor=user,
+            payload={
+                "title": case.title,
+                "status": case.status,
+                "court_type": case.court_type,
+            },
+        )
+
         for doc in documents_data:
-            CaseDocument.objects.create(
+            document = CaseDocument.objects.create(
                 case=case,
                 uploaded_by_user=user,
                 uploaded_by_type=user.role.lower(),
                 **doc
             )
+            CaseEventService.document_uploaded(case, document, user)
 
         # -------------------------------------------------
         # Create Dates (optional)
         # -------------------------------------------------
         for date in dates_data:
-            CaseDate.objects.create(
+            case_date = CaseDate.objects.create(
                 case=case,
                 **date
             )
+            CaseEventService.date_added(case, case_date, user)
 
         # -------------------------------------------------
         # Return full annotated detail
@@ -223,7 +248,11 @@ class CaseDetailView(APIView):
             "**Important Notes:**\n"
             "- Documents are NOT embedded\n"
             "- Use Document API to fetch documents\n"
-            "- Visibility is strictly enforced"
+            "- Visibility is strictly enforced\n\n"
+            "**Conditional requests:**\n"
+            "- Responses carry `ETag` and `Last-Modified`\n"
+            "- Send `If-None-Match` / `If-Modified-Since` to get "
+            "`304 Not Modified` when nothing changed"
         ),
         parameters=[
             OpenApiParameter(
@@ -235,6 +264,7 @@ class CaseDetailView(APIView):
         ],
         responses={
             200: CaseDetailSerializer,
+            304: OpenApiResponse(description="Not modified"),
             403: OpenApiResponse(description="Permission denied"),
             404: OpenApiResponse(description="Case not found"),
         },
@@ -242,6 +272,22 @@ class CaseDetailView(APIView):
     )
     def get(self, request, case_id):
 
+        # One cheap query: permission columns + version annotations
+        version = get_object_or_404(get_case_versions(), id=case_id)
+        self.check_object_permissions(request, version)
+
+        etag = self._etag(version)
+        # HTTP dates have one-second resolution
+        last_modified = int(version.last_modified.timestamp())
+
+        not_modified = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if not_modified is not None:
+            return self._with_validators(not_modified, etag, last_modified)
+
         case = get_object_or_404(
             Case.objects
             .select_related(
@@ -264,9 +310,27 @@ class CaseDetailView(APIView):
             id=case_id
         )
 
-        self.check_object_permissions(request, case)
-
-        return Response(CaseDetailSerializer(case).data)
+        response = Response(CaseDetailSerializer(case).data)
+        return self._with_validators(response, etag, last_modified)
+
+    @staticmethod
+    def _etag(version):
+        raw = ":".join([
+            str(version.id),
+            version.last_modified.isoformat(),
+            str(version.dates_count),
+            str(version.lawyers_count),
+            str(version.documents_count),
+        ])
+        return '"{}"'.format(hashlib.md5(raw.encode()).hexdigest())
+
+    @staticmethod
+    def _with_validators(response, etag, last_modified):
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        # Per-user data: clients may store it but must revalidate
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
 
 # =========================================================
@@ -330,6 +394,19 @@ class CaseUpdateView(APIView):
         client_details_data = data.pop("client_details", None)
         waris_data = data.pop("waris", None)
 
+        # Long free text is logged as "updated" only, not copied into the log
+        description_changed = (
+            "description" in data
+            and data["description"] != case.description
+        )
+        changes = CaseEventService.diff(
+            case,
+            {
+                **{k: v for k, v in data.items() if k != "description"},
+                **({"client": client_profile} if client_profile is not None else {}),
+            }
+        )
+
         for field, value in data.items():
             setattr(case, field, value)
 
@@ -350,6 +427,24 @@ class CaseUpdateView(APIView):
                 defaults=waris_data
             )
 
+        updated = [
+            name
+            for name, changed in (
+                ("description", description_changed),
+                ("client_details", bool(client_details_data)),
+                ("waris", bool(waris_data)),
+            )
+            if changed
+        ]
+
+        if changes or updated:
+            CaseEventService.record(
+                case,
+                CaseEventType.CASE_UPDATED,
+                actor=request.user,
+                payload={"changes": changes, "updated": updated},
+            )
+
         return Response(CaseDetailSerializer(case).data)
 
 
@@ -389,7 +484,9 @@ class CaseListView(APIView):
             "- Assigned lawyers\n\n"
             "**Notes:**\n"
             "- Results are paginated\n"
-            "- Duplicate rows are automatically removed"
+            "- Duplicate rows are automatically removed\n"
+            "- Pages are cached per user and invalidated on any write "
+            "to the user's cases"
         ),
         parameters=[
             OpenApiParameter(name="status", type=str, location=OpenApiParameter.QUERY),
@@ -414,7 +511,17 @@ class CaseListView(APIView):
 
         user = request.user
 
-        qs = Case.objects.select_related(
+        qs = get_visible_cases(user)
+
+        if qs is None:
+            return Response({"error": "Not allowed"}, status=403)
+
+        cache_key = CaseCacheService.list_cache_key(request)
+        cached = CaseCacheService.get_list(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+        qs = qs.select_related(
             "owner_lawyer__user",
             "owner_firm__user",
             "client",
@@ -432,29 +539,12 @@ class CaseListView(APIView):
         case_scope = request.query_params.get("case_scope")
 
         if user.role == UserRoles.LAWYER:
-            lawyer = Lawyer.objects.get(user=user)
-
-            qs = qs.filter(
-                Q(owner_lawyer=lawyer) |
-                Q(assigned_lawyers__lawyer=lawyer)
-            )
-
             if case_scope == "personal":
                 qs = qs.filter(owner_type=UserRoles.LAWYER)
 
             elif case_scope == "firm":
                 qs = qs.filter(owner_type=UserRoles.FIRM)
 
-        elif user.role == UserRoles.FIRM:
-            firm = Firm.objects.get(user=user)
-            qs = qs.filter(owner_firm=firm)
-
-        elif user.role == UserRoles.CLIENT:
-            qs = qs.filter(client__user=user)
-
-        else:
-            return Response({"error": "Not allowed"}, status=403)
-
         if status := request.query_params.get("status"):
             qs = qs.filter(status=status)
 
@@ -476,7 +566,7 @@ class CaseListView(APIView):
         if created_to := request.query_params.get("created_to"):
             qs = qs.filter(created_at__date__lte=created_to)
 
-        qs = qs.distinct().annotate(
+        qs = qs.annotate(
             total_documents=Count("documents", distinct=True)
         )
 
@@ -487,4 +577,88 @@ class CaseListView(APIView):
         )
 
         serializer = CaseDetailSerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        response = paginator.get_paginated_response(serializer.data)
+
+        CaseCacheService.set_list(cache_key, response.data)
+        return response
+
+
+# =========================================================
+# CASE EXPORT
+# =========================================================
+
+class CaseExportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Export cases",
+        description=(
+            "Stream every case visible to the authenticated user.\n\n"
+            "**Formats:**\n"
+            "- csv → one row per case; nested client / waris fields as "
+            "`client_details.*` / `waris.*` columns, lists as JSON\n"
+            "- ndjson → one JSON object per line\n\n"
+            "**Each case includes:**\n"
+            "- Case metadata\n"
+            "- Client snapshot and waris\n"
+            "- Dates\n"
+            "- Assigned lawyers\n"
+            "- Document metadata (no file contents)\n\n"
+            "**Notes:**\n"
+            "- Same visibility rules as the case list\n"
+            "- Response is streamed, not paginated\n"
+            "- Oldest cases first"
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                enum=["csv", "ndjson"],
+                description="Output format (default csv)",
+            ),
+            OpenApiParameter(name="status", type=str, location=OpenApiParameter.QUERY),
+            OpenApiParameter(name="case_category", type=str, location=OpenApiParameter.QUERY),
+        ],
+        responses={
+            (200, "text/csv"): OpenApiResponse(description="CSV stream"),
+            (200, "application/x-ndjson"): OpenApiResponse(description="NDJSON stream"),
+            400: OpenApiResponse(description="Invalid export format"),
+            403: OpenApiResponse(description="Not allowed"),
+        },
+        tags=["cases"],
+    )
+    def get(self, request):
+        export_format = request.query_params.get("export_format", "csv")
+
+        if export_format not in ("csv", "ndjson"):
+            return Response({"error": "Invalid export format"}, status=400)
+
+        qs = get_visible_cases(request.user)
+
+        if qs is None:
+            return Response({"error": "Not allowed"}, status=403)
+
+        if status := request.query_params.get("status"):
+            qs = qs.filter(status=status)
+
+        if category := request.query_params.get("case_category"):
+            qs = qs.filter(case_category_id=category)
+
+        qs = CaseExportService.prepare_queryset(qs)
+
+        if export_format == "ndjson":
+            stream = CaseExportService.iter_ndjson(qs)
+            content_type = "application/x-ndjson"
+        else:
+            stream = CaseExportService.iter_csv(qs)
+            content_type = "text/csv"
+
+        filename = f"cases-{timezone.now():%Y%m%d}.{export_format}"
+
+        response = StreamingHttpResponse(
+            streaming_content(request, stream),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
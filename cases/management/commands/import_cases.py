@@ -0,0 +1,92 @@
+# cases/management/commands/import_cases.py
+
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from base.constants.case import CaseImportFormat
+from cases.models import CaseImportJob
+from cases.services.case_import_service import CaseImportService
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Bulk import cases from a CSV / JSONL file for a lawyer or firm"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the .csv / .jsonl file")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Email of the lawyer / firm user that will own the cases",
+        )
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=[value for value, _ in CaseImportFormat.choices],
+            help="File format (detected from the extension by default)",
+        )
+        parser.add_argument(
+            "--resume",
+            dest="job_id",
+            help="Resume an existing import job id",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CaseImportService.DEFAULT_CHUNK_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+
+        if not path.exists():
+            raise CommandError(f"{path} not found")
+
+        try:
+            user = User.objects.get(email=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['user']} not found")
+
+        if options["job_id"]:
+            try:
+                job = CaseImportJob.objects.get(
+                    id=options["job_id"],
+                    created_by=user
+                )
+            except CaseImportJob.DoesNotExist:
+                raise CommandError(f"Import job {options['job_id']} not found")
+
+            self.stdout.write(
+                f"→ Resuming job {job.id} after row {job.rows_processed}"
+            )
+        else:
+            job = CaseImportService.create_job(
+                user=user,
+                file_name=path.name,
+                file_format=(
+                    options["file_format"]
+                    or CaseImportService.detect_format(path.name)
+                ),
+            )
+            self.stdout.write(f"→ Created import job {job.id}")
+
+        with path.open(encoding="utf-8-sig", newline="") as stream:
+            CaseImportService.run(
+                job,
+                stream,
+                chunk_size=options["chunk_size"]
+            )
+
+        for error in job.errors:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+
+        if job.rows_failed > len(job.errors):
+            self.stderr.write(f"... and {job.rows_failed - len(job.errors)} more failed rows")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {job.rows_imported} cases "
+            f"({job.rows_failed} failed, {job.rows_processed} processed)"
+        ))
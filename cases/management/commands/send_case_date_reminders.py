@@ -0,0 +1,58 @@
+# cases/management/commands/send_case_date_reminders.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cases.services.case_reminder_service import CaseReminderService
+
+
+class Command(BaseCommand):
+    help = (
+        "Send reminders for upcoming case dates (hearings / deadlines). "
+        "Safe to run repeatedly, e.g. hourly from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lead-days",
+            default=",".join(
+                str(days) for days in CaseReminderService.DEFAULT_LEAD_DAYS
+            ),
+            help="Comma-separated reminder windows in days before the date",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=CaseReminderService.DEFAULT_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count reminders without creating notifications",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            lead_days = [
+                int(days)
+                for days in options["lead_days"].split(",")
+                if days.strip()
+            ]
+        except ValueError:
+            raise CommandError("--lead-days must be comma-separated integers")
+
+        if not lead_days or min(lead_days) < 0:
+            raise CommandError("--lead-days must contain non-negative values")
+
+        stats = CaseReminderService.send_due_reminders(
+            lead_days=lead_days,
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+
+        prefix = "[dry run] " if options["dry_run"] else ""
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}Scanned {stats['dates']} dates: "
+            f"{stats['created']} reminders sent, "
+            f"{stats['skipped']} already sent"
+        ))
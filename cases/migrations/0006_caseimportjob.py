@@ -0,0 +1,42 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:06
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0005_remove_case_client_user_case_client_and_more'),
+        ('firms', '0004_firminvitation_firmmember'),
+        ('lawyers', '0003_alter_lawyer_address'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaseImportJob',
+            fields=[
+                ('deleted_at', models.DateTimeField(blank=True, default=None, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('owner_type', models.CharField(choices=[('lawyer', 'Lawyer'), ('firm', 'Firm')], max_length=20)),
+                ('file_name', models.CharField(blank=True, max_length=255)),
+                ('file_format', models.CharField(choices=[('csv', 'CSV'), ('jsonl', 'JSON Lines')], max_length=10)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('rows_processed', models.PositiveIntegerField(default=0)),
+                ('rows_imported', models.PositiveIntegerField(default=0)),
+                ('rows_failed', models.PositiveIntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='case_import_jobs', to=settings.AUTH_USER_MODEL)),
+                ('owner_firm', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='case_import_jobs', to='firms.firm')),
+                ('owner_lawyer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='case_import_jobs', to='lawyers.lawyer')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0006_caseimportjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='casedate',
+            index=models.Index(fields=['date', 'case'], name='cases_cased_date_74f2d1_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0007_casedate_cases_cased_date_74f2d1_idx'),
+        ('media', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='casedocument',
+            index=models.Index(fields=['case', '-created_at'], name='cases_cased_case_id_d5d10c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='casedocument',
+            index=models.Index(fields=['case', 'document_scope', '-created_at'], name='cases_cased_case_id_b03b42_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='casedocument',
+            index=models.Index(fields=['case', 'uploaded_by_user', 'document_scope', '-created_at'], name='cases_cased_case_id_9be1b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='casedocument',
+            index=models.Index(fields=['case', 'uploaded_by_type', 'uploaded_by_user', '-created_at'], name='cases_cased_case_id_7c7954_idx'),
+        ),
+    ]
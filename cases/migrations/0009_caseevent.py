@@ -0,0 +1,38 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:14
+
+import django.core.serializers.json
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0008_casedocument_scope_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaseEvent',
+            fields=[
+                ('deleted_at', models.DateTimeField(blank=True, default=None, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('event_type', models.CharField(choices=[('case_created', 'Case Created'), ('case_imported', 'Case Imported'), ('case_updated', 'Case Updated'), ('document_uploaded', 'Document Uploaded'), ('date_added', 'Date Added'), ('lawyer_assigned', 'Lawyer Assigned')], max_length=30)),
+                ('actor_role', models.CharField(blank=True, max_length=20)),
+                ('target_id', models.UUIDField(blank=True, null=True)),
+                ('payload', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('client_visible', models.BooleanField(default=True)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='case_events', to=settings.AUTH_USER_MODEL)),
+                ('case', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='cases.case')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['case', '-created_at'], name='cases_casee_case_id_df57df_idx'), models.Index(fields=['case', 'client_visible', '-created_at'], name='cases_casee_case_id_c41250_idx')],
+            },
+        ),
+    ]
@@ -5,6 +5,9 @@ from cases.models.case_document import CaseDocument
 from cases.models.case_lawyer import CaseLawyer
 from cases.models.case_client_details import CaseClientDetails
 from cases.models.case_waris import CaseWaris
+from cases.models.case_import_job import CaseImportJob
+from cases.models.case_event import CaseEvent
+from cases.models.case_calendar_feed import CaseCalendarFeed
 
 __all__ = [
     "Case",
@@ -14,4 +17,7 @@ __all__ = [
     "CaseLawyer",
     "CaseClientDetails",
     "CaseWaris",
+    "CaseImportJob",
+    "CaseEvent",
+    "CaseCalendarFeed",
 ]
\ No newline at end of file
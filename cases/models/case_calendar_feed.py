@@ -0,0 +1,28 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+from base.models import AbstractBaseModel
+
+User = settings.AUTH_USER_MODEL
+
+
+class CaseCalendarFeed(AbstractBaseModel):
+    """
+    Subscription key of a user's iCal feed.
+    Feed URLs carry a signed (user, key) token, so calendar apps can
+    subscribe without a bearer header; rotating the key revokes every
+    URL handed out before.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        related_name="case_calendar_feed"
+    )
+
+    key = models.UUIDField(default=uuid.uuid4)
+
+    def __str__(self):
+        return f"Calendar feed of {self.user_id}"
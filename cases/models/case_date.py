@@ -25,5 +25,11 @@ class CaseDate(AbstractBaseModel):
         blank=True
     )
 
+    class Meta:
+        indexes = [
+            # Calendar range scans: date window first, then case visibility
+            models.Index(fields=["date", "case"]),
+        ]
+
     def __str__(self):
         return f"{self.case.title} - {self.date_type} - {self.date}"
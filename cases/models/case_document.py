@@ -48,5 +48,21 @@ class CaseDocument(AbstractBaseModel):
         related_name="uploaded_case_documents"
     )
 
+    class Meta:
+        indexes = [
+            # No scope: every document of the case, newest first
+            models.Index(fields=["case", "-created_at"]),
+            # scope=client / scope=firm
+            models.Index(fields=["case", "document_scope", "-created_at"]),
+            # scope=my
+            models.Index(
+                fields=["case", "uploaded_by_user", "document_scope", "-created_at"]
+            ),
+            # Client users: only their own uploads
+            models.Index(
+                fields=["case", "uploaded_by_type", "uploaded_by_user", "-created_at"]
+            ),
+        ]
+
     def __str__(self):
         return f"Document({self.title})"
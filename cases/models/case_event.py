@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from base.models import AbstractBaseModel
+from cases.models.case import Case
+from base.constants.case import CaseEventType
+
+User = settings.AUTH_USER_MODEL
+
+
+class CaseEvent(AbstractBaseModel):
+    """
+    Append-only activity log of a case.
+    Rows are written next to the change they describe and never updated.
+    """
+
+    case = models.ForeignKey(
+        Case,
+        on_delete=models.CASCADE,
+        related_name="events"
+    )
+
+    event_type = models.CharField(
+        max_length=30,
+        choices=CaseEventType.choices
+    )
+
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="case_events"
+    )
+
+    # Role at the time of the event (lawyer / firm / client)
+    actor_role = models.CharField(max_length=20, blank=True)
+
+    # Document / date / case lawyer the event refers to
+    target_id = models.UUIDField(null=True, blank=True)
+
+    # Event details, e.g. {"changes": {"status": {"from": .., "to": ..}}}
+    payload = models.JSONField(
+        default=dict,
+        blank=True,
+        encoder=DjangoJSONEncoder
+    )
+
+    # Internal events (lawyer / firm working files) are hidden from clients
+    client_visible = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["case", "-created_at"]),
+            models.Index(fields=["case", "client_visible", "-created_at"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("CaseEvent is append-only")
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"CaseEvent({self.event_type}, {self.case_id})"
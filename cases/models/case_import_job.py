@@ -0,0 +1,76 @@
+from django.conf import settings
+from django.db import models
+
+from base.models import AbstractBaseModel
+from base.constants.case import (
+    CaseOwnerType,
+    CaseImportFormat,
+    CaseImportStatus,
+)
+
+User = settings.AUTH_USER_MODEL
+
+
+class CaseImportJob(AbstractBaseModel):
+    """
+    Bulk case import run.
+    Tracks a checkpoint so an interrupted import can be resumed
+    from the first unprocessed row of the same file.
+    """
+
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="case_import_jobs"
+    )
+
+    owner_type = models.CharField(
+        max_length=20,
+        choices=CaseOwnerType.choices
+    )
+
+    owner_lawyer = models.ForeignKey(
+        "lawyers.Lawyer",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="case_import_jobs"
+    )
+
+    owner_firm = models.ForeignKey(
+        "firms.Firm",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="case_import_jobs"
+    )
+
+    file_name = models.CharField(max_length=255, blank=True)
+
+    file_format = models.CharField(
+        max_length=10,
+        choices=CaseImportFormat.choices
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=CaseImportStatus.choices,
+        default=CaseImportStatus.PENDING
+    )
+
+    # --------------------
+    # Progress / checkpoint
+    # --------------------
+    rows_processed = models.PositiveIntegerField(default=0)
+    rows_imported = models.PositiveIntegerField(default=0)
+    rows_failed = models.PositiveIntegerField(default=0)
+
+    # [{"row": 12, "errors": {...}}, ...]; the first
+    # CaseImportService.MAX_STORED_ERRORS of rows_failed
+    errors = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"CaseImportJob({self.file_name}, {self.status})"
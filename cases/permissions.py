@@ -1,5 +1,6 @@
 # cases/permissions.py
 
+from django.utils.functional import cached_property
 from rest_framework.permissions import BasePermission
 
 from cases.models import Case, CaseLawyer
@@ -32,16 +33,25 @@ def is_case_owner_firm_admin(user, case: Case) -> bool:
     )
 
 
-def is_assigned_lawyer(user, case: Case, require_edit: bool = False) -> bool:
+def get_lawyer_assignment(user, case: Case):
+    """
+    The user's CaseLawyer row for this case, or None.
+    """
     if user.role != UserRoles.LAWYER:
-        return False
+        return None
 
-    try:
-        assignment = CaseLawyer.objects.get(
-            case=case,
-            lawyer__user=user
-        )
-    except CaseLawyer.DoesNotExist:
+    return (
+        CaseLawyer.objects
+        .filter(case=case, lawyer__user=user)
+        .only("id", "can_edit")
+        .first()
+    )
+
+
+def is_assigned_lawyer(user, case: Case, require_edit: bool = False) -> bool:
+    assignment = get_lawyer_assignment(user, case)
+
+    if assignment is None:
         return False
 
     if require_edit:
@@ -58,83 +68,140 @@ def is_case_client(user, case: Case) -> bool:
     if user.role != UserRoles.CLIENT:
         return False
 
-    if not case.client:
+    if not case.client_id:
         return False
 
     return case.client.user_id == user.id
 
 
 # ---------------------------------------------------
-# Permission Classes
+# Per-request access resolver
 # ---------------------------------------------------
 
-class CanViewCase(BasePermission):
-    def has_object_permission(self, request, view, obj: Case):
-        user = request.user
+class CaseAccess:
+    """
+    The user's role on one case, resolved lazily and at most once.
 
-        if not user.is_authenticated:
-            return False
+    Every permission class and view-level scope filter of a request
+    reads from the same instance (see get_case_access), so the owner /
+    assignment / client lookups run at most once per case per request.
+    """
 
-        return any([
-            is_case_owner_lawyer(user, obj),
-            is_case_owner_firm_admin(user, obj),
-            is_assigned_lawyer(user, obj),
-            is_case_client(user, obj),
-        ])
+    def __init__(self, user, case: Case):
+        self.user = user
+        self.case = case
+
+    @cached_property
+    def is_owner_lawyer(self) -> bool:
+        return bool(is_case_owner_lawyer(self.user, self.case))
+
+    @cached_property
+    def is_firm_admin(self) -> bool:
+        return bool(is_case_owner_firm_admin(self.user, self.case))
+
+    @cached_property
+    def assignment(self):
+        return get_lawyer_assignment(self.user, self.case)
+
+    @cached_property
+    def is_client(self) -> bool:
+        return bool(is_case_client(self.user, self.case))
+
+    @property
+    def is_assigned(self) -> bool:
+        return self.assignment is not None
+
+    @property
+    def is_assigned_with_edit(self) -> bool:
+        return self.is_assigned and self.assignment.can_edit
+
+    @property
+    def can_view(self) -> bool:
+        return (
+            self.is_owner_lawyer
+            or self.is_firm_admin
+            or self.is_assigned
+            or self.is_client
+        )
 
+    @property
+    def can_edit(self) -> bool:
+        return (
+            self.is_owner_lawyer
+            or self.is_firm_admin
+            or self.is_assigned_with_edit
+        )
 
-class CanEditCase(BasePermission):
-    def has_object_permission(self, request, view, obj: Case):
-        user = request.user
+    @property
+    def can_assign_lawyers(self) -> bool:
+        return self.is_firm_admin
 
-        if not user.is_authenticated:
-            return False
+    @property
+    def can_upload_documents(self) -> bool:
+        return self.can_view
 
-        return any([
-            is_case_owner_lawyer(user, obj),
-            is_case_owner_firm_admin(user, obj),
-            is_assigned_lawyer(user, obj, require_edit=True),
-        ])
+    @property
+    def can_manage_dates(self) -> bool:
+        return self.is_owner_lawyer or self.is_assigned
 
 
-class CanAssignCaseLawyers(BasePermission):
-    def has_object_permission(self, request, view, obj: Case):
-        user = request.user
+def get_case_access(request, case: Case) -> CaseAccess:
+    """
+    Memoized CaseAccess for (request, case).
+    The cache lives on the request object and dies with it.
+    """
+    cache = getattr(request, "_case_access_cache", None)
 
-        if not user.is_authenticated:
-            return False
+    if cache is None:
+        cache = {}
+        request._case_access_cache = cache
 
-        return is_case_owner_firm_admin(user, obj)
+    access = cache.get(case.pk)
 
+    if access is None:
+        access = CaseAccess(request.user, case)
+        cache[case.pk] = access
 
-class CanUploadCaseDocument(BasePermission):
-    def has_object_permission(self, request, view, obj: Case):
-        user = request.user
+    return access
 
-        if not user.is_authenticated:
-            return False
 
-        return any([
-            is_case_owner_lawyer(user, obj),
-            is_case_owner_firm_admin(user, obj),
-            is_assigned_lawyer(user, obj),
-            is_case_client(user, obj),
-        ])
+# ---------------------------------------------------
+# Permission Classes
+# ---------------------------------------------------
 
+class CaseObjectPermission(BasePermission):
+    """
+    Base for case permissions backed by the per-request CaseAccess.
+    """
+
+    access_attr = None
 
-class CanViewCaseDocuments(BasePermission):
     def has_object_permission(self, request, view, obj: Case):
-        return CanViewCase().has_object_permission(request, view, obj)
+        if not request.user.is_authenticated:
+            return False
 
+        return getattr(get_case_access(request, obj), self.access_attr)
 
-class CanManageCaseDates(BasePermission):
-    def has_object_permission(self, request, view, obj: Case):
-        user = request.user
 
-        if not user.is_authenticated:
-            return False
+class CanViewCase(CaseObjectPermission):
+    access_attr = "can_view"
+
+
+class CanEditCase(CaseObjectPermission):
+    access_attr = "can_edit"
+
+
+class CanAssignCaseLawyers(CaseObjectPermission):
+    access_attr = "can_assign_lawyers"
+
+
+class CanUploadCaseDocument(CaseObjectPermission):
+    access_attr = "can_upload_documents"
+
+
+class CanViewCaseDocuments(CaseObjectPermission):
+    access_attr = "can_view"
+
 
-        return any([
-            is_case_owner_lawyer(user, obj),
-            is_assigned_lawyer(user, obj),
-        ])
+class CanManageCaseDates(CaseObjectPermission):
+    access_attr = "can_manage_dates"
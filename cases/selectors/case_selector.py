@@ -0,0 +1,97 @@
+from django.db.models import Count, IntegerField, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from base.constants.user_roles import UserRoles
+from cases.models import Case, CaseDate, CaseDocument, CaseLawyer
+
+
+def get_visible_cases(user):
+    """
+    Cases the user is allowed to see.
+
+    - Lawyers: personal + assigned cases
+    - Firm admins: all firm-owned cases
+    - Clients: cases linked to their profile
+
+    Assignments are matched with a subquery instead of a join,
+    so the result never needs `.distinct()`.
+    Returns None for roles that cannot list cases.
+    """
+    if user.role == UserRoles.LAWYER:
+        return Case.objects.filter(
+            Q(owner_lawyer__user=user) |
+            Q(id__in=CaseLawyer.objects.filter(
+                lawyer__user=user
+            ).values("case_id"))
+        )
+
+    if user.role == UserRoles.FIRM:
+        return Case.objects.filter(owner_firm__user=user)
+
+    if user.role == UserRoles.CLIENT:
+        return Case.objects.filter(client__user=user)
+
+    return None
+
+
+def _related_aggregate(model, aggregate):
+    return Subquery(
+        model.objects
+        .filter(case=OuterRef("pk"))
+        .order_by()
+        .values("case")
+        .annotate(value=aggregate)
+        .values("value")
+    )
+
+
+def get_case_versions():
+    """
+    Cases annotated with what the detail response depends on,
+    without loading the graph:
+
+    - last_modified: newest updated_at across the case, client details,
+      waris, dates and assigned lawyers
+    - dates / lawyers / documents counts, so removals also change the version
+
+    Only the columns needed for permission checks are loaded.
+    """
+    return (
+        Case.objects
+        .select_related("owner_lawyer", "owner_firm", "client")
+        .only(
+            "id",
+            "owner_type",
+            "updated_at",
+            "owner_lawyer__id",
+            "owner_lawyer__user_id",
+            "owner_firm__id",
+            "owner_firm__user_id",
+            "client__id",
+            "client__user_id",
+        )
+        .annotate(
+            last_modified=Greatest(
+                "updated_at",
+                "client_details__updated_at",
+                "waris__updated_at",
+                _related_aggregate(CaseDate, Max("updated_at")),
+                _related_aggregate(CaseLawyer, Max("updated_at")),
+            ),
+            dates_count=Coalesce(
+                _related_aggregate(CaseDate, Count("id")),
+                0,
+                output_field=IntegerField(),
+            ),
+            lawyers_count=Coalesce(
+                _related_aggregate(CaseLawyer, Count("id")),
+                0,
+                output_field=IntegerField(),
+            ),
+            documents_count=Coalesce(
+                _related_aggregate(CaseDocument, Count("id")),
+                0,
+                output_field=IntegerField(),
+            ),
+        )
+    )
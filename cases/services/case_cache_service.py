@@ -0,0 +1,110 @@
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from base.cache import bump_generations, get_generation, params_fingerprint
+from cases.models import Case, CaseLawyer
+
+
+class CaseCacheService:
+    """
+    Per-user response cache for case reads.
+
+    Every user has a "cases" generation counter. Any write touching a case
+    bumps the counter of each user who can see it (owner lawyer / firm,
+    assigned lawyers, client), which invalidates all of their cached pages.
+    """
+
+    NAMESPACE = "cases"
+
+    # -------------------------
+    # INVALIDATION
+    # -------------------------
+    _pending = threading.local()
+
+    @staticmethod
+    def user_ids_for_cases(case_ids):
+        # _base_manager also sees soft-deleted cases
+        user_ids = set()
+
+        for row in Case._base_manager.filter(pk__in=case_ids).values_list(
+            "owner_lawyer__user_id",
+            "owner_firm__user_id",
+            "client__user_id",
+        ):
+            user_ids.update(row)
+
+        user_ids.update(
+            CaseLawyer.objects
+            .filter(case_id__in=case_ids)
+            .values_list("lawyer__user_id", flat=True)
+        )
+        user_ids.discard(None)
+        return user_ids
+
+    @staticmethod
+    def invalidate_users(user_ids):
+        """
+        Bump after commit, so a concurrent read cannot cache
+        pre-commit data under the new generation.
+        """
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if not user_ids:
+            return
+
+        transaction.on_commit(
+            lambda: bump_generations(CaseCacheService.NAMESPACE, user_ids)
+        )
+
+    @staticmethod
+    def invalidate_case(case_id, extra_user_ids=()):
+        """
+        Queue a case for invalidation. Writes inside one transaction
+        (e.g. a case with its documents and dates) are collected and
+        resolved to users with a single lookup at commit time.
+        """
+        pending = getattr(CaseCacheService._pending, "cases", None)
+        if pending is None:
+            pending = CaseCacheService._pending.cases = {}
+
+        pending.setdefault(case_id, set()).update(extra_user_ids)
+        transaction.on_commit(CaseCacheService._flush)
+
+    @staticmethod
+    def _flush():
+        pending = getattr(CaseCacheService._pending, "cases", None)
+        if not pending:
+            return
+
+        CaseCacheService._pending.cases = {}
+
+        user_ids = CaseCacheService.user_ids_for_cases(list(pending))
+        for extra_user_ids in pending.values():
+            user_ids.update(extra_user_ids)
+        user_ids.discard(None)
+
+        bump_generations(CaseCacheService.NAMESPACE, user_ids)
+
+    # -------------------------
+    # CASE LIST
+    # -------------------------
+    @staticmethod
+    def list_cache_key(request):
+        generation = get_generation(CaseCacheService.NAMESPACE, request.user.pk)
+
+        return "case_list:{}:{}:{}:{}".format(
+            request.user.pk,
+            generation,
+            request.get_host(),
+            params_fingerprint(request.query_params),
+        )
+
+    @staticmethod
+    def get_list(key):
+        return cache.get(key)
+
+    @staticmethod
+    def set_list(key, data):
+        cache.set(key, data, timeout=settings.CASE_LIST_CACHE_TIMEOUT)
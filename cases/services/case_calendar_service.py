@@ -0,0 +1,203 @@
+import uuid
+from datetime import timedelta
+
+from django.core import signing
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from base.constants.case import CaseDateType
+from cases.models import CaseCalendarFeed, CaseDate
+from cases.selectors.case_selector import get_visible_cases
+
+
+class CaseCalendarService:
+    """
+    Upcoming hearings / deadlines across all cases visible to a user.
+
+    The query walks the (date, case) index over the requested window
+    and checks visibility with a semi-join on the visible case ids,
+    so cost depends on the window size, not on how many cases a
+    lawyer has.
+    """
+
+    DEFAULT_WINDOW_DAYS = 14
+    MAX_WINDOW_DAYS = 366
+
+    @staticmethod
+    def parse_window(date_from, date_to):
+        today = timezone.localdate()
+
+        start = parse_date(date_from) if date_from else today
+        if start is None:
+            raise ValidationError({"date_from": "Use YYYY-MM-DD."})
+
+        if date_to:
+            end = parse_date(date_to)
+            if end is None:
+                raise ValidationError({"date_to": "Use YYYY-MM-DD."})
+        else:
+            end = start + timedelta(days=CaseCalendarService.DEFAULT_WINDOW_DAYS)
+
+        if end < start:
+            raise ValidationError({"date_to": "Must not be before date_from."})
+
+        if (end - start).days > CaseCalendarService.MAX_WINDOW_DAYS:
+            raise ValidationError({
+                "date_to": (
+                    f"Window cannot exceed "
+                    f"{CaseCalendarService.MAX_WINDOW_DAYS} days."
+                )
+            })
+
+        return start, end
+
+    @staticmethod
+    def get_dates(user, start, end, date_type=None):
+        cases = get_visible_cases(user)
+
+        if cases is None:
+            return CaseDate.objects.none()
+
+        qs = (
+            CaseDate.objects
+            .filter(
+                date__gte=start,
+                date__lte=end,
+                case__in=cases.values("id"),
+            )
+            .select_related("case")
+            .order_by("date", "case_id")
+        )
+
+        if date_type:
+            qs = qs.filter(date_type=date_type)
+
+        return qs
+
+    # -------------------------
+    # Feed tokens
+    # -------------------------
+    FEED_SALT = "cases.calendar-feed"
+
+    @staticmethod
+    def feed_token(user, rotate=False):
+        """
+        Signed token of the user's feed URL. `rotate` issues a new key,
+        revoking every earlier token.
+        """
+        feed, created = CaseCalendarFeed.objects.get_or_create(user=user)
+
+        if rotate and not created:
+            feed.key = uuid.uuid4()
+            feed.save(update_fields=["key", "updated_at"])
+
+        return signing.dumps(
+            {"user": str(user.pk), "key": str(feed.key)},
+            salt=CaseCalendarService.FEED_SALT,
+        )
+
+    @staticmethod
+    def revoke_feed(user):
+        CaseCalendarFeed.objects.filter(user=user).update(
+            key=uuid.uuid4(),
+            updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    def feed_user(token):
+        """
+        Active user of a current feed token, else None.
+        """
+        try:
+            data = signing.loads(token, salt=CaseCalendarService.FEED_SALT)
+            feed = (
+                CaseCalendarFeed.objects
+                .select_related("user")
+                .filter(user_id=data["user"], key=data["key"])
+                .first()
+            )
+        except (signing.BadSignature, KeyError, TypeError, DjangoValidationError):
+            return None
+
+        if feed is None or not feed.user.is_active:
+            return None
+
+        return feed.user
+
+    # -------------------------
+    # iCalendar
+    # -------------------------
+    @staticmethod
+    def _escape(value):
+        return (
+            (value or "")
+            .replace("\\", "\\\\")
+            .replace(";", "\\;")
+            .replace(",", "\\,")
+            .replace("\r\n", "\\n")
+            .replace("\n", "\\n")
+        )
+
+    @staticmethod
+    def _fold(line):
+        """
+        RFC 5545: lines longer than 75 octets are folded with CRLF + space.
+        """
+        encoded = line.encode("utf-8")
+        if len(encoded) <= 75:
+            return line
+
+        parts = []
+        current = ""
+
+        for char in line:
+            limit = 75 if not parts else 74
+            if len((current + char).encode("utf-8")) > limit:
+                parts.append(current)
+                current = char
+            else:
+                current += char
+
+        parts.append(current)
+        return "\r\n ".join(parts)
+
+    @staticmethod
+    def iter_ical(dates):
+        labels = dict(CaseDateType.choices)
+        stamp = timezone.now().strftime("%Y%m%dT%H%M%SZ")
+
+        yield "BEGIN:VCALENDAR\r\n"
+        yield "VERSION:2.0\r\n"
+        yield "PRODID:-//Trilex//Case Calendar//EN\r\n"
+        yield "CALSCALE:GREGORIAN\r\n"
+        yield "X-WR-CALNAME:Trilex hearings\r\n"
+
+        for case_date in dates.iterator(chunk_size=500):
+            case = case_date.case
+            summary = f"{labels.get(case_date.date_type, case_date.date_type)}: {case.title}"
+
+            description = case_date.remark
+            if case_date.assigned_to_name:
+                description = (
+                    f"{description}\nAssigned to: {case_date.assigned_to_name}"
+                ).strip()
+
+            lines = [
+                "BEGIN:VEVENT",
+                f"UID:{case_date.id}@trilex",
+                f"DTSTAMP:{stamp}",
+                f"DTSTART;VALUE=DATE:{case_date.date:%Y%m%d}",
+                f"DTEND;VALUE=DATE:{case_date.date + timedelta(days=1):%Y%m%d}",
+                f"SUMMARY:{CaseCalendarService._escape(summary)}",
+                f"DESCRIPTION:{CaseCalendarService._escape(description)}",
+                f"CATEGORIES:{case_date.date_type.upper()}",
+                "END:VEVENT",
+            ]
+
+            yield "".join(
+                CaseCalendarService._fold(line) + "\r\n" for line in lines
+            )
+
+        yield "END:VCALENDAR\r\n"
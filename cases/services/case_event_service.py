@@ -0,0 +1,104 @@
+from django.db.models import Model
+
+from base.constants.case import CaseDocumentUploader, CaseEventType
+from cases.models import CaseEvent
+
+
+class CaseEventService:
+    """
+    Writes the case activity log.
+
+    Call it inside the same transaction as the change it describes,
+    so the log never records something that was rolled back.
+    """
+
+    @staticmethod
+    def _actor_role(actor):
+        return getattr(actor, "role", "") or ""
+
+    @staticmethod
+    def build(case, event_type, actor=None, target=None, payload=None, client_visible=True):
+        return CaseEvent(
+            case=case,
+            event_type=event_type,
+            actor=actor,
+            actor_role=CaseEventService._actor_role(actor),
+            target_id=getattr(target, "pk", target),
+            payload=payload or {},
+            client_visible=client_visible,
+        )
+
+    @staticmethod
+    def record(case, event_type, actor=None, target=None, payload=None, client_visible=True):
+        event = CaseEventService.build(
+            case,
+            event_type,
+            actor=actor,
+            target=target,
+            payload=payload,
+            client_visible=client_visible,
+        )
+        event.save()
+        return event
+
+    @staticmethod
+    def bulk_record(events):
+        return CaseEvent.objects.bulk_create(events)
+
+    # -------------------------
+    # PAYLOAD HELPERS
+    # -------------------------
+    @staticmethod
+    def _plain(value):
+        if isinstance(value, Model):
+            return value.pk
+        return value
+
+    @staticmethod
+    def diff(instance, data):
+        """
+        {field: {"from": old, "to": new}} for the fields in `data`
+        whose value differs from the instance. Call before applying.
+        """
+        changes = {}
+
+        for field, value in data.items():
+            old = CaseEventService._plain(getattr(instance, field, None))
+            new = CaseEventService._plain(value)
+
+            if old != new:
+                changes[field] = {"from": old, "to": new}
+
+        return changes
+
+    @staticmethod
+    def document_uploaded(case, document, actor):
+        # Clients only ever see their own uploads
+        return CaseEventService.record(
+            case,
+            CaseEventType.DOCUMENT_UPLOADED,
+            actor=actor,
+            target=document,
+            payload={
+                "title": document.title,
+                "file_type": document.file_type,
+                "document_scope": document.document_scope,
+            },
+            client_visible=(
+                document.uploaded_by_type == CaseDocumentUploader.CLIENT
+            ),
+        )
+
+    @staticmethod
+    def date_added(case, case_date, actor):
+        return CaseEventService.record(
+            case,
+            CaseEventType.DATE_ADDED,
+            actor=actor,
+            target=case_date,
+            payload={
+                "date_type": case_date.date_type,
+                "date": case_date.date,
+                "remark": case_date.remark,
+            },
+        )
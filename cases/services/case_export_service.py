@@ -0,0 +1,228 @@
+import csv
+import json
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+from cases.models import CaseDocument, CaseLawyer
+
+
+class _Echo:
+    """
+    File-like object whose write() returns the value,
+    so csv.writer rows can be yielded straight to the response.
+    """
+
+    def write(self, value):
+        return value
+
+
+class CaseExportService:
+    """
+    Streams a docket export as CSV or NDJSON.
+
+    Cases are read with `.iterator()` (server-side cursor on PostgreSQL)
+    and related rows are prefetched per chunk, so memory stays constant
+    regardless of how many cases are exported.
+    """
+
+    CHUNK_SIZE = 500
+
+    CSV_COLUMNS = (
+        "id",
+        "title",
+        "case_category",
+        "court_type",
+        "status",
+        "description",
+        "owner_type",
+        "owner",
+        "client",
+        "client_details.full_name",
+        "client_details.address",
+        "client_details.email",
+        "client_details.phone",
+        "client_details.date_of_birth",
+        "client_details.citizenship_number",
+        "client_details.gender",
+        "waris.full_name",
+        "waris.email",
+        "waris.address",
+        "waris.phone",
+        "waris.date_of_birth",
+        "waris.citizenship_number",
+        "waris.gender",
+        "assigned_lawyers",
+        "dates",
+        "documents",
+        "created_at",
+        "updated_at",
+    )
+
+    SNAPSHOT_FIELDS = (
+        "full_name",
+        "address",
+        "email",
+        "phone",
+        "date_of_birth",
+        "citizenship_number",
+        "gender",
+    )
+
+    @staticmethod
+    def prepare_queryset(qs):
+        return (
+            qs.select_related(
+                "owner_lawyer__user",
+                "owner_firm__user",
+                "case_category",
+                "client_details",
+                "waris",
+            )
+            .prefetch_related(
+                Prefetch(
+                    "assigned_lawyers",
+                    queryset=CaseLawyer.objects.select_related("lawyer__user")
+                ),
+                "dates",
+                Prefetch(
+                    "documents",
+                    queryset=CaseDocument.objects.only(
+                        "id",
+                        "case_id",
+                        "title",
+                        "file_id",
+                        "file_type",
+                        "document_scope",
+                        "uploaded_by_type",
+                        "created_at",
+                    ).order_by("created_at")
+                ),
+            )
+            .order_by("created_at")
+        )
+
+    # -------------------------
+    # ROW BUILDING
+    # -------------------------
+    @staticmethod
+    def _snapshot(obj):
+        if obj is None:
+            return None
+
+        return {
+            field: getattr(obj, field)
+            for field in CaseExportService.SNAPSHOT_FIELDS
+        }
+
+    @staticmethod
+    def _related_or_none(case, attr):
+        try:
+            return getattr(case, attr)
+        except ObjectDoesNotExist:
+            return None
+
+    @staticmethod
+    def build_row(case):
+        if case.owner_lawyer:
+            owner = case.owner_lawyer.user.email
+        elif case.owner_firm:
+            owner = case.owner_firm.user.email
+        else:
+            owner = None
+
+        return {
+            "id": case.id,
+            "title": case.title,
+            "case_category": case.case_category.name,
+            "court_type": case.court_type,
+            "status": case.status,
+            "description": case.description,
+            "owner_type": case.owner_type,
+            "owner": owner,
+            "client": case.client_id,
+            "client_details": CaseExportService._snapshot(
+                CaseExportService._related_or_none(case, "client_details")
+            ),
+            "waris": CaseExportService._snapshot(
+                CaseExportService._related_or_none(case, "waris")
+            ),
+            "assigned_lawyers": [
+                {
+                    "lawyer_id": cl.lawyer_id,
+                    "email": cl.lawyer.user.email,
+                    "role": cl.role,
+                    "can_edit": cl.can_edit,
+                }
+                for cl in case.assigned_lawyers.all()
+            ],
+            "dates": [
+                {
+                    "date_type": d.date_type,
+                    "date": d.date,
+                    "remark": d.remark,
+                    "assigned_to_name": d.assigned_to_name,
+                }
+                for d in case.dates.all()
+            ],
+            "documents": [
+                {
+                    "id": doc.id,
+                    "title": doc.title,
+                    "file": doc.file_id,
+                    "file_type": doc.file_type,
+                    "document_scope": doc.document_scope,
+                    "uploaded_by_type": doc.uploaded_by_type,
+                    "created_at": doc.created_at,
+                }
+                for doc in case.documents.all()
+            ],
+            "created_at": case.created_at,
+            "updated_at": case.updated_at,
+        }
+
+    @staticmethod
+    def _flatten(row):
+        flat = {}
+
+        for column in CaseExportService.CSV_COLUMNS:
+            if "." in column:
+                prefix, field = column.split(".", 1)
+                value = (row[prefix] or {}).get(field)
+            else:
+                value = row[column]
+
+            if isinstance(value, list):
+                value = json.dumps(value, cls=DjangoJSONEncoder)
+            elif value is None:
+                value = ""
+            elif hasattr(value, "isoformat"):
+                value = value.isoformat()
+
+            flat[column] = value
+
+        return [flat[column] for column in CaseExportService.CSV_COLUMNS]
+
+    # -------------------------
+    # STREAMS
+    # -------------------------
+    @staticmethod
+    def iter_ndjson(qs):
+        for case in qs.iterator(chunk_size=CaseExportService.CHUNK_SIZE):
+            yield json.dumps(
+                CaseExportService.build_row(case),
+                cls=DjangoJSONEncoder,
+                ensure_ascii=False,
+            ) + "\n"
+
+    @staticmethod
+    def iter_csv(qs):
+        writer = csv.writer(_Echo())
+
+        yield writer.writerow(CaseExportService.CSV_COLUMNS)
+
+        for case in qs.iterator(chunk_size=CaseExportService.CHUNK_SIZE):
+            yield writer.writerow(
+                CaseExportService._flatten(CaseExportService.build_row(case))
+            )
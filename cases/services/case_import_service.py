@@ -0,0 +1,382 @@
+import csv
+import json
+from collections import Counter
+from itertools import islice
+
+from django.db import transaction
+from rest_framework.exceptions import PermissionDenied
+
+from base.constants.user_roles import UserRoles
+from base.constants.case import (
+    CaseEventType,
+    CaseImportFormat,
+    CaseImportStatus,
+    CaseLawyerRole,
+)
+from cases.models import (
+    Case,
+    CaseCategory,
+    CaseClientDetails,
+    CaseDate,
+    CaseDocument,
+    CaseImportJob,
+    CaseLawyer,
+    CaseWaris,
+)
+from cases.api.serializers.case_import_serializers import CaseImportRowSerializer
+from cases.services.case_cache_service import CaseCacheService
+from cases.services.case_event_service import CaseEventService
+from clients.models import Client
+from dashboards.services import DashboardStatService
+from firms.models import Firm
+from lawyers.models import Lawyer
+from media.models import Image
+
+
+class CaseImportService:
+    """
+    Bulk case import from CSV / JSONL.
+
+    - Rows are read lazily from the uploaded stream
+    - Each chunk is validated, then inserted with bulk_create
+    - The job checkpoint is saved in the same transaction as the chunk,
+      so re-running a job skips exactly the rows already handled
+    """
+
+    DEFAULT_CHUNK_SIZE = 500
+
+    # Per-row errors kept on the job; the rest are only counted
+    MAX_STORED_ERRORS = 200
+
+    # CSV columns holding a JSON array
+    CSV_JSON_COLUMNS = ("documents", "dates")
+
+    # -------------------------
+    # OWNER
+    # -------------------------
+    @staticmethod
+    def resolve_owner(user):
+        if user.role == UserRoles.LAWYER:
+            return {
+                "owner_type": UserRoles.LAWYER,
+                "owner_lawyer": Lawyer.objects.get(user=user),
+                "owner_firm": None,
+            }
+
+        if user.role == UserRoles.FIRM:
+            return {
+                "owner_type": UserRoles.FIRM,
+                "owner_lawyer": None,
+                "owner_firm": Firm.objects.get(user=user),
+            }
+
+        raise PermissionDenied("Only lawyers and firms can import cases.")
+
+    @staticmethod
+    def detect_format(file_name):
+        name = (file_name or "").lower()
+
+        if name.endswith((".jsonl", ".ndjson")):
+            return CaseImportFormat.JSONL
+
+        return CaseImportFormat.CSV
+
+    # -------------------------
+    # JOB
+    # -------------------------
+    @staticmethod
+    def create_job(*, user, file_name, file_format):
+        return CaseImportJob.objects.create(
+            created_by=user,
+            file_name=file_name or "",
+            file_format=file_format,
+            **CaseImportService.resolve_owner(user)
+        )
+
+    @staticmethod
+    def run(job, stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Import every row of `stream` (a text stream) not yet covered
+        by the job checkpoint.
+        """
+        rows = islice(
+            CaseImportService.read_rows(stream, job.file_format),
+            job.rows_processed,
+            None
+        )
+
+        job.status = CaseImportStatus.RUNNING
+        job.save(update_fields=["status", "updated_at"])
+
+        try:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+
+                CaseImportService.import_chunk(job, chunk)
+
+        except Exception:
+            job.status = CaseImportStatus.FAILED
+            job.save(update_fields=["status", "updated_at"])
+            raise
+
+        job.status = CaseImportStatus.COMPLETED
+        job.save(update_fields=["status", "updated_at"])
+        return job
+
+    # -------------------------
+    # READERS
+    # -------------------------
+    @staticmethod
+    def read_rows(stream, file_format):
+        """
+        Yields (row_number, payload, parse_error) tuples.
+        Row numbers are 1-based and exclude the CSV header.
+        """
+        if file_format == CaseImportFormat.JSONL:
+            yield from CaseImportService._read_jsonl(stream)
+        else:
+            yield from CaseImportService._read_csv(stream)
+
+    @staticmethod
+    def _read_jsonl(stream):
+        row_number = 0
+
+        for line in stream:
+            if not line.strip():
+                continue
+
+            row_number += 1
+
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield row_number, None, f"Invalid JSON: {exc.msg}"
+                continue
+
+            if not isinstance(payload, dict):
+                yield row_number, None, "Each line must be a JSON object"
+                continue
+
+            yield row_number, payload, None
+
+    @staticmethod
+    def _read_csv(stream):
+        reader = csv.DictReader(stream)
+
+        for row_number, row in enumerate(reader, start=1):
+            try:
+                payload = CaseImportService._csv_row_to_payload(row)
+            except json.JSONDecodeError as exc:
+                yield row_number, None, f"Invalid JSON in column: {exc.msg}"
+                continue
+
+            yield row_number, payload, None
+
+    @staticmethod
+    def _csv_row_to_payload(row):
+        """
+        Flat CSV columns -> nested payload.
+
+        - `client_details.full_name`, `waris.phone`, ... become nested objects
+        - `documents` / `dates` hold JSON arrays
+        - empty cells are treated as missing
+        """
+        payload = {}
+
+        for column, value in row.items():
+            if column is None:
+                continue
+
+            value = (value or "").strip()
+            if not value:
+                continue
+
+            if "." in column:
+                prefix, field = column.split(".", 1)
+                payload.setdefault(prefix, {})[field] = value
+
+            elif column in CaseImportService.CSV_JSON_COLUMNS:
+                payload[column] = json.loads(value)
+
+            else:
+                payload[column] = value
+
+        return payload
+
+    # -------------------------
+    # CHUNK
+    # -------------------------
+    @staticmethod
+    @transaction.atomic
+    def import_chunk(job, chunk):
+        errors = []
+        valid = []
+
+        for row_number, payload, parse_error in chunk:
+            if parse_error:
+                errors.append({
+                    "row": row_number,
+                    "errors": {"non_field_errors": [parse_error]},
+                })
+                continue
+
+            serializer = CaseImportRowSerializer(data=payload)
+            if serializer.is_valid():
+                valid.append((row_number, serializer.validated_data))
+            else:
+                errors.append({"row": row_number, "errors": serializer.errors})
+
+        # Resolve relations for the whole chunk at once
+        categories = CaseCategory.objects.in_bulk({
+            data["case_category"] for _, data in valid
+        })
+        clients = Client.objects.in_bulk({
+            data["client"] for _, data in valid if data.get("client")
+        })
+        images = Image.objects.in_bulk({
+            doc["file"]
+            for _, data in valid
+            for doc in data.get("documents", [])
+        })
+
+        cases = []
+        client_details = []
+        waris_list = []
+        dates = []
+        documents = []
+        lawyers = []
+
+        user = job.created_by
+
+        for row_number, data in valid:
+            row_errors = CaseImportService._missing_relations(
+                data, categories, clients, images
+            )
+            if row_errors:
+                errors.append({"row": row_number, "errors": row_errors})
+                continue
+
+            case = Case(
+                owner_type=job.owner_type,
+                owner_lawyer=job.owner_lawyer,
+                owner_firm=job.owner_firm,
+                created_by=user,
+                title=data["title"],
+                case_category=categories[data["case_category"]],
+                court_type=data["court_type"],
+                description=data.get("description", ""),
+                status=data["status"],
+                client=clients.get(data.get("client")),
+            )
+            cases.append(case)
+
+            client_details.append(
+                CaseClientDetails(case=case, **data["client_details"])
+            )
+
+            if data.get("waris"):
+                waris_list.append(CaseWaris(case=case, **data["waris"]))
+
+            for date in data.get("dates", []):
+                dates.append(CaseDate(case=case, **date))
+
+            for doc in data.get("documents", []):
+                documents.append(
+                    CaseDocument(
+                        case=case,
+                        uploaded_by_user=user,
+                        uploaded_by_type=user.role.lower(),
+                        **{**doc, "file": images[doc["file"]]}
+                    )
+                )
+
+            # Lawyer-owned cases get the owner as lead lawyer
+            if job.owner_lawyer:
+                lawyers.append(
+                    CaseLawyer(
+                        case=case,
+                        lawyer=job.owner_lawyer,
+                        role=CaseLawyerRole.LEAD,
+                        can_edit=True,
+                    )
+                )
+
+        Case.objects.bulk_create(cases)
+        CaseClientDetails.objects.bulk_create(client_details)
+        CaseWaris.objects.bulk_create(waris_list)
+        CaseDate.objects.bulk_create(dates)
+        CaseDocument.objects.bulk_create(documents)
+        CaseLawyer.objects.bulk_create(lawyers)
+        CaseEventService.bulk_record([
+            CaseEventService.build(
+                case,
+                CaseEventType.CASE_IMPORTED,
+                actor=user,
+                payload={"import_job": job.id, "title": case.title},
+            )
+            for case in cases
+        ])
+
+        # bulk_create skips signals: update dashboard rollups and
+        # invalidate case caches explicitly
+        owner_user_id = (
+            job.owner_lawyer.user_id if job.owner_lawyer
+            else job.owner_firm.user_id if job.owner_firm
+            else None
+        )
+        dashboard_deltas = Counter()
+        for case in cases:
+            dashboard_deltas.update(DashboardStatService.case_deltas(
+                {owner_user_id, case.client.user_id if case.client else None},
+                case.status,
+                case.created_at,
+            ))
+        DashboardStatService.apply(dashboard_deltas)
+
+        CaseCacheService.invalidate_users(
+            {owner_user_id}
+            | {case.client.user_id for case in cases if case.client}
+        )
+
+        errors.sort(key=lambda item: item["row"])
+
+        job.rows_processed += len(chunk)
+        job.rows_imported += len(cases)
+        job.rows_failed += len(errors)
+
+        update_fields = ["rows_processed", "rows_imported", "rows_failed", "updated_at"]
+
+        # Only the first MAX_STORED_ERRORS are kept, so the list stops
+        # being rewritten once full
+        room = CaseImportService.MAX_STORED_ERRORS - len(job.errors)
+        if errors and room > 0:
+            job.errors = job.errors + errors[:room]
+            update_fields.append("errors")
+
+        job.save(update_fields=update_fields)
+
+        return cases
+
+    @staticmethod
+    def _missing_relations(data, categories, clients, images):
+        errors = {}
+
+        if data["case_category"] not in categories:
+            errors["case_category"] = ["Case category not found."]
+
+        if data.get("client") and data["client"] not in clients:
+            errors["client"] = ["Client not found."]
+
+        missing_files = [
+            str(doc["file"])
+            for doc in data.get("documents", [])
+            if doc["file"] not in images
+        ]
+        if missing_files:
+            errors["documents"] = [
+                f"File not found: {file_id}" for file_id in missing_files
+            ]
+
+        return errors
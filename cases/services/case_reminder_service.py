@@ -0,0 +1,165 @@
+from datetime import timedelta
+from itertools import islice
+
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+
+from base.constants.case import CaseDateType, CaseStatus
+from cases.models import CaseDate, CaseLawyer
+from notifications.constants import NotificationType
+from notifications.models import Notification
+from notifications.services import NotificationService
+
+
+class CaseReminderService:
+    """
+    Reminders before each CaseDate for the lead lawyer, assigned
+    lawyers and the linked client. Deleted and completed cases are
+    skipped.
+
+    - Upcoming dates are streamed over the (date, case) index in batches
+    - Each (case date, date, lead window, recipient) gets a dedupe key,
+      so re-running the job never notifies twice
+    - A date that moved gets a new key and is reminded again
+    """
+
+    DEFAULT_LEAD_DAYS = (7, 1)
+    DEFAULT_BATCH_SIZE = 1000
+
+    @staticmethod
+    def dedupe_key(case_date_id, date, lead_days, recipient_id):
+        return (
+            f"case_date_reminder:{case_date_id}:{date:%Y-%m-%d}:"
+            f"{lead_days}:{recipient_id}"
+        )
+
+    @staticmethod
+    def lead_window(days_until, lead_days):
+        """
+        Smallest configured lead window the date falls into,
+        so a late first run sends only the most urgent reminder.
+        """
+        windows = [days for days in lead_days if days_until <= days]
+        return min(windows) if windows else None
+
+    @staticmethod
+    def send_due_reminders(
+        *,
+        today=None,
+        lead_days=DEFAULT_LEAD_DAYS,
+        batch_size=DEFAULT_BATCH_SIZE,
+        dry_run=False,
+    ):
+        today = today or timezone.localdate()
+        lead_days = sorted(set(lead_days))
+
+        dates = (
+            CaseDate.objects
+            .filter(
+                date__gte=today,
+                date__lte=today + timedelta(days=max(lead_days)),
+                case__deleted_at__isnull=True,
+            )
+            .exclude(case__status=CaseStatus.COMPLETED)
+            .order_by("date", "case")
+            .values(
+                "id",
+                "date",
+                "date_type",
+                "case_id",
+                "case__title",
+                "case__owner_lawyer__user_id",
+                "case__client__user_id",
+            )
+            .iterator(chunk_size=batch_size)
+        )
+
+        stats = {"dates": 0, "created": 0, "skipped": 0}
+        content_type = ContentType.objects.get_for_model(CaseDate)
+
+        while True:
+            batch = list(islice(dates, batch_size))
+            if not batch:
+                break
+
+            notifications = CaseReminderService._build_batch(
+                batch, today, lead_days, content_type
+            )
+
+            stats["dates"] += len(batch)
+
+            if dry_run:
+                stats["created"] += len(notifications)
+                continue
+
+            created = NotificationService.bulk_create_notifications(notifications)
+
+            stats["created"] += len(created)
+            stats["skipped"] += len(notifications) - len(created)
+
+        return stats
+
+    @staticmethod
+    def _build_batch(batch, today, lead_days, content_type):
+        labels = dict(CaseDateType.choices)
+
+        # Assigned lawyers (lead included) for the whole batch in one query
+        assigned = {}
+        for case_id, user_id in (
+            CaseLawyer.objects
+            .filter(case_id__in={row["case_id"] for row in batch})
+            .values_list("case_id", "lawyer__user_id")
+        ):
+            assigned.setdefault(case_id, set()).add(user_id)
+
+        notifications = []
+
+        for row in batch:
+            days_until = (row["date"] - today).days
+            window = CaseReminderService.lead_window(days_until, lead_days)
+            if window is None:
+                continue
+
+            recipients = set(assigned.get(row["case_id"], ()))
+            for user_id in (
+                row["case__owner_lawyer__user_id"],
+                row["case__client__user_id"],
+            ):
+                if user_id:
+                    recipients.add(user_id)
+
+            label = labels.get(row["date_type"], row["date_type"])
+
+            if days_until == 0:
+                when = "today"
+            elif days_until == 1:
+                when = "tomorrow"
+            else:
+                when = f"in {days_until} days"
+
+            for recipient_id in recipients:
+                notifications.append(Notification(
+                    recipient_id=recipient_id,
+                    type=NotificationType.CASE_DATE_REMINDER,
+                    title=f"Upcoming {label}",
+                    message=(
+                        f"{label} for \"{row['case__title']}\" is {when} "
+                        f"({row['date']:%Y-%m-%d})."
+                    ),
+                    entity_type="case",
+                    entity_id=row["case_id"],
+                    content_type=content_type,
+                    object_id=row["id"],
+                    metadata={
+                        "case_id": str(row["case_id"]),
+                        "case_date_id": str(row["id"]),
+                        "date": row["date"].isoformat(),
+                        "date_type": row["date_type"],
+                        "days_before": window,
+                    },
+                    dedupe_key=CaseReminderService.dedupe_key(
+                        row["id"], row["date"], window, recipient_id
+                    ),
+                ))
+
+        return notifications
@@ -0,0 +1,73 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from cases.models import (
+    Case,
+    CaseClientDetails,
+    CaseDate,
+    CaseDocument,
+    CaseLawyer,
+    CaseWaris,
+)
+from cases.services.case_cache_service import CaseCacheService
+
+
+# ---------------------------------------------------
+# Case list cache invalidation
+# ---------------------------------------------------
+
+@receiver(pre_save, sender=Case)
+def remember_previous_case_users(sender, instance, **kwargs):
+    """
+    Owner / client can change on save; the users who lose
+    the case must be invalidated too.
+    """
+    if instance._state.adding:
+        return
+
+    instance._previous_user_ids = set(
+        Case._base_manager.filter(pk=instance.pk).values_list(
+            "owner_lawyer__user_id",
+            "owner_firm__user_id",
+            "client__user_id",
+        ).first() or ()
+    )
+
+
+@receiver(pre_delete, sender=Case)
+def remember_deleted_case_users(sender, instance, **kwargs):
+    # Assignments are cascaded away before commit
+    instance._previous_user_ids = CaseCacheService.user_ids_for_cases(
+        [instance.pk]
+    )
+
+
+@receiver(post_save, sender=Case)
+@receiver(post_delete, sender=Case)
+def invalidate_case(sender, instance, **kwargs):
+    CaseCacheService.invalidate_case(
+        instance.pk,
+        extra_user_ids=getattr(instance, "_previous_user_ids", ()),
+    )
+
+
+@receiver(post_save, sender=CaseLawyer)
+@receiver(post_delete, sender=CaseLawyer)
+def invalidate_case_lawyer(sender, instance, **kwargs):
+    # The (un)assigned lawyer is not reachable through the case once removed
+    CaseCacheService.invalidate_case(
+        instance.case_id,
+        extra_user_ids={instance.lawyer.user_id},
+    )
+
+
+@receiver(post_save, sender=CaseDate)
+@receiver(post_delete, sender=CaseDate)
+@receiver(post_save, sender=CaseDocument)
+@receiver(post_delete, sender=CaseDocument)
+@receiver(post_save, sender=CaseClientDetails)
+@receiver(post_delete, sender=CaseClientDetails)
+@receiver(post_save, sender=CaseWaris)
+@receiver(post_delete, sender=CaseWaris)
+def invalidate_case_child(sender, instance, **kwargs):
+    CaseCacheService.invalidate_case(instance.case_id)
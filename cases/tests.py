@@ -1,3 +1,708 @@
-from django.test import TestCase
+import io
+import json
+from datetime import date, timedelta
+from unittest import mock
+from uuid import uuid4
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncClient, TestCase
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from addresses.models import Address, District, Municipality, Province, Ward
+from base.constants.case import (
+    CaseDateType,
+    CaseDocumentFileType,
+    CaseDocumentUploader,
+    CaseEventType,
+    CaseImportFormat,
+    CaseImportStatus,
+    CaseStatus,
+)
+from base.constants.user_roles import UserRoles
+from base.constants.verification import VerificationStatus
+from cases.models import (
+    Case,
+    CaseCategory,
+    CaseClientDetails,
+    CaseDate,
+    CaseDocument,
+    CaseEvent,
+    CaseLawyer,
+    CaseWaris,
+)
+from cases.permissions import (
+    CanEditCase,
+    CanManageCaseDates,
+    CanViewCase,
+    CanViewCaseDocuments,
+    get_case_access,
+)
+from cases.services.case_cache_service import CaseCacheService
+from cases.services.case_event_service import CaseEventService
+from cases.services.case_import_service import CaseImportService
+from cases.services.case_reminder_service import CaseReminderService
+from clients.models import Client
+from lawyers.models import BarVerification, Lawyer
+from media.models import Image
+from notifications.constants import NotificationType
+from notifications.models import Notification
+
+
+class CaseTestData(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        province = Province.objects.create(title="Bagmati", title_nepali="बागमती", code=3)
+        district = District.objects.create(
+            province=province, title="Kathmandu", title_nepali="काठमाडौं", code=27
+        )
+        municipality = Municipality.objects.create(
+            district=district, title="Kathmandu", title_nepali="काठमाडौं", code=27001
+        )
+        cls.ward = Ward.objects.create(municipality=municipality, number=1, number_nepali="१")
+
+        cls.lawyer = cls.create_lawyer("lawyer@example.com")
+        cls.user = cls.lawyer.user
+        cls.category = CaseCategory.objects.create(name="Civil")
+
+        cls.cases = [cls.create_case(cls.lawyer, f"Case {index}") for index in range(3)]
+
+    @classmethod
+    def create_lawyer(cls, email):
+        municipality = cls.ward.municipality
+
+        return Lawyer.objects.create(
+            user=User.objects.create_user(email=email, password="x", role=UserRoles.LAWYER),
+            address=Address.objects.create(
+                province=municipality.district.province,
+                district=municipality.district,
+                municipality=municipality,
+                ward=cls.ward,
+            ),
+        )
+
+    @classmethod
+    def create_case(cls, lawyer, title):
+        return Case.objects.create(
+            owner_type=UserRoles.LAWYER,
+            owner_lawyer=lawyer,
+            created_by=lawyer.user,
+            title=title,
+            case_category=cls.category,
+            court_type="district",
+            status=CaseStatus.ONGOING,
+        )
+
+
+class CaseReminderTests(CaseTestData):
+
+    def test_deleted_and_completed_cases_are_skipped(self):
+        today = date(2026, 1, 1)
+        for case in self.cases:
+            CaseDate.objects.create(case=case, date_type=CaseDateType.PESI, date=today + timedelta(days=1))
+
+        self.cases[1].soft_delete()
+        Case.objects.filter(pk=self.cases[2].pk).update(status=CaseStatus.COMPLETED)
+
+        stats = CaseReminderService.send_due_reminders(today=today, dry_run=True)
+
+        self.assertEqual(stats["dates"], 1)
+
+    def test_rerun_notifies_once(self):
+        today = date(2026, 1, 1)
+        assignee = self.create_lawyer("assignee@example.com")
+        CaseLawyer.objects.create(case=self.cases[0], lawyer=assignee)
+        client_user = User.objects.create_user(
+            email="client@example.com", password="x", role=UserRoles.CLIENT
+        )
+        Case.objects.filter(pk=self.cases[0].pk).update(
+            client=Client.objects.create(user=client_user)
+        )
+        for case in self.cases[:2]:
+            CaseDate.objects.create(case=case, date_type=CaseDateType.PESI, date=today + timedelta(days=1))
+
+        channel_layer = mock.Mock(group_send=mock.AsyncMock())
+        with mock.patch("notifications.services.get_channel_layer", return_value=channel_layer):
+            first = CaseReminderService.send_due_reminders(today=today)
+            second = CaseReminderService.send_due_reminders(today=today)
+
+        # Lead lawyer of both cases, the assignee and the client
+        self.assertEqual(first["created"], 4)
+        self.assertEqual((second["created"], second["skipped"]), (0, 4))
+        self.assertEqual(
+            Notification.objects.filter(type=NotificationType.CASE_DATE_REMINDER).count(), 4
+        )
+
+        unread_pushes = sorted(
+            call.args[0] for call in channel_layer.group_send.call_args_list
+            if call.args[1]["type"] == "unread_count"
+        )
+        self.assertEqual(
+            unread_pushes,
+            sorted(f"user_{user.id}" for user in (self.user, assignee.user, client_user)),
+        )
+
+
+class CaseExportStreamingTests(CaseTestData):
+
+    def token(self):
+        return str(RefreshToken.for_user(self.user).access_token)
+
+    def test_wsgi_stream(self):
+        api = APIClient()
+        api.force_authenticate(self.user)
+
+        response = api.get("/api/cases/export/?export_format=ndjson")
+
+        self.assertFalse(response.is_async)
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 3)
+
+    async def test_asgi_stream_is_async(self):
+        # A sync iterator would be read into memory by the ASGI handler
+        response = await AsyncClient().get(
+            "/api/cases/export/?export_format=ndjson",
+            headers={"authorization": f"Bearer {self.token()}"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(body.splitlines()), 3)
+
+
+class CaseCalendarFeedTests(CaseTestData):
+
+    def setUp(self):
+        CaseDate.objects.create(
+            case=self.cases[0], date_type=CaseDateType.PESI, date=date.today()
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def feed_url(self, method="get"):
+        return getattr(self.api, method)("/api/cases/calendar/feed/").data["url"]
+
+    def test_feed_needs_no_authorization_header(self):
+        response = APIClient().get(self.feed_url())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Pesi Date: Case 0", b"".join(response.streaming_content))
+
+    def test_rotate_and_revoke(self):
+        old = self.feed_url()
+        self.assertEqual(self.feed_url(), old)
+
+        new = self.feed_url("post")
+        self.assertEqual(APIClient().get(old).status_code, 404)
+        self.assertEqual(APIClient().get(new).status_code, 200)
+
+        self.api.delete("/api/cases/calendar/feed/")
+        self.assertEqual(APIClient().get(new).status_code, 404)
+
+    def test_tampered_token(self):
+        url = self.feed_url().replace(".ics", "x.ics")
+
+        self.assertEqual(APIClient().get(url).status_code, 404)
+
+
+class CaseCalendarPaginationTests(CaseTestData):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.start = date(2026, 1, 1)
+        for offset in range(3):
+            for case in cls.cases:
+                CaseDate.objects.create(
+                    case=case, date_type=CaseDateType.PESI, date=cls.start + timedelta(days=offset)
+                )
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+        self.window = {"date_from": "2026-01-01", "date_to": "2027-01-01"}
+
+    def test_json_is_paginated(self):
+        response = self.api.get("/api/cases/calendar/", {**self.window, "page_size": 4})
+        entries = response.data["results"]
+
+        while response.data["next"]:
+            response = self.api.get(response.data["next"])
+            self.assertEqual(len(response.data["results"]), min(4, 9 - len(entries)))
+            self.assertEqual(response.data["date_to"], date(2027, 1, 1))
+            entries += response.data["results"]
+
+        self.assertEqual(
+            [(entry["date"], entry["case_id"]) for entry in entries],
+            sorted(
+                (str(self.start + timedelta(days=offset)), str(case.id))
+                for offset in range(3)
+                for case in self.cases
+            ),
+        )
+
+    def test_ical_keeps_the_whole_window(self):
+        response = self.api.get("/api/cases/calendar.ics", {**self.window, "page_size": 4})
+
+        self.assertEqual(b"".join(response.streaming_content).count(b"BEGIN:VEVENT"), 9)
+
+
+class CaseListCacheTests(CaseTestData):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.assignee = cls.create_lawyer("assignee@example.com")
+        cls.other = cls.create_lawyer("other@example.com")
+        cls.create_case(cls.other, "Unrelated")
+
+    def setUp(self):
+        cache.clear()
+        # Drop what setUpTestData queued; its commit never happens
+        CaseCacheService._pending.cases = {}
+
+    def list_cases(self, user):
+        api = APIClient()
+        api.force_authenticate(user)
+        return api.get("/api/cases/list/")
+
+    def assert_invalidates(self, write, users):
+        """
+        After write() commits, the case list of each of `users` is
+        recomputed and the unrelated lawyer's is still served from cache.
+        """
+        for user in [*users, self.other.user]:
+            self.list_cases(user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            write()
+
+        with mock.patch.object(
+            CaseCacheService, "set_list", wraps=CaseCacheService.set_list
+        ) as set_list:
+            for user in users:
+                self.list_cases(user)
+            self.assertEqual(set_list.call_count, len(users))
+
+            self.list_cases(self.other.user)
+            self.assertEqual(set_list.call_count, len(users))
+
+    def test_list_is_cached(self):
+        self.list_cases(self.user)
+
+        with mock.patch.object(CaseCacheService, "set_list") as set_list:
+            self.assertEqual(self.list_cases(self.user).data["count"], 3)
+
+        set_list.assert_not_called()
+
+    def test_case_lawyer(self):
+        self.assert_invalidates(
+            lambda: CaseLawyer.objects.create(case=self.cases[0], lawyer=self.assignee),
+            [self.user, self.assignee.user],
+        )
+        self.assertEqual(self.list_cases(self.assignee.user).data["count"], 1)
+
+        self.assert_invalidates(
+            lambda: CaseLawyer.objects.filter(lawyer=self.assignee).delete(),
+            [self.user, self.assignee.user],
+        )
+        self.assertEqual(self.list_cases(self.assignee.user).data["count"], 0)
+
+    def test_case_date(self):
+        self.assert_invalidates(
+            lambda: CaseDate.objects.create(
+                case=self.cases[0], date_type=CaseDateType.TARIK, date=date.today()
+            ),
+            [self.user],
+        )
+
+    def test_case_document(self):
+        self.assert_invalidates(
+            lambda: CaseDocument.objects.create(
+                case=self.cases[0],
+                title="Plaint",
+                file=Image.objects.create(url="https://example.com/plaint.pdf"),
+                file_type=CaseDocumentFileType.PDF,
+                uploaded_by_type=CaseDocumentUploader.LAWYER,
+                uploaded_by_user=self.user,
+            ),
+            [self.user],
+        )
+
+    def test_case_client_details(self):
+        self.assert_invalidates(
+            lambda: CaseClientDetails.objects.create(
+                case=self.cases[0],
+                full_name="Client",
+                address="Kathmandu",
+                email="client@example.com",
+                phone="9800000000",
+                date_of_birth="1990-01-01",
+                citizenship_number="123",
+                gender="female",
+            ),
+            [self.user],
+        )
+
+    def test_case_waris(self):
+        self.assert_invalidates(
+            lambda: CaseWaris.objects.create(case=self.cases[0], full_name="Waris"),
+            [self.user],
+        )
+
+
+class CaseImportTests(CaseTestData):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        BarVerification.objects.create(
+            user=cls.user,
+            full_name="Lawyer",
+            date_of_birth="1990-01-01",
+            bar_id="B-1",
+            gender="male",
+            status=VerificationStatus.VERIFIED,
+        )
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def row(self, title, **overrides):
+        return {
+            "title": title,
+            "case_category": str(self.category.id),
+            "court_type": "district",
+            "status": CaseStatus.ONGOING,
+            "client_details": {
+                "full_name": "Client",
+                "address": "Kathmandu",
+                "email": "client@example.com",
+                "phone": "9800000000",
+                "date_of_birth": "1990-01-01",
+                "citizenship_number": "123",
+                "gender": "female",
+            },
+            "dates": [{"date_type": CaseDateType.PESI, "date": "2030-01-01"}],
+            **overrides,
+        }
+
+    def jsonl(self, count, bad=()):
+        """
+        `count` lines; those in `bad` (1-based) fail validation.
+        """
+        lines = []
+        for number in range(1, count + 1):
+            row = self.row(f"Imported {number}")
+            if number in bad:
+                row["court_type"] = "moon"
+            lines.append(json.dumps(row))
+        return "\n".join(lines) + "\n"
+
+    def upload(self, content, name="cases.jsonl", **data):
+        return self.api.post(
+            "/api/cases/import/",
+            {"file": SimpleUploadedFile(name, content.encode()), **data},
+            format="multipart",
+        )
+
+    def imported_titles(self):
+        return list(
+            Case.objects.filter(title__startswith="Imported")
+            .order_by("title")
+            .values_list("title", flat=True)
+        )
+
+    def test_jsonl_with_bad_rows(self):
+        content = self.jsonl(4, bad={3}) + "not json\n" + json.dumps(
+            self.row("Imported 6", case_category=str(uuid4()))
+        ) + "\n"
+
+        response = self.upload(content)
+
+        self.assertEqual(response.status_code, 201)
+        job = response.data
+        self.assertEqual(job["status"], CaseImportStatus.COMPLETED)
+        self.assertEqual(
+            (job["rows_processed"], job["rows_imported"], job["rows_failed"]), (6, 3, 3)
+        )
+        self.assertEqual([error["row"] for error in job["errors"]], [3, 5, 6])
+        self.assertIn("court_type", job["errors"][0]["errors"])
+        self.assertIn("Invalid JSON", job["errors"][1]["errors"]["non_field_errors"][0])
+        self.assertEqual(job["errors"][2]["errors"], {"case_category": ["Case category not found."]})
+
+        self.assertEqual(self.imported_titles(), ["Imported 1", "Imported 2", "Imported 4"])
+        case = Case.objects.get(title="Imported 1")
+        self.assertEqual(case.client_details.full_name, "Client")
+        self.assertEqual(case.dates.count(), 1)
+        self.assertTrue(case.assigned_lawyers.filter(lawyer=self.lawyer).exists())
+
+    def test_csv_columns(self):
+        content = (
+            "title,case_category,court_type,client_details.full_name,client_details.address,"
+            "client_details.email,client_details.phone,client_details.date_of_birth,"
+            "client_details.citizenship_number,client_details.gender,dates\n"
+            f"Imported 1,{self.category.id},district,Client,Kathmandu,client@example.com,"
+            '9800000000,1990-01-01,123,female,"[{""date_type"": ""pesi"", ""date"": ""2030-01-01""}]"\n'
+            f"Imported 2,{self.category.id},district,Client,Kathmandu,client@example.com,"
+            "9800000000,1990-01-01,123,female,[oops\n"
+        )
+
+        job = self.upload(content, name="cases.csv").data
+
+        self.assertEqual(job["file_format"], CaseImportFormat.CSV)
+        self.assertEqual((job["rows_imported"], job["rows_failed"]), (1, 1))
+        self.assertEqual(job["errors"][0]["row"], 2)
+        self.assertEqual(Case.objects.get(title="Imported 1").dates.get().date_type, CaseDateType.PESI)
+
+    def test_resume_skips_processed_rows(self):
+        content = self.jsonl(7, bad={2, 6})
+
+        def interrupted():
+            lines = content.splitlines(keepends=True)
+            yield from lines[:5]
+            raise OSError("Connection reset")
+
+        job = CaseImportService.create_job(
+            user=self.user, file_name="cases.jsonl", file_format=CaseImportFormat.JSONL
+        )
+        with self.assertRaises(OSError):
+            CaseImportService.run(job, interrupted(), chunk_size=2)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, CaseImportStatus.FAILED)
+        # Two full chunks committed; the fifth row was never imported
+        self.assertEqual((job.rows_processed, job.rows_imported, job.rows_failed), (4, 3, 1))
+
+        response = self.upload(content, job=str(job.id))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["id"], str(job.id))
+        self.assertEqual(
+            (
+                response.data["rows_processed"],
+                response.data["rows_imported"],
+                response.data["rows_failed"],
+            ),
+            (7, 5, 2),
+        )
+        self.assertEqual([error["row"] for error in response.data["errors"]], [2, 6])
+        self.assertEqual(
+            self.imported_titles(),
+            ["Imported 1", "Imported 3", "Imported 4", "Imported 5", "Imported 7"],
+        )
+
+    def test_stored_errors_are_capped(self):
+        job = CaseImportService.create_job(
+            user=self.user, file_name="cases.jsonl", file_format=CaseImportFormat.JSONL
+        )
+
+        with mock.patch.object(CaseImportService, "MAX_STORED_ERRORS", 3):
+            CaseImportService.run(job, io.StringIO(self.jsonl(6, bad={1, 2, 4, 5, 6})), chunk_size=2)
+
+        job.refresh_from_db()
+        self.assertEqual((job.rows_imported, job.rows_failed), (1, 5))
+        self.assertEqual([error["row"] for error in job.errors], [1, 2, 4])
+
+
+class CaseAccessTests(CaseTestData):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.assignee = cls.create_lawyer("assignee@example.com")
+        CaseLawyer.objects.create(case=cls.cases[0], lawyer=cls.assignee, can_edit=False)
+
+    def request(self, user):
+        request = APIRequestFactory().get("/")
+        request.user = user
+        return request
+
+    def test_resolved_once_per_request(self):
+        request = self.request(self.assignee.user)
+        case = Case.objects.get(pk=self.cases[0].pk)
+        permissions = [CanViewCase(), CanEditCase(), CanManageCaseDates(), CanViewCaseDocuments()]
+
+        # Owner lawyer row + the assignment, however many checks run
+        with self.assertNumQueries(2):
+            results = [
+                permission.has_object_permission(request, None, case)
+                for permission in permissions
+            ]
+            get_case_access(request, case).is_client
+
+        self.assertEqual(results, [True, False, True, True])
+        self.assertIs(get_case_access(request, case), get_case_access(request, case))
+
+    def test_not_shared_between_requests(self):
+        case = self.cases[0]
+
+        self.assertIsNot(
+            get_case_access(self.request(self.user), case),
+            get_case_access(self.request(self.user), case),
+        )
+        self.assertFalse(get_case_access(self.request(self.assignee.user), self.cases[1]).can_view)
+
+
+class CaseDocumentPaginationTests(CaseTestData):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        image = Image.objects.create(url="https://example.com/plaint.pdf")
+        for index in range(12):
+            CaseDocument.objects.create(
+                case=cls.cases[0],
+                title=f"Document {index}",
+                file=image,
+                file_type=CaseDocumentFileType.PDF,
+                uploaded_by_type=CaseDocumentUploader.LAWYER,
+                uploaded_by_user=cls.user,
+            )
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+        self.url = f"/api/cases/{self.cases[0].id}/documents/"
+
+    def test_page_number_by_default(self):
+        data = self.api.get(self.url, {"page": 2}).data
+
+        self.assertEqual(data["count"], 12)
+        self.assertEqual(len(data["results"]), 2)
+
+    def test_cursor_on_request(self):
+        first = self.api.get(self.url, {"paginate": "cursor"}).data
+
+        self.assertNotIn("count", first)
+        self.assertIsNone(first["previous"])
+        self.assertEqual(len(first["results"]), 10)
+
+        # `next` carries the cursor, which keeps cursor pagination on
+        second = self.api.get(first["next"]).data
+        self.assertIsNone(second["next"])
+
+        titles = [doc["title"] for doc in first["results"] + second["results"]]
+        self.assertEqual(sorted(titles), sorted(f"Document {index}" for index in range(12)))
+        self.assertEqual(titles[0], "Document 11")
+
+
+
+class CaseEventTests(CaseTestData):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.client_user = User.objects.create_user(
+            email="client@example.com", password="x", role=UserRoles.CLIENT
+        )
+        Case.objects.filter(pk=cls.cases[0].pk).update(
+            client=Client.objects.create(user=cls.client_user)
+        )
+
+    def setUp(self):
+        self.case = self.cases[0]
+        self.url = f"/api/cases/{self.case.id}/timeline/"
+
+    def timeline(self, user, url=None):
+        api = APIClient()
+        api.force_authenticate(user)
+        return api.get(url or self.url).data
+
+    def test_events_cannot_be_updated(self):
+        event = CaseEventService.record(
+            self.case, CaseEventType.CASE_UPDATED, actor=self.user,
+            payload={"title": {"from": "Case 0", "to": "Renamed"}},
+        )
+        event.payload = {}
+
+        with self.assertRaises(ValueError):
+            event.save()
+
+        self.assertEqual(
+            CaseEvent.objects.get(pk=event.pk).payload,
+            {"title": {"from": "Case 0", "to": "Renamed"}},
+        )
+
+    def test_timeline_newest_first(self):
+        recorded = [
+            CaseEventService.record(
+                self.case, CaseEventType.CASE_UPDATED, actor=self.user, payload={"index": index}
+            )
+            for index in range(12)
+        ]
+
+        first = self.timeline(self.user)
+        second = self.timeline(self.user, first["next"])
+
+        ids = [event["id"] for event in first["results"] + second["results"]]
+        self.assertEqual(ids, [str(event.id) for event in reversed(recorded)])
+        self.assertIsNone(second["next"])
+
+    def test_client_sees_only_client_visible_events(self):
+        CaseEventService.record(self.case, CaseEventType.DATE_ADDED, actor=self.user)
+        CaseEventService.record(
+            self.case, CaseEventType.DOCUMENT_UPLOADED, actor=self.user, client_visible=False
+        )
+
+        types = [event["event_type"] for event in self.timeline(self.client_user)["results"]]
+        self.assertEqual(types, [CaseEventType.DATE_ADDED])
+        self.assertEqual(len(self.timeline(self.user)["results"]), 2)
+
+
+class CaseDetailETagTests(CaseTestData):
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+        self.case = self.cases[0]
+        self.url = f"/api/cases/{self.case.id}/"
+
+    def etag(self):
+        response = self.api.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def assertChanged(self, etag):
+        self.assertNotEqual(self.etag(), etag)
+        self.assertEqual(self.api.get(self.url, headers={"if-none-match": etag}).status_code, 200)
+
+    def test_not_modified(self):
+        etag = self.etag()
+
+        response = self.api.get(self.url, headers={"if-none-match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_case_date_changes_etag(self):
+        etag = self.etag()
+
+        case_date = CaseDate.objects.create(
+            case=self.case, date_type=CaseDateType.PESI, date=date.today()
+        )
+        self.assertChanged(etag)
+
+        # Edits move updated_at without changing the count
+        etag = self.etag()
+        case_date.remark = "Adjourned"
+        case_date.save()
+        self.assertChanged(etag)
+
+    def test_case_document_changes_etag(self):
+        etag = self.etag()
+
+        CaseDocument.objects.create(
+            case=self.case,
+            title="Plaint",
+            file=Image.objects.create(url="https://example.com/plaint.pdf"),
+            file_type=CaseDocumentFileType.PDF,
+            uploaded_by_type=CaseDocumentUploader.LAWYER,
+            uploaded_by_user=self.user,
+        )
+
+        self.assertChanged(etag)
@@ -9,13 +9,25 @@ from cases.api.views.case_views import (
     CaseDetailView,
     CaseUpdateView,
     CaseListView,
+    CaseExportView,
 )
 from cases.api.views.case_lawyer_views import CaseLawyerAssignView
 from cases.api.views.case_document_views import (
     CaseDocumentCreateView,
     CaseDocumentListView,
 )
-from cases.api.views.case_date_views import CaseDateCreateView
+from cases.api.views.case_date_views import (
+    CaseDateCreateView,
+    CaseCalendarView,
+    CaseCalendarICalView,
+    CaseCalendarFeedView,
+    CaseCalendarFeedICalView,
+)
+from cases.api.views.case_event_views import CaseTimelineView
+from cases.api.views.case_import_views import (
+    CaseImportView,
+    CaseImportJobDetailView,
+)
 
 urlpatterns = [
 
@@ -42,6 +54,41 @@ urlpatterns = [
         CaseListView.as_view(),
         name="cases-list",
     ),
+    path(
+        "export/",
+        CaseExportView.as_view(),
+        name="cases-export",
+    ),
+    path(
+        "calendar/",
+        CaseCalendarView.as_view(),
+        name="cases-calendar",
+    ),
+    path(
+        "calendar.ics",
+        CaseCalendarICalView.as_view(),
+        name="cases-calendar-ical",
+    ),
+    path(
+        "calendar/feed/",
+        CaseCalendarFeedView.as_view(),
+        name="cases-calendar-feed",
+    ),
+    path(
+        "calendar/feed/<str:token>.ics",
+        CaseCalendarFeedICalView.as_view(),
+        name="cases-calendar-feed-ical",
+    ),
+    path(
+        "import/",
+        CaseImportView.as_view(),
+        name="cases-import",
+    ),
+    path(
+        "import/<uuid:job_id>/",
+        CaseImportJobDetailView.as_view(),
+        name="cases-import-job",
+    ),
     path(
         "<uuid:case_id>/",
         CaseDetailView.as_view(),
@@ -52,6 +99,11 @@ urlpatterns = [
         CaseUpdateView.as_view(),
         name="cases-update",
     ),
+    path(
+        "<uuid:case_id>/timeline/",
+        CaseTimelineView.as_view(),
+        name="cases-timeline",
+    ),
 
     # Case Lawyers
     path(
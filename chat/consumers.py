@@ -1,10 +1,20 @@
+import asyncio
 import json
+import logging
+from types import SimpleNamespace
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from accounts.permissions import IsVerifiedClientLawyerOrFirm
+from ai_assistant.services.ai_gateway import AIServiceUnavailable, get_ai_gateway
+from ai_assistant.services.ai_query_service import AIQueryService
+from ai_assistant.services.answer_cache import AIAnswerCache
 from chat.models import ChatParticipant, ChatMessage
 from chat.services.message_service import MessageService
 
 
+logger = logging.getLogger(__name__)
+
 # Track online users (simple in-memory presence)
 ONLINE_USERS = set()
 
@@ -22,6 +32,7 @@ class SocketConsumer(AsyncWebsocketConsumer):
             return
 
         self.user_group = f"user_{self.user.id}"
+        self.ai_task = None
 
         # Mark user online
         ONLINE_USERS.add(str(self.user.id))
@@ -39,6 +50,9 @@ class SocketConsumer(AsyncWebsocketConsumer):
     # DISCONNECT
     # =========================
     async def disconnect(self, close_code):
+        if getattr(self, "ai_task", None):
+            self.ai_task.cancel()
+
         # Remove user from online set
         ONLINE_USERS.discard(str(self.user.id))
 
@@ -74,6 +88,9 @@ class SocketConsumer(AsyncWebsocketConsumer):
         elif action == "mark_read":
             await self.handle_mark_read(data)
 
+        elif action == "ai_query":
+            await self.handle_ai_query(data)
+
         else:
             await self.send(json.dumps({"error": "Invalid action"}))
 
@@ -220,6 +237,95 @@ class SocketConsumer(AsyncWebsocketConsumer):
                     }
                 )
 
+    # =========================
+    # AI QUERY (STREAMED)
+    # =========================
+    async def handle_ai_query(self, data):
+        query = data.get("query")
+        request_id = data.get("request_id")
+
+        if not query:
+            await self.send(json.dumps({"error": "Query is required"}))
+            return
+
+        if self.ai_task and not self.ai_task.done():
+            await self.send(json.dumps({"error": "AI query already in progress"}))
+            return
+
+        can_ask = await self.can_use_ai()
+        if not can_ask:
+            await self.send(json.dumps({"error": "Access denied"}))
+            return
+
+        # Stream in the background so the socket keeps serving chat actions
+        self.ai_task = asyncio.ensure_future(self.stream_ai_query(query, request_id))
+
+    async def send_ai_query_error(self, request_id, error):
+        await self.send(json.dumps({
+            "type": "ai_query_error",
+            "request_id": request_id,
+            "error": error,
+        }))
+
+    async def stream_ai_query(self, query, request_id):
+        # Runs as a detached task: every failure must still end the
+        # request with a terminal event, or the client waits forever
+        try:
+            await self._stream_ai_query(query, request_id)
+        except asyncio.CancelledError:
+            raise
+        except AIServiceUnavailable:
+            await self.send_ai_query_error(request_id, "AI service unavailable")
+        except Exception:
+            logger.exception("AI query %s failed for user %s", request_id, self.user.id)
+            await self.send_ai_query_error(request_id, "AI query failed")
+
+    async def _stream_ai_query(self, query, request_id):
+        await self.send(json.dumps({
+            "type": "ai_query_started",
+            "request_id": request_id,
+        }))
+
+        # Repeated question: the reused answer goes out as one token
+        ai_data = await self.cached_ai_answer(query)
+
+        if ai_data is not None:
+            await self.send(json.dumps({
+                "type": "ai_token",
+                "request_id": request_id,
+                "token": ai_data.get("answer", ""),
+            }))
+        else:
+            async for kind, value in get_ai_gateway().stream(
+                {
+                    "question": query,
+                    "user_id": str(self.user.id),
+                    "user_role": self.user.role,
+                }
+            ):
+                if kind == "token":
+                    await self.send(json.dumps({
+                        "type": "ai_token",
+                        "request_id": request_id,
+                        "token": value,
+                    }))
+                else:
+                    ai_data = value
+
+            await database_sync_to_async(AIAnswerCache.store)(self.user.role, query, ai_data)
+
+        # Same history row + recommendations as AIQueryView
+        payload = await self.record_ai_query(query, ai_data)
+
+        await self.send(json.dumps(
+            {
+                "type": "ai_query_completed",
+                "request_id": request_id,
+                **payload,
+            },
+            cls=DjangoJSONEncoder,
+        ))
+
     async def push_unread_count(self):
         from notifications.models import Notification
         from asgiref.sync import sync_to_async
@@ -261,9 +367,30 @@ class SocketConsumer(AsyncWebsocketConsumer):
     async def notification(self, event):
         await self.send(json.dumps(event))
 
+    async def ai_query_job(self, event):
+        await self.send(json.dumps(event))
+
     # =========================
     # DATABASE HELPERS
     # =========================
+    @database_sync_to_async
+    def can_use_ai(self):
+        return bool(
+            IsVerifiedClientLawyerOrFirm().has_permission(
+                SimpleNamespace(user=self.user), None
+            )
+        )
+
+    @database_sync_to_async
+    def cached_ai_answer(self, query):
+        ai_data, _ = AIAnswerCache.lookup(self.user.role, query)
+        return ai_data
+
+    @database_sync_to_async
+    def record_ai_query(self, query, ai_data):
+        _, payload = AIQueryService.record(self.user, query, ai_data)
+        return payload
+
     @database_sync_to_async
     def validate_participant(self, room_id):
         return ChatParticipant.objects.filter(
@@ -1,5 +1,3 @@
-from django.db.models import Q
-
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -11,10 +9,9 @@ from base.constants.case import CaseStatus
 from base.constants.booking_status import BookingStatus
 from base.constants.verification import VerificationStatus
 
-from bookings.models import Booking
-from cases.models import Case
-from clients.models import IDVerification
 from clients.api.serializers import ClientDashboardSerializer
+from dashboards.constants import DashboardMetric
+from dashboards.engine import DashboardQueryEngine
 
 
 class ClientDashboardAPIView(APIView):
@@ -29,33 +26,30 @@ class ClientDashboardAPIView(APIView):
     def get(self, request):
 
         user = request.user
-        client_profile = user.client_profile
+
+        stats = DashboardQueryEngine.cached_stats(user)
 
         # Accepted Bookings
-        accepted_bookings = Booking.objects.filter(
-            created_by=user,
-            status=BookingStatus.ACCEPTED
-        ).count()
+        accepted_bookings = stats[DashboardMetric.BOOKINGS_CREATED].get(
+            BookingStatus.ACCEPTED, 0
+        )
 
         # Active Cases (Not completed)
-        active_cases = Case.objects.filter(
-            client=client_profile,
-            status__in=[
+        active_cases = sum(
+            count
+            for status, count in stats[DashboardMetric.CASES].items()
+            if status in (
                 CaseStatus.DRAFT,
                 CaseStatus.REGISTERED,
                 CaseStatus.ONGOING,
-            ]
-        ).count()
+            )
+        )
 
         # Verification Status
-        verification = IDVerification.objects.filter(
-            user=user
-        ).first()
-
-        if not verification:
-            verification_status = VerificationStatus.NOT_SUBMITTED
-        else:
-            verification_status = verification.status
+        verification_status = (
+            stats["verification_status"]
+            or VerificationStatus.NOT_SUBMITTED
+        )
 
         data = {
             "accepted_bookings": accepted_bookings,
@@ -1,4 +1,5 @@
 from django.db import transaction
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
 
@@ -40,6 +41,28 @@ def is_admin_user(user):
     return user.is_authenticated and user.role == UserRoles.ADMIN
 
 
+def client_queryset():
+    """
+    Clients with user, verification (+ photos) and address joined in,
+    so serializing a page needs no per-client queries.
+    """
+    return Client.objects.select_related(
+        "user",
+        "user__client_verification",
+        "user__client_verification__passport_size_photo",
+        "user__client_verification__photo_front",
+        "user__client_verification__photo_back",
+        "address__province",
+        "address__district",
+        "address__municipality",
+        "address__ward",
+    )
+
+
+def client_verification(client):
+    return getattr(client.user, "client_verification", None)
+
+
 # =========================
 # SIGNUP
 # =========================
@@ -97,13 +120,12 @@ class ClientMeView(APIView):
         tags=["clients"],
     )
     def get(self, request):
-        client = request.user.client_profile
-        verification = IDVerification.objects.filter(user=request.user).first()
+        client = get_object_or_404(client_queryset(), user=request.user)
 
         serializer = ClientMeSerializer({
-            "user": request.user,
+            "user": client.user,
             "profile": client,
-            "verification": verification,
+            "verification": client_verification(client),
         })
         return Response(serializer.data)
 
@@ -214,7 +236,12 @@ class IDVerificationListView(APIView):
         tags=["client-verifications"],
     )
     def get(self, request):
-        qs = IDVerification.objects.select_related("user")
+        qs = IDVerification.objects.select_related(
+            "user",
+            "passport_size_photo",
+            "photo_front",
+            "photo_back",
+        ).order_by("-created_at")
 
         status = request.query_params.get("status")
         if status:
@@ -291,7 +318,8 @@ class ClientListView(APIView):
         summary="List clients",
         description=(
             "Public users see only verified clients with limited verification data. "
-            "Admins see all clients with full verification details."
+            "Admins see all clients with full verification details "
+            "and can filter by verification status."
         ),
         parameters=[
             OpenApiParameter("page", int, OpenApiParameter.QUERY),
@@ -302,6 +330,13 @@ class ClientListView(APIView):
                 location=OpenApiParameter.QUERY,
                 description="Search clients by full name or email",
             ),
+            OpenApiParameter(
+                name="status",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                enum=[v for v, _ in VerificationStatus.choices],
+                description="Admin only: filter by verification status",
+            ),
         ],
         responses={
             200: ClientPublicSerializer(many=True),
@@ -312,7 +347,9 @@ class ClientListView(APIView):
     def get(self, request):
         admin = is_admin_user(request.user)
         search = request.query_params.get("search")
-        qs = Client.objects.select_related("user")
+        status = request.query_params.get("status")
+
+        qs = client_queryset().order_by("-created_at")
 
         if not admin:
             qs = qs.filter(
@@ -320,16 +357,19 @@ class ClientListView(APIView):
             )
             serializer_class = ClientPublicSerializer
         else:
+            if status == VerificationStatus.NOT_SUBMITTED:
+                qs = qs.filter(user__client_verification__isnull=True)
+            elif status:
+                qs = qs.filter(user__client_verification__status=status)
             serializer_class = ClientAdminSerializer
 
+        # One-to-one joins only: no duplicates, no DISTINCT needed
         if search:
             qs = qs.filter(
-                user__client_verification__full_name__icontains=search
-            ) | qs.filter(
-                user__email__icontains=search
+                Q(user__client_verification__full_name__icontains=search) |
+                Q(user__email__icontains=search)
             )
-        
-        qs.distinct()
+
         paginator = DefaultPageNumberPagination()
         page = paginator.paginate_queryset(qs, request)
 
@@ -337,9 +377,7 @@ class ClientListView(APIView):
             {
                 "user": client.user,
                 "profile": client,
-                "verification": IDVerification.objects.filter(
-                    user=client.user
-                ).first(),
+                "verification": client_verification(client),
             }
             for client in page
         ]
@@ -364,7 +402,7 @@ class ClientDetailView(APIView):
     def get(self, request, client_id):
         admin = is_admin_user(request.user)
 
-        qs = Client.objects.select_related("user")
+        qs = client_queryset()
 
         if not admin:
             client = get_object_or_404(
@@ -377,11 +415,9 @@ class ClientDetailView(APIView):
             client = get_object_or_404(qs, id=client_id)
             serializer_class = ClientAdminSerializer
 
-        verification = IDVerification.objects.filter(user=client.user).first()
-
         serializer = serializer_class({
             "user": client.user,
             "profile": client,
-            "verification": verification,
+            "verification": client_verification(client),
         })
         return Response(serializer.data)
@@ -0,0 +1,104 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from addresses.models import Address, District, Municipality, Province, Ward
+from base.constants.client_id_type import ClientIDType
+from base.constants.user_roles import UserRoles
+from base.constants.verification import VerificationStatus
+from clients.models import Client, IDVerification
+from media.models import Image
+
+
+class ClientListQueryCountTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        province = Province.objects.create(title="Bagmati", title_nepali="बागमती", code=3)
+        district = District.objects.create(
+            province=province, title="Kathmandu", title_nepali="काठमाडौं", code=27
+        )
+        municipality = Municipality.objects.create(
+            district=district, title="Kathmandu", title_nepali="काठमाडौं", code=27001
+        )
+        ward = Ward.objects.create(municipality=municipality, number=1, number_nepali="१")
+
+        cls.admin = User.objects.create_user(
+            email="admin@example.com", password="x", role=UserRoles.ADMIN
+        )
+
+        statuses = [
+            VerificationStatus.VERIFIED,
+            VerificationStatus.VERIFIED,
+            VerificationStatus.VERIFIED,
+            VerificationStatus.PENDING,
+            VerificationStatus.REJECTED,
+            None,
+        ]
+
+        for i, status in enumerate(statuses):
+            user = User.objects.create_user(
+                email=f"client{i}@example.com", password="x", role=UserRoles.CLIENT
+            )
+            Client.objects.create(
+                user=user,
+                address=Address.objects.create(
+                    province=province,
+                    district=district,
+                    municipality=municipality,
+                    ward=ward,
+                ),
+            )
+
+            if status is None:
+                continue
+
+            IDVerification.objects.create(
+                user=user,
+                full_name=f"Client {i}",
+                date_of_birth="1990-01-01",
+                id_type=ClientIDType.values[0],
+                passport_size_photo=Image.objects.create(url=f"https://example.com/{i}/p.jpg"),
+                photo_front=Image.objects.create(url=f"https://example.com/{i}/f.jpg"),
+                photo_back=Image.objects.create(url=f"https://example.com/{i}/b.jpg"),
+                status=status,
+            )
+
+    def get_list(self, url, user=None):
+        api = APIClient()
+        if user:
+            api.force_authenticate(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        # COUNT + one page query, independent of page size
+        self.assertLessEqual(len(queries), 2, [q["sql"] for q in queries])
+        return response.data
+
+    def test_public_list(self):
+        data = self.get_list("/api/clients/")
+        self.assertEqual(data["count"], 3)
+        self.assertTrue(all(row["verification"]["full_name"] for row in data["results"]))
+
+    def test_admin_list(self):
+        data = self.get_list("/api/clients/", self.admin)
+        self.assertEqual(data["count"], 6)
+
+    def test_admin_status_filter(self):
+        data = self.get_list("/api/clients/?status=PENDING", self.admin)
+        self.assertEqual(data["count"], 1)
+
+        data = self.get_list("/api/clients/?status=NOT_SUBMITTED", self.admin)
+        self.assertEqual(data["count"], 1)
+        self.assertIsNone(data["results"][0]["verification"])
+
+    def test_search(self):
+        data = self.get_list("/api/clients/?search=client 1")
+        self.assertEqual(data["count"], 1)
+
+        data = self.get_list("/api/clients/?search=client5@example", self.admin)
+        self.assertEqual(data["count"], 1)
@@ -0,0 +1,5 @@
+from django.contrib import admin
+
+from dashboards.models import DashboardStat
+
+admin.site.register(DashboardStat)
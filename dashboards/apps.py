@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class DashboardsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "dashboards"
+
+    def ready(self):
+        from dashboards import signals  # noqa: F401
@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class DashboardMetric(models.TextChoices):
+    # Cases visible to the user (owned / assigned / linked as client)
+    CASES = "cases", "Cases"
+
+    # Bookings sent to a lawyer / firm, and bookings made by a client
+    BOOKINGS_RECEIVED = "bookings_received", "Bookings Received"
+    BOOKINGS_CREATED = "bookings_created", "Bookings Created"
+
+    # Lawyers in a firm
+    MEMBERS = "members", "Firm Members"
+
+
+class DashboardPeriod(models.TextChoices):
+    TOTAL = "total", "Total"
+    MONTH = "month", "Month"
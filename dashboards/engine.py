@@ -0,0 +1,192 @@
+from datetime import datetime, time
+
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from base.cache import get_generation, get_or_compute
+from base.constants.booking_status import BookingStatus
+from base.constants.case import CaseStatus
+from base.constants.user_roles import UserRoles
+from bookings.models import Booking
+from cases.selectors.case_selector import get_visible_cases
+from clients.models import IDVerification
+from dashboards.constants import DashboardMetric
+from dashboards.services import DashboardStatService
+from firms.models import FirmMember
+
+User = get_user_model()
+
+
+class DashboardQueryEngine:
+    """
+    Shared source of lawyer / firm / client dashboard numbers.
+
+    Returns the DashboardStatService.read() shape plus
+    "verification_status", in at most two queries:
+
+    - rollups (default): the DashboardStat rows, plus the client's
+      verification row
+    - live (DASHBOARD_USE_ROLLUPS=False, or rollups=False):
+        1. one pass over the visible cases with Count(filter=...)
+           per status and per month
+        2. one users-row query with correlated COUNT subqueries for
+           bookings and members and the verification status
+    """
+
+    @staticmethod
+    def stats(user, months=12, rollups=None):
+        if rollups is None:
+            rollups = settings.DASHBOARD_USE_ROLLUPS
+
+        if not rollups:
+            return DashboardQueryEngine.live(user, months)
+
+        stats = DashboardStatService.read(user, months)
+        stats["verification_status"] = None
+
+        if user.role == UserRoles.CLIENT:
+            stats["verification_status"] = (
+                IDVerification.objects
+                .filter(user=user)
+                .values_list("status", flat=True)
+                .first()
+            )
+
+        return stats
+
+    @staticmethod
+    def cached_stats(user, months=12):
+        """
+        stats() behind a short-TTL, single-flight cache.
+        The key carries the user's dashboard generation, which is bumped
+        whenever a case / booking / member / verification write touches them.
+        """
+        generation = get_generation(DashboardStatService.CACHE_NAMESPACE, user.pk)
+        key = f"dashboard:{user.pk}:{generation}:{months}"
+
+        return get_or_compute(
+            key,
+            lambda: DashboardQueryEngine.stats(user, months),
+            timeout=settings.DASHBOARD_CACHE_TIMEOUT,
+        )
+
+    # -------------------------
+    # LIVE
+    # -------------------------
+    @staticmethod
+    def live(user, months=12):
+        stats = {
+            DashboardMetric.CASES: {},
+            DashboardMetric.BOOKINGS_RECEIVED: {},
+            DashboardMetric.BOOKINGS_CREATED: {},
+            DashboardMetric.MEMBERS: 0,
+            "cases_per_month": {},
+            "verification_status": None,
+        }
+
+        DashboardQueryEngine._case_counts(user, months, stats)
+        DashboardQueryEngine._user_counts(user, stats)
+
+        return stats
+
+    @staticmethod
+    def _case_counts(user, months, stats):
+        cases = get_visible_cases(user)
+        if cases is None:
+            return
+
+        start = DashboardStatService.month_start(months)
+        tz = timezone.get_current_timezone()
+
+        bounds = [
+            timezone.make_aware(
+                datetime.combine(start + relativedelta(months=i), time.min),
+                tz,
+            )
+            for i in range(months + 1)
+        ]
+
+        aggregates = {
+            f"status_{status}": Count("id", filter=Q(status=status))
+            for status in CaseStatus.values
+        }
+        aggregates.update({
+            f"month_{i}": Count(
+                "id",
+                filter=Q(created_at__gte=bounds[i], created_at__lt=bounds[i + 1]),
+            )
+            for i in range(months)
+        })
+
+        row = cases.order_by().aggregate(**aggregates)
+
+        stats[DashboardMetric.CASES] = {
+            status: row[f"status_{status}"]
+            for status in CaseStatus.values
+            if row[f"status_{status}"]
+        }
+        stats["cases_per_month"] = {
+            bounds[i].date(): row[f"month_{i}"]
+            for i in range(months)
+            if row[f"month_{i}"]
+        }
+
+    @staticmethod
+    def _count(qs, field):
+        return Coalesce(
+            Subquery(
+                qs.filter(**{field: OuterRef("pk")})
+                .order_by()
+                .values(field)
+                .annotate(value=Count("id"))
+                .values("value")
+            ),
+            0,
+            output_field=IntegerField(),
+        )
+
+    @staticmethod
+    def _user_counts(user, stats):
+        annotations = {}
+
+        for status in BookingStatus.values:
+            bookings = Booking.objects.filter(status=status)
+            annotations[f"received_{status}"] = DashboardQueryEngine._count(
+                bookings, "created_to"
+            )
+            annotations[f"created_{status}"] = DashboardQueryEngine._count(
+                bookings, "created_by"
+            )
+
+        if user.role == UserRoles.FIRM:
+            annotations["members"] = DashboardQueryEngine._count(
+                FirmMember.objects.all(), "firm__user"
+            )
+
+        if user.role == UserRoles.CLIENT:
+            annotations["verification_status"] = Subquery(
+                IDVerification.objects
+                .filter(user=OuterRef("pk"))
+                .values("status")[:1]
+            )
+
+        row = (
+            User.objects
+            .filter(pk=user.pk)
+            .annotate(**annotations)
+            .values(*annotations)
+            .get()
+        )
+
+        for status in BookingStatus.values:
+            if row[f"received_{status}"]:
+                stats[DashboardMetric.BOOKINGS_RECEIVED][status] = row[f"received_{status}"]
+            if row[f"created_{status}"]:
+                stats[DashboardMetric.BOOKINGS_CREATED][status] = row[f"created_{status}"]
+
+        stats[DashboardMetric.MEMBERS] = row.get("members", 0)
+        stats["verification_status"] = row.get("verification_status")
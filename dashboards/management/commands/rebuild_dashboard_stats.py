@@ -0,0 +1,41 @@
+# dashboards/management/commands/rebuild_dashboard_stats.py
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboards.services import DashboardStatService
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute dashboard rollups from cases, bookings and firm members, "
+        "repairing counters that drifted from their source rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="emails",
+            help="Only rebuild for this user email (repeatable)",
+        )
+
+    def handle(self, *args, **options):
+        user_ids = None
+
+        if options["emails"]:
+            users = dict(
+                User.objects
+                .filter(email__in=options["emails"])
+                .values_list("email", "id")
+            )
+            missing = set(options["emails"]) - set(users)
+            if missing:
+                raise CommandError(f"Users not found: {', '.join(sorted(missing))}")
+            user_ids = list(users.values())
+
+        rows = DashboardStatService.rebuild(user_ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} dashboard stat rows"))
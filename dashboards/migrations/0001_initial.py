@@ -0,0 +1,126 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:19
+
+from collections import Counter
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncMonth
+
+
+def fill_stats(apps, schema_editor):
+    # DashboardStatService.rebuild() over the historical models; their
+    # managers don't hide soft-deleted rows, so filter those here
+    DashboardStat = apps.get_model("dashboards", "DashboardStat")
+    Case = apps.get_model("cases", "Case")
+    CaseLawyer = apps.get_model("cases", "CaseLawyer")
+    Booking = apps.get_model("bookings", "Booking")
+    FirmMember = apps.get_model("firms", "FirmMember")
+
+    deltas = Counter()
+
+    def add_case_rows(qs, user_field, prefix, count):
+        counter = models.Count(count, distinct=True)
+
+        for row in (
+            qs.values(user_id=models.F(user_field), dimension=models.F(f"{prefix}status"))
+            .annotate(value=counter)
+            .order_by()
+        ):
+            deltas[(row["user_id"], "cases", row["dimension"], "total", None)] += row["value"]
+
+        for row in (
+            qs.values(user_id=models.F(user_field), bucket=TruncMonth(f"{prefix}created_at"))
+            .annotate(value=counter)
+            .order_by()
+        ):
+            deltas[(row["user_id"], "cases", "", "month", row["bucket"].date())] += row["value"]
+
+    for user_field in ("owner_lawyer__user_id", "owner_firm__user_id", "client__user_id"):
+        add_case_rows(
+            Case.objects.filter(deleted_at__isnull=True, **{f"{user_field}__isnull": False}),
+            user_field,
+            "",
+            count="id",
+        )
+
+    add_case_rows(
+        CaseLawyer.objects.filter(deleted_at__isnull=True, case__deleted_at__isnull=True).filter(
+            models.Q(case__owner_lawyer__isnull=True) |
+            ~models.Q(lawyer__user_id=models.F("case__owner_lawyer__user_id"))
+        ),
+        "lawyer__user_id",
+        "case__",
+        count="case",
+    )
+
+    for user_field, metric in (
+        ("created_to_id", "bookings_received"),
+        ("created_by_id", "bookings_created"),
+    ):
+        for row in (
+            Booking.objects.filter(deleted_at__isnull=True)
+            .values(user_id=models.F(user_field), dimension=models.F("status"))
+            .annotate(value=models.Count("id"))
+            .order_by()
+        ):
+            deltas[(row["user_id"], metric, row["dimension"], "total", None)] += row["value"]
+
+    for row in (
+        FirmMember.objects.filter(deleted_at__isnull=True)
+        .values(user_id=models.F("firm__user_id"))
+        .annotate(value=models.Count("id"))
+        .order_by()
+    ):
+        deltas[(row["user_id"], "members", "", "total", None)] += row["value"]
+
+    DashboardStat.objects.bulk_create(
+        [
+            DashboardStat(
+                user_id=user_id,
+                metric=metric,
+                dimension=dimension,
+                period=period,
+                bucket=bucket,
+                value=value,
+            )
+            for (user_id, metric, dimension, period, bucket), value in deltas.items()
+            if value
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('bookings', '0001_initial'),
+        ('cases', '0009_caseevent'),
+        ('firms', '0004_firminvitation_firmmember'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStat',
+            fields=[
+                ('deleted_at', models.DateTimeField(blank=True, default=None, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metric', models.CharField(choices=[('cases', 'Cases'), ('bookings_received', 'Bookings Received'), ('bookings_created', 'Bookings Created'), ('members', 'Firm Members')], max_length=30)),
+                ('dimension', models.CharField(blank=True, max_length=30)),
+                ('period', models.CharField(choices=[('total', 'Total'), ('month', 'Month')], max_length=10)),
+                ('bucket', models.DateField(blank=True, null=True)),
+                ('value', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(condition=models.Q(('bucket__isnull', False)), fields=('user', 'metric', 'dimension', 'period', 'bucket'), name='unique_dashboard_stat_bucket'), models.UniqueConstraint(condition=models.Q(('bucket__isnull', True)), fields=('user', 'metric', 'dimension', 'period'), name='unique_dashboard_stat_total')],
+            },
+        ),
+        migrations.RunPython(fill_stats, migrations.RunPython.noop),
+    ]
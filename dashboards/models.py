@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+from base.models import AbstractBaseModel
+from dashboards.constants import DashboardMetric, DashboardPeriod
+
+
+class DashboardStat(AbstractBaseModel):
+    """
+    Pre-aggregated dashboard counter of one user.
+
+    - period=total: current count per dimension (e.g. cases by status),
+      bucket is empty
+    - period=month: rows created in that month (e.g. cases opened),
+      dimension is empty
+
+    Filled by the initial migration, maintained incrementally by
+    dashboards.signals and repaired with `manage.py rebuild_dashboard_stats`.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="dashboard_stats"
+    )
+
+    metric = models.CharField(
+        max_length=30,
+        choices=DashboardMetric.choices
+    )
+
+    # Status value for totals, "" otherwise
+    dimension = models.CharField(max_length=30, blank=True)
+
+    period = models.CharField(
+        max_length=10,
+        choices=DashboardPeriod.choices
+    )
+
+    # First day of the month; null for totals
+    bucket = models.DateField(null=True, blank=True)
+
+    value = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "metric", "dimension", "period", "bucket"],
+                condition=Q(bucket__isnull=False),
+                name="unique_dashboard_stat_bucket",
+            ),
+            models.UniqueConstraint(
+                fields=["user", "metric", "dimension", "period"],
+                condition=Q(bucket__isnull=True),
+                name="unique_dashboard_stat_total",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"DashboardStat({self.user_id}, {self.metric}, "
+            f"{self.dimension or '-'}, {self.period}, {self.bucket}) = {self.value}"
+        )
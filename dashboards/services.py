@@ -0,0 +1,268 @@
+from collections import Counter
+
+from dateutil.relativedelta import relativedelta
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from base.cache import bump_generations
+from bookings.models import Booking
+from cases.models import Case, CaseLawyer
+from dashboards.constants import DashboardMetric, DashboardPeriod
+from dashboards.models import DashboardStat
+from firms.models import FirmMember
+
+
+class DashboardStatService:
+    """
+    Reads and maintains the DashboardStat rollups.
+
+    Changes are expressed as a Counter of deltas keyed by
+    (user_id, metric, dimension, period, bucket) and applied
+    with `value = value + delta` upserts.
+    """
+
+    # -------------------------
+    # CONTRIBUTIONS
+    # -------------------------
+    @staticmethod
+    def case_deltas(user_ids, status, created_at, sign=1):
+        deltas = Counter()
+        created = timezone.localtime(created_at).date()
+
+        for user_id in user_ids:
+            if not user_id:
+                continue
+
+            deltas[(user_id, DashboardMetric.CASES, status, DashboardPeriod.TOTAL, None)] += sign
+            deltas[(user_id, DashboardMetric.CASES, "", DashboardPeriod.MONTH, created.replace(day=1))] += sign
+
+        return deltas
+
+    @staticmethod
+    def booking_deltas(created_to_id, created_by_id, status, sign=1):
+        return Counter({
+            (created_to_id, DashboardMetric.BOOKINGS_RECEIVED, status, DashboardPeriod.TOTAL, None): sign,
+            (created_by_id, DashboardMetric.BOOKINGS_CREATED, status, DashboardPeriod.TOTAL, None): sign,
+        })
+
+    @staticmethod
+    def member_deltas(firm_user_id, sign=1):
+        return Counter({
+            (firm_user_id, DashboardMetric.MEMBERS, "", DashboardPeriod.TOTAL, None): sign,
+        })
+
+    # -------------------------
+    # APPLY
+    # -------------------------
+    CACHE_NAMESPACE = "dashboard"
+
+    @staticmethod
+    def invalidate(user_ids):
+        """
+        Drop cached dashboards after commit (see DashboardQueryEngine.cached_stats).
+        """
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if user_ids:
+            transaction.on_commit(
+                lambda: bump_generations(DashboardStatService.CACHE_NAMESPACE, user_ids)
+            )
+
+    @staticmethod
+    def apply(deltas):
+        DashboardStatService.invalidate(
+            user_id for (user_id, *_), delta in deltas.items() if delta
+        )
+
+        for (user_id, metric, dimension, period, bucket), delta in deltas.items():
+            if not delta or not user_id:
+                continue
+
+            lookup = {
+                "user_id": user_id,
+                "metric": metric,
+                "dimension": dimension,
+                "period": period,
+                "bucket": bucket,
+            }
+
+            if DashboardStat.objects.filter(**lookup).update(value=F("value") + delta):
+                continue
+
+            try:
+                with transaction.atomic():
+                    DashboardStat.objects.create(value=delta, **lookup)
+            except IntegrityError:
+                # Created concurrently: fall back to the increment
+                DashboardStat.objects.filter(**lookup).update(value=F("value") + delta)
+
+    # -------------------------
+    # READ
+    # -------------------------
+    @staticmethod
+    def month_start(months=12):
+        now = timezone.localtime()
+        return (now - relativedelta(months=months - 1)).date().replace(day=1)
+
+    @staticmethod
+    def read(user, months=12):
+        """
+        All totals plus the last `months` monthly buckets in one query:
+        {"cases": {status: n}, ..., "members": n, "cases_per_month": {date: n}}
+        """
+        start = DashboardStatService.month_start(months)
+
+        stats = {
+            DashboardMetric.CASES: {},
+            DashboardMetric.BOOKINGS_RECEIVED: {},
+            DashboardMetric.BOOKINGS_CREATED: {},
+            DashboardMetric.MEMBERS: 0,
+            "cases_per_month": {},
+        }
+
+        rows = DashboardStat.objects.filter(user=user).filter(
+            Q(period=DashboardPeriod.TOTAL) |
+            Q(
+                period=DashboardPeriod.MONTH,
+                metric=DashboardMetric.CASES,
+                bucket__gte=start,
+            )
+        ).values_list("metric", "dimension", "period", "bucket", "value")
+
+        for metric, dimension, period, bucket, value in rows:
+            if period == DashboardPeriod.MONTH:
+                stats["cases_per_month"][bucket] = value
+            elif metric == DashboardMetric.MEMBERS:
+                stats[metric] += value
+            else:
+                stats[metric][dimension] = value
+
+        return stats
+
+    @staticmethod
+    def monthly_series(per_month, months=12):
+        """
+        Last `months` months, oldest first, zero-filled.
+        """
+        start = DashboardStatService.month_start(months)
+
+        series = []
+        for i in range(months):
+            month_date = start + relativedelta(months=i)
+            series.append({
+                "month": month_date.strftime("%b"),
+                "year": month_date.year,
+                "count": per_month.get(month_date, 0),
+            })
+
+        return series
+
+    # -------------------------
+    # REBUILD
+    # -------------------------
+    @staticmethod
+    def compute(user_ids=None):
+        """
+        Recompute every rollup from the source tables with grouped queries.
+        """
+        deltas = Counter()
+
+        def scoped(qs, user_field):
+            if user_ids is not None:
+                qs = qs.filter(**{f"{user_field}__in": user_ids})
+            return qs
+
+        # Cases: owner lawyer, owner firm, linked client
+        case_sources = [
+            "owner_lawyer__user_id",
+            "owner_firm__user_id",
+            "client__user_id",
+        ]
+
+        for user_field in case_sources:
+            qs = scoped(Case.objects.filter(**{f"{user_field}__isnull": False}), user_field)
+            DashboardStatService._add_case_rows(deltas, qs, user_field, "", count="id")
+
+        # Cases where a lawyer is assigned but is not the owner
+        assigned = scoped(
+            CaseLawyer.objects.filter(case__deleted_at__isnull=True).filter(
+                Q(case__owner_lawyer__isnull=True) |
+                ~Q(lawyer__user_id=F("case__owner_lawyer__user_id"))
+            ),
+            "lawyer__user_id",
+        )
+        DashboardStatService._add_case_rows(
+            deltas, assigned, "lawyer__user_id", "case__", count="case"
+        )
+
+        # Bookings
+        for user_field, metric in (
+            ("created_to_id", DashboardMetric.BOOKINGS_RECEIVED),
+            ("created_by_id", DashboardMetric.BOOKINGS_CREATED),
+        ):
+            for row in (
+                scoped(Booking.objects.all(), user_field)
+                .values(user_id=F(user_field), dimension=F("status"))
+                .annotate(value=Count("id"))
+                .order_by()
+            ):
+                deltas[(row["user_id"], metric, row["dimension"], DashboardPeriod.TOTAL, None)] += row["value"]
+
+        # Firm members
+        for row in (
+            scoped(FirmMember.objects.all(), "firm__user_id")
+            .values(user_id=F("firm__user_id"))
+            .annotate(value=Count("id"))
+            .order_by()
+        ):
+            deltas[(row["user_id"], DashboardMetric.MEMBERS, "", DashboardPeriod.TOTAL, None)] += row["value"]
+
+        return deltas
+
+    @staticmethod
+    def _add_case_rows(deltas, qs, user_field, prefix, count):
+        counter = Count(count, distinct=True)
+
+        for row in (
+            qs.values(user_id=F(user_field), dimension=F(f"{prefix}status"))
+            .annotate(value=counter)
+            .order_by()
+        ):
+            deltas[(row["user_id"], DashboardMetric.CASES, row["dimension"], DashboardPeriod.TOTAL, None)] += row["value"]
+
+        for row in (
+            qs.values(user_id=F(user_field), bucket=TruncMonth(f"{prefix}created_at"))
+            .annotate(value=counter)
+            .order_by()
+        ):
+            bucket = row["bucket"]
+            if hasattr(bucket, "date"):
+                bucket = bucket.date()
+            deltas[(row["user_id"], DashboardMetric.CASES, "", DashboardPeriod.MONTH, bucket)] += row["value"]
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(user_ids=None):
+        deltas = DashboardStatService.compute(user_ids)
+
+        existing = DashboardStat.objects.all()
+        if user_ids is not None:
+            existing = existing.filter(user_id__in=user_ids)
+        existing.delete()
+
+        rows = [
+            DashboardStat(
+                user_id=user_id,
+                metric=metric,
+                dimension=dimension,
+                period=period,
+                bucket=bucket,
+                value=value,
+            )
+            for (user_id, metric, dimension, period, bucket), value in deltas.items()
+            if value
+        ]
+        DashboardStat.objects.bulk_create(rows, batch_size=1000)
+
+        return len(rows)
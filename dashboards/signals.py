@@ -0,0 +1,254 @@
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from bookings.models import Booking
+from cases.models import Case, CaseLawyer
+from clients.models import IDVerification
+from dashboards.services import DashboardStatService
+from firms.models import FirmMember
+
+
+# ---------------------------------------------------
+# Helpers
+# ---------------------------------------------------
+#
+# Each handler computes what the row contributed before the write and
+# what it contributes after, and applies the difference. Soft-deleted
+# rows contribute nothing.
+
+def _previous(model, pk, *fields):
+    # _base_manager also sees soft-deleted rows
+    return model._base_manager.filter(pk=pk).values(*fields).first()
+
+
+def _case_assigned_user_ids(case_id):
+    return set(
+        CaseLawyer.objects
+        .filter(case_id=case_id)
+        .values_list("lawyer__user_id", flat=True)
+    )
+
+
+CASE_STATE_FIELDS = (
+    "status",
+    "created_at",
+    "deleted_at",
+    "owner_lawyer__user_id",
+    "owner_firm__user_id",
+    "client__user_id",
+)
+
+
+def _case_state(case):
+    return {
+        "status": case.status,
+        "created_at": case.created_at,
+        "deleted_at": case.deleted_at,
+        "owner_lawyer__user_id": case.owner_lawyer.user_id if case.owner_lawyer_id else None,
+        "owner_firm__user_id": case.owner_firm.user_id if case.owner_firm_id else None,
+        "client__user_id": case.client.user_id if case.client_id else None,
+    }
+
+
+def _case_deltas(state, assigned_user_ids, sign):
+    if not state or state["deleted_at"] is not None:
+        return Counter()
+
+    user_ids = {
+        state["owner_lawyer__user_id"],
+        state["owner_firm__user_id"],
+        state["client__user_id"],
+    } | assigned_user_ids
+
+    return DashboardStatService.case_deltas(
+        user_ids, state["status"], state["created_at"], sign
+    )
+
+
+# ---------------------------------------------------
+# Cases
+# ---------------------------------------------------
+
+@receiver(pre_save, sender=Case)
+def remember_case_state(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._dashboard_previous = _previous(Case, instance.pk, *CASE_STATE_FIELDS)
+
+
+@receiver(post_save, sender=Case)
+def update_case_stats(sender, instance, created, **kwargs):
+    assigned = set() if created else _case_assigned_user_ids(instance.pk)
+
+    deltas = _case_deltas(_case_state(instance), assigned, 1)
+    deltas.update(
+        _case_deltas(getattr(instance, "_dashboard_previous", None), assigned, -1)
+    )
+
+    DashboardStatService.apply(deltas)
+
+
+@receiver(pre_delete, sender=Case)
+def remember_deleted_case_state(sender, instance, **kwargs):
+    instance._dashboard_previous = _previous(Case, instance.pk, *CASE_STATE_FIELDS)
+
+
+@receiver(post_delete, sender=Case)
+def remove_case_stats(sender, instance, **kwargs):
+    # Assigned lawyers are subtracted by the cascaded CaseLawyer deletes,
+    # which run while the case row still exists
+    DashboardStatService.apply(
+        _case_deltas(getattr(instance, "_dashboard_previous", None), set(), -1)
+    )
+
+
+# ---------------------------------------------------
+# Case lawyers
+# ---------------------------------------------------
+
+def _apply_assignment(case_lawyer, lawyer_user_id, sign):
+    """
+    An assignment counts the case for the lawyer only if the lawyer
+    does not already see it as owner or through another assignment.
+    """
+    case = _previous(Case, case_lawyer.case_id, *CASE_STATE_FIELDS)
+
+    if not case or case["deleted_at"] is not None:
+        return
+
+    if case["owner_lawyer__user_id"] == lawyer_user_id:
+        return
+
+    if (
+        CaseLawyer.objects
+        .filter(case_id=case_lawyer.case_id, lawyer__user_id=lawyer_user_id)
+        .exclude(pk=case_lawyer.pk)
+        .exists()
+    ):
+        return
+
+    DashboardStatService.apply(
+        DashboardStatService.case_deltas(
+            [lawyer_user_id], case["status"], case["created_at"], sign
+        )
+    )
+
+
+@receiver(pre_save, sender=CaseLawyer)
+def remember_case_lawyer_state(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._dashboard_previous = _previous(
+            CaseLawyer, instance.pk, "deleted_at", "lawyer__user_id"
+        )
+
+
+@receiver(post_save, sender=CaseLawyer)
+def update_case_lawyer_stats(sender, instance, **kwargs):
+    previous = getattr(instance, "_dashboard_previous", None)
+    lawyer_user_id = instance.lawyer.user_id
+
+    was_active = bool(previous) and previous["deleted_at"] is None
+    is_active = instance.deleted_at is None
+
+    if was_active and (not is_active or previous["lawyer__user_id"] != lawyer_user_id):
+        _apply_assignment(instance, previous["lawyer__user_id"], -1)
+
+    if is_active and (not was_active or previous["lawyer__user_id"] != lawyer_user_id):
+        _apply_assignment(instance, lawyer_user_id, 1)
+
+
+@receiver(post_delete, sender=CaseLawyer)
+def remove_case_lawyer_stats(sender, instance, **kwargs):
+    if instance.deleted_at is None:
+        _apply_assignment(instance, instance.lawyer.user_id, -1)
+
+
+# ---------------------------------------------------
+# Bookings
+# ---------------------------------------------------
+
+def _booking_deltas(state, sign):
+    if not state or state["deleted_at"] is not None:
+        return Counter()
+
+    return DashboardStatService.booking_deltas(
+        state["created_to_id"], state["created_by_id"], state["status"], sign
+    )
+
+
+def _booking_state(booking):
+    return {
+        "status": booking.status,
+        "deleted_at": booking.deleted_at,
+        "created_to_id": booking.created_to_id,
+        "created_by_id": booking.created_by_id,
+    }
+
+
+@receiver(pre_save, sender=Booking)
+def remember_booking_state(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._dashboard_previous = _previous(
+            Booking, instance.pk, "status", "deleted_at", "created_to_id", "created_by_id"
+        )
+
+
+@receiver(post_save, sender=Booking)
+def update_booking_stats(sender, instance, **kwargs):
+    deltas = _booking_deltas(_booking_state(instance), 1)
+    deltas.update(_booking_deltas(getattr(instance, "_dashboard_previous", None), -1))
+    DashboardStatService.apply(deltas)
+
+
+@receiver(post_delete, sender=Booking)
+def remove_booking_stats(sender, instance, **kwargs):
+    DashboardStatService.apply(_booking_deltas(_booking_state(instance), -1))
+
+
+# ---------------------------------------------------
+# Firm members
+# ---------------------------------------------------
+
+def _member_deltas(state, sign):
+    if not state or state["deleted_at"] is not None:
+        return Counter()
+
+    return DashboardStatService.member_deltas(state["firm__user_id"], sign)
+
+
+@receiver(pre_save, sender=FirmMember)
+def remember_member_state(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._dashboard_previous = _previous(
+            FirmMember, instance.pk, "deleted_at", "firm__user_id"
+        )
+
+
+@receiver(post_save, sender=FirmMember)
+def update_member_stats(sender, instance, **kwargs):
+    state = {"deleted_at": instance.deleted_at, "firm__user_id": instance.firm.user_id}
+
+    deltas = _member_deltas(state, 1)
+    deltas.update(_member_deltas(getattr(instance, "_dashboard_previous", None), -1))
+    DashboardStatService.apply(deltas)
+
+
+@receiver(post_delete, sender=FirmMember)
+def remove_member_stats(sender, instance, **kwargs):
+    DashboardStatService.apply(
+        _member_deltas(
+            {"deleted_at": instance.deleted_at, "firm__user_id": instance.firm.user_id},
+            -1,
+        )
+    )
+
+
+# ---------------------------------------------------
+# Client verification (shown on the client dashboard)
+# ---------------------------------------------------
+
+@receiver(post_save, sender=IDVerification)
+@receiver(post_delete, sender=IDVerification)
+def invalidate_client_dashboard(sender, instance, **kwargs):
+    DashboardStatService.invalidate([instance.user_id])
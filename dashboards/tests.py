@@ -0,0 +1,180 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from addresses.models import Address, District, Municipality, Province, Ward
+from base.constants.booking_status import BookingStatus
+from base.constants.case import CaseStatus
+from base.constants.user_roles import UserRoles
+from bookings.models import Booking
+from cases.models import Case, CaseCategory, CaseLawyer
+from clients.models import Client
+from dashboards.engine import DashboardQueryEngine
+from dashboards.models import DashboardStat
+from dashboards.services import DashboardStatService
+from firms.models import Firm, FirmMember
+from lawyers.models import Lawyer
+
+
+class DashboardQueryCountTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        province = Province.objects.create(title="Bagmati", title_nepali="बागमती", code=3)
+        district = District.objects.create(
+            province=province, title="Kathmandu", title_nepali="काठमाडौं", code=27
+        )
+        municipality = Municipality.objects.create(
+            district=district, title="Kathmandu", title_nepali="काठमाडौं", code=27001
+        )
+        ward = Ward.objects.create(municipality=municipality, number=1, number_nepali="१")
+
+        def address():
+            return Address.objects.create(
+                province=province,
+                district=district,
+                municipality=municipality,
+                ward=ward,
+            )
+
+        cls.lawyer_user = User.objects.create_user(
+            email="lawyer@example.com", password="x", role=UserRoles.LAWYER
+        )
+        cls.firm_user = User.objects.create_user(
+            email="firm@example.com", password="x", role=UserRoles.FIRM
+        )
+        cls.client_user = User.objects.create_user(
+            email="client@example.com", password="x", role=UserRoles.CLIENT
+        )
+
+        lawyer = Lawyer.objects.create(user=cls.lawyer_user, address=address())
+        firm = Firm.objects.create(user=cls.firm_user, address=address())
+        client = Client.objects.create(user=cls.client_user)
+
+        FirmMember.objects.create(firm=firm, lawyer=lawyer)
+
+        category = CaseCategory.objects.create(name="Civil")
+
+        for status in (CaseStatus.DRAFT, CaseStatus.ONGOING, CaseStatus.ONGOING):
+            case = Case.objects.create(
+                owner_type=UserRoles.LAWYER,
+                owner_lawyer=lawyer,
+                created_by=cls.lawyer_user,
+                client=client,
+                title="Personal",
+                case_category=category,
+                court_type="district",
+                status=status,
+            )
+            CaseLawyer.objects.create(case=case, lawyer=lawyer, role="lead")
+
+        firm_case = Case.objects.create(
+            owner_type=UserRoles.FIRM,
+            owner_firm=firm,
+            created_by=cls.firm_user,
+            title="Firm",
+            case_category=category,
+            court_type="district",
+            status=CaseStatus.COMPLETED,
+        )
+        CaseLawyer.objects.create(case=firm_case, lawyer=lawyer, role="assistant")
+
+        for status in (BookingStatus.PENDING, BookingStatus.ACCEPTED):
+            Booking.objects.create(
+                created_by=cls.client_user,
+                created_to=cls.lawyer_user,
+                case_category=category,
+                court_type="district",
+                description="Consultation",
+                date="2030-01-01",
+                status=status,
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def get_dashboard(self, user, url):
+        api = APIClient()
+        api.force_authenticate(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(queries), 2, [q["sql"] for q in queries])
+        return response.data
+
+    def assert_dashboards(self):
+        lawyer = self.get_dashboard(self.lawyer_user, "/api/lawyers/dashboard/")
+        self.assertEqual(lawyer["total_cases"], 4)
+        self.assertEqual(lawyer["total_ongoing_cases"], 2)
+        self.assertEqual(lawyer["total_pending_bookings"], 1)
+        self.assertEqual(len(lawyer["cases_per_month"]), 12)
+        self.assertEqual(lawyer["cases_per_month"][-1]["count"], 4)
+
+        firm = self.get_dashboard(self.firm_user, "/api/firms/dashboard/")
+        self.assertEqual(firm["total_cases"], 1)
+        self.assertEqual(firm["total_ongoing_cases"], 0)
+        self.assertEqual(firm["total_members"], 1)
+
+        client = self.get_dashboard(self.client_user, "/api/clients/dashboard/")
+        self.assertEqual(client["active_cases"], 3)
+        self.assertEqual(client["accepted_bookings"], 1)
+
+    @override_settings(DASHBOARD_USE_ROLLUPS=True)
+    def test_rollup_dashboards(self):
+        self.assert_dashboards()
+
+    @override_settings(DASHBOARD_USE_ROLLUPS=False)
+    def test_live_dashboards(self):
+        self.assert_dashboards()
+
+    def test_live_matches_rollups(self):
+        for user in (self.lawyer_user, self.firm_user, self.client_user):
+            self.assertEqual(
+                DashboardQueryEngine.stats(user, rollups=False),
+                DashboardQueryEngine.stats(user, rollups=True),
+            )
+
+    def test_cached_until_invalidated(self):
+        self.get_dashboard(self.lawyer_user, "/api/lawyers/dashboard/")
+
+        api = APIClient()
+        api.force_authenticate(self.lawyer_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api.get("/api/lawyers/dashboard/")
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(response.data["total_pending_bookings"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Booking.objects.create(
+                created_by=self.client_user,
+                created_to=self.lawyer_user,
+                case_category=CaseCategory.objects.get(),
+                court_type="district",
+                description="Follow-up",
+                date="2030-01-02",
+            )
+
+        data = self.get_dashboard(self.lawyer_user, "/api/lawyers/dashboard/")
+        self.assertEqual(data["total_pending_bookings"], 2)
+
+    def test_migration_matches_rebuild(self):
+        fields = ("user", "metric", "dimension", "period", "bucket", "value")
+
+        DashboardStatService.rebuild()
+        expected = sorted(DashboardStat.objects.values_list(*fields), key=str)
+        DashboardStat.objects.all().delete()
+
+        import_module("dashboards.migrations.0001_initial").fill_stats(apps, None)
+
+        self.assertTrue(expected)
+        self.assertEqual(sorted(DashboardStat.objects.values_list(*fields), key=str), expected)
+
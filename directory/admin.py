@@ -0,0 +1,6 @@
+from django.contrib import admin
+
+from directory.models import DirectoryEntry, RecommendationCandidate
+
+admin.site.register(DirectoryEntry)
+admin.site.register(RecommendationCandidate)
@@ -0,0 +1,13 @@
+from .directory_serializers import (
+    DirectoryAutocompleteSerializer,
+    DirectoryRankSerializer,
+    LawyerDiscoverSerializer,
+    FirmDiscoverSerializer,
+)
+
+__all__ = [
+    "DirectoryAutocompleteSerializer",
+    "DirectoryRankSerializer",
+    "LawyerDiscoverSerializer",
+    "FirmDiscoverSerializer",
+]
@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from directory.constants import DirectoryProximity
+from firms.api.serializers import FirmPublicSerializer
+from lawyers.api.serializers import LawyerPublicSerializer
+
+
+class DirectoryAutocompleteSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    rank = serializers.FloatField(read_only=True)
+
+
+class DirectoryRankSerializer(serializers.Serializer):
+    proximity = serializers.ChoiceField(
+        choices=DirectoryProximity.choices,
+        read_only=True,
+        help_text="3 same municipality, 2 same district, 1 same province, 0 elsewhere",
+    )
+    matched_services = serializers.IntegerField(read_only=True)
+
+
+class LawyerDiscoverSerializer(LawyerPublicSerializer, DirectoryRankSerializer):
+    pass
+
+
+class FirmDiscoverSerializer(FirmPublicSerializer, DirectoryRankSerializer):
+    pass
@@ -0,0 +1,16 @@
+from .autocomplete_views import (
+    LawyerAutocompleteView,
+    FirmAutocompleteView,
+)
+
+from .discover_views import (
+    LawyerDiscoverView,
+    FirmDiscoverView,
+)
+
+__all__ = [
+    "LawyerAutocompleteView",
+    "FirmAutocompleteView",
+    "LawyerDiscoverView",
+    "FirmDiscoverView",
+]
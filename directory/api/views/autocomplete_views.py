@@ -0,0 +1,149 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from directory.api.serializers import DirectoryAutocompleteSerializer
+from directory.constants import DirectoryEntryKind
+from directory.services import DirectoryService
+
+
+FILTER_PARAMETERS = [
+    OpenApiParameter(
+        name="search",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=True,
+        description="Name or service typed so far (min 2 characters), typos tolerated",
+    ),
+    OpenApiParameter(
+        name="limit",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        description="Max suggestions (default 10, max 20)",
+    ),
+    OpenApiParameter(
+        name="services",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description="Comma-separated CaseCategory IDs",
+    ),
+    OpenApiParameter(
+        name="province",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        description="Province ID",
+    ),
+    OpenApiParameter(
+        name="district",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        description="District ID",
+    ),
+]
+
+
+class DirectoryAutocompleteView(APIView):
+    """
+    Ranked name suggestions for the public directory.
+    Reads only the directory entry table (id, name, rank).
+    """
+
+    permission_classes = [AllowAny]
+
+    kind = None
+    profile_field = None
+
+    MIN_LENGTH = 2
+    DEFAULT_LIMIT = 10
+    MAX_LIMIT = 20
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get("limit", self.DEFAULT_LIMIT))
+        except ValueError:
+            limit = self.DEFAULT_LIMIT
+
+        return max(1, min(limit, self.MAX_LIMIT))
+
+    def get_filters(self, request):
+        return {
+            "services": request.query_params.get("services"),
+            "province": request.query_params.get("province"),
+            "district": request.query_params.get("district"),
+        }
+
+    def get(self, request):
+        search = (request.query_params.get("search") or "").strip()
+
+        if len(search) < self.MIN_LENGTH:
+            return Response([])
+
+        rows = DirectoryService.suggest(
+            DirectoryService.filter(self.kind, **self.get_filters(request)),
+            search,
+            self.get_limit(request),
+        ).values(self.profile_field, "name", "rank")
+
+        with DirectoryService.word_similarity():
+            data = [
+                {"id": row[self.profile_field], "name": row["name"], "rank": row["rank"]}
+                for row in rows
+            ]
+
+        return Response(DirectoryAutocompleteSerializer(data, many=True).data)
+
+
+class LawyerAutocompleteView(DirectoryAutocompleteView):
+    kind = DirectoryEntryKind.LAWYER
+    profile_field = "lawyer_id"
+
+    @extend_schema(
+        summary="Autocomplete lawyers",
+        description=(
+            "Verified lawyers whose name or services fuzzy-match the search, "
+            "best match first. Accepts the lawyer list filters."
+        ),
+        parameters=FILTER_PARAMETERS + [
+            OpenApiParameter(
+                name="has_firm",
+                type=bool,
+                location=OpenApiParameter.QUERY,
+                description="Filter lawyers by firm association",
+            ),
+        ],
+        responses={200: DirectoryAutocompleteSerializer(many=True)},
+        tags=["lawyers"],
+    )
+    def get(self, request):
+        return super().get(request)
+
+    def get_filters(self, request):
+        filters = super().get_filters(request)
+
+        value = (request.query_params.get("has_firm") or "").lower()
+        if value in ["true", "1", "yes"]:
+            filters["has_firm"] = True
+        elif value in ["false", "0", "no"]:
+            filters["has_firm"] = False
+
+        return filters
+
+
+class FirmAutocompleteView(DirectoryAutocompleteView):
+    kind = DirectoryEntryKind.FIRM
+    profile_field = "firm_id"
+
+    @extend_schema(
+        summary="Autocomplete firms",
+        description=(
+            "Verified firms whose name or services fuzzy-match the search, "
+            "best match first. Accepts the firm list filters."
+        ),
+        parameters=FILTER_PARAMETERS,
+        responses={200: DirectoryAutocompleteSerializer(many=True)},
+        tags=["firms"],
+    )
+    def get(self, request):
+        return super().get(request)
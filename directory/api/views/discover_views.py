@@ -0,0 +1,176 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from base.constants.user_roles import UserRoles
+from directory.api.serializers import FirmDiscoverSerializer, LawyerDiscoverSerializer
+from directory.constants import DirectoryEntryKind
+from directory.services import DirectoryService
+
+
+DISCOVER_PARAMETERS = [
+    OpenApiParameter(
+        name="municipality",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        description="Municipality ID (most specific location wins)",
+    ),
+    OpenApiParameter(
+        name="district",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        description="District ID",
+    ),
+    OpenApiParameter(
+        name="province",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        description="Province ID",
+    ),
+    OpenApiParameter(
+        name="services",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description="Comma-separated CaseCategory IDs; at least one must match",
+    ),
+    OpenApiParameter(
+        name="limit",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        description="Max results (default 20, max 50)",
+    ),
+]
+
+PROFILE_ATTRS = {
+    UserRoles.CLIENT: "client_profile",
+    UserRoles.LAWYER: "lawyer_profile",
+    UserRoles.FIRM: "firm_profile",
+}
+
+
+class DirectoryDiscoverView(APIView):
+    """
+    Verified lawyers / firms ranked by closeness to a location in the
+    address hierarchy, then by service match.
+    """
+
+    permission_classes = [AllowAny]
+
+    kind = None
+    serializer_class = None
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 50
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get("limit", self.DEFAULT_LIMIT))
+        except ValueError:
+            limit = self.DEFAULT_LIMIT
+
+        return max(1, min(limit, self.MAX_LIMIT))
+
+    def get_location(self, request):
+        params = request.query_params
+
+        if any(params.get(level) for level in ("municipality", "district", "province")):
+            return DirectoryService.resolve_location(
+                province=params.get("province"),
+                district=params.get("district"),
+                municipality=params.get("municipality"),
+            )
+
+        # Default to the caller's own address
+        user = request.user
+        profile = (
+            getattr(user, PROFILE_ATTRS[user.role], None)
+            if user.is_authenticated and user.role in PROFILE_ATTRS
+            else None
+        )
+        address = getattr(profile, "address", None)
+
+        if address is None:
+            return None, None, None
+
+        return address.province_id, address.district_id, address.municipality_id
+
+    def get_filters(self, request):
+        return {}
+
+    def get(self, request):
+        entries = DirectoryService.nearby(
+            self.kind,
+            self.get_location(request),
+            services=request.query_params.get("services"),
+            limit=self.get_limit(request),
+            **self.get_filters(request),
+        )
+
+        data = []
+        for entry in entries:
+            profile = getattr(entry, self.kind)
+            data.append({
+                "user": profile.user,
+                "profile": profile,
+                "verification": getattr(profile.user, DirectoryService.VERIFICATION[self.kind]),
+                "proximity": entry.proximity,
+                "matched_services": entry.matched_services,
+            })
+
+        return Response(self.serializer_class(data, many=True).data)
+
+
+class LawyerDiscoverView(DirectoryDiscoverView):
+    kind = DirectoryEntryKind.LAWYER
+    serializer_class = LawyerDiscoverSerializer
+
+    @extend_schema(
+        summary="Discover nearby lawyers",
+        description=(
+            "Verified lawyers nearest first (same municipality, district, "
+            "province, elsewhere), then by number of matched services. "
+            "Without a location parameter the caller's own address is used."
+        ),
+        parameters=DISCOVER_PARAMETERS + [
+            OpenApiParameter(
+                name="has_firm",
+                type=bool,
+                location=OpenApiParameter.QUERY,
+                description="Filter lawyers by firm association",
+            ),
+        ],
+        responses={200: LawyerDiscoverSerializer(many=True)},
+        tags=["lawyers"],
+    )
+    def get(self, request):
+        return super().get(request)
+
+    def get_filters(self, request):
+        value = (request.query_params.get("has_firm") or "").lower()
+
+        if value in ["true", "1", "yes"]:
+            return {"has_firm": True}
+        if value in ["false", "0", "no"]:
+            return {"has_firm": False}
+        return {}
+
+
+class FirmDiscoverView(DirectoryDiscoverView):
+    kind = DirectoryEntryKind.FIRM
+    serializer_class = FirmDiscoverSerializer
+
+    @extend_schema(
+        summary="Discover nearby firms",
+        description=(
+            "Verified firms nearest first (same municipality, district, "
+            "province, elsewhere), then by number of matched services. "
+            "Without a location parameter the caller's own address is used."
+        ),
+        parameters=DISCOVER_PARAMETERS,
+        responses={200: FirmDiscoverSerializer(many=True)},
+        tags=["firms"],
+    )
+    def get(self, request):
+        return super().get(request)
@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class DirectoryEntryKind(models.TextChoices):
+    LAWYER = "lawyer", "Lawyer"
+    FIRM = "firm", "Firm"
+
+
+class DirectoryProximity(models.IntegerChoices):
+    # Higher is nearer; the address data has no coordinates,
+    # so distance is the deepest shared level of the hierarchy
+    ELSEWHERE = 0, "Elsewhere"
+    PROVINCE = 1, "Same province"
+    DISTRICT = 2, "Same district"
+    MUNICIPALITY = 3, "Same municipality"
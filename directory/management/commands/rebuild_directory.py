@@ -0,0 +1,17 @@
+# directory/management/commands/rebuild_directory.py
+
+from django.core.management.base import BaseCommand
+
+from directory.services import DirectoryService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the directory search rows from verified lawyers and firms, "
+        "repairing rows left stale by a failed sync at commit."
+    )
+
+    def handle(self, *args, **options):
+        rows = DirectoryService.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} directory entries"))
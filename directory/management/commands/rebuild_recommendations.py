@@ -0,0 +1,18 @@
+# directory/management/commands/rebuild_recommendations.py
+
+from django.core.management.base import BaseCommand
+
+from directory.services import RecommendationService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the per case category recommendation pools, including the "
+        "accepted booking and active case counts they are ranked by, "
+        "repairing rows left stale by a failed refresh at commit."
+    )
+
+    def handle(self, *args, **options):
+        rows = RecommendationService.refresh()
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} recommendation candidates"))
@@ -0,0 +1,104 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:24
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def fill_directory(apps, schema_editor):
+    # DirectoryService.rebuild() over the historical models; their
+    # managers don't hide soft-deleted rows, so filter those here
+    DirectoryEntry = apps.get_model("directory", "DirectoryEntry")
+    CaseCategory = apps.get_model("cases", "CaseCategory")
+    Lawyer = apps.get_model("lawyers", "Lawyer")
+    Firm = apps.get_model("firms", "Firm")
+    FirmMember = apps.get_model("firms", "FirmMember")
+
+    services = models.Prefetch(
+        "services", queryset=CaseCategory.objects.filter(deleted_at__isnull=True)
+    )
+    in_firm = set(
+        FirmMember.objects.filter(deleted_at__isnull=True).values_list("lawyer_id", flat=True)
+    )
+
+    def entry(kind, profile, name, has_firm=False):
+        address = profile.address
+        categories = list(profile.services.all())
+
+        return DirectoryEntry(
+            kind=kind,
+            lawyer_id=profile.pk if kind == "lawyer" else None,
+            firm_id=profile.pk if kind == "firm" else None,
+            name=name,
+            search_text=" ".join([name, *sorted(c.name for c in categories)]).lower(),
+            service_ids=sorted(c.id for c in categories),
+            province_id=address.province_id,
+            district_id=address.district_id,
+            municipality_id=address.municipality_id,
+            has_firm=has_firm,
+        )
+
+    lawyers = (
+        Lawyer.objects
+        .filter(deleted_at__isnull=True, user__bar_verification__status="VERIFIED")
+        .select_related("address", "user__bar_verification")
+        .prefetch_related(services)
+    )
+    firms = (
+        Firm.objects
+        .filter(deleted_at__isnull=True, user__firm_verification__status="VERIFIED")
+        .select_related("address", "user__firm_verification")
+        .prefetch_related(services)
+    )
+
+    entries = [
+        entry("lawyer", lawyer, lawyer.user.bar_verification.full_name, lawyer.pk in in_firm)
+        for lawyer in lawyers
+    ] + [
+        entry("firm", firm, firm.user.firm_verification.firm_name)
+        for firm in firms
+    ]
+    DirectoryEntry.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('addresses', '0001_initial'),
+        ('cases', '0001_initial'),
+        ('firms', '0004_firminvitation_firmmember'),
+        ('lawyers', '0003_alter_lawyer_address'),
+    ]
+
+    operations = [
+        # Shared with other apps' trigram indexes: never dropped on rollback
+        migrations.RunSQL("CREATE EXTENSION IF NOT EXISTS pg_trgm", migrations.RunSQL.noop),
+        migrations.CreateModel(
+            name='DirectoryEntry',
+            fields=[
+                ('deleted_at', models.DateTimeField(blank=True, default=None, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('lawyer', 'Lawyer'), ('firm', 'Firm')], max_length=10)),
+                ('name', models.CharField(max_length=255)),
+                ('search_text', models.TextField(blank=True, default='')),
+                ('service_ids', django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), blank=True, default=list, size=None)),
+                ('has_firm', models.BooleanField(default=False)),
+                ('district', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='addresses.district')),
+                ('firm', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='directory_entry', to='firms.firm')),
+                ('lawyer', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='directory_entry', to='lawyers.lawyer')),
+                ('municipality', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='addresses.municipality')),
+                ('province', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='addresses.province')),
+            ],
+            options={
+                'verbose_name_plural': 'directory entries',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_text'], name='directory_search_text_trgm', opclasses=['gin_trgm_ops']), django.contrib.postgres.indexes.GistIndex(fields=['search_text'], name='directory_search_text_knn', opclasses=['gist_trgm_ops']), django.contrib.postgres.indexes.GinIndex(fields=['service_ids'], name='directory_service_ids_gin'), models.Index(fields=['kind', 'name'], name='directory_kind_name'), models.Index(fields=['kind', 'province', 'district'], name='directory_kind_location')],
+            },
+        ),
+        migrations.RunPython(fill_directory, migrations.RunPython.noop),
+    ]
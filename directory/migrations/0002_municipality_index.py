@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('addresses', '0001_initial'),
+        ('directory', '0001_initial'),
+        ('firms', '0004_firminvitation_firmmember'),
+        ('lawyers', '0003_alter_lawyer_address'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='directoryentry',
+            index=models.Index(fields=['kind', 'municipality'], name='directory_kind_municipality'),
+        ),
+    ]
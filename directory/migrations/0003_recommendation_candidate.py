@@ -0,0 +1,114 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:58
+
+import math
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+ACTIVE_CASE_STATUSES = ["registered", "ongoing"]
+
+
+def fill_candidates(apps, schema_editor):
+    # RecommendationService.refresh() over the historical models; their
+    # managers don't hide soft-deleted rows, so filter those here
+    DirectoryEntry = apps.get_model("directory", "DirectoryEntry")
+    RecommendationCandidate = apps.get_model("directory", "RecommendationCandidate")
+    CaseCategory = apps.get_model("cases", "CaseCategory")
+    Case = apps.get_model("cases", "Case")
+    CaseLawyer = apps.get_model("cases", "CaseLawyer")
+    Booking = apps.get_model("bookings", "Booking")
+
+    def counts(qs, key, category="case_category_id"):
+        return {
+            (row[key], row[category]): row["total"]
+            for row in qs.values(key, category).annotate(
+                total=models.Count("id", distinct=True)
+            )
+        }
+
+    bookings = counts(
+        Booking.objects.filter(deleted_at__isnull=True, status="accepted"),
+        "created_to_id",
+    )
+    cases = counts(
+        CaseLawyer.objects.filter(
+            deleted_at__isnull=True,
+            case__deleted_at__isnull=True,
+            case__status__in=ACTIVE_CASE_STATUSES,
+        ),
+        "lawyer_id",
+        "case__case_category_id",
+    )
+    cases.update(counts(
+        Case.objects.filter(
+            deleted_at__isnull=True,
+            owner_firm__isnull=False,
+            status__in=ACTIVE_CASE_STATUSES,
+        ),
+        "owner_firm_id",
+    ))
+    known = set(
+        CaseCategory.objects.filter(deleted_at__isnull=True).values_list("id", flat=True)
+    )
+
+    candidates = []
+    for entry in DirectoryEntry.objects.values(
+        "id", "kind", "service_ids", "lawyer_id", "firm_id",
+        "lawyer__user_id", "firm__user_id",
+    ):
+        user_id = entry["lawyer__user_id"] or entry["firm__user_id"]
+        profile_id = entry["lawyer_id"] or entry["firm_id"]
+
+        for category_id in entry["service_ids"]:
+            if category_id not in known:
+                continue
+
+            accepted_bookings = bookings.get((user_id, category_id), 0)
+            active_cases = cases.get((profile_id, category_id), 0)
+
+            candidates.append(RecommendationCandidate(
+                case_category_id=category_id,
+                entry_id=entry["id"],
+                kind=entry["kind"],
+                accepted_bookings=accepted_bookings,
+                active_cases=active_cases,
+                score=round(
+                    math.log1p(accepted_bookings) + 0.5 * math.log1p(active_cases), 6
+                ),
+            ))
+
+    RecommendationCandidate.objects.bulk_create(candidates, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0001_initial'),
+        ('cases', '0009_caseevent'),
+        ('directory', '0002_municipality_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationCandidate',
+            fields=[
+                ('deleted_at', models.DateTimeField(blank=True, default=None, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('lawyer', 'Lawyer'), ('firm', 'Firm')], max_length=10)),
+                ('accepted_bookings', models.PositiveIntegerField(default=0)),
+                ('active_cases', models.PositiveIntegerField(default=0)),
+                ('score', models.FloatField(default=0)),
+                ('case_category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='cases.casecategory')),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='directory.directoryentry')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['case_category', 'kind', '-score'], name='recommendation_pool')],
+                'constraints': [models.UniqueConstraint(fields=('case_category', 'entry'), name='recommendation_category_entry')],
+            },
+        ),
+        migrations.RunPython(fill_candidates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,156 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.db import models
+
+from addresses.models import District, Municipality, Province
+from base.models import AbstractBaseModel
+from cases.models import CaseCategory
+from directory.constants import DirectoryEntryKind
+from firms.models import Firm
+from lawyers.models import Lawyer
+
+
+class DirectoryEntry(AbstractBaseModel):
+    """
+    Public search row of one verified lawyer or firm.
+
+    Denormalized from the profile, its verification, services and
+    address so directory listings filter a single table. Only verified
+    profiles have a row.
+
+    Filled by the initial migration, maintained by directory.signals and
+    repaired with `manage.py rebuild_directory`.
+    """
+
+    kind = models.CharField(
+        max_length=10,
+        choices=DirectoryEntryKind.choices
+    )
+
+    lawyer = models.OneToOneField(
+        Lawyer,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="directory_entry"
+    )
+
+    firm = models.OneToOneField(
+        Firm,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="directory_entry"
+    )
+
+    # BarVerification.full_name / FirmVerification.firm_name
+    name = models.CharField(max_length=255)
+
+    # Lower-cased name and service names; fuzzy search target
+    search_text = models.TextField(blank=True, default="")
+
+    # CaseCategory ids of the profile's services
+    service_ids = ArrayField(models.UUIDField(), default=list, blank=True)
+
+    province = models.ForeignKey(
+        Province,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+    district = models.ForeignKey(
+        District,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+    municipality = models.ForeignKey(
+        Municipality,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    # Lawyers only: member of a firm
+    has_firm = models.BooleanField(default=False)
+
+    class Meta:
+        verbose_name_plural = "directory entries"
+        indexes = [
+            # Substring / similarity filters and counts
+            GinIndex(
+                fields=["search_text"],
+                name="directory_search_text_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            # Nearest-first (trigram distance) ordering for autocomplete
+            GistIndex(
+                fields=["search_text"],
+                name="directory_search_text_knn",
+                opclasses=["gist_trgm_ops"],
+            ),
+            GinIndex(fields=["service_ids"], name="directory_service_ids_gin"),
+            models.Index(fields=["kind", "name"], name="directory_kind_name"),
+            models.Index(fields=["kind", "province", "district"], name="directory_kind_location"),
+            models.Index(fields=["kind", "municipality"], name="directory_kind_municipality"),
+        ]
+
+    def __str__(self):
+        return f"DirectoryEntry({self.kind}, {self.name})"
+
+
+class RecommendationCandidate(AbstractBaseModel):
+    """
+    One directory entry in the recommendation pool of a case category
+    it offers, with the ranking signals for that category.
+
+    Filled by its migration, maintained with the directory rows
+    (verification, services, address) and refreshed on booking and case
+    writes; `manage.py rebuild_recommendations` repairs drift.
+    """
+
+    case_category = models.ForeignKey(
+        CaseCategory,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    entry = models.ForeignKey(
+        DirectoryEntry,
+        on_delete=models.CASCADE,
+        related_name="recommendations"
+    )
+
+    # Copy of entry.kind; pools are read per kind
+    kind = models.CharField(
+        max_length=10,
+        choices=DirectoryEntryKind.choices
+    )
+
+    # Accepted bookings in this category
+    accepted_bookings = models.PositiveIntegerField(default=0)
+
+    # Registered / ongoing cases in this category
+    active_cases = models.PositiveIntegerField(default=0)
+
+    score = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["case_category", "entry"],
+                name="recommendation_category_entry",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["case_category", "kind", "-score"],
+                name="recommendation_pool",
+            ),
+        ]
+
+    def __str__(self):
+        return f"RecommendationCandidate({self.kind}, {self.case_category_id}, {self.score})"
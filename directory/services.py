@@ -0,0 +1,764 @@
+import logging
+import math
+import threading
+from contextlib import contextmanager
+from uuid import UUID
+
+from django.contrib.postgres.search import TrigramWordDistance, TrigramWordSimilarity
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    Func,
+    IntegerField,
+    OuterRef,
+    Q,
+    UUIDField,
+    Value,
+)
+from rest_framework.exceptions import ValidationError
+
+from addresses.services.address_tree import get_address_tree
+from base.cache import bump_generations, get_generation, get_or_compute, get_or_revalidate
+from base.constants.booking_status import BookingStatus
+from base.constants.case import CaseStatus
+from base.constants.verification import VerificationStatus
+from directory.constants import DirectoryEntryKind, DirectoryProximity
+from bookings.models import Booking
+from cases.models import Case, CaseCategory, CaseLawyer
+from directory.models import DirectoryEntry, RecommendationCandidate
+from firms.models import Firm, FirmMember
+from lawyers.models import Lawyer
+
+logger = logging.getLogger(__name__)
+
+
+class MatchedServices(Func):
+    """
+    Number of ids shared by two uuid[] expressions.
+    """
+    template = "cardinality(ARRAY(SELECT unnest(%(expressions)s)))"
+    arg_joiner = ") INTERSECT SELECT unnest("
+    output_field = IntegerField()
+
+
+class DirectoryService:
+    """
+    Maintains and queries the DirectoryEntry search rows.
+
+    Writes queue the affected profile (by user id) and the rows are
+    re-derived once at commit, so a profile update that touches the
+    address, services and verification in one request is synced once.
+    """
+
+    # Profile user -> verification relation
+    VERIFICATION = {
+        DirectoryEntryKind.LAWYER: "bar_verification",
+        DirectoryEntryKind.FIRM: "firm_verification",
+    }
+
+    UPDATE_FIELDS = [
+        "name",
+        "search_text",
+        "service_ids",
+        "province",
+        "district",
+        "municipality",
+        "has_firm",
+        "updated_at",
+    ]
+
+    # -------------------------
+    # SOURCES
+    # -------------------------
+    @staticmethod
+    def lawyer_queryset():
+        return (
+            Lawyer.objects
+            .filter(user__bar_verification__status=VerificationStatus.VERIFIED)
+            .select_related("address", "user__bar_verification")
+            .prefetch_related("services")
+            .annotate(
+                in_firm=Exists(FirmMember.objects.filter(lawyer=OuterRef("pk")))
+            )
+        )
+
+    @staticmethod
+    def firm_queryset():
+        return (
+            Firm.objects
+            .filter(user__firm_verification__status=VerificationStatus.VERIFIED)
+            .select_related("address", "user__firm_verification")
+            .prefetch_related("services")
+        )
+
+    @staticmethod
+    def search_text(name, service_names):
+        return " ".join([name, *sorted(service_names)]).lower()
+
+    @staticmethod
+    def _entry(kind, profile, name, has_firm=False):
+        address = profile.address
+        services = profile.services.all()
+
+        return DirectoryEntry(
+            kind=kind,
+            lawyer=profile if kind == DirectoryEntryKind.LAWYER else None,
+            firm=profile if kind == DirectoryEntryKind.FIRM else None,
+            name=name,
+            search_text=DirectoryService.search_text(
+                name, [service.name for service in services]
+            ),
+            service_ids=sorted(service.id for service in services),
+            province_id=address.province_id,
+            district_id=address.district_id,
+            municipality_id=address.municipality_id,
+            has_firm=has_firm,
+        )
+
+    @staticmethod
+    def lawyer_entries(qs):
+        return [
+            DirectoryService._entry(
+                DirectoryEntryKind.LAWYER,
+                lawyer,
+                lawyer.user.bar_verification.full_name,
+                has_firm=lawyer.in_firm,
+            )
+            for lawyer in qs
+        ]
+
+    @staticmethod
+    def firm_entries(qs):
+        return [
+            DirectoryService._entry(
+                DirectoryEntryKind.FIRM,
+                firm,
+                firm.user.firm_verification.firm_name,
+            )
+            for firm in qs
+        ]
+
+    # -------------------------
+    # SYNC
+    # -------------------------
+    _pending = threading.local()
+
+    @staticmethod
+    def queue(kind, user_ids):
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if not user_ids:
+            return
+
+        pending = getattr(DirectoryService._pending, "users", None)
+        if pending is None:
+            pending = DirectoryService._pending.users = {}
+
+        pending.setdefault(kind, set()).update(user_ids)
+        transaction.on_commit(DirectoryService._flush)
+
+    @staticmethod
+    def _flush():
+        pending = getattr(DirectoryService._pending, "users", None)
+        if not pending:
+            return
+
+        DirectoryService._pending.users = {}
+
+        sync = {
+            DirectoryEntryKind.LAWYER: DirectoryService.sync_lawyers,
+            DirectoryEntryKind.FIRM: DirectoryService.sync_firms,
+        }
+
+        # Runs after the request's own data is committed: a failure here
+        # must not turn the write into a 500. `rebuild_directory` repairs
+        # the rows.
+        for kind, user_ids in pending.items():
+            try:
+                PublicProfileCacheService.invalidate(kind, user_ids)
+                sync[kind](user_ids)
+            except Exception:
+                logger.exception("Directory sync failed for %s users %s", kind, user_ids)
+
+    @staticmethod
+    def sync_lawyers(user_ids):
+        entries = DirectoryService.lawyer_entries(
+            DirectoryService.lawyer_queryset().filter(user_id__in=user_ids)
+        )
+        DirectoryService._save(
+            entries,
+            DirectoryEntry.objects.filter(lawyer__user_id__in=user_ids),
+            "lawyer",
+        )
+
+    @staticmethod
+    def sync_firms(user_ids):
+        entries = DirectoryService.firm_entries(
+            DirectoryService.firm_queryset().filter(user_id__in=user_ids)
+        )
+        DirectoryService._save(
+            entries,
+            DirectoryEntry.objects.filter(firm__user_id__in=user_ids),
+            "firm",
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def _save(entries, existing, profile_field):
+        # Profiles no longer verified / deleted lose their row
+        stale = existing.exclude(
+            **{f"{profile_field}_id__in": [getattr(e, f"{profile_field}_id") for e in entries]}
+        )
+        RecommendationService.forget(stale.values_list("id", flat=True))
+        stale.delete()
+
+        DirectoryEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=[profile_field],
+            update_fields=DirectoryService.UPDATE_FIELDS,
+        )
+
+        RecommendationService.refresh(existing.values_list("id", flat=True))
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild():
+        DirectoryEntry.objects.all().delete()
+
+        entries = (
+            DirectoryService.lawyer_entries(DirectoryService.lawyer_queryset())
+            + DirectoryService.firm_entries(DirectoryService.firm_queryset())
+        )
+        DirectoryEntry.objects.bulk_create(entries, batch_size=1000)
+        RecommendationService.refresh()
+
+        return len(entries)
+
+    # -------------------------
+    # SEARCH
+    # -------------------------
+    @staticmethod
+    def parse_ids(value):
+        """
+        Comma-separated CaseCategory ids -> [UUID].
+        """
+        try:
+            return [UUID(item.strip()) for item in value.split(",") if item.strip()]
+        except ValueError:
+            raise ValidationError({"services": "Invalid service id"})
+
+    @staticmethod
+    def filter(kind, services=None, province=None, district=None, has_firm=None):
+        qs = DirectoryEntry.objects.filter(kind=kind)
+
+        if services:
+            qs = qs.filter(service_ids__overlap=DirectoryService.parse_ids(services))
+
+        if province:
+            qs = qs.filter(province_id=province)
+
+        if district:
+            qs = qs.filter(district_id=district)
+
+        if has_firm is not None:
+            qs = qs.filter(has_firm=has_firm)
+
+        return qs
+
+    @staticmethod
+    @contextmanager
+    def word_similarity():
+        """
+        Transaction in which the `%>` filters of match() / suggest() use
+        DIRECTORY_WORD_SIMILARITY. The operator reads pg_trgm's threshold
+        setting, and only the operator can use the GIN index. The setting
+        is transaction-local (SET LOCAL) and restored on exit, so it never
+        outlives the search, even inside an outer transaction.
+        """
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT current_setting('pg_trgm.word_similarity_threshold', true), "
+                    "set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                    [str(settings.DIRECTORY_WORD_SIMILARITY)],
+                )
+                previous = cursor.fetchone()[0]
+
+            yield
+
+            # On error the savepoint rollback restores it instead
+            if previous:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                        [previous],
+                    )
+
+    @staticmethod
+    def match(qs, search):
+        """
+        Fuzzy match on name + service names, best first.
+
+        Rows qualify on a substring hit or when the query is word-similar
+        (pg_trgm `%>`) to part of search_text, so misspelt and
+        transliterated names still match. Evaluate inside word_similarity().
+        """
+        term = search.strip().lower()
+
+        return (
+            qs.filter(
+                Q(search_text__contains=term) |
+                Q(search_text__trigram_word_similar=term)
+            )
+            .annotate(rank=TrigramWordSimilarity(term, "search_text"))
+            .order_by(TrigramWordDistance(term, "search_text"), "name", "id")
+        )
+
+    @staticmethod
+    def suggest(qs, search, limit):
+        """
+        Top `limit` word-similar rows, nearest first. Ordering by distance
+        alone lets the GiST index stop after `limit` matches. Evaluate
+        inside word_similarity().
+        """
+        term = search.strip().lower()
+
+        return (
+            qs.filter(search_text__trigram_word_similar=term)
+            .annotate(rank=TrigramWordSimilarity(term, "search_text"))
+            .order_by(TrigramWordDistance(term, "search_text"))[:limit]
+        )
+
+    @staticmethod
+    def search(kind, search=None, services=None, province=None, district=None, has_firm=None):
+        """
+        Filtered DirectoryEntry queryset; every filter is on the entry row.
+        With `search`, rows are fuzzy matched and ranked by relevance.
+        """
+        qs = DirectoryService.filter(
+            kind,
+            services=services,
+            province=province,
+            district=district,
+            has_firm=has_firm,
+        )
+
+        if search and search.strip():
+            return DirectoryService.match(qs, search)
+
+        return qs.order_by("name", "id")
+
+    # -------------------------
+    # DISCOVERY
+    # -------------------------
+    @staticmethod
+    def resolve_location(province=None, district=None, municipality=None):
+        """
+        (province_id, district_id, municipality_id) from the most specific
+        id given, with the parents filled in from the address tree;
+        (None, None, None) when nothing is given.
+        """
+        try:
+            ids = [int(value) if value else None for value in (province, district, municipality)]
+        except (TypeError, ValueError):
+            ids = None
+
+        location = ids and get_address_tree().lineage(*ids)
+        if not location:
+            raise ValidationError({"location": "Unknown province, district or municipality"})
+
+        return location
+
+    @staticmethod
+    def proximity_tiers(location):
+        """
+        [(DirectoryProximity, Q)] nearest first; each Q selects only the
+        rows of its tier and leads with an indexed equality.
+        """
+        province_id, district_id, municipality_id = location
+        tiers = []
+
+        if municipality_id:
+            tiers.append((DirectoryProximity.MUNICIPALITY, Q(municipality_id=municipality_id)))
+        if district_id:
+            tiers.append((
+                DirectoryProximity.DISTRICT,
+                Q(district_id=district_id) & ~Q(municipality_id=municipality_id),
+            ))
+        if province_id:
+            tiers.append((
+                DirectoryProximity.PROVINCE,
+                Q(province_id=province_id) & ~Q(district_id=district_id),
+            ))
+            tiers.append((DirectoryProximity.ELSEWHERE, ~Q(province_id=province_id)))
+        else:
+            tiers.append((DirectoryProximity.ELSEWHERE, Q()))
+
+        return tiers
+
+    @staticmethod
+    def nearby(kind, location, services=None, limit=20, has_firm=None):
+        """
+        Verified entries nearest to `location` (see resolve_location), as a
+        list of at most `limit` DirectoryEntry rows annotated with
+        `proximity` (DirectoryProximity) and `matched_services`.
+
+        Ranked by proximity, then by the number of requested services
+        offered. Tiers are read nearest first and reading stops once
+        `limit` rows are found, so the usual request is a single query on
+        the (kind, municipality) index. With `services` (comma-separated
+        ids) at least one must match, through the GIN index.
+        """
+        service_ids = DirectoryService.parse_ids(services) if services else None
+
+        if service_ids:
+            matched = MatchedServices(
+                F("service_ids"),
+                Value(service_ids, output_field=ArrayField(UUIDField())),
+            )
+        else:
+            matched = Value(0, output_field=IntegerField())
+
+        qs = (
+            DirectoryService.filter(kind, services=services, has_firm=has_firm)
+            .select_related(
+                f"{kind}__user__{DirectoryService.VERIFICATION[kind]}",
+                f"{kind}__address__province",
+                f"{kind}__address__district",
+                f"{kind}__address__municipality",
+                f"{kind}__address__ward",
+            )
+            .prefetch_related(f"{kind}__services")
+            .annotate(matched_services=matched)
+            .order_by("-matched_services", "name", "id")
+        )
+
+        entries = []
+        for proximity, condition in DirectoryService.proximity_tiers(location):
+            tier = qs.filter(condition).annotate(
+                proximity=Value(proximity, output_field=IntegerField())
+            )
+            entries += tier[: limit - len(entries)]
+
+            if len(entries) >= limit:
+                break
+
+        return entries
+
+
+class RecommendationService:
+    """
+    Per case category pools of lawyers / firms to recommend.
+
+    RecommendationCandidate holds a row for each verified profile and
+    category it offers, scored by accepted bookings and active cases in
+    that category. A profile's rows follow its directory entry
+    (verification, services, address), and are refreshed at commit when
+    a booking or case write changes its counts (see queue()).
+
+    Serving reads the top of a pool from the cache, orders it by
+    proximity to the client and score, and rotates through the best
+    RECOMMENDATION_ROTATION_WINDOW candidates, so the same few profiles
+    are not recommended to everyone.
+    """
+
+    CACHE_NAMESPACE = "recommendations"
+
+    ACTIVE_CASE_STATUSES = [CaseStatus.REGISTERED, CaseStatus.ONGOING]
+
+    # -------------------------
+    # BUILD
+    # -------------------------
+    @staticmethod
+    def score(accepted_bookings, active_cases):
+        # Log-damped so a handful of very busy profiles don't take every slot
+        return round(math.log1p(accepted_bookings) + 0.5 * math.log1p(active_cases), 6)
+
+    @staticmethod
+    def _counts(qs, key, category="case_category_id"):
+        """
+        {(key, category id): count} of a grouped queryset.
+        """
+        return {
+            (row[key], row[category]): row["total"]
+            for row in qs.values(key, category).annotate(total=Count("id", distinct=True))
+        }
+
+    @staticmethod
+    def _signals(entries):
+        """
+        (accepted bookings, active cases) counters for the entries'
+        profiles, keyed by (user id / profile id, category id).
+        """
+        user_ids = [e["lawyer__user_id"] or e["firm__user_id"] for e in entries]
+        lawyer_ids = [e["lawyer_id"] for e in entries if e["lawyer_id"]]
+        firm_ids = [e["firm_id"] for e in entries if e["firm_id"]]
+
+        bookings = RecommendationService._counts(
+            Booking.objects.filter(
+                created_to_id__in=user_ids,
+                status=BookingStatus.ACCEPTED,
+            ),
+            "created_to_id",
+        )
+
+        cases = RecommendationService._counts(
+            CaseLawyer.objects.filter(
+                lawyer_id__in=lawyer_ids,
+                case__status__in=RecommendationService.ACTIVE_CASE_STATUSES,
+                case__deleted_at__isnull=True,
+            ),
+            "lawyer_id",
+            "case__case_category_id",
+        )
+        cases.update(RecommendationService._counts(
+            Case.objects.filter(
+                owner_firm_id__in=firm_ids,
+                status__in=RecommendationService.ACTIVE_CASE_STATUSES,
+            ),
+            "owner_firm_id",
+        ))
+
+        return bookings, cases
+
+    @staticmethod
+    @transaction.atomic
+    def refresh(entry_ids=None):
+        """
+        Recompute the candidate rows of the given directory entries (all
+        when None). Returns the number of rows written.
+        """
+        entries = DirectoryEntry.objects.all()
+        existing = RecommendationCandidate.objects.all()
+
+        if entry_ids is not None:
+            entry_ids = list(entry_ids)
+            entries = entries.filter(id__in=entry_ids)
+            existing = existing.filter(entry_id__in=entry_ids)
+
+        entries = list(entries.values(
+            "id", "kind", "service_ids", "lawyer_id", "firm_id",
+            "lawyer__user_id", "firm__user_id",
+        ))
+        bookings, cases = RecommendationService._signals(entries)
+
+        # service_ids may still name a category deleted since the last sync
+        known = set(
+            CaseCategory.objects
+            .filter(id__in={c for entry in entries for c in entry["service_ids"]})
+            .values_list("id", flat=True)
+        )
+
+        candidates = []
+        for entry in entries:
+            user_id = entry["lawyer__user_id"] or entry["firm__user_id"]
+            profile_id = entry["lawyer_id"] or entry["firm_id"]
+
+            for category_id in entry["service_ids"]:
+                if category_id not in known:
+                    continue
+
+                accepted_bookings = bookings.get((user_id, category_id), 0)
+                active_cases = cases.get((profile_id, category_id), 0)
+
+                candidates.append(RecommendationCandidate(
+                    case_category_id=category_id,
+                    entry_id=entry["id"],
+                    kind=entry["kind"],
+                    accepted_bookings=accepted_bookings,
+                    active_cases=active_cases,
+                    score=RecommendationService.score(accepted_bookings, active_cases),
+                ))
+
+        categories = set(existing.values_list("case_category_id", flat=True))
+        categories.update(candidate.case_category_id for candidate in candidates)
+
+        existing.delete()
+        # A concurrent refresh of the same entry may have written its rows
+        RecommendationCandidate.objects.bulk_create(
+            candidates, batch_size=1000, ignore_conflicts=True
+        )
+
+        transaction.on_commit(
+            lambda: bump_generations(RecommendationService.CACHE_NAMESPACE, categories)
+        )
+        return len(candidates)
+
+    @staticmethod
+    def forget(entry_ids):
+        """
+        Drop the candidate rows of entries about to be deleted.
+        """
+        qs = RecommendationCandidate.objects.filter(entry_id__in=list(entry_ids))
+        categories = set(qs.values_list("case_category_id", flat=True))
+
+        if categories:
+            qs.delete()
+            transaction.on_commit(
+                lambda: bump_generations(RecommendationService.CACHE_NAMESPACE, categories)
+            )
+
+    _pending = threading.local()
+
+    @staticmethod
+    def queue(user_ids):
+        """
+        Refresh the candidate rows of these lawyer / firm users at commit,
+        once per transaction; bookings and cases call this when a write
+        changes their accepted booking or active case counts.
+        """
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if not user_ids:
+            return
+
+        pending = getattr(RecommendationService._pending, "users", None)
+        if pending is None:
+            pending = RecommendationService._pending.users = set()
+
+        pending.update(user_ids)
+        transaction.on_commit(RecommendationService._flush)
+
+    @staticmethod
+    def _flush():
+        user_ids = getattr(RecommendationService._pending, "users", None)
+        if not user_ids:
+            return
+
+        RecommendationService._pending.users = set()
+
+        # As DirectoryService._flush: the write is already committed
+        try:
+            RecommendationService.refresh(
+                DirectoryEntry.objects
+                .filter(Q(lawyer__user_id__in=user_ids) | Q(firm__user_id__in=user_ids))
+                .values_list("id", flat=True)
+            )
+        except Exception:
+            logger.exception("Recommendation refresh failed for users %s", user_ids)
+
+    # -------------------------
+    # SERVE
+    # -------------------------
+    @staticmethod
+    def pool(kind, case_category_id):
+        """
+        [(profile id, score, province id, district id, municipality id)]
+        of the best RECOMMENDATION_POOL_SIZE candidates, best first.
+        Cached until the category's rows change.
+        """
+        generation = get_generation(RecommendationService.CACHE_NAMESPACE, case_category_id)
+
+        return get_or_compute(
+            f"recommendations:{case_category_id}:{kind}:{generation}",
+            lambda: list(
+                RecommendationCandidate.objects
+                .filter(case_category_id=case_category_id, kind=kind)
+                .order_by("-score", "entry_id")
+                .values_list(
+                    f"entry__{kind}_id",
+                    "score",
+                    "entry__province_id",
+                    "entry__district_id",
+                    "entry__municipality_id",
+                )[:settings.RECOMMENDATION_POOL_SIZE]
+            ),
+            timeout=settings.RECOMMENDATION_CACHE_TIMEOUT,
+        )
+
+    @staticmethod
+    def proximity(location, province_id, district_id, municipality_id):
+        if not location:
+            return DirectoryProximity.ELSEWHERE
+
+        client_province, client_district, client_municipality = location
+
+        if client_municipality and municipality_id == client_municipality:
+            return DirectoryProximity.MUNICIPALITY
+        if client_district and district_id == client_district:
+            return DirectoryProximity.DISTRICT
+        if client_province and province_id == client_province:
+            return DirectoryProximity.PROVINCE
+        return DirectoryProximity.ELSEWHERE
+
+    @staticmethod
+    def _turn(kind, case_category_id):
+        key = f"recommendations:turn:{case_category_id}:{kind}"
+        cache.add(key, 0, timeout=None)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # Evicted between add and incr
+            return 0
+
+    @staticmethod
+    def recommend(kind, case_category_id, location=None, limit=5):
+        """
+        Profile ids (Lawyer / Firm pk) to recommend, best first.
+
+        `location` is (province_id, district_id, municipality_id) of the
+        client, or None. Successive calls for a category take turns
+        through the top of its pool, `limit` at a time.
+        """
+        ranked = sorted(
+            RecommendationService.pool(kind, case_category_id),
+            key=lambda row: (-RecommendationService.proximity(location, *row[2:]), -row[1]),
+        )
+        window = ranked[:max(settings.RECOMMENDATION_ROTATION_WINDOW, limit)]
+
+        if len(window) > limit:
+            start = RecommendationService._turn(kind, case_category_id) * limit
+            picked = sorted((start + i) % len(window) for i in range(limit))
+            window = [window[i] for i in picked]
+
+        return [row[0] for row in window]
+
+
+class PublicProfileCacheService:
+    """
+    Serialized public lawyer / firm profiles, keyed by profile id.
+
+    Served stale-while-revalidate (see base.cache.get_or_revalidate), and
+    dropped at commit whenever the directory queues the profile, i.e. on
+    profile, verification, services and address changes.
+    """
+
+    MODELS = {
+        DirectoryEntryKind.LAWYER: Lawyer,
+        DirectoryEntryKind.FIRM: Firm,
+    }
+
+    @staticmethod
+    def cache_key(kind, profile_id):
+        return f"public_profile:{kind}:{profile_id}"
+
+    @staticmethod
+    def get(kind, profile_id, compute):
+        """
+        compute() -> serialized profile, or None when not publicly visible.
+        """
+        return get_or_revalidate(
+            PublicProfileCacheService.cache_key(kind, profile_id),
+            compute,
+            fresh_for=settings.PUBLIC_PROFILE_CACHE_FRESH,
+            stale_for=settings.PUBLIC_PROFILE_CACHE_STALE,
+            missing_for=settings.PUBLIC_PROFILE_CACHE_MISSING,
+        )
+
+    @staticmethod
+    def invalidate(kind, user_ids):
+        # _base_manager also sees soft-deleted profiles
+        profile_ids = (
+            PublicProfileCacheService.MODELS[kind]._base_manager
+            .filter(user_id__in=user_ids)
+            .values_list("id", flat=True)
+        )
+
+        cache.delete_many([
+            PublicProfileCacheService.cache_key(kind, profile_id)
+            for profile_id in profile_ids
+        ])
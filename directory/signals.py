@@ -0,0 +1,232 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from addresses.models import Address
+from base.constants.booking_status import BookingStatus
+from bookings.models import Booking
+from cases.models import Case, CaseCategory, CaseLawyer
+from directory.constants import DirectoryEntryKind
+from directory.services import DirectoryService, RecommendationService
+from firms.models import Firm, FirmMember, FirmVerification
+from lawyers.models import BarVerification, Lawyer
+
+
+# ---------------------------------------------------
+# Profiles / verifications
+# ---------------------------------------------------
+
+@receiver(post_save, sender=Lawyer)
+@receiver(post_delete, sender=Lawyer)
+@receiver(post_save, sender=BarVerification)
+@receiver(post_delete, sender=BarVerification)
+def lawyer_changed(sender, instance, **kwargs):
+    DirectoryService.queue(DirectoryEntryKind.LAWYER, [instance.user_id])
+
+
+@receiver(post_save, sender=Firm)
+@receiver(post_delete, sender=Firm)
+@receiver(post_save, sender=FirmVerification)
+@receiver(post_delete, sender=FirmVerification)
+def firm_changed(sender, instance, **kwargs):
+    DirectoryService.queue(DirectoryEntryKind.FIRM, [instance.user_id])
+
+
+@receiver(post_save, sender=FirmMember)
+@receiver(post_delete, sender=FirmMember)
+def firm_member_changed(sender, instance, **kwargs):
+    user_id = (
+        Lawyer._base_manager
+        .filter(pk=instance.lawyer_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+    DirectoryService.queue(DirectoryEntryKind.LAWYER, [user_id])
+
+
+@receiver(post_save, sender=Address)
+def address_changed(sender, instance, created, **kwargs):
+    # New addresses are picked up when the profile is saved with them
+    if created:
+        return
+
+    DirectoryService.queue(
+        DirectoryEntryKind.LAWYER,
+        Lawyer.objects.filter(address=instance).values_list("user_id", flat=True),
+    )
+    DirectoryService.queue(
+        DirectoryEntryKind.FIRM,
+        Firm.objects.filter(address=instance).values_list("user_id", flat=True),
+    )
+
+
+# ---------------------------------------------------
+# Services (M2M)
+# ---------------------------------------------------
+
+def _services_changed(model, kind, instance, action, reverse, pk_set):
+    if action == "pre_clear" and reverse:
+        # The category side of a clear only knows its profiles before the clear
+        instance._directory_user_ids = list(
+            model.objects.filter(services=instance).values_list("user_id", flat=True)
+        )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        user_ids = [instance.user_id]
+    elif action == "post_clear":
+        user_ids = getattr(instance, "_directory_user_ids", [])
+    else:
+        user_ids = model.objects.filter(pk__in=pk_set).values_list("user_id", flat=True)
+
+    DirectoryService.queue(kind, user_ids)
+
+
+@receiver(m2m_changed, sender=Lawyer.services.through)
+def lawyer_services_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    _services_changed(Lawyer, DirectoryEntryKind.LAWYER, instance, action, reverse, pk_set)
+
+
+@receiver(m2m_changed, sender=Firm.services.through)
+def firm_services_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    _services_changed(Firm, DirectoryEntryKind.FIRM, instance, action, reverse, pk_set)
+
+
+@receiver(post_save, sender=CaseCategory)
+def case_category_changed(sender, instance, created, **kwargs):
+    # Service names are part of the search text
+    if created:
+        return
+
+    DirectoryService.queue(
+        DirectoryEntryKind.LAWYER,
+        Lawyer.objects.filter(services=instance).values_list("user_id", flat=True),
+    )
+    DirectoryService.queue(
+        DirectoryEntryKind.FIRM,
+        Firm.objects.filter(services=instance).values_list("user_id", flat=True),
+    )
+
+
+# ---------------------------------------------------
+# Recommendation counts (bookings / cases)
+# ---------------------------------------------------
+#
+# Each handler compares what the row counted for before and after the
+# write and queues the profiles whose counts may have moved.
+
+def _booking_counted(state):
+    # (recipient user, category) the booking counts for, or None
+    if not state or state["deleted_at"] is not None:
+        return None
+    if state["status"] != BookingStatus.ACCEPTED:
+        return None
+    return state["created_to_id"], state["case_category_id"]
+
+
+def _booking_state(booking):
+    return {
+        "status": booking.status,
+        "deleted_at": booking.deleted_at,
+        "created_to_id": booking.created_to_id,
+        "case_category_id": booking.case_category_id,
+    }
+
+
+@receiver(pre_save, sender=Booking)
+def remember_booking_counted(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._recommendation_previous = _booking_counted(
+            Booking._base_manager
+            .filter(pk=instance.pk)
+            .values("status", "deleted_at", "created_to_id", "case_category_id")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Booking)
+def booking_changed(sender, instance, **kwargs):
+    previous = getattr(instance, "_recommendation_previous", None)
+    current = _booking_counted(_booking_state(instance))
+
+    if previous != current:
+        RecommendationService.queue([state[0] for state in (previous, current) if state])
+
+
+@receiver(post_delete, sender=Booking)
+def booking_deleted(sender, instance, **kwargs):
+    current = _booking_counted(_booking_state(instance))
+
+    if current:
+        RecommendationService.queue([current[0]])
+
+
+def _case_counted(state):
+    # (owner firm, category) the case counts for while active, or None
+    if not state or state["deleted_at"] is not None:
+        return None
+    if state["status"] not in RecommendationService.ACTIVE_CASE_STATUSES:
+        return None
+    return state["owner_firm_id"], state["case_category_id"]
+
+
+def _case_state(case):
+    return {
+        "status": case.status,
+        "deleted_at": case.deleted_at,
+        "owner_firm_id": case.owner_firm_id,
+        "case_category_id": case.case_category_id,
+    }
+
+
+def _queue_case_profiles(case_id, firm_ids):
+    RecommendationService.queue(
+        Firm._base_manager.filter(pk__in=firm_ids).values_list("user_id", flat=True)
+    )
+    RecommendationService.queue(
+        CaseLawyer.objects.filter(case_id=case_id).values_list("lawyer__user_id", flat=True)
+    )
+
+
+@receiver(pre_save, sender=Case)
+def remember_case_counted(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._recommendation_previous = _case_counted(
+            Case._base_manager
+            .filter(pk=instance.pk)
+            .values("status", "deleted_at", "owner_firm_id", "case_category_id")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Case)
+def case_changed(sender, instance, created, **kwargs):
+    previous = getattr(instance, "_recommendation_previous", None)
+    current = _case_counted(_case_state(instance))
+
+    if previous != current:
+        _queue_case_profiles(
+            instance.pk, {state[0] for state in (previous, current) if state}
+        )
+
+
+@receiver(post_delete, sender=Case)
+def case_deleted(sender, instance, **kwargs):
+    # Assigned lawyers are queued by the cascaded CaseLawyer deletes
+    current = _case_counted(_case_state(instance))
+
+    if current:
+        RecommendationService.queue(
+            Firm._base_manager.filter(pk=current[0]).values_list("user_id", flat=True)
+        )
+
+
+@receiver(post_save, sender=CaseLawyer)
+@receiver(post_delete, sender=CaseLawyer)
+def case_lawyer_changed(sender, instance, **kwargs):
+    RecommendationService.queue(
+        Lawyer._base_manager.filter(pk=instance.lawyer_id).values_list("user_id", flat=True)
+    )
+
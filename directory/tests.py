@@ -0,0 +1,323 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+from addresses.models import Address, District, Municipality, Province, Ward
+from base.constants.booking_status import BookingStatus
+from base.constants.case import CaseStatus
+from base.constants.user_roles import UserRoles
+from base.constants.verification import VerificationStatus
+from bookings.models import Booking
+from cases.models import Case, CaseCategory, CaseLawyer
+from directory.constants import DirectoryEntryKind
+from directory.models import DirectoryEntry, RecommendationCandidate
+from directory import services
+from directory.services import DirectoryService, PublicProfileCacheService, RecommendationService
+from firms.models import Firm, FirmVerification
+from lawyers.models import BarVerification, Lawyer
+
+
+class DirectoryTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        province = Province.objects.create(title="Bagmati", title_nepali="बागमती", code=3)
+        district = District.objects.create(
+            province=province, title="Kathmandu", title_nepali="काठमाडौं", code=27
+        )
+        cls.kathmandu = Municipality.objects.create(
+            district=district, title="Kathmandu", title_nepali="काठमाडौं", code=27001
+        )
+        cls.kirtipur = Municipality.objects.create(
+            district=district, title="Kirtipur", title_nepali="कीर्तिपुर", code=27002
+        )
+
+        cls.civil = CaseCategory.objects.create(name="Civil")
+        cls.criminal = CaseCategory.objects.create(name="Criminal")
+        cls.client_user = User.objects.create_user(
+            email="client@example.com", password="x", role=UserRoles.CLIENT
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def address(self, municipality):
+        ward, _ = Ward.objects.get_or_create(
+            municipality=municipality, number=1, defaults={"number_nepali": "१"}
+        )
+        return Address.objects.create(
+            province_id=municipality.district.province_id,
+            district=municipality.district,
+            municipality=municipality,
+            ward=ward,
+        )
+
+    def lawyer(self, name, municipality=None, services=None):
+        user = User.objects.create_user(
+            email=f"{name}@example.com", password="x", role=UserRoles.LAWYER
+        )
+        BarVerification.objects.create(
+            user=user,
+            full_name=name,
+            date_of_birth="1990-01-01",
+            bar_id=name,
+            gender="male",
+            status=VerificationStatus.VERIFIED,
+        )
+        lawyer = Lawyer.objects.create(user=user, address=self.address(municipality or self.kathmandu))
+        lawyer.services.set(services or [self.civil])
+        return lawyer
+
+    def accept_bookings(self, profile, count):
+        for _ in range(count):
+            Booking.objects.create(
+                created_by=self.client_user,
+                created_to=profile.user,
+                case_category=self.civil,
+                court_type="district",
+                description="Dispute",
+                date="2026-01-01",
+                status=BookingStatus.ACCEPTED,
+            )
+
+
+class RecommendationPoolTests(DirectoryTestCase):
+
+    def recommend(self, location=None, limit=5):
+        return RecommendationService.recommend(
+            DirectoryEntryKind.LAWYER, self.civil.id, location, limit=limit
+        )
+
+    def test_pool_follows_verification_and_services(self):
+        lawyer = self.lawyer("ram", services=[self.civil, self.criminal])
+        DirectoryService.rebuild()
+
+        self.assertEqual(RecommendationCandidate.objects.filter(entry__lawyer=lawyer).count(), 2)
+
+        lawyer.services.remove(self.criminal)
+        DirectoryService.sync_lawyers([lawyer.user_id])
+        self.assertEqual(
+            list(RecommendationCandidate.objects.values_list("case_category", flat=True)),
+            [self.civil.id],
+        )
+
+        BarVerification.objects.filter(user=lawyer.user).update(status=VerificationStatus.PENDING)
+        DirectoryService.sync_lawyers([lawyer.user_id])
+        self.assertFalse(RecommendationCandidate.objects.exists())
+
+    def test_ranked_by_accepted_bookings_and_active_cases(self):
+        quiet = self.lawyer("quiet")
+        booked = self.lawyer("booked")
+        firm_user = User.objects.create_user(
+            email="firm@example.com", password="x", role=UserRoles.FIRM
+        )
+        FirmVerification.objects.create(
+            user=firm_user,
+            firm_name="Firm",
+            owner_name="Owner",
+            firm_id="F-1",
+            status=VerificationStatus.VERIFIED,
+        )
+        firm = Firm.objects.create(user=firm_user, address=self.address(self.kathmandu))
+        firm.services.set([self.civil])
+
+        self.accept_bookings(booked, 3)
+        Case.objects.create(
+            owner_type=UserRoles.FIRM,
+            owner_firm=firm,
+            created_by=firm_user,
+            title="Firm",
+            case_category=self.civil,
+            court_type="district",
+            status=CaseStatus.ONGOING,
+        )
+
+        DirectoryService.rebuild()
+
+        self.assertEqual(self.recommend(), [booked.id, quiet.id])
+        self.assertEqual(
+            RecommendationCandidate.objects.get(entry__lawyer=booked).accepted_bookings, 3
+        )
+        self.assertEqual(RecommendationCandidate.objects.get(entry__firm=firm).active_cases, 1)
+
+    def test_nearest_first(self):
+        near = self.lawyer("near", municipality=self.kirtipur)
+        busy = self.lawyer("busy")
+        self.accept_bookings(busy, 5)
+        DirectoryService.rebuild()
+
+        location = (self.kirtipur.district.province_id, self.kirtipur.district_id, self.kirtipur.id)
+
+        self.assertEqual(self.recommend(location), [near.id, busy.id])
+        self.assertEqual(self.recommend(), [busy.id, near.id])
+
+    @override_settings(RECOMMENDATION_ROTATION_WINDOW=3)
+    def test_rotation_shares_the_top_of_the_pool(self):
+        lawyers = [self.lawyer(name) for name in ("a", "b", "c", "d")]
+        self.accept_bookings(lawyers[3], 1)
+        DirectoryService.rebuild()
+
+        seen = [self.recommend(limit=1)[0] for _ in range(3)]
+
+        # Everyone in the window gets a turn, nobody outside it does
+        self.assertEqual(len(set(seen)), 3)
+        self.assertIn(lawyers[3].id, seen)
+
+    def test_pool_is_cached_until_rows_change(self):
+        lawyer = self.lawyer("ram")
+        DirectoryService.rebuild()
+        self.recommend()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.recommend(), [lawyer.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            lawyer.services.remove(self.civil)
+            DirectoryService.sync_lawyers([lawyer.user_id])
+
+        self.assertEqual(self.recommend(), [])
+
+    def test_counts_follow_booking_and_case_writes(self):
+        lawyer = self.lawyer("ram")
+        DirectoryService.rebuild()
+        candidate = RecommendationCandidate.objects.filter(entry__lawyer=lawyer)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            booking = Booking.objects.create(
+                created_by=self.client_user,
+                created_to=lawyer.user,
+                case_category=self.civil,
+                court_type="district",
+                description="Dispute",
+                date="2026-01-01",
+            )
+        self.assertEqual(candidate.get().accepted_bookings, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.status = BookingStatus.ACCEPTED
+            booking.save()
+        self.assertEqual(candidate.get().accepted_bookings, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            case = Case.objects.create(
+                owner_type=UserRoles.LAWYER,
+                owner_lawyer=lawyer,
+                created_by=lawyer.user,
+                title="Case",
+                case_category=self.civil,
+                court_type="district",
+                status=CaseStatus.ONGOING,
+            )
+            CaseLawyer.objects.create(case=case, lawyer=lawyer)
+        self.assertEqual(candidate.get().active_cases, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            case.status = CaseStatus.COMPLETED
+            case.save()
+        self.assertEqual(candidate.get().active_cases, 0)
+
+    def test_migration_matches_refresh(self):
+        lawyer = self.lawyer("ram", services=[self.civil, self.criminal])
+        self.lawyer("sita")
+        self.accept_bookings(lawyer, 2)
+        DirectoryService.rebuild()
+
+        fields = ("entry", "case_category", "kind", "accepted_bookings", "active_cases", "score")
+        expected = sorted(RecommendationCandidate.objects.values_list(*fields), key=str)
+        RecommendationCandidate.objects.all().delete()
+
+        import_module("directory.migrations.0003_recommendation_candidate").fill_candidates(
+            apps, None
+        )
+
+        self.assertEqual(len(expected), 3)
+        self.assertEqual(
+            sorted(RecommendationCandidate.objects.values_list(*fields), key=str), expected
+        )
+
+
+class DirectorySearchTests(DirectoryTestCase):
+
+    def search(self, term):
+        with DirectoryService.word_similarity():
+            return [
+                entry.lawyer_id
+                for entry in DirectoryService.search(DirectoryEntryKind.LAWYER, search=term)
+            ]
+
+    @override_settings(DIRECTORY_WORD_SIMILARITY=0.4)
+    def test_threshold_applies_to_the_search_only(self):
+        lawyer = self.lawyer("shrestha")
+        DirectoryService.rebuild()
+
+        # word_similarity("shrsta", ...) is ~0.43, under pg_trgm's 0.6 default
+        self.assertEqual(self.search("shrsta"), [lawyer.id])
+        self.assertEqual(self.search("sharma"), [])
+
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW pg_trgm.word_similarity_threshold")
+            self.assertEqual(cursor.fetchone()[0], "0.6")
+
+
+class DirectorySyncTests(DirectoryTestCase):
+
+    def test_sync_failure_does_not_fail_the_write(self):
+        failing = mock.patch.object(
+            DirectoryService, "sync_lawyers", side_effect=RuntimeError("boom")
+        )
+
+        with failing, self.assertLogs(services.logger, "ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                lawyer = self.lawyer("ram")
+
+        self.assertTrue(Lawyer.objects.filter(pk=lawyer.pk).exists())
+
+
+class PublicProfileCacheTests(DirectoryTestCase):
+
+    @override_settings(
+        PUBLIC_PROFILE_CACHE_FRESH=300,
+        PUBLIC_PROFILE_CACHE_STALE=86400,
+        PUBLIC_PROFILE_CACHE_MISSING=60,
+    )
+    def test_misses_are_cached_briefly(self):
+        with mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+            PublicProfileCacheService.get(DirectoryEntryKind.LAWYER, "missing", lambda: None)
+            PublicProfileCacheService.get(DirectoryEntryKind.LAWYER, "found", lambda: {"id": 1})
+
+        timeouts = [call.kwargs["timeout"] for call in cache_set.call_args_list]
+        self.assertEqual(timeouts, [60, 300 + 86400])
+
+
+class DirectoryBackfillTests(DirectoryTestCase):
+
+    def rows(self):
+        return sorted(
+            DirectoryEntry.objects.values_list(
+                "kind", "lawyer", "firm", "name", "search_text", "service_ids",
+                "municipality", "has_firm",
+            ),
+            key=str,
+        )
+
+    def test_migration_matches_rebuild(self):
+        self.lawyer("ram", services=[self.civil, self.criminal])
+        self.lawyer("sita", municipality=self.kirtipur)
+        unverified = self.lawyer("hari")
+        BarVerification.objects.filter(user=unverified.user).update(status=VerificationStatus.PENDING)
+
+        DirectoryService.rebuild()
+        expected = self.rows()
+        DirectoryEntry.objects.all().delete()
+
+        import_module("directory.migrations.0001_initial").fill_directory(apps, None)
+
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(self.rows(), expected)
+
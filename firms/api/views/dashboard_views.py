@@ -1,8 +1,3 @@
-from dateutil.relativedelta import relativedelta
-from django.utils import timezone
-from django.db.models import Count
-from django.db.models.functions import TruncMonth
-
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -13,9 +8,9 @@ from accounts.permissions import IsFirmUser
 from base.constants.case import CaseStatus
 from base.constants.booking_status import BookingStatus
 
-from firms.models import Firm
-from cases.models import Case
-from bookings.models import Booking
+from dashboards.constants import DashboardMetric
+from dashboards.engine import DashboardQueryEngine
+from dashboards.services import DashboardStatService
 from firms.api.serializers.dashboard import FirmDashboardSerializer
 
 
@@ -30,73 +25,19 @@ class FirmDashboardAPIView(APIView):
     )
     def get(self, request):
 
-        firm = request.user.firm_profile
-
-        # -----------------------------------
-        # 1️⃣ Total Cases (Firm-owned only)
-        # -----------------------------------
-        case_qs = Case.objects.filter(
-            owner_firm=firm
-        )
-
-        total_cases = case_qs.count()
-
-        # -----------------------------------
-        # 2️⃣ Ongoing Cases
-        # -----------------------------------
-        total_ongoing_cases = case_qs.filter(
-            status=CaseStatus.ONGOING
-        ).count()
-
-        # -----------------------------------
-        # 3️⃣ Pending Bookings
-        # -----------------------------------
-        total_pending_bookings = Booking.objects.filter(
-            created_to=request.user,
-            status=BookingStatus.PENDING
-        ).count()
-
-        # -----------------------------------
-        # 4️⃣ Total Firm Members
-        # -----------------------------------
-        total_members = firm.members.count()
-
-        # -----------------------------------
-        # 5️⃣ Cases Per Month (Last 12 Months)
-        # -----------------------------------
-        now = timezone.now()
-        start_date = now - relativedelta(months=11)
-
-        monthly_data = (
-            case_qs.filter(created_at__gte=start_date)
-            .annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(count=Count("id"))
-            .order_by("month")
-        )
-
-        month_map = {
-            item["month"].strftime("%Y-%m"): item["count"]
-            for item in monthly_data
-        }
-
-        cases_per_month = []
-        for i in range(12):
-            month_date = start_date + relativedelta(months=i)
-            key = month_date.strftime("%Y-%m")
+        stats = DashboardQueryEngine.cached_stats(request.user)
 
-            cases_per_month.append({
-                "month": month_date.strftime("%b"),
-                "year": month_date.year,
-                "count": month_map.get(key, 0),
-            })
+        cases = stats[DashboardMetric.CASES]
+        bookings = stats[DashboardMetric.BOOKINGS_RECEIVED]
 
         data = {
-            "total_cases": total_cases,
-            "total_ongoing_cases": total_ongoing_cases,
-            "total_pending_bookings": total_pending_bookings,
-            "total_members": total_members,
-            "cases_per_month": cases_per_month,
+            "total_cases": sum(cases.values()),
+            "total_ongoing_cases": cases.get(CaseStatus.ONGOING, 0),
+            "total_pending_bookings": bookings.get(BookingStatus.PENDING, 0),
+            "total_members": stats[DashboardMetric.MEMBERS],
+            "cases_per_month": DashboardStatService.monthly_series(
+                stats["cases_per_month"]
+            ),
         }
 
         return Response(FirmDashboardSerializer(data).data)
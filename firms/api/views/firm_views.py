@@ -1,5 +1,6 @@
 from django.db import transaction
 from django.contrib.auth import get_user_model
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
 from rest_framework.views import APIView
@@ -24,6 +25,8 @@ from firms.api.serializers import (
 from firms.services.firm_profile_service import FirmProfileService
 from addresses.services.address_service import AddressService
 from base.pagination import DefaultPageNumberPagination
+from directory.constants import DirectoryEntryKind
+from directory.services import DirectoryService, PublicProfileCacheService
 
 User = get_user_model()
 
@@ -159,7 +162,7 @@ class FirmListView(APIView):
                 name="search",
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description="Search firms by firm name",
+                description="Search firms by firm name. Public results are typo-tolerant, also match service names, and are ranked by relevance",
             ),
             OpenApiParameter(
                 name="services",
@@ -191,6 +194,41 @@ class FirmListView(APIView):
         province = request.query_params.get("province")
         district = request.query_params.get("district")
 
+        paginator = DefaultPageNumberPagination()
+
+        # 🔐 Public: verified firms, filtered on the directory rows
+        if not admin:
+            entries = DirectoryService.search(
+                DirectoryEntryKind.FIRM,
+                search=search,
+                services=services,
+                province=province,
+                district=district,
+            ).select_related(
+                "firm__user",
+                "firm__address__province",
+                "firm__address__district",
+                "firm__address__municipality",
+                "firm__address__ward",
+                "firm__user__firm_verification",
+            ).prefetch_related("firm__services")
+
+            with DirectoryService.word_similarity():
+                page = paginator.paginate_queryset(entries, request)
+
+            data = [
+                {
+                    "user": entry.firm.user,
+                    "profile": entry.firm,
+                    "verification": entry.firm.user.firm_verification,
+                }
+                for entry in page
+            ]
+
+            serializer = FirmPublicSerializer(data, many=True)
+            return paginator.get_paginated_response(serializer.data)
+
+        # 🛡️ Admin: all firms, any verification status
         qs = (
             Firm.objects
             .select_related(
@@ -201,15 +239,6 @@ class FirmListView(APIView):
             .prefetch_related("services")
         )
 
-        # 🔐 Visibility
-        if not admin:
-            qs = qs.filter(
-                user__firm_verification__status=VerificationStatus.VERIFIED
-            )
-            serializer_class = FirmPublicSerializer
-        else:
-            serializer_class = FirmAdminSerializer
-
         # 🔍 Search by firm name
         if search:
             qs = qs.filter(
@@ -233,7 +262,6 @@ class FirmListView(APIView):
         # ⚠️ Avoid duplicates from M2M joins
         qs = qs.distinct()
 
-        paginator = DefaultPageNumberPagination()
         page = paginator.paginate_queryset(qs, request)
 
         data = [
@@ -245,7 +273,7 @@ class FirmListView(APIView):
             for firm in page
         ]
 
-        serializer = serializer_class(data, many=True)
+        serializer = FirmAdminSerializer(data, many=True)
         return paginator.get_paginated_response(serializer.data)
 
 
@@ -264,28 +292,44 @@ class FirmDetailView(APIView):
         tags=["firms"],
     )
     def get(self, request, firm_id):
-        admin = is_admin_user(request.user)
-        qs = Firm.objects.select_related(
-            "user",
-            "address",
-            "user__firm_verification",
-        ).prefetch_related("services")
-
-        if not admin:
-            firm = get_object_or_404(
-                qs,
-                id=firm_id,
-                user__firm_verification__status=VerificationStatus.VERIFIED
+        if not is_admin_user(request.user):
+            data = PublicProfileCacheService.get(
+                DirectoryEntryKind.FIRM,
+                firm_id,
+                lambda: self.public_profile(firm_id),
             )
-            serializer_class = FirmPublicSerializer
-        else:
-            firm = get_object_or_404(qs, id=firm_id)
-            serializer_class = FirmAdminSerializer
+            if data is None:
+                raise Http404
+            return Response(data)
 
+        firm = get_object_or_404(self.get_queryset(), id=firm_id)
 
-        serializer = serializer_class({
+        serializer = FirmAdminSerializer({
             "user": firm.user,
             "profile": firm,
             "verification": getattr(firm.user, "firm_verification", None),
         })
         return Response(serializer.data)
+
+    @staticmethod
+    def get_queryset():
+        return Firm.objects.select_related(
+            "user",
+            "address",
+            "user__firm_verification",
+        ).prefetch_related("services")
+
+    def public_profile(self, firm_id):
+        firm = (
+            self.get_queryset()
+            .filter(id=firm_id, user__firm_verification__status=VerificationStatus.VERIFIED)
+            .first()
+        )
+        if firm is None:
+            return None
+
+        return FirmPublicSerializer({
+            "user": firm.user,
+            "profile": firm,
+            "verification": firm.user.firm_verification,
+        }).data
@@ -14,6 +14,7 @@ from firms.api.views import (
     FirmMembersListView
 )
 from firms.api.views.dashboard_views import FirmDashboardAPIView
+from directory.api.views import FirmAutocompleteView, FirmDiscoverView
 
 urlpatterns = [
     # signup
@@ -31,6 +32,8 @@ urlpatterns = [
 
     # public
     path("", FirmListView.as_view()),
+    path("autocomplete/", FirmAutocompleteView.as_view()),
+    path("discover/", FirmDiscoverView.as_view()),
     path("<uuid:firm_id>/", FirmDetailView.as_view()),
 
     # admin
@@ -1,5 +1,6 @@
 from django.db import transaction
 from django.contrib.auth import get_user_model
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
 from rest_framework.views import APIView
@@ -29,6 +30,8 @@ from lawyers.api.serializers import (
 )
 from addresses.services.address_service import AddressService
 from base.pagination import DefaultPageNumberPagination
+from directory.constants import DirectoryEntryKind
+from directory.services import DirectoryService, PublicProfileCacheService
 
 User = get_user_model()
 
@@ -162,7 +165,7 @@ class LawyerListView(APIView):
                 name="search",
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description="Search lawyers by full name",
+                description="Search lawyers by full name. Public results are typo-tolerant, also match service names, and are ranked by relevance",
             ),
             OpenApiParameter(
                 name="services",
@@ -201,21 +204,57 @@ class LawyerListView(APIView):
         province = request.query_params.get("province")
         district = request.query_params.get("district")
 
+        firm_filter = None
+        if has_firm is not None:
+            value = has_firm.lower()
+
+            if value in ["true", "1", "yes"]:
+                firm_filter = True
+            elif value in ["false", "0", "no"]:
+                firm_filter = False
+
+        paginator = DefaultPageNumberPagination()
+
+        # 🔐 Public: verified lawyers, filtered on the directory rows
+        if not admin:
+            entries = DirectoryService.search(
+                DirectoryEntryKind.LAWYER,
+                search=search,
+                services=services,
+                province=province,
+                district=district,
+                has_firm=firm_filter,
+            ).select_related(
+                "lawyer__user",
+                "lawyer__address__province",
+                "lawyer__address__district",
+                "lawyer__address__municipality",
+                "lawyer__address__ward",
+                "lawyer__user__bar_verification",
+            ).prefetch_related("lawyer__services")
+
+            with DirectoryService.word_similarity():
+                page = paginator.paginate_queryset(entries, request)
+
+            data = [
+                {
+                    "user": entry.lawyer.user,
+                    "profile": entry.lawyer,
+                    "verification": entry.lawyer.user.bar_verification,
+                }
+                for entry in page
+            ]
+
+            serializer = LawyerPublicSerializer(data, many=True)
+            return paginator.get_paginated_response(serializer.data)
+
+        # 🛡️ Admin: all lawyers, any verification status
         qs = (
             Lawyer.objects
             .select_related("user", "address", "user__bar_verification")
             .prefetch_related("services")
         )
 
-        # 🔐 Visibility
-        if not admin:
-            qs = qs.filter(
-                user__bar_verification__status=VerificationStatus.VERIFIED
-            )
-            serializer_class = LawyerPublicSerializer
-        else:
-            serializer_class = LawyerAdminSerializer
-
         # 🔍 Search (full name)
         if search:
             qs = qs.filter(
@@ -226,15 +265,9 @@ class LawyerListView(APIView):
         if services:
             qs = qs.filter(services__id__in=services.split(","))
 
-        if has_firm is not None:
-            value = has_firm.lower()
-        
-            if value in ["true", "1", "yes"]:
-                qs = qs.filter(firm_membership__isnull=False)
-            elif value in ["false", "0", "no"]:
-                qs = qs.filter(firm_membership__isnull=True)
-        
-        
+        if firm_filter is not None:
+            qs = qs.filter(firm_membership__isnull=not firm_filter)
+
         # 📍 Filter by province
         if province:
             qs = qs.filter(address__province_id=province)
@@ -246,7 +279,6 @@ class LawyerListView(APIView):
         # ⚠️ Avoid duplicates due to M2M joins
         qs = qs.distinct()
 
-        paginator = DefaultPageNumberPagination()
         page = paginator.paginate_queryset(qs, request)
 
         data = [
@@ -258,7 +290,7 @@ class LawyerListView(APIView):
             for lawyer in page
         ]
 
-        serializer = serializer_class(data, many=True)
+        serializer = LawyerAdminSerializer(data, many=True)
         return paginator.get_paginated_response(serializer.data)
 
 
@@ -276,29 +308,44 @@ class LawyerDetailView(APIView):
         tags=["lawyers"],
     )
     def get(self, request, lawyer_id):
-        admin = is_admin_user(request.user)
+        if not is_admin_user(request.user):
+            data = PublicProfileCacheService.get(
+                DirectoryEntryKind.LAWYER,
+                lawyer_id,
+                lambda: self.public_profile(lawyer_id),
+            )
+            if data is None:
+                raise Http404
+            return Response(data)
+
+        lawyer = get_object_or_404(self.get_queryset(), id=lawyer_id)
 
-        qs = Lawyer.objects.select_related(
+        serializer = LawyerAdminSerializer({
+            "user": lawyer.user,
+            "profile": lawyer,
+            "verification": getattr(lawyer.user, "bar_verification", None),
+        })
+        return Response(serializer.data)
+
+    @staticmethod
+    def get_queryset():
+        return Lawyer.objects.select_related(
             "user",
             "address",
             "user__bar_verification",
         ).prefetch_related("services")
 
+    def public_profile(self, lawyer_id):
+        lawyer = (
+            self.get_queryset()
+            .filter(id=lawyer_id, user__bar_verification__status=VerificationStatus.VERIFIED)
+            .first()
+        )
+        if lawyer is None:
+            return None
 
-        if not admin:
-            lawyer = get_object_or_404(
-                qs,
-                id=lawyer_id,
-                user__bar_verification__status=VerificationStatus.VERIFIED
-            )
-            serializer_class = LawyerPublicSerializer
-        else:
-            lawyer = get_object_or_404(qs, id=lawyer_id)
-            serializer_class = LawyerAdminSerializer
-
-        serializer = serializer_class({
+        return LawyerPublicSerializer({
             "user": lawyer.user,
             "profile": lawyer,
-            "verification": getattr(lawyer.user, "bar_verification", None),
-        })
-        return Response(serializer.data)
+            "verification": lawyer.user.bar_verification,
+        }).data
@@ -13,6 +13,7 @@ from lawyers.api.views import (
     LawyerInvitationsListView,
     LawyerInvitationRespondView,
 )
+from directory.api.views import LawyerAutocompleteView, LawyerDiscoverView
 
 urlpatterns = [
     # SIGNUP
@@ -37,6 +38,8 @@ urlpatterns = [
 
     #PUBLIC
     path("", LawyerListView.as_view()),
+    path("autocomplete/", LawyerAutocompleteView.as_view()),
+    path("discover/", LawyerDiscoverView.as_view()),
     path("<uuid:lawyer_id>/", LawyerDetailView.as_view()),
 
     # INVITATIONS
@@ -11,3 +11,6 @@ class NotificationType(models.TextChoices):
     FIRM_INVITATION_RECEIVED = "firm_invitation_received", "Firm Invitation Received"
     FIRM_INVITATION_ACCEPTED = "firm_invitation_accepted", "Firm Invitation Accepted"
     FIRM_INVITATION_REJECTED = "firm_invitation_rejected", "Firm Invitation Rejected"
+
+    # Case
+    CASE_DATE_REMINDER = "case_date_reminder", "Case Date Reminder"
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-19 03:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_notification_actor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='dedupe_key',
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('booking_created', 'Booking Created'), ('booking_accepted', 'Booking Accepted'), ('booking_rejected', 'Booking Rejected'), ('firm_invitation_received', 'Firm Invitation Received'), ('firm_invitation_accepted', 'Firm Invitation Accepted'), ('firm_invitation_rejected', 'Firm Invitation Rejected'), ('case_date_reminder', 'Case Date Reminder')], max_length=50),
+        ),
+    ]
@@ -50,6 +50,14 @@ class Notification(AbstractBaseModel):
 
     is_read = models.BooleanField(default=False)
 
+    # Set by batch producers (e.g. reminders) so reruns never double-notify
+    dedupe_key = models.CharField(
+        max_length=255,
+        unique=True,
+        null=True,
+        blank=True
+    )
+
     class Meta:
         db_table = "notifications"
         ordering = ["-created_at"]
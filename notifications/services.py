@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 from notifications.serializers import NotificationActorSerializer
@@ -46,6 +47,70 @@ class NotificationService:
 
         return notification
 
+    # ----------------------------
+    # Bulk creation (batch jobs)
+    # ----------------------------
+    @staticmethod
+    def bulk_create_notifications(notifications, batch_size=500):
+        """
+        Insert many unsaved Notification instances at once.
+
+        Instances carrying a `dedupe_key` that already exists are skipped,
+        so a producer can be re-run safely. Only rows actually inserted
+        are pushed over WebSocket, followed by one unread_count per
+        recipient.
+        """
+        if not notifications:
+            return []
+
+        keys = [n.dedupe_key for n in notifications if n.dedupe_key]
+
+        existing = set(
+            Notification.objects
+            .filter(dedupe_key__in=keys)
+            .values_list("dedupe_key", flat=True)
+        ) if keys else set()
+
+        pending = []
+        seen = set()
+
+        for notification in notifications:
+            key = notification.dedupe_key
+            if key and (key in existing or key in seen):
+                continue
+
+            if key:
+                seen.add(key)
+
+            pending.append(notification)
+
+        if not pending:
+            return []
+
+        # A concurrent run may insert the same keys in between;
+        # the unique constraint makes those rows no-ops.
+        Notification.objects.bulk_create(
+            pending,
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
+        inserted_ids = set(
+            Notification.objects
+            .filter(id__in=[n.id for n in pending])
+            .values_list("id", flat=True)
+        )
+        created = [n for n in pending if n.id in inserted_ids]
+
+        for notification in created:
+            NotificationService.send_realtime_notification(notification)
+
+        NotificationService.send_unread_counts(
+            {n.recipient_id for n in created}
+        )
+
+        return created
+
     # ----------------------------
     # Real-time WebSocket delivery
     # ----------------------------
@@ -74,7 +139,7 @@ class NotificationService:
         }
 
         async_to_sync(channel_layer.group_send)(
-            f"user_{notification.recipient.id}",
+            f"user_{notification.recipient_id}",
             payload
         )
 
@@ -94,3 +159,30 @@ class NotificationService:
                 "count": count
             }
         )
+
+    @staticmethod
+    def send_unread_counts(user_ids):
+        """
+        unread_count push for many users with a single COUNT query.
+        """
+        if not user_ids:
+            return
+
+        channel_layer = get_channel_layer()
+
+        counts = dict(
+            Notification.objects
+            .filter(recipient_id__in=user_ids, is_read=False)
+            .values("recipient_id")
+            .annotate(count=Count("id"))
+            .values_list("recipient_id", "count")
+        )
+
+        for user_id in user_ids:
+            async_to_sync(channel_layer.group_send)(
+                f"user_{user_id}",
+                {
+                    "type": "unread_count",
+                    "count": counts.get(user_id, 0)
+                }
+            )